@@ -0,0 +1,41 @@
+"""user search indexes
+
+관리자 사용자 검색(/api/admin/users/search)용 인덱스.
+create_all 로 새로 만든 DB에는 이미 있을 수 있으므로 존재하지 않는 인덱스만 생성합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 12:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_users_name', ['name']),
+    ('ix_users_department', ['department']),
+    ('ix_users_position', ['position']),
+    ('ix_users_created_id', ['created_at', 'id']),
+    ('ix_users_role_active_created', ['role', 'is_active', 'created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    existing = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('users')}
+    for name, columns in INDEXES:
+        if name not in existing:
+            op.create_index(name, 'users', columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='users')
@@ -0,0 +1,33 @@
+"""schema fingerprint
+
+앱 기동 시 스키마 일치 여부를 쿼리 1회로 확인하기 위한 테이블 (app.db.migrations 참고)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 12:00:02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('schema_fingerprint',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('schema_fingerprint')
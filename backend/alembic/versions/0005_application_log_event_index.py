@@ -0,0 +1,28 @@
+"""application log event index
+
+신청서 이벤트 스트림 Last-Event-ID 재접속 시 (created_at, id) 이후 감사 로그 조회용 인덱스
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 12:00:04
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_application_logs_created_id', 'application_logs', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_application_logs_created_id', table_name='application_logs')
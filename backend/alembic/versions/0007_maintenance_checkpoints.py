@@ -0,0 +1,49 @@
+"""maintenance checkpoints and filename fix backup
+
+- maintenance_checkpoints: 배치 유지보수 명령의 진행 상황 (중단 후 재개용)
+- application_filename_backup: scripts/fix_corrupted_filenames.py 가 수정하기 전 원본 파일명 (수정 대상 행만)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 12:00:06
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('maintenance_checkpoints',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('position', sa.String(), nullable=True),
+    sa.Column('stats', sa.JSON(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_table('application_filename_backup',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('run_id', sa.String(), nullable=False),
+    sa.Column('application_id', sa.String(), nullable=False),
+    sa.Column('irb_document_original_name', sa.String(), nullable=True),
+    sa.Column('research_plan_original_name', sa.String(), nullable=True),
+    sa.Column('backed_up_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_application_filename_backup_run_id', 'application_filename_backup', ['run_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_application_filename_backup_run_id', table_name='application_filename_backup')
+    op.drop_table('application_filename_backup')
+    op.drop_table('maintenance_checkpoints')
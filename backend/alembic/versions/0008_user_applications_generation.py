@@ -0,0 +1,29 @@
+"""user applications generation
+
+연구자 신청서 목록 응답 캐시 무효화용 세대 카운터 (app.services.application_cache)
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 12:00:07
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('applications_generation', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('applications_generation')
@@ -0,0 +1,80 @@
+"""application service types mask
+
+applications.service_types(JSON) 의 비트마스크 컬럼과 인덱스, 기존 행 채우기
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 12:00:08
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.models.application.SERVICE_TYPE_BITS 와 같은 값 (마이그레이션은 모델 변경과 무관하게 고정)
+SERVICE_TYPE_BITS = {
+    'STRUCTURED_EXTRACTION': 1,
+    'UNSTRUCTURED_EXTRACTION': 2,
+    'PSEUDONYMIZATION': 4,
+    'EXTERNAL_LINKAGE': 8,
+}
+BATCH_SIZE = 1000
+
+
+def _mask(service_types) -> int:
+    if isinstance(service_types, str):
+        service_types = json.loads(service_types)
+    mask = 0
+    for service_type in service_types or ():
+        mask |= SERVICE_TYPE_BITS.get(service_type, 0)
+    return mask
+
+
+def upgrade() -> None:
+    op.add_column('applications', sa.Column('service_types_mask', sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 행 채우기 (id 키셋으로 나눠서 읽고, 배치마다 executemany 로 갱신)
+    applications = sa.table(
+        'applications',
+        sa.column('id', sa.String()),
+        sa.column('service_types', sa.JSON()),
+        sa.column('service_types_mask', sa.Integer()),
+    )
+    conn = op.get_bind()
+    statement = (
+        applications.update()
+        .where(applications.c.id == sa.bindparam('b_id'))
+        .values(service_types_mask=sa.bindparam('b_mask'))
+    )
+    last_id = ''
+    while True:
+        rows = conn.execute(
+            sa.select(applications.c.id, applications.c.service_types)
+            .where(applications.c.id > last_id)
+            .order_by(applications.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        params = [{'b_id': row.id, 'b_mask': _mask(row.service_types)} for row in rows]
+        params = [param for param in params if param['b_mask']]
+        if params:
+            conn.execute(statement, params)
+        last_id = rows[-1].id
+
+    op.create_index('ix_applications_service_types_mask_created', 'applications', ['service_types_mask', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_service_types_mask_created', table_name='applications')
+    with op.batch_alter_table('applications') as batch_op:
+        batch_op.drop_column('service_types_mask')
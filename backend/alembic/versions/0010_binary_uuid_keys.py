@@ -0,0 +1,105 @@
+"""binary uuid keys
+
+기본 키/외래 키 컬럼을 36자 문자열에서 16바이트 UUID 로 변경 (app.db.ids.UUIDKey)
+기존 uuid4 값은 그대로 변환되며, 새 행부터 UUIDv7 이 사용됩니다.
+
+- PostgreSQL: 외래 키 제약을 잠시 제거하고 ALTER COLUMN ... TYPE uuid USING col::uuid
+- SQLite: 값을 먼저 16바이트 BLOB 으로 바꾼 뒤(파이썬 함수 등록) batch 모드로 컬럼 타입 변경
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 12:00:09
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+KEY_COLUMNS = {
+    'users': ('id',),
+    'applications': ('id', 'user_id', 'reviewed_by', 'deleted_by'),
+    'application_logs': ('id', 'application_id', 'user_id'),
+    'downloads': ('id', 'application_id', 'user_id'),
+    'refresh_tokens': ('id', 'user_id'),
+    'password_reset_tokens': ('id', 'user_id'),
+    'jobs': ('id',),
+}
+NULLABLE_COLUMNS = {('applications', 'reviewed_by'), ('applications', 'deleted_by')}
+
+# (테이블, 컬럼, 참조 테이블) - 0001 에서 이름 없이 생성되어 PostgreSQL 기본 이름({table}_{column}_fkey)을 가짐
+FOREIGN_KEYS = (
+    ('applications', 'user_id', 'users'),
+    ('applications', 'reviewed_by', 'users'),
+    ('applications', 'deleted_by', 'users'),
+    ('application_logs', 'application_id', 'applications'),
+    ('application_logs', 'user_id', 'users'),
+    ('downloads', 'application_id', 'applications'),
+    ('downloads', 'user_id', 'users'),
+    ('refresh_tokens', 'user_id', 'users'),
+    ('password_reset_tokens', 'user_id', 'users'),
+)
+
+
+def _uuid_bytes(value):
+    if value is None or isinstance(value, bytes):
+        return value
+    return uuid.UUID(value).bytes
+
+
+def _uuid_text(value):
+    if value is None or isinstance(value, str):
+        return value
+    return str(uuid.UUID(bytes=bytes(value)))
+
+
+def _convert_postgresql(target_type: str) -> None:
+    for table, column, _ in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+    for table, columns in KEY_COLUMNS.items():
+        for column in columns:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {target_type} USING {column}::{target_type}')
+    for table, column, referred_table in FOREIGN_KEYS:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referred_table, [column], ['id'])
+
+
+def _convert_sqlite(function, from_type, to_type) -> None:
+    # 값 변환: SQLite 는 선언 타입과 무관하게 값을 저장하므로 타입 변경 전에 바꿔 둠 (테이블당 UPDATE 1회)
+    conn = op.get_bind()
+    conn.connection.dbapi_connection.create_function('convert_key', 1, function)
+    for table, columns in KEY_COLUMNS.items():
+        assignments = ', '.join(f'{column} = convert_key({column})' for column in columns)
+        conn.execute(sa.text(f'UPDATE {table} SET {assignments}'))
+
+    # 선언 타입 변경 (테이블 재생성, 인덱스/외래 키는 batch 모드가 다시 생성)
+    for table, columns in KEY_COLUMNS.items():
+        with op.batch_alter_table(table, recreate='always') as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    type_=to_type,
+                    existing_type=from_type,
+                    existing_nullable=(table, column) in NULLABLE_COLUMNS,
+                )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        _convert_postgresql('uuid')
+    else:
+        _convert_sqlite(_uuid_bytes, sa.String(), sa.LargeBinary(16))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        _convert_postgresql('varchar')
+    else:
+        _convert_sqlite(_uuid_text, sa.LargeBinary(16), sa.String())
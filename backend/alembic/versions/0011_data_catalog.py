@@ -0,0 +1,216 @@
+"""data catalog
+
+데이터 카탈로그 테이블(catalog_datasets, catalog_columns)과 초기 데이터, applications.requested_columns
+초기 데이터는 프론트엔드(data-catalog 페이지)에 있던 컬럼 정의입니다.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 12:00:10
+
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.ids import UUIDKey, new_id
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SENSITIVITY_LEVELS = ('LOW', 'MEDIUM', 'HIGH')
+
+# (키, 탭 이름, 제목, 설명, ((컬럼 키, 항목명, 기본 선택, 민감도), ...))
+DATASETS = (
+    ('diagnosis', '진단', '진단 데이터', '환자의 진단 이력 정보 (ICD-10 코드 기반)', (
+        ('id', '대체번호', True, 'HIGH'),
+        ('date', '진단일자', True, 'HIGH'),
+        ('visitCode', '내원구분', True, 'LOW'),
+        ('visitName', '내원구분명', True, 'LOW'),
+        ('deptCode', '진료과', True, 'LOW'),
+        ('deptName', '진료과명', True, 'LOW'),
+        ('dischargeDate', '퇴원일자', False, 'HIGH'),
+        ('birth', '생년월일', False, 'HIGH'),
+        ('gender', '성별', True, 'MEDIUM'),
+        ('height', '신장', False, 'MEDIUM'),
+        ('weight', '체중', False, 'MEDIUM'),
+        ('bmi', 'BMI', True, 'MEDIUM'),
+        ('diagCode', '진단코드', True, 'MEDIUM'),
+        ('diagName', '진단명', True, 'MEDIUM'),
+        ('mainDiag', '주진단여부', True, 'MEDIUM'),
+    )),
+    ('medication', '약처방', '약처방 데이터', '처방된 약물 정보 (ATC 코드 포함)', (
+        ('id', '대체번호', True, 'HIGH'),
+        ('visitTime', '외래/입원일시', True, 'HIGH'),
+        ('visitCode', '내원구분코드', False, 'LOW'),
+        ('visitName', '내원구분명', True, 'LOW'),
+        ('deptCode', '진료과코드', False, 'LOW'),
+        ('deptName', '진료과명', True, 'LOW'),
+        ('birth', '생년월일', False, 'HIGH'),
+        ('gender', '성별', False, 'MEDIUM'),
+        ('height', '신장', False, 'MEDIUM'),
+        ('weight', '체중', False, 'MEDIUM'),
+        ('bmi', 'BMI', False, 'MEDIUM'),
+        ('prescDate', '처방일자', True, 'HIGH'),
+        ('prescOrder', '처방순서', False, 'LOW'),
+        ('prescCode', '처방코드', False, 'MEDIUM'),
+        ('prescName', '처방명', True, 'MEDIUM'),
+        ('ingredCode', '성분코드', False, 'MEDIUM'),
+        ('ingredName', '성분명', True, 'MEDIUM'),
+        ('atcCode', 'ATC코드', True, 'MEDIUM'),
+        ('atcName', 'ATC명', False, 'MEDIUM'),
+        ('usage', '용법명', True, 'MEDIUM'),
+        ('dose', '처방용량', True, 'MEDIUM'),
+        ('days', '처방일수', True, 'MEDIUM'),
+    )),
+    ('lab', '검사결과', '검사결과 데이터', '혈액검사, 소변검사 등 각종 검체 검사 결과', (
+        ('id', '대체번호', True, 'HIGH'),
+        ('visitTime', '외래/입원일시', True, 'HIGH'),
+        ('visitCode', '내원구분코드', False, 'LOW'),
+        ('visitName', '내원구분명', True, 'LOW'),
+        ('deptCode', '진료과코드', False, 'LOW'),
+        ('deptName', '진료과명', True, 'LOW'),
+        ('birth', '생년월일', False, 'HIGH'),
+        ('gender', '성별', False, 'MEDIUM'),
+        ('height', '신장', False, 'MEDIUM'),
+        ('weight', '체중', False, 'MEDIUM'),
+        ('bmi', 'BMI', False, 'MEDIUM'),
+        ('prescDate', '처방일자', True, 'HIGH'),
+        ('prescOrder', '처방순서', False, 'LOW'),
+        ('prescName', '처방명', False, 'MEDIUM'),
+        ('testName', '검사명', True, 'MEDIUM'),
+        ('testCode', '검사코드', False, 'MEDIUM'),
+        ('result', '결과', True, 'MEDIUM'),
+        ('unit', '단위', True, 'MEDIUM'),
+        ('normalFlag', '정상구분', False, 'MEDIUM'),
+        ('normalLow', '정상치(하한)', False, 'MEDIUM'),
+        ('normalHigh', '정상치(상한)', False, 'MEDIUM'),
+        ('normalRange', '정상범위', True, 'MEDIUM'),
+    )),
+    ('surgery', '수술', '수술 데이터', '수술 이력 및 관련 정보', (
+        ('id', '대체번호', True, 'HIGH'),
+        ('visitTime', '외래/입원일시', True, 'HIGH'),
+        ('visitCode', '진료내원구분', False, 'LOW'),
+        ('visitName', '진료내원구분명', True, 'LOW'),
+        ('deptCode', '진료과', False, 'LOW'),
+        ('deptName', '진료과명', True, 'LOW'),
+        ('surgDate', '수술일자', True, 'HIGH'),
+        ('surgVisitCode', '수술내원구분', False, 'LOW'),
+        ('surgVisitName', '수술내원구분명', False, 'LOW'),
+        ('surgDeptCode', '수술과', False, 'LOW'),
+        ('surgDeptName', '수술과명', False, 'LOW'),
+        ('dischargeTime', '퇴원일시', False, 'HIGH'),
+        ('birth', '생년월일', False, 'HIGH'),
+        ('gender', '성별', False, 'MEDIUM'),
+        ('height', '신장', False, 'MEDIUM'),
+        ('weight', '체중', False, 'MEDIUM'),
+        ('bmi', 'BMI', False, 'MEDIUM'),
+        ('surgOrder', '수술순번', False, 'LOW'),
+        ('surgCode', '수술코드', False, 'MEDIUM'),
+        ('surgName', '수술명', True, 'MEDIUM'),
+        ('specimen', '검체여부', True, 'MEDIUM'),
+        ('anesthesia', '마취방법명', True, 'MEDIUM'),
+    )),
+    ('pathology', '병리', '병리 데이터', '조직검사, 세포검사 등 병리 검사 결과', (
+        ('id', '대체번호', True, 'HIGH'),
+        ('visitTime', '외래/입원일시', True, 'HIGH'),
+        ('deptCode', '진료과', False, 'LOW'),
+        ('deptName', '진료과명', True, 'LOW'),
+        ('birth', '생년월일', False, 'HIGH'),
+        ('gender', '성별', False, 'MEDIUM'),
+        ('height', '신장', False, 'MEDIUM'),
+        ('weight', '체중', False, 'MEDIUM'),
+        ('bmi', 'BMI', False, 'MEDIUM'),
+        ('pathType', '병리구분', False, 'LOW'),
+        ('pathTypeName', '병리구분명', True, 'LOW'),
+        ('prescCode', '처방코드', False, 'MEDIUM'),
+        ('prescName', '처방명', True, 'MEDIUM'),
+        ('pathFindings', '병리소견', True, 'MEDIUM'),
+        ('pathFindings2', '병리소견2', False, 'MEDIUM'),
+        ('grossFindings', 'GROSS소견', False, 'MEDIUM'),
+        ('grossFindings2', 'GROSS소견2', False, 'MEDIUM'),
+        ('receiveTime', '접수일시', False, 'HIGH'),
+        ('reportTime', '보고일시', True, 'HIGH'),
+    )),
+)
+
+
+def upgrade() -> None:
+    op.create_table('catalog_datasets',
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('sort_order', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+    sa.Column('id', UUIDKey(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('dcyn', sa.String(length=1), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('key')
+    )
+    op.create_table('catalog_columns',
+    sa.Column('dataset_id', UUIDKey(), nullable=False),
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('label', sa.String(), nullable=False),
+    sa.Column('default_selected', sa.Boolean(), nullable=False),
+    sa.Column('sensitivity', sa.Enum(*SENSITIVITY_LEVELS, name='sensitivitylevel'), nullable=False),
+    sa.Column('sort_order', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+    sa.Column('id', UUIDKey(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('dcyn', sa.String(length=1), nullable=False),
+    sa.ForeignKeyConstraint(['dataset_id'], ['catalog_datasets.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_catalog_columns_dataset_key', 'catalog_columns', ['dataset_id', 'key'], unique=True)
+
+    with op.batch_alter_table('applications') as batch_op:
+        batch_op.add_column(sa.Column('requested_columns', sa.JSON(), nullable=True))
+
+    # 초기 데이터
+    now = datetime.now(timezone(timedelta(hours=9))).replace(tzinfo=None)
+    common = {'version': 1, 'created_at': now, 'updated_at': now, 'dcyn': 'N'}
+    datasets = []
+    columns = []
+    for dataset_order, (key, name, title, description, dataset_columns) in enumerate(DATASETS):
+        dataset_id = new_id()
+        datasets.append({'id': dataset_id, 'key': key, 'name': name, 'title': title,
+                         'description': description, 'sort_order': dataset_order, **common})
+        for column_order, (column_key, label, default_selected, sensitivity) in enumerate(dataset_columns):
+            columns.append({'id': new_id(), 'dataset_id': dataset_id, 'key': column_key, 'label': label,
+                            'default_selected': default_selected, 'sensitivity': sensitivity,
+                            'sort_order': column_order, **common})
+
+    def common_columns():
+        return (
+            sa.column('id', UUIDKey()), sa.column('sort_order', sa.Integer()), sa.column('version', sa.Integer()),
+            sa.column('created_at', sa.DateTime()), sa.column('updated_at', sa.DateTime()), sa.column('dcyn', sa.String()),
+        )
+
+    op.bulk_insert(sa.table(
+        'catalog_datasets',
+        sa.column('key', sa.String()), sa.column('name', sa.String()), sa.column('title', sa.String()),
+        sa.column('description', sa.Text()), *common_columns(),
+    ), datasets)
+    op.bulk_insert(sa.table(
+        'catalog_columns',
+        sa.column('dataset_id', UUIDKey()), sa.column('key', sa.String()), sa.column('label', sa.String()),
+        sa.column('default_selected', sa.Boolean()), sa.column('sensitivity', sa.String()), *common_columns(),
+    ), columns)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('applications') as batch_op:
+        batch_op.drop_column('requested_columns')
+    op.drop_index('ix_catalog_columns_dataset_key', table_name='catalog_columns')
+    op.drop_table('catalog_columns')
+    op.drop_table('catalog_datasets')
+    sa.Enum(name='sensitivitylevel').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,57 @@
+"""extractions
+
+정형 추출 실행 기록과 진행률 (extractions)
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19 12:00:11
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.ids import UUIDKey
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('extractions',
+    sa.Column('application_id', UUIDKey(), nullable=False),
+    sa.Column('requested_by', UUIDKey(), nullable=False),
+    sa.Column('job_id', UUIDKey(), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'SUCCEEDED', 'FAILED', name='extractionstatus'), nullable=False),
+    sa.Column('columns', sa.JSON(), nullable=False),
+    sa.Column('cohort', sa.JSON(), nullable=False),
+    sa.Column('progress', sa.Float(), nullable=False),
+    sa.Column('rows_total', sa.Integer(), nullable=False),
+    sa.Column('rows_scanned', sa.Integer(), nullable=False),
+    sa.Column('rows_written', sa.Integer(), nullable=False),
+    sa.Column('cohort_size', sa.Integer(), nullable=True),
+    sa.Column('file_path', sa.String(), nullable=True),
+    sa.Column('file_size', sa.Integer(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('id', UUIDKey(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('dcyn', sa.String(length=1), nullable=False),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ),
+    sa.ForeignKeyConstraint(['requested_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_extractions_application_created', 'extractions', ['application_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_extractions_application_created', table_name='extractions')
+    op.drop_table('extractions')
+    sa.Enum(name='extractionstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,30 @@
+"""extraction pseudonymization
+
+정형 추출 결과 가명화 규칙 (extractions.pseudonymization)
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-19 12:00:12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013'
+down_revision: Union[str, None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('extractions') as batch_op:
+        batch_op.add_column(sa.Column('pseudonymization', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('extractions') as batch_op:
+        batch_op.drop_column('pseudonymization')
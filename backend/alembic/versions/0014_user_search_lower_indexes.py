@@ -0,0 +1,63 @@
+"""user search lower indexes
+
+관리자 사용자 검색(/api/admin/users/search)의 대소문자 무시 검색용 인덱스.
+
+- 접두어 검색: lower(컬럼) 표현식 인덱스 (SQLite, PostgreSQL 공통)
+- 부분 일치 검색: PostgreSQL 은 pg_trgm GIN 인덱스 (확장을 만들 권한이 없으면 건너뜀),
+  SQLite 는 인덱스 없이 훑음 (검색어 최소 길이로 제한, app.api.admin.CONTAINS_MIN_LENGTH)
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-19 12:00:13
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0014'
+down_revision: Union[str, None] = '0013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ['name', 'email', 'department', 'position']
+
+
+def _create_trigram_indexes(bind) -> None:
+    try:
+        with bind.begin_nested():
+            bind.execute(sa.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    except sa.exc.DBAPIError:
+        logger.warning("pg_trgm 확장을 만들 수 없어 사용자 부분 일치 검색 인덱스를 건너뜁니다")
+        return
+    for column in COLUMNS:
+        op.execute(
+            f'CREATE INDEX IF NOT EXISTS ix_users_{column}_trgm ON users USING gin (lower("{column}") gin_trgm_ops)'
+        )
+
+
+def create_lower_indexes() -> None:
+    """lower(컬럼) 인덱스 생성 (리플렉션은 표현식 인덱스를 건너뛰므로 IF NOT EXISTS 로 중복 방지)"""
+    for column in COLUMNS:
+        op.execute(f'CREATE INDEX IF NOT EXISTS ix_users_{column}_lower ON users (lower("{column}"))')
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    create_lower_indexes()
+    if bind.dialect.name == 'postgresql':
+        _create_trigram_indexes(bind)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for column in reversed(COLUMNS):
+            op.execute(f'DROP INDEX IF EXISTS ix_users_{column}_trgm')
+    for column in reversed(COLUMNS):
+        op.drop_index(f'ix_users_{column}_lower', table_name='users')
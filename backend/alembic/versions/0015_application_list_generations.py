@@ -0,0 +1,51 @@
+"""application list generations
+
+연구자 신청서 목록 응답 캐시 세대를 users.applications_generation 에서 별도 테이블로 이동
+(신청서 쓰기마다 소유자의 users 행을 UPDATE 하던 잠금 경합 제거, app.services.application_cache)
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-19 12:00:14
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.ids import UUIDKey
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0015'
+down_revision: Union[str, None] = '0014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 0014 의 사용자 검색 인덱스 (SQLite batch 모드는 테이블을 다시 만들 때 표현식 인덱스를 옮기지 못함)
+LOWER_INDEX_COLUMNS = ['name', 'email', 'department', 'position']
+
+
+def upgrade() -> None:
+    op.create_table(
+        'application_list_generations',
+        sa.Column('user_id', UUIDKey(), sa.ForeignKey('users.id'), primary_key=True),
+        sa.Column('generation', sa.Integer(), nullable=False),
+    )
+    op.execute(
+        'INSERT INTO application_list_generations (user_id, generation) '
+        'SELECT id, applications_generation FROM users WHERE applications_generation > 0'
+    )
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('applications_generation')
+    for column in LOWER_INDEX_COLUMNS:
+        op.execute(f'CREATE INDEX IF NOT EXISTS ix_users_{column}_lower ON users (lower("{column}"))')
+
+
+def downgrade() -> None:
+    op.add_column('users', sa.Column('applications_generation', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        'UPDATE users SET applications_generation = COALESCE((SELECT generation FROM application_list_generations '
+        'WHERE application_list_generations.user_id = users.id), 0)'
+    )
+    op.drop_table('application_list_generations')
@@ -0,0 +1,62 @@
+"""filename backup uuid key
+
+application_filename_backup.application_id 를 applications.id 와 같은 UUIDKey 로 변경
+(0010 에서 빠져 문자열로 남아 있어 백업에서 원본 파일명을 복원하는 UPDATE ... FROM 이
+SQLite 에서는 0건, PostgreSQL 에서는 varchar = uuid 비교 오류가 됨)
+
+이미 저장된 백업 행은 문자열 UUID 이므로 0010 과 같은 방식으로 값을 변환합니다.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-19 12:00:15
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0016'
+down_revision: Union[str, None] = '0015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = 'application_filename_backup'
+COLUMN = 'application_id'
+
+
+def _uuid_bytes(value):
+    if value is None or isinstance(value, bytes):
+        return value
+    return uuid.UUID(value).bytes
+
+
+def _uuid_text(value):
+    if value is None or isinstance(value, str):
+        return value
+    return str(uuid.UUID(bytes=bytes(value)))
+
+
+def _convert_sqlite(function, from_type, to_type) -> None:
+    conn = op.get_bind()
+    conn.connection.dbapi_connection.create_function('convert_key', 1, function)
+    conn.execute(sa.text(f'UPDATE {TABLE} SET {COLUMN} = convert_key({COLUMN})'))
+    with op.batch_alter_table(TABLE, recreate='always') as batch_op:
+        batch_op.alter_column(COLUMN, type_=to_type, existing_type=from_type, existing_nullable=False)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(f'ALTER TABLE {TABLE} ALTER COLUMN {COLUMN} TYPE uuid USING {COLUMN}::uuid')
+    else:
+        _convert_sqlite(_uuid_bytes, sa.String(), sa.LargeBinary(16))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(f'ALTER TABLE {TABLE} ALTER COLUMN {COLUMN} TYPE varchar USING {COLUMN}::varchar')
+    else:
+        _convert_sqlite(_uuid_text, sa.LargeBinary(16), sa.String())
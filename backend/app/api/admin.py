@@ -1,20 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from typing import List
+from sqlalchemy import select, update, insert, func, and_, or_, literal
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
+import base64
 
+from app.db.base import get_korean_time
+from app.db.functions import days_between
+from app.db.ids import new_id
 from app.db.session import get_db
 from app.core.deps import get_current_admin_user
+from app.core.events import queue_log_rows
+from app.core.etag import check_if_match, get_if_match_versions, is_not_modified, make_etag, not_modified_response, weak_etag
 from app.models import User, UserRole, Application, ApplicationStatus, ApplicationLog, LogAction
-from app.schemas.user import User as UserSchema, UserUpdate
+from app.models.application import ServiceType, service_types_from_mask
+from app.schemas.user import User as UserSchema, UserUpdate, UserSearchResponse
 from app.schemas.application import ApplicationDelete
+from app.schemas.bulk import (
+    UserBulkAction,
+    ApplicationBulkStatusUpdate,
+    ApplicationBulkDelete,
+    BulkItemResult,
+    BulkOperationResult
+)
+from app.services import workflow
+from app.services.application_cache import invalidate_application_lists
+from app.services.workflow import WorkflowEvent
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
 
 @router.get("/users", response_model=List[UserSchema])
 async def get_users(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(get_current_admin_user),
@@ -28,13 +47,121 @@ async def get_users(
         .order_by(User.created_at.desc())
     )
     users = result.scalars().all()
+    
+    # last_login_at 은 version 을 올리지 않고 기록되므로 목록 ETag 에는 따로 포함
+    etag = weak_etag(f"{user.id}:{user.version}:{user.last_login_at}" for user in users)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
     return users
 
 
+# 사용자 검색 대상 컬럼 (모두 lower(컬럼) 표현식 인덱스가 걸려 있음, 0014)
+USER_SEARCH_FIELDS = ("name", "email", "department", "position")
+
+# 부분 일치 검색어 최소 길이: PostgreSQL 은 pg_trgm 인덱스를 타지만 검색어가 3자 미만이면 트라이그램이 없어
+# 인덱스 전체를 훑고, SQLite 는 인덱스 없이 테이블을 훑으므로(키셋 limit 만큼 찾으면 멈춤) 짧은 검색어는 막음
+CONTAINS_MIN_LENGTH = 3
+
+
+def _encode_user_cursor(user: User) -> str:
+    raw = f"{user.created_at.isoformat()}|{user.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_user_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, user_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), user_id
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _user_search_condition(q: str, match: str, fields: List[str]):
+    # 두 방식 모두 대소문자 구분 없음: 컬럼과 검색어를 같은 DB lower() 로 맞춤
+    columns = [func.lower(getattr(User, field)) for field in fields]
+    needle = func.lower(q)
+    if match == "prefix":
+        # LIKE 'q%' 는 SQLite에서 인덱스를 타지 못하므로 lower(컬럼) 인덱스의 범위 조건으로 변환
+        upper = needle.concat("\U0010ffff")
+        return or_(*[and_(column >= needle, column < upper) for column in columns])
+    escaped = q.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    pattern = literal("%").concat(func.lower(escaped)).concat("%")
+    return or_(*[column.like(pattern, escape="/") for column in columns])
+
+
+@router.get("/users/search", response_model=UserSearchResponse)
+async def search_users(
+    q: Optional[str] = Query(None, min_length=1, max_length=100, description="검색어"),
+    match: str = Query(
+        "prefix",
+        pattern="^(prefix|contains)$",
+        description=f"prefix: 접두어 일치, contains: 부분 일치 (검색어 {CONTAINS_MIN_LENGTH}자 이상), 모두 대소문자 무시",
+    ),
+    fields: Optional[List[str]] = Query(None, description="검색 대상 컬럼 (name, email, department, position)"),
+    role: Optional[UserRole] = Query(None),
+    is_active: Optional[bool] = Query(None),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """사용자 검색 (키셋 페이지네이션)"""
+    search_fields = fields or list(USER_SEARCH_FIELDS)
+    invalid_fields = [field for field in search_fields if field not in USER_SEARCH_FIELDS]
+    if invalid_fields:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid search fields: {', '.join(invalid_fields)}"
+        )
+    if q and match == "contains" and len(q) < CONTAINS_MIN_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Substring search requires at least {CONTAINS_MIN_LENGTH} characters"
+        )
+    
+    query = select(User).where(User.dcyn == 'N')
+    
+    if q:
+        query = query.where(_user_search_condition(q, match, search_fields))
+    if role is not None:
+        query = query.where(User.role == role)
+    if is_active is not None:
+        query = query.where(User.is_active == is_active)
+    
+    if cursor:
+        cursor_created_at, cursor_id = _decode_user_cursor(cursor)
+        query = query.where(
+            or_(
+                User.created_at < cursor_created_at,
+                and_(User.created_at == cursor_created_at, User.id < cursor_id)
+            )
+        )
+    
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    query = query.order_by(User.created_at.desc(), User.id.desc()).limit(limit + 1)
+    
+    result = await db.execute(query)
+    users = result.scalars().all()
+    
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        next_cursor = _encode_user_cursor(users[-1])
+    
+    return UserSearchResponse(items=users, next_cursor=next_cursor)
+
+
 @router.put("/users/{user_id}", response_model=UserSchema)
 async def update_user(
     user_id: str,
     user_update: UserUpdate,
+    response: Response,
+    expected_versions: Optional[List[int]] = Depends(get_if_match_versions),
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -54,6 +181,8 @@ async def update_user(
             detail="User not found"
         )
     
+    check_if_match(user.version, expected_versions)
+    
     update_data = user_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         if field == "password" and value:
@@ -65,9 +194,11 @@ async def update_user(
         else:
             setattr(user, field, value)
     
+    # 동시 수정은 version_id_col 검사로 StaleDataError(412) 발생
     await db.commit()
     await db.refresh(user)
     
+    response.headers["ETag"] = make_etag(user.version)
     return user
 
 
@@ -110,6 +241,8 @@ async def delete_user(
 @router.post("/users/{user_id}/toggle-active", response_model=UserSchema)
 async def toggle_user_active(
     user_id: str,
+    response: Response,
+    expected_versions: Optional[List[int]] = Depends(get_if_match_versions),
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -135,37 +268,137 @@ async def toggle_user_active(
             detail="User not found"
         )
     
+    check_if_match(user.version, expected_versions)
+    
     user.is_active = not user.is_active
     await db.commit()
     await db.refresh(user)
     
+    response.headers["ETag"] = make_etag(user.version)
     return user
 
 
+def _unique_ids(ids: List[str]) -> List[str]:
+    """요청 순서를 유지하면서 중복 ID 제거"""
+    return list(dict.fromkeys(ids))
+
+
+def _bulk_result(results: List[BulkItemResult]) -> BulkOperationResult:
+    succeeded = sum(1 for item in results if item.success)
+    return BulkOperationResult(
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results
+    )
+
+
+@router.post("/users/bulk", response_model=BulkOperationResult)
+async def bulk_update_users(
+    bulk_request: UserBulkAction,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """사용자 일괄 활성화/비활성화/삭제 (단일 트랜잭션)"""
+    user_ids = _unique_ids(bulk_request.user_ids)
+    
+    result = await db.execute(
+        select(User.id).where(
+            and_(
+                User.id.in_(user_ids),
+                User.dcyn == 'N'
+            )
+        )
+    )
+    existing_ids = set(result.scalars().all())
+    
+    results_by_id = {}
+    target_ids = []
+    for user_id in user_ids:
+        if user_id == current_user.id:
+            results_by_id[user_id] = BulkItemResult(id=user_id, success=False, detail="Cannot modify yourself")
+        elif user_id not in existing_ids:
+            results_by_id[user_id] = BulkItemResult(id=user_id, success=False, detail="User not found")
+        else:
+            target_ids.append(user_id)
+    
+    if target_ids:
+        if bulk_request.action == "activate":
+            values = {"is_active": True}
+        elif bulk_request.action == "deactivate":
+            values = {"is_active": False}
+        else:
+            # Soft delete 적용 (비활성화도 함께 처리)
+            values = {"dcyn": 'Y', "is_active": False}
+        
+        # 조회 이후 삭제된 사용자는 조건에 걸려 빠지므로 RETURNING 으로 실제로 바뀐 행만 성공 처리
+        updated = await db.execute(
+            update(User)
+            .where(
+                and_(
+                    User.id.in_(target_ids),
+                    User.dcyn == 'N'
+                )
+            )
+            .values(**values, version=User.version + 1)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated_ids = set(updated.scalars())
+        await db.commit()
+        
+        for user_id in target_ids:
+            if user_id in updated_ids:
+                results_by_id[user_id] = BulkItemResult(id=user_id, success=True)
+            else:
+                results_by_id[user_id] = BulkItemResult(
+                    id=user_id,
+                    success=False,
+                    detail="User was modified concurrently"
+                )
+    
+    results = [results_by_id[user_id] for user_id in user_ids]
+    return _bulk_result(results)
+
+
 @router.get("/statistics")
 async def get_statistics(
+    request: Request,
+    response: Response,
+    service_type: Optional[ServiceType] = Query(None, description="해당 서비스 유형을 포함하는 신청서만 집계"),
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
     today = datetime.utcnow().date()
     thirty_days_ago = today - timedelta(days=30)
     six_months_ago = today - timedelta(days=180)
+    # 신청서 집계에 공통으로 적용할 조건
+    application_filters = [Application.has_service_type(service_type)] if service_type else []
     
     total_users = await db.execute(select(func.count(User.id)))
     active_users = await db.execute(
         select(func.count(User.id)).where(User.is_active == True)
     )
     
-    total_applications = await db.execute(select(func.count(Application.id)))
-    
-    status_counts = await db.execute(
-        select(Application.status, func.count(Application.id))
-        .group_by(Application.status)
+    # 전체 / 상태별 / 서비스 유형별 신청 수를 (상태, 유형 마스크) 그룹 한 번으로 집계
+    # (한 신청서가 여러 유형에 포함될 수 있으므로 유형별 합계는 전체 수보다 클 수 있음)
+    group_counts = await db.execute(
+        select(Application.status, Application.service_types_mask, func.count(Application.id))
+        .where(*application_filters)
+        .group_by(Application.status, Application.service_types_mask)
     )
+    total_applications = 0
+    status_dict = {}
+    service_type_breakdown = {service_type.value: 0 for service_type in ServiceType}
+    for application_status, mask, count in group_counts:
+        total_applications += count
+        status_key = application_status.value if hasattr(application_status, 'value') else application_status
+        status_dict[status_key] = status_dict.get(status_key, 0) + count
+        for mask_service_type in service_types_from_mask(mask):
+            service_type_breakdown[mask_service_type.value] += count
     
     recent_applications = await db.execute(
         select(func.count(Application.id))
-        .where(Application.created_at >= thirty_days_ago)
+        .where(Application.created_at >= thirty_days_ago, *application_filters)
     )
     
     # 월별 신청 통계 (최근 6개월)
@@ -176,19 +409,17 @@ async def get_statistics(
             extract('month', Application.created_at).label('month'),
             func.count(Application.id).label('count')
         )
-        .where(Application.created_at >= six_months_ago)
+        .where(Application.created_at >= six_months_ago, *application_filters)
         .group_by('year', 'month')
         .order_by('year', 'month')
     )
     
     monthly_data = [
-        {"year": year, "month": month, "count": count}
+        # PostgreSQL 의 EXTRACT 는 numeric 을 반환하므로 정수로 맞춤
+        {"year": int(year), "month": int(month), "count": count}
         for year, month, count in monthly_stats
     ]
     
-    status_dict = {status.value if hasattr(status, 'value') else status: count 
-                   for status, count in status_counts}
-    
     approved_count = status_dict.get(ApplicationStatus.APPROVED.value, 0)
     rejected_count = status_dict.get(ApplicationStatus.REJECTED.value, 0)
     total_reviewed = approved_count + rejected_count
@@ -198,29 +429,35 @@ async def get_statistics(
     # 평균 처리 시간 계산 (승인된 신청서 기준)
     avg_processing_time = await db.execute(
         select(
-            func.avg(
-                func.julianday(Application.reviewed_at) - 
-                func.julianday(Application.submitted_at)
-            )
+            func.avg(days_between(Application.reviewed_at, Application.submitted_at))
         )
         .where(Application.status == ApplicationStatus.APPROVED)
         .where(Application.reviewed_at.isnot(None))
         .where(Application.submitted_at.isnot(None))
+        .where(*application_filters)
     )
-    avg_time = avg_processing_time.scalar() or 0
+    avg_time = float(avg_processing_time.scalar() or 0)
     
-    return {
+    statistics = {
         "total_users": total_users.scalar(),
         "active_users": active_users.scalar(),
-        "total_applications": total_applications.scalar(),
+        "total_applications": total_applications,
         "recent_applications": recent_applications.scalar(),
         "status_breakdown": status_dict,
+        "service_type_breakdown": service_type_breakdown,
         "approval_rate": round(approval_rate, 2),
         "pending_review": status_dict.get(ApplicationStatus.SUBMITTED.value, 0) + 
                          status_dict.get(ApplicationStatus.UNDER_REVIEW.value, 0),
         "monthly_statistics": monthly_data,
         "average_processing_days": round(avg_time, 1)
     }
+    
+    # 대시보드 폴링 시 변경이 없으면 본문 없이 304 응답
+    etag = weak_etag(sorted((key, repr(value)) for key, value in statistics.items()))
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+    return statistics
 
 
 @router.delete("/applications/{application_id}")
@@ -259,11 +496,197 @@ async def delete_application(
         application_id=application_id,
         user_id=current_user.id,
         action=LogAction.DELETED,
-        reason=delete_request.reason,
-        created_at=datetime.utcnow()
+        reason=delete_request.reason
     )
     db.add(log)
+    await invalidate_application_lists(db, user_ids=[application.user_id])
     
     await db.commit()
     
-    return {"message": "Application deleted successfully"}
\ No newline at end of file
+    return {"message": "Application deleted successfully"}
+
+
+@router.post("/applications/bulk-status", response_model=BulkOperationResult)
+async def bulk_update_application_status(
+    bulk_request: ApplicationBulkStatusUpdate,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """신청서 상태 일괄 변경 (단일 상태 변경과 동일한 전이 규칙 적용)"""
+    application_ids = _unique_ids(bulk_request.application_ids)
+    new_status = bulk_request.status
+    allowed = workflow.allowed_sources(WorkflowEvent.PROGRESS, new_status)
+    
+    result = await db.execute(
+        select(Application.id, Application.status).where(
+            and_(
+                Application.id.in_(application_ids),
+                Application.dcyn == 'N'
+            )
+        )
+    )
+    current_statuses = {application_id: current_status for application_id, current_status in result}
+    
+    results_by_id = {}
+    target_ids = []
+    for application_id in application_ids:
+        current_status = current_statuses.get(application_id)
+        if current_status is None:
+            results_by_id[application_id] = BulkItemResult(id=application_id, success=False, detail="Application not found")
+        elif current_status not in allowed:
+            results_by_id[application_id] = BulkItemResult(
+                id=application_id,
+                success=False,
+                detail=f"Invalid status transition from {current_status} to {new_status.value}"
+            )
+        else:
+            target_ids.append(application_id)
+    
+    # 허용 상태별로 상태 조건부 UPDATE 를 수행하고 RETURNING 으로 실제로 바뀐 행만 받음
+    # (조회 이후 다른 요청이 상태를 바꾼 행은 조건에 걸려 빠지므로 충돌로 보고, 로그/이벤트도 남기지 않음)
+    old_statuses = {}
+    values = workflow.transition_values(WorkflowEvent.PROGRESS, new_status, current_user)
+    for old_status in workflow.ordered_sources({current_statuses[application_id] for application_id in target_ids}):
+        pending_ids = [application_id for application_id in target_ids if application_id not in old_statuses]
+        updated = await db.execute(
+            update(Application)
+            .where(
+                and_(
+                    Application.id.in_(pending_ids),
+                    Application.status == old_status,
+                    Application.dcyn == 'N'
+                )
+            )
+            .values(**values, version=Application.version + 1)
+            .returning(Application.id)
+            .execution_options(synchronize_session=False)
+        )
+        old_statuses.update((application_id, old_status) for application_id in updated.scalars())
+    
+    for application_id in target_ids:
+        if application_id in old_statuses:
+            results_by_id[application_id] = BulkItemResult(id=application_id, success=True)
+        else:
+            results_by_id[application_id] = BulkItemResult(
+                id=application_id,
+                success=False,
+                detail="Application was modified concurrently"
+            )
+    
+    if old_statuses:
+        # 로그 일괄 기록 (이벤트 발행을 위해 id/created_at 을 미리 생성)
+        log_action = workflow.log_action_for(WorkflowEvent.PROGRESS, new_status)
+        logged_at = get_korean_time()
+        log_rows = [
+            {
+                "id": new_id(),
+                "application_id": application_id,
+                "user_id": current_user.id,
+                "action": log_action,
+                "details": {
+                    "old_status": old_status.value,
+                    "new_status": new_status.value,
+                    "changed_by_admin": True,
+                    "bulk": True
+                },
+                "created_at": logged_at
+            }
+            for application_id, old_status in old_statuses.items()
+        ]
+        await db.execute(insert(ApplicationLog), log_rows)
+        queue_log_rows(db, log_rows)
+        await invalidate_application_lists(db, application_ids=list(old_statuses))
+        await db.commit()
+    
+    results = [results_by_id[application_id] for application_id in application_ids]
+    return _bulk_result(results)
+
+
+@router.post("/applications/bulk-delete", response_model=BulkOperationResult)
+async def bulk_delete_applications(
+    bulk_request: ApplicationBulkDelete,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """신청서 일괄 삭제 (Soft Delete, 단일 트랜잭션)"""
+    application_ids = _unique_ids(bulk_request.application_ids)
+    
+    result = await db.execute(
+        select(Application.id).where(
+            and_(
+                Application.id.in_(application_ids),
+                Application.dcyn == 'N'  # 이미 삭제되지 않은 신청서만
+            )
+        )
+    )
+    existing_ids = set(result.scalars().all())
+    
+    results_by_id = {}
+    target_ids = []
+    for application_id in application_ids:
+        if application_id in existing_ids:
+            target_ids.append(application_id)
+        else:
+            results_by_id[application_id] = BulkItemResult(
+                id=application_id,
+                success=False,
+                detail="Application not found"
+            )
+    
+    deleted_ids = set()
+    if target_ids:
+        # 삭제되지 않은 행만 조건부로 삭제하고 RETURNING 으로 실제로 삭제한 행만 받음
+        # (조회 이후 다른 요청이 삭제한 행은 삭제 정보를 덮어쓰지 않고 충돌로 보고, 로그/이벤트도 남기지 않음)
+        deleted_at = datetime.utcnow()
+        deleted = await db.execute(
+            update(Application)
+            .where(
+                and_(
+                    Application.id.in_(target_ids),
+                    Application.dcyn == 'N'
+                )
+            )
+            .values(
+                dcyn='Y',
+                deleted_at=deleted_at,
+                deleted_by=current_user.id,
+                deletion_reason=bulk_request.reason,
+                version=Application.version + 1
+            )
+            .returning(Application.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted_ids.update(deleted.scalars())
+    
+    for application_id in target_ids:
+        if application_id in deleted_ids:
+            results_by_id[application_id] = BulkItemResult(id=application_id, success=True)
+        else:
+            results_by_id[application_id] = BulkItemResult(
+                id=application_id,
+                success=False,
+                detail="Application was modified concurrently"
+            )
+    
+    if deleted_ids:
+        # 로그 일괄 기록 (이벤트 발행을 위해 id 를 미리 생성)
+        # 이벤트 재접속이 (created_at, id) 순서에 의존하므로 다른 로그와 같은 기준(KST)으로 기록
+        logged_at = get_korean_time()
+        log_rows = [
+            {
+                "id": new_id(),
+                "application_id": application_id,
+                "user_id": current_user.id,
+                "action": LogAction.DELETED,
+                "reason": bulk_request.reason,
+                "created_at": logged_at
+            }
+            for application_id in target_ids if application_id in deleted_ids
+        ]
+        await db.execute(insert(ApplicationLog), log_rows)
+        queue_log_rows(db, log_rows)
+        await invalidate_application_lists(db, application_ids=list(deleted_ids))
+        await db.commit()
+    
+    results = [results_by_id[application_id] for application_id in application_ids]
+    return _bulk_result(results)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Request, Response
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
@@ -11,7 +11,18 @@ from pathlib import Path
 
 from app.db.session import get_db
 from app.core.deps import get_current_user, get_current_admin_user
+from app.core.etag import get_if_match_versions, is_not_modified, make_etag, not_modified_response, weak_etag
 from app.models import User, Application, ApplicationStatus, ApplicationLog, LogAction
+from app.models.application import ServiceType
+from app.services import workflow
+from app.services.application_cache import (
+    application_list_cache,
+    invalidate_application_lists,
+    list_cache_key,
+    serialize_applications,
+)
+from app.services.catalog import ensure_catalog_columns
+from app.services.workflow import WorkflowEvent
 from app.schemas.application import (
     ApplicationCreate,
     ApplicationUpdate,
@@ -105,13 +116,26 @@ def save_uploaded_file(file: UploadFile, application_id: str, file_type: str) ->
 
 @router.get("/", response_model=List[ApplicationSchema])
 async def get_applications(
+    request: Request,
+    response: Response,
     status: Optional[ApplicationStatus] = Query(None),
+    service_type: Optional[ServiceType] = Query(None, description="해당 서비스 유형을 포함하는 신청서만"),
     include_deleted: bool = Query(False, description="삭제된 항목도 포함 (관리자 전용)"),
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
+    # 연구자 목록은 본인 신청서가 바뀌기 전까지 직렬화된 응답을 재사용 (세대 카운터로 무효화)
+    cache_key = list_cache_key(current_user, status, service_type, skip, limit)
+    generation = current_user.applications_generation
+    if cache_key is not None:
+        cached = application_list_cache.get(cache_key, generation)
+        if cached is not None:
+            if is_not_modified(request, cached.etag):
+                return not_modified_response(cached.etag)
+            return cached.to_response()
+    
     # 기본적으로 삭제되지 않은 항목만 조회
     if include_deleted and current_user.role.value == "ADMIN":
         # 관리자이고 include_deleted가 True인 경우 모든 항목 조회
@@ -126,11 +150,24 @@ async def get_applications(
     if status:
         query = query.where(Application.status == status)
     
+    if service_type:
+        query = query.where(Application.has_service_type(service_type))
+    
     query = query.offset(skip).limit(limit).order_by(Application.created_at.desc())
     
     result = await db.execute(query)
     applications = result.scalars().all()
     
+    # 폴링하는 대시보드는 목록이 바뀌지 않았으면 본문 없이 304 응답
+    etag = weak_etag(f"{application.id}:{application.version}" for application in applications)
+    if cache_key is not None:
+        cached = application_list_cache.put(cache_key, generation, serialize_applications(applications), etag)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        return cached.to_response()
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
     return applications
 
 
@@ -140,6 +177,8 @@ async def create_application(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
+    await ensure_catalog_columns(db, application_in.requested_columns)
+    
     # 신청 시점의 사용자 정보 저장
     application_data = application_in.dict()
     application_data.update({
@@ -155,6 +194,7 @@ async def create_application(
     application = Application(**application_data)
     
     db.add(application)
+    await invalidate_application_lists(db, user_ids=[current_user.id])
     await db.commit()
     await db.refresh(application)
     
@@ -172,6 +212,8 @@ async def create_application(
 @router.get("/{application_id}", response_model=ApplicationWithUser)
 async def get_application(
     application_id: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -205,11 +247,13 @@ async def get_application(
     )
     user = result.scalar_one()
     
-    response = ApplicationWithUser(
+    application_response = ApplicationWithUser(
         **application.__dict__,
         user_name=user.name,
         user_email=user.email
     )
+    # 신청서 version + 응답에 포함된 사용자 정보의 version
+    versions = [application.version, user.version]
     
     if application.reviewed_by:
         result = await db.execute(
@@ -222,98 +266,67 @@ async def get_application(
         )
         reviewer = result.scalar_one_or_none()
         if reviewer:
-            response.reviewer_name = reviewer.name
-    
-    return response
+            application_response.reviewer_name = reviewer.name
+            versions.append(reviewer.version)
+    
+    etag = make_etag(*versions)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+    return application_response
 
 
 @router.put("/{application_id}", response_model=ApplicationSchema)
 async def update_application(
     application_id: str,
     application_update: ApplicationUpdate,
+    response: Response,
+    expected_versions: Optional[List[int]] = Depends(get_if_match_versions),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(
-        select(Application).where(
-            and_(
-                Application.id == application_id,
-                Application.user_id == current_user.id
-            )
-        )
+    await ensure_catalog_columns(db, application_update.requested_columns)
+    
+    # 상태 확인과 수정을 조건부 UPDATE 한 번으로 처리
+    application = await workflow.update_editable(
+        db,
+        application_id,
+        current_user,
+        application_update.dict(exclude_unset=True),
+        error_detail="Cannot update application in current status",
+        expected_versions=expected_versions
     )
-    application = result.scalar_one_or_none()
-    
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found"
-        )
-    
-    if application.status not in [ApplicationStatus.DRAFT, ApplicationStatus.REVISION_REQUESTED]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot update application in current status"
-        )
-    
-    update_data = application_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(application, field, value)
-    
-    log = ApplicationLog(
-        application_id=application.id,
-        user_id=current_user.id,
-        action=LogAction.UPDATED
-    )
-    db.add(log)
+    await invalidate_application_lists(db, user_ids=[application.user_id])
     
     await db.commit()
-    await db.refresh(application)
     
+    response.headers["ETag"] = make_etag(application.version)
     return application
 
 
 @router.post("/{application_id}/submit", response_model=ApplicationSchema)
 async def submit_application(
     application_id: str,
+    response: Response,
+    expected_versions: Optional[List[int]] = Depends(get_if_match_versions),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(
-        select(Application).where(
-            and_(
-                Application.id == application_id,
-                Application.user_id == current_user.id
-            )
-        )
+    application = await workflow.apply_transition(
+        db,
+        application_id,
+        WorkflowEvent.SUBMIT,
+        ApplicationStatus.SUBMITTED,
+        current_user,
+        owner_id=current_user.id,
+        error_detail="Cannot submit application in current status",
+        expected_versions=expected_versions
     )
-    application = result.scalar_one_or_none()
-    
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found"
-        )
-    
-    if application.status not in [ApplicationStatus.DRAFT, ApplicationStatus.REVISION_REQUESTED]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot submit application in current status"
-        )
-    
-    application.status = ApplicationStatus.SUBMITTED
-    application.submitted_at = get_korean_time()
-    
-    log = ApplicationLog(
-        application_id=application.id,
-        user_id=current_user.id,
-        action=LogAction.SUBMITTED
-    )
-    db.add(log)
+    await invalidate_application_lists(db, user_ids=[application.user_id])
     
     await db.commit()
-    await db.refresh(application)
     
+    response.headers["ETag"] = make_etag(application.version)
     return application
 
 
@@ -321,50 +334,34 @@ async def submit_application(
 async def review_application(
     application_id: str,
     review: ApplicationReview,
+    response: Response,
+    expected_versions: Optional[List[int]] = Depends(get_if_match_versions),
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Application).where(Application.id == application_id))
-    application = result.scalar_one_or_none()
-    
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found"
-        )
-    
-    if application.status not in [ApplicationStatus.SUBMITTED, ApplicationStatus.UNDER_REVIEW]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot review application in current status"
-        )
-    
-    application.status = review.status
-    application.reviewed_at = get_korean_time()
-    application.reviewed_by = current_user.id
-    
+    values = {}
     if review.status == ApplicationStatus.REJECTED:
-        application.rejection_reason = review.reason
-        action = LogAction.REJECTED
+        values["rejection_reason"] = review.reason
     elif review.status == ApplicationStatus.REVISION_REQUESTED:
-        application.revision_request_reason = review.reason
-        action = LogAction.REVISION_REQUESTED
-    elif review.status == ApplicationStatus.APPROVED:
-        action = LogAction.APPROVED
-    else:
-        action = LogAction.UPDATED
-    
-    log = ApplicationLog(
-        application_id=application.id,
-        user_id=current_user.id,
-        action=action,
-        reason=review.reason
+        values["revision_request_reason"] = review.reason
+    
+    # 두 관리자가 동시에 검토해도 현재 상태 조건 때문에 한 쪽만 반영됨
+    application = await workflow.apply_transition(
+        db,
+        application_id,
+        WorkflowEvent.REVIEW,
+        review.status,
+        current_user,
+        reason=review.reason,
+        values=values,
+        error_detail="Cannot review application in current status",
+        expected_versions=expected_versions
     )
-    db.add(log)
+    await invalidate_application_lists(db, user_ids=[application.user_id])
     
     await db.commit()
-    await db.refresh(application)
     
+    response.headers["ETag"] = make_etag(application.version)
     return application
 
 # 파일 업로드 엔드포인트
@@ -372,39 +369,38 @@ async def review_application(
 async def upload_irb_document(
     application_id: str,
     file: UploadFile = File(...),
+    expected_versions: Optional[List[int]] = Depends(get_if_match_versions),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """IRB 통지서 업로드"""
-    result = await db.execute(
-        select(Application).where(
-            and_(
-                Application.id == application_id,
-                Application.user_id == current_user.id
-            )
-        )
+    # 파일 저장 전 사전 검사
+    await workflow.get_editable(
+        db,
+        application_id,
+        current_user,
+        error_detail="Cannot upload files in current status",
+        expected_versions=expected_versions
     )
-    application = result.scalar_one_or_none()
-    
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found"
-        )
-    
-    if application.status not in [ApplicationStatus.DRAFT, ApplicationStatus.REVISION_REQUESTED]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot upload files in current status"
-        )
     
     try:
         # 안전한 파일 저장
         file_info = save_uploaded_file(file, application_id, "irb")
         
-        # DB 업데이트
-        application.irb_document_path = file_info["file_path"]
-        application.irb_document_original_name = file_info["original_filename"]
+        # DB 업데이트 (그 사이 제출/검토된 경우를 막기 위해 상태 조건을 다시 적용)
+        application = await workflow.update_editable(
+            db,
+            application_id,
+            current_user,
+            {
+                "irb_document_path": file_info["file_path"],
+                "irb_document_original_name": file_info["original_filename"],
+            },
+            log=False,
+            error_detail="Cannot upload files in current status",
+            expected_versions=expected_versions
+        )
+        await invalidate_application_lists(db, user_ids=[application.user_id])
         await db.commit()
         
         return {
@@ -425,39 +421,38 @@ async def upload_irb_document(
 async def upload_research_plan(
     application_id: str,
     file: UploadFile = File(...),
+    expected_versions: Optional[List[int]] = Depends(get_if_match_versions),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """연구계획서 업로드"""
-    result = await db.execute(
-        select(Application).where(
-            and_(
-                Application.id == application_id,
-                Application.user_id == current_user.id
-            )
-        )
+    # 파일 저장 전 사전 검사
+    await workflow.get_editable(
+        db,
+        application_id,
+        current_user,
+        error_detail="Cannot upload files in current status",
+        expected_versions=expected_versions
     )
-    application = result.scalar_one_or_none()
-    
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found"
-        )
-    
-    if application.status not in [ApplicationStatus.DRAFT, ApplicationStatus.REVISION_REQUESTED]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot upload files in current status"
-        )
     
     try:
         # 안전한 파일 저장
         file_info = save_uploaded_file(file, application_id, "research_plan")
         
-        # DB 업데이트
-        application.research_plan_path = file_info["file_path"]
-        application.research_plan_original_name = file_info["original_filename"]
+        # DB 업데이트 (그 사이 제출/검토된 경우를 막기 위해 상태 조건을 다시 적용)
+        application = await workflow.update_editable(
+            db,
+            application_id,
+            current_user,
+            {
+                "research_plan_path": file_info["file_path"],
+                "research_plan_original_name": file_info["original_filename"],
+            },
+            log=False,
+            error_detail="Cannot upload files in current status",
+            expected_versions=expected_versions
+        )
+        await invalidate_application_lists(db, user_ids=[application.user_id])
         await db.commit()
         
         return {
@@ -478,54 +473,33 @@ async def upload_research_plan(
 async def delete_file(
     application_id: str,
     file_type: str,  # 'irb' or 'research-plan'
+    expected_versions: Optional[List[int]] = Depends(get_if_match_versions),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """파일 삭제 (논리 삭제)"""
-    result = await db.execute(
-        select(Application).where(
-            and_(
-                Application.id == application_id,
-                Application.user_id == current_user.id,
-                Application.dcyn == 'N'
-            )
-        )
-    )
-    application = result.scalar_one_or_none()
-    
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found"
-        )
-    
-    if application.status not in [ApplicationStatus.DRAFT, ApplicationStatus.REVISION_REQUESTED]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot delete files in current status"
-        )
-    
     # 파일 경로를 null로 설정 (물리적 파일은 유지)
     if file_type == "irb":
-        application.irb_document_path = None
-        application.irb_document_original_name = None
+        values = {"irb_document_path": None, "irb_document_original_name": None}
     elif file_type == "research-plan":
-        application.research_plan_path = None
-        application.research_plan_original_name = None
+        values = {"research_plan_path": None, "research_plan_original_name": None}
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid file type"
         )
     
-    # 로그 기록
-    log = ApplicationLog(
-        application_id=application.id,
-        user_id=current_user.id,
-        action=LogAction.UPDATED,
-        reason=f"{file_type} 파일 삭제"
+    application = await workflow.update_editable(
+        db,
+        application_id,
+        current_user,
+        values,
+        log_reason=f"{file_type} 파일 삭제",
+        error_detail="Cannot delete files in current status",
+        conditions=(Application.dcyn == 'N',),
+        expected_versions=expected_versions
     )
-    db.add(log)
+    await invalidate_application_lists(db, user_ids=[application.user_id])
     
     await db.commit()
     
@@ -606,21 +580,12 @@ async def download_file(
 async def update_application_status(
     application_id: str,
     request: dict,
+    response: Response,
+    expected_versions: Optional[List[int]] = Depends(get_if_match_versions),
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
     """신청서 상태 업데이트 (관리자만 가능)"""
-    result = await db.execute(
-        select(Application).where(Application.id == application_id)
-    )
-    application = result.scalar_one_or_none()
-    
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found"
-        )
-    
     new_status = request.get("status")
     if not new_status:
         raise HTTPException(
@@ -636,53 +601,20 @@ async def update_application_status(
             detail=f"Invalid status: {new_status}"
         )
     
-    # 현재 상태에서 변경 가능한 상태인지 검증
-    valid_transitions = {
-        ApplicationStatus.APPROVED: [ApplicationStatus.PROCESSING, ApplicationStatus.COMPLETED],
-        ApplicationStatus.PROCESSING: [ApplicationStatus.COMPLETED],
-    }
-    
-    if application.status not in valid_transitions:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot change status from {application.status}"
-        )
-    
-    if new_status_enum not in valid_transitions[application.status]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status transition from {application.status} to {new_status}"
-        )
-    
-    # 상태 변경
-    old_status = application.status
-    application.status = new_status_enum
-    
-    # 완료 시간 설정
-    if new_status_enum == ApplicationStatus.COMPLETED:
-        application.completed_at = get_korean_time()
-    
-    # 로그 기록
-    if new_status_enum == ApplicationStatus.PROCESSING:
-        log_action = LogAction.PROCESSING
-    elif new_status_enum == ApplicationStatus.COMPLETED:
-        log_action = LogAction.COMPLETED
-    else:
-        log_action = LogAction.UPDATED
-    
-    log = ApplicationLog(
-        application_id=application.id,
-        user_id=current_user.id,
-        action=log_action,
-        details={
-            "old_status": old_status.value,
-            "new_status": new_status_enum.value,
-            "changed_by_admin": True
-        }
+    # 현재 상태에서 변경 가능한 상태인지 검증과 변경을 조건부 UPDATE 한 번으로 처리
+    application = await workflow.apply_transition(
+        db,
+        application_id,
+        WorkflowEvent.PROGRESS,
+        new_status_enum,
+        current_user,
+        details={"changed_by_admin": True},
+        error_detail=lambda current: f"Invalid status transition from {current} to {new_status}",
+        expected_versions=expected_versions
     )
-    db.add(log)
+    await invalidate_application_lists(db, user_ids=[application.user_id])
     
     await db.commit()
-    await db.refresh(application)
     
+    response.headers["ETag"] = make_etag(application.version)
     return application
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from app.db.session import get_db
 from app.core.security import verify_password, get_password_hash, create_access_token, create_refresh_token, decode_token
 from app.core.deps import get_current_user
+from app.core.etag import is_not_modified, make_etag, not_modified_response
 from app.core.rate_limit import auth_limit, password_reset_limit
 from app.core.crypto import decrypt_password
 from app.models.user import User
@@ -13,6 +14,7 @@ from app.models.token import RefreshToken
 from app.schemas.user import UserCreate, UserLogin, User as UserSchema
 from app.schemas.token import Token
 from app.core.config import settings
+from app.services.login_activity import login_activity
 
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
@@ -129,7 +131,9 @@ async def login(request: Request, response: Response, user_credentials: UserLogi
             detail="Inactive user"
         )
     
-    user.last_login_at = datetime.utcnow()
+    # 마지막 로그인 시각은 모아서 주기적으로 일괄 기록 (비활성화 시 이 트랜잭션에서 바로 기록)
+    # 같은 계정의 동시 로그인끼리 version 충돌이 나지 않도록 version 검사 없이 갱신
+    await login_activity.record(db, user.id)
     
     access_token = create_access_token(data={"sub": user.id, "email": user.email, "role": user.role})
     refresh_token_str = create_refresh_token(data={"sub": user.id})
@@ -210,7 +214,11 @@ async def refresh_token(refresh_token: str, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserSchema)
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(request: Request, response: Response, current_user: User = Depends(get_current_user)):
+    etag = make_etag(current_user.version)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
     return current_user
 
 
@@ -241,7 +249,7 @@ async def request_password_reset(
     
     # Import here to avoid circular dependency
     from app.models.password_reset import PasswordResetToken
-    from app.services.email import email_service
+    from app.services.jobs import enqueue
     
     # Invalidate any existing tokens for this user
     existing_tokens = await db.execute(
@@ -259,15 +267,11 @@ async def request_password_reset(
     # Create new token
     reset_token = PasswordResetToken.generate_token(user.id)
     db.add(reset_token)
-    await db.commit()
+    await db.flush()
     
-    # Send email (in production, use proper email service)
-    reset_url = f"{settings.FRONTEND_URL}/reset-password?token={reset_token.token}"
-    await email_service.send_password_reset_email(
-        email=user.email,
-        reset_url=reset_url,
-        user_name=user.name
-    )
+    # 메일 발송은 백그라운드 작업으로 (토큰과 같은 트랜잭션으로 등록, 실패 시 재시도)
+    enqueue(db, "email.password_reset", {"token_id": reset_token.id})
+    await db.commit()
     
     return {"message": "If the email exists, a password reset link has been sent"}
 
@@ -0,0 +1,162 @@
+"""
+데이터 카탈로그 (제공 가능한 데이터 종류와 컬럼)
+
+조회는 로그인 없이 가능하며 메모리 스냅샷에서 응답합니다 (app.services.catalog).
+변경은 관리자 전용입니다.
+"""
+import re
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_current_admin_user
+from app.core.etag import is_not_modified, not_modified_response
+from app.db.session import get_db
+from app.models import User, CatalogDataset, CatalogColumn
+from app.schemas.catalog import (
+    CATALOG_KEY_PATTERN,
+    Catalog as CatalogSchema,
+    CatalogColumn as CatalogColumnSchema,
+    CatalogColumnUpsert,
+    CatalogDataset as CatalogDatasetSchema,
+    CatalogDatasetUpsert,
+)
+from app.services.catalog import catalog_registry, mark_catalog_changed
+
+router = APIRouter(prefix="/api/catalog", tags=["catalog"])
+
+
+def _validate_key(key: str, name: str):
+    if not re.match(CATALOG_KEY_PATTERN, key):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {name} (영문자로 시작하는 영문/숫자/_ 만 사용)"
+        )
+
+
+async def _get_dataset(db: AsyncSession, dataset_key: str) -> CatalogDataset:
+    result = await db.execute(
+        select(CatalogDataset).where(CatalogDataset.key == dataset_key, CatalogDataset.dcyn == 'N')
+    )
+    dataset = result.scalar_one_or_none()
+    if not dataset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dataset not found"
+        )
+    return dataset
+
+
+@router.get("/", response_model=CatalogSchema)
+async def get_catalog(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    """전체 카탈로그 (ETag = 카탈로그 리비전)"""
+    snapshot = await catalog_registry.get(db)
+    if is_not_modified(request, snapshot.etag):
+        return not_modified_response(snapshot.etag)
+    return snapshot.to_response()
+
+
+@router.get("/{dataset_key}", response_model=CatalogDatasetSchema)
+async def get_catalog_dataset(
+    dataset_key: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    snapshot = await catalog_registry.get(db)
+    if dataset_key not in snapshot.dataset_bodies:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dataset not found"
+        )
+    if is_not_modified(request, snapshot.etag):
+        return not_modified_response(snapshot.etag)
+    return snapshot.to_response(dataset_key)
+
+
+@router.put("/{dataset_key}", response_model=CatalogDatasetSchema)
+async def upsert_catalog_dataset(
+    dataset_key: str,
+    dataset_in: CatalogDatasetUpsert,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """데이터 종류 추가/수정 (삭제된 키면 복구)"""
+    _validate_key(dataset_key, "dataset key")
+    result = await db.execute(select(CatalogDataset).where(CatalogDataset.key == dataset_key))
+    dataset = result.scalar_one_or_none()
+    if dataset is None:
+        dataset = CatalogDataset(key=dataset_key)
+        db.add(dataset)
+    for field, value in dataset_in.dict().items():
+        setattr(dataset, field, value)
+    dataset.dcyn = 'N'
+
+    mark_catalog_changed(db)
+    await db.commit()
+
+    snapshot = await catalog_registry.get(db)
+    return snapshot.to_response(dataset_key)
+
+
+@router.put("/{dataset_key}/columns/{column_key}", response_model=CatalogColumnSchema)
+async def upsert_catalog_column(
+    dataset_key: str,
+    column_key: str,
+    column_in: CatalogColumnUpsert,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """컬럼 추가/수정 (삭제된 키면 복구)"""
+    _validate_key(column_key, "column key")
+    dataset = await _get_dataset(db, dataset_key)
+    result = await db.execute(
+        select(CatalogColumn).where(CatalogColumn.dataset_id == dataset.id, CatalogColumn.key == column_key)
+    )
+    column = result.scalar_one_or_none()
+    if column is None:
+        column = CatalogColumn(dataset_id=dataset.id, key=column_key)
+        db.add(column)
+    for field, value in column_in.dict().items():
+        setattr(column, field, value)
+    column.dcyn = 'N'
+
+    mark_catalog_changed(db)
+    await db.commit()
+    return column
+
+
+@router.delete("/{dataset_key}/columns/{column_key}")
+async def delete_catalog_column(
+    dataset_key: str,
+    column_key: str,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    컬럼 삭제 (dcyn='Y')
+
+    이미 제출된 신청서의 requested_columns 는 그대로 남고, 이후 신청/수정에서만 사용할 수 없게 됩니다.
+    """
+    dataset = await _get_dataset(db, dataset_key)
+    result = await db.execute(
+        select(CatalogColumn).where(
+            CatalogColumn.dataset_id == dataset.id,
+            CatalogColumn.key == column_key,
+            CatalogColumn.dcyn == 'N'
+        )
+    )
+    column = result.scalar_one_or_none()
+    if not column:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Column not found"
+        )
+    column.dcyn = 'Y'
+
+    mark_catalog_changed(db)
+    await db.commit()
+    return {"message": "Column deleted successfully"}
@@ -0,0 +1,129 @@
+"""
+신청서 변경 이벤트 스트림 (Server-Sent Events)
+
+관리자 대시보드가 목록/통계를 주기적으로 다시 조회하는 대신 이 스트림을 구독하고,
+이벤트를 받았을 때만 필요한 데이터를 다시 가져오도록 하기 위한 엔드포인트입니다.
+"""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.deps import get_current_admin_user
+from app.core.events import EVENT_TYPES, ApplicationEvent, bus, event_from_log
+from app.db.session import get_write_db
+from app.models import User, ApplicationLog
+
+router = APIRouter(prefix="/api/events", tags=["events"])
+
+# 재접속 시 클라이언트가 다시 시도하기까지 대기 시간 (ms)
+RETRY_MILLISECONDS = 3000
+
+
+async def _load_missed_events(db: AsyncSession, last_event_id: str) -> Optional[List[ApplicationEvent]]:
+    """
+    Last-Event-ID 이후의 이벤트를 감사 로그에서 조회
+
+    기준 이벤트를 찾을 수 없거나 놓친 이벤트가 너무 많으면 None (클라이언트가 전체를 다시 조회해야 함)
+    """
+    result = await db.execute(
+        select(ApplicationLog.created_at, ApplicationLog.id).where(ApplicationLog.id == last_event_id)
+    )
+    anchor = result.one_or_none()
+    if anchor is None:
+        return None
+
+    anchor_created_at, anchor_id = anchor
+    result = await db.execute(
+        select(
+            ApplicationLog.id,
+            ApplicationLog.application_id,
+            ApplicationLog.user_id,
+            ApplicationLog.action,
+            ApplicationLog.created_at,
+        )
+        .where(
+            and_(
+                ApplicationLog.action.in_(list(EVENT_TYPES)),
+                or_(
+                    ApplicationLog.created_at > anchor_created_at,
+                    and_(ApplicationLog.created_at == anchor_created_at, ApplicationLog.id > anchor_id)
+                )
+            )
+        )
+        .order_by(ApplicationLog.created_at, ApplicationLog.id)
+        .limit(settings.EVENTS_RESUME_LIMIT + 1)
+    )
+    rows = result.all()
+    if len(rows) > settings.EVENTS_RESUME_LIMIT:
+        return None
+    return [event_from_log(*row) for row in rows]
+
+
+@router.get("/applications")
+async def stream_application_events(
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    last_event_id_param: Optional[str] = Query(None, alias="last_event_id", description="Last-Event-ID 헤더 대신 사용 가능"),
+    current_user: User = Depends(get_current_admin_user),
+    # 복제본의 감사 로그는 늦을 수 있어 실시간 구독과의 사이에 빠지는 이벤트가 생기므로 기본 DB 사용
+    db: AsyncSession = Depends(get_write_db)
+):
+    """
+    신청서 변경 이벤트 스트림 (관리자 전용)
+
+    이벤트 타입: application.submitted / application.reviewed / application.status_changed /
+    application.updated / application.deleted. 이벤트 id 는 감사 로그 id 이며,
+    재접속 시 Last-Event-ID 를 보내면 그 이후 이벤트부터 이어서 받습니다.
+    이어받을 수 없는 경우 `reset` 이벤트를 보내므로 클라이언트는 목록을 다시 조회해야 합니다.
+    """
+    # 놓친 이벤트 조회와 실시간 구독 사이의 공백이 없도록 먼저 구독
+    subscription = bus.subscribe()
+    resume_from = last_event_id or last_event_id_param
+    missed: Optional[List[ApplicationEvent]] = []
+    try:
+        if resume_from:
+            missed = await _load_missed_events(db, resume_from)
+    except BaseException:
+        subscription.close()
+        raise
+    finally:
+        # 스트리밍 동안 DB 커넥션을 잡고 있지 않도록 세션 종료
+        await db.close()
+
+    async def event_stream():
+        sent_ids = set()
+        try:
+            yield f"retry: {RETRY_MILLISECONDS}\n\n"
+            if missed is None:
+                yield "event: reset\ndata: {}\n\n"
+            else:
+                for application_event in missed:
+                    sent_ids.add(application_event.id)
+                    yield application_event.to_sse()
+
+            while not subscription.overflowed:
+                if await request.is_disconnected():
+                    break
+                application_event = await subscription.get(timeout=settings.EVENTS_HEARTBEAT_SECONDS)
+                if application_event is None:
+                    # 프록시가 유휴 연결을 끊지 않도록 주석 라인 전송
+                    yield ": keepalive\n\n"
+                    continue
+                if application_event.id in sent_ids:
+                    continue
+                yield application_event.to_sse()
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -0,0 +1,184 @@
+"""
+정형 추출 실행/진행률/결과 다운로드 (app.services.extraction)
+
+- 시작: 관리자 전용, 승인(APPROVED) 또는 처리 중(PROCESSING)인 정형 추출 신청서만
+- 진행률 조회/결과 다운로드: 신청자 본인 또는 관리자
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from pathlib import Path
+
+from app.core.deps import get_current_user, get_current_admin_user
+from app.db.ids import new_id
+from app.db.session import get_db, get_write_db
+from app.models import User, Application, ApplicationStatus, Download, Extraction, ExtractionStatus
+from app.models.application import ServiceType
+from app.schemas.extraction import Extraction as ExtractionSchema, ExtractionCreate
+from app.services import jobs
+from app.services.catalog import column_key, ensure_catalog_columns
+from app.services.extraction import EXTRACTION_JOB
+
+router = APIRouter(prefix="/api/applications", tags=["extractions"])
+
+EXTRACTABLE_STATUSES = (ApplicationStatus.APPROVED, ApplicationStatus.PROCESSING)
+ACTIVE_STATUSES = (ExtractionStatus.PENDING, ExtractionStatus.RUNNING)
+
+
+async def _get_application(db: AsyncSession, application_id: str, current_user: User) -> Application:
+    query = select(Application).where(
+        Application.id == application_id,
+        Application.dcyn == 'N'
+    )
+    # 일반 사용자는 본인 신청서만, 관리자는 모든 신청서 접근 가능
+    if current_user.role.value != "ADMIN":
+        query = query.where(Application.user_id == current_user.id)
+
+    result = await db.execute(query)
+    application = result.scalar_one_or_none()
+    if not application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
+    return application
+
+
+async def _latest_extraction(db: AsyncSession, application_id: str, *statuses: ExtractionStatus):
+    query = select(Extraction).where(Extraction.application_id == application_id, Extraction.dcyn == 'N')
+    if statuses:
+        query = query.where(Extraction.status.in_(statuses))
+    result = await db.execute(query.order_by(Extraction.created_at.desc(), Extraction.id.desc()).limit(1))
+    return result.scalar_one_or_none()
+
+
+@router.post("/{application_id}/extraction", response_model=ExtractionSchema, status_code=status.HTTP_202_ACCEPTED)
+async def start_extraction(
+    application_id: str,
+    extraction_in: ExtractionCreate,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    정형 추출 시작 (관리자 전용)
+
+    신청서의 requested_columns 를 코호트 조건의 환자에 대해 추출합니다.
+    pseudonymization 을 지정하면 결과 파일을 가명화합니다 (가명화 서비스를 함께 신청한 경우).
+    코호트 조건 컬럼은 카탈로그로 검증하고, 요청 컬럼은 실행 시 웨어하우스 스냅샷에서 확인합니다.
+    """
+    application = await _get_application(db, application_id, current_user)
+
+    if application.status not in EXTRACTABLE_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="승인되었거나 처리 중인 신청서만 추출할 수 있습니다"
+        )
+    if ServiceType.STRUCTURED_EXTRACTION.value not in (application.service_types or []):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="정형 추출 신청서가 아닙니다"
+        )
+    if not application.requested_columns:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="요청 데이터 항목(requested_columns)이 없습니다"
+        )
+
+    if extraction_in.pseudonymization and ServiceType.PSEUDONYMIZATION.value not in application.service_types:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="가명화 신청서가 아닙니다"
+        )
+
+    cohort = extraction_in.cohort
+    await ensure_catalog_columns(
+        db, [column_key(cohort.dataset, condition.column) for condition in cohort.conditions]
+    )
+
+    if await _latest_extraction(db, application.id, *ACTIVE_STATUSES):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 진행 중인 추출이 있습니다"
+        )
+
+    extraction = Extraction(
+        id=new_id(),
+        application_id=application.id,
+        requested_by=current_user.id,
+        status=ExtractionStatus.PENDING,
+        columns=list(application.requested_columns),
+        cohort=cohort.model_dump(),
+        pseudonymization=extraction_in.pseudonymization.model_dump() if extraction_in.pseudonymization else None,
+        progress=0.0,
+        rows_total=0,
+        rows_scanned=0,
+        rows_written=0,
+    )
+    db.add(extraction)
+    job_row = jobs.enqueue(db, EXTRACTION_JOB, {"extraction_id": extraction.id})
+    await db.flush()
+    extraction.job_id = job_row.id
+
+    await db.commit()
+    return extraction
+
+
+@router.get("/{application_id}/extraction", response_model=ExtractionSchema)
+async def get_extraction(
+    application_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """최근 추출의 상태와 진행률"""
+    application = await _get_application(db, application_id, current_user)
+    extraction = await _latest_extraction(db, application.id)
+    if not extraction:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Extraction not found"
+        )
+    return extraction
+
+
+@router.get("/{application_id}/extraction/download")
+async def download_extraction(
+    application_id: str,
+    current_user: User = Depends(get_current_user),
+    # 다운로드 이력을 기록하므로 조회 요청이지만 기본 DB 세션 사용
+    db: AsyncSession = Depends(get_write_db)
+):
+    """최근 완료된 추출 결과 다운로드 (다운로드 이력 기록)"""
+    application = await _get_application(db, application_id, current_user)
+    extraction = await _latest_extraction(db, application.id, ExtractionStatus.SUCCEEDED)
+    if not extraction or not extraction.file_path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="File not found"
+        )
+
+    file_path_obj = Path(extraction.file_path)
+    if not file_path_obj.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="File not found on disk"
+        )
+
+    finished_date = extraction.finished_at.strftime("%Y%m%d")
+    project_name = application.project_name[:20].replace("/", "_").replace("\\", "_")  # 파일명에 사용할 수 없는 문자 제거
+    download_filename = f"정형추출_{project_name}_{finished_date}.zip"
+
+    db.add(Download(
+        application_id=application.id,
+        user_id=current_user.id,
+        file_name=download_filename,
+        file_size=extraction.file_size,
+        file_path=extraction.file_path,
+    ))
+    await db.commit()
+
+    return FileResponse(
+        path=str(file_path_obj),
+        filename=download_filename,
+        media_type="application/zip"
+    )
@@ -0,0 +1,154 @@
+"""
+백그라운드 작업 상태 조회/관리 API (관리자 전용)
+"""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_current_admin_user
+from app.db.base import get_korean_time
+from app.db.session import get_db
+from app.models import User, Job, JobStatus
+from app.schemas.job import Job as JobSchema, JobCreate, JobDefinitionInfo, JobSummary
+from app.services import jobs
+
+router = APIRouter(prefix="/api/admin/jobs", tags=["jobs"])
+
+# 핸들러 등록 (작업 이름 검증/요약에 사용)
+jobs.load_task_modules()
+
+
+@router.get("/", response_model=List[JobSchema])
+async def list_jobs(
+    status_filter: Optional[JobStatus] = Query(None, alias="status"),
+    name: Optional[str] = None,
+    skip: int = 0,
+    limit: int = Query(50, ge=1, le=500),
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    query = select(Job)
+    if status_filter is not None:
+        query = query.where(Job.status == status_filter)
+    if name:
+        query = query.where(Job.name == name)
+    result = await db.execute(query.order_by(Job.created_at.desc()).offset(skip).limit(limit))
+    return result.scalars().all()
+
+
+@router.get("/summary", response_model=JobSummary)
+async def get_job_summary(
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """상태별 작업 수, 실행기 상태, 등록된 작업 목록"""
+    result = await db.execute(select(Job.status, func.count(Job.id)).group_by(Job.status))
+    counts = {job_status.value: 0 for job_status in JobStatus}
+    counts.update({job_status.value: count for job_status, count in result.all()})
+
+    runner = jobs.get_runner()
+    return JobSummary(
+        runner_running=bool(runner and runner.running),
+        concurrency=runner.concurrency if runner else 0,
+        workers_busy=runner.busy if runner else 0,
+        counts=counts,
+        definitions=[
+            JobDefinitionInfo(
+                name=definition.name,
+                max_attempts=definition.max_attempts,
+                timeout=definition.timeout,
+                every=definition.every,
+            )
+            for definition in sorted(jobs.JOB_DEFINITIONS.values(), key=lambda item: item.name)
+        ],
+    )
+
+
+@router.post("/", response_model=JobSchema, status_code=status.HTTP_201_CREATED)
+async def create_job(
+    job_data: JobCreate,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """등록된 작업을 수동으로 실행 요청"""
+    if job_data.name not in jobs.JOB_DEFINITIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown job: {job_data.name}"
+        )
+    job_row = jobs.enqueue(db, job_data.name, job_data.payload, delay=job_data.delay_seconds)
+    await db.commit()
+    return job_row
+
+
+@router.get("/{job_id}", response_model=JobSchema)
+async def get_job(
+    job_id: str,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    job_row = await db.get(Job, job_id)
+    if job_row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return job_row
+
+
+async def _change_status(db: AsyncSession, job_id: str, allowed: tuple, values: dict, error_detail: str) -> Job:
+    """허용 상태일 때만 변경 (조건부 UPDATE, 실행기가 동시에 가져가도 한 쪽만 성공)"""
+    result = await db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.status.in_(allowed))
+        .values(**values, updated_at=get_korean_time())
+        .returning(Job)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    job_row = result.scalar_one_or_none()
+    if job_row is None:
+        if await db.get(Job, job_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_detail
+        )
+    return job_row
+
+
+@router.post("/{job_id}/retry", response_model=JobSchema)
+async def retry_job(
+    job_id: str,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """실패/취소된 작업을 다시 대기 상태로 (시도 횟수 초기화)"""
+    job_row = await _change_status(
+        db, job_id, (JobStatus.FAILED, JobStatus.CANCELLED),
+        {"status": JobStatus.PENDING, "attempts": 0, "run_at": get_korean_time(), "finished_at": None},
+        "Only failed or cancelled jobs can be retried"
+    )
+    jobs.wake_after_commit(db)
+    await db.commit()
+    return job_row
+
+
+@router.post("/{job_id}/cancel", response_model=JobSchema)
+async def cancel_job(
+    job_id: str,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """대기 중인 작업 취소 (실행 중인 작업은 취소할 수 없음)"""
+    job_row = await _change_status(
+        db, job_id, (JobStatus.PENDING,),
+        {"status": JobStatus.CANCELLED, "finished_at": get_korean_time()},
+        "Only pending jobs can be cancelled"
+    )
+    await db.commit()
+    return job_row
@@ -5,6 +5,20 @@ from functools import lru_cache
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite+aiosqlite:///./data_portal.db"
+    DATABASE_ECHO: bool = True
+    # 커넥션 풀: PostgreSQL(postgresql+asyncpg), SQLite 는 조회 전용 커넥션에만 적용
+    DATABASE_POOL_SIZE: int = 10  # 워커 프로세스당 유지할 커넥션 수
+    DATABASE_MAX_OVERFLOW: int = 10  # 부하 시 추가로 열 수 있는 커넥션 수
+    DATABASE_POOL_TIMEOUT: float = 10.0  # 풀이 모두 사용 중일 때 커넥션 대기 시간 (초)
+    DATABASE_POOL_RECYCLE: int = 1800  # 이 시간(초)보다 오래된 커넥션은 다시 연결
+    DATABASE_POOL_PRE_PING: bool = True  # 사용 전 끊긴 커넥션 확인
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 30000  # 쿼리 실행 제한 시간 (0 이면 제한 없음)
+    # 조회(GET/HEAD) 요청을 보낼 읽기 전용 DB (PostgreSQL 복제본, 또는 같은 SQLite 파일을 mode=ro 로)
+    # 예: sqlite+aiosqlite:///file:./data_portal.db?mode=ro&uri=true
+    DATABASE_READ_URL: Optional[str] = None
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = 5.0  # 사용자가 쓰기 요청을 한 뒤 이 시간 동안은 조회도 기본 DB 사용 (0 이면 끔)
+    # 기동 시 스키마 지문이 다르면 alembic upgrade head 자동 실행
+    AUTO_MIGRATE: bool = True
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
@@ -12,9 +26,72 @@ class Settings(BaseSettings):
     BACKEND_PORT: int = 10402
     FRONTEND_URL: str = "http://localhost:10401"
     
+    # Rate limiting (부하 테스트 시 비활성화)
+    RATE_LIMIT_ENABLED: bool = True
+    
+    # 요청/DB 계측 (/metrics, Server-Timing 헤더)
+    METRICS_ENABLED: bool = True
+    
+    # 마지막 로그인 시각 일괄 기록 (app.services.login_activity), 0 이면 로그인마다 바로 기록
+    LOGIN_ACTIVITY_FLUSH_SECONDS: float = 5.0
+    LOGIN_ACTIVITY_MAX_PENDING: int = 5000  # 대기 중인 사용자 수가 이 값에 도달하면 바로 기록
+    
+    # 연구자 신청서 목록 응답 캐시 (app.services.application_cache), 0 이면 비활성화
+    APPLICATION_LIST_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    
+    # 데이터 카탈로그 스냅샷 (app.services.catalog): 다른 워커의 변경을 확인하는 간격 (초)
+    CATALOG_REFRESH_SECONDS: float = 10.0
+    
+    # 정형 추출 (app.services.extraction)
+    # 웨어하우스 스냅샷: SQLite 파일 또는 <데이터 종류>.parquet 파일이 있는 디렉터리 (Parquet 는 pyarrow 필요)
+    EXTRACTION_WAREHOUSE_PATH: str = "warehouse/warehouse.db"
+    EXTRACTION_OUTPUT_DIR: str = "deliveries"  # 결과 파일 위치 (<신청서 id>/<추출 id>.zip)
+    EXTRACTION_CHUNK_ROWS: int = 50000  # 한 번에 읽어 필터링/기록할 행 수
+    EXTRACTION_PROGRESS_SECONDS: float = 2.0  # 진행률 기록 간격
+    EXTRACTION_TIMEOUT_SECONDS: float = 6 * 3600
+    # 가명화 (app.services.pseudonymization): 가명 생성 키, 미지정 시 SECRET_KEY 사용
+    # (키가 바뀌면 같은 환자도 다른 가명이 되므로 운영에서는 별도로 지정하고 바꾸지 않음)
+    PSEUDONYMIZATION_KEY: Optional[str] = None
+    PSEUDONYMIZATION_WORKERS: int = 0  # 가명화 프로세스 수 (0 이면 CPU 수)
+    
+    # 신청서 변경 이벤트 스트림 (/api/events/applications)
+    EVENTS_BUFFER_SIZE: int = 256  # 구독자별 최대 대기 이벤트 수 (초과 시 연결 종료)
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0
+    EVENTS_RESUME_LIMIT: int = 1000  # Last-Event-ID 재접속 시 감사 로그에서 다시 보낼 최대 이벤트 수
+    
+    # 백그라운드 작업 실행기 (app.services.jobs)
+    JOBS_ENABLED: bool = True
+    JOBS_CONCURRENCY: int = 2  # 동시에 실행할 작업 수
+    JOBS_POLL_SECONDS: float = 2.0  # 대기 작업 조회 간격 (같은 프로세스에서 등록하면 즉시 실행)
+    JOBS_SCHEDULER_SECONDS: float = 30.0  # 주기 작업 등록/중단 작업 복구 간격
+    JOBS_MAX_ATTEMPTS: int = 3
+    JOBS_RETRY_BACKOFF_SECONDS: float = 30.0  # 재시도 대기 (시도마다 2배)
+    JOBS_STALE_SECONDS: float = 900.0  # 실행 중 heartbeat 가 이 시간 이상 없으면 중단된 것으로 보고 다시 실행
+    JOBS_RETENTION_DAYS: int = 30  # 완료 작업 보관 기간
+    TOKEN_SWEEP_INTERVAL_SECONDS: int = 3600  # 만료 토큰 정리 주기
+    
+    # 고아 업로드 파일 정리 (app.services.upload_gc)
+    UPLOAD_GC_INTERVAL_SECONDS: int = 86400
+    UPLOAD_GC_MODE: str = "report"  # report / quarantine / delete (보고 결과를 확인한 뒤 운영자가 변경)
+    UPLOAD_GC_GRACE_HOURS: float = 24.0  # 수정된 지 이 시간이 지나지 않은 파일은 제외
+    UPLOAD_GC_DELETED_RETENTION_DAYS: int = 90  # 삭제된 신청서 첨부파일 보관 기간
+    UPLOAD_GC_QUARANTINE_DAYS: int = 30  # 격리한 파일 보관 기간
+    UPLOAD_GC_BATCH_SIZE: int = 1000  # DB 경로 스트리밍 배치 크기
+    
+    # development / production
+    ENVIRONMENT: str = "development"
+    # Swagger 테스트용 /api/crypto 라우터 (미지정 시 production 이 아닐 때만 등록)
+    CRYPTO_API_ENABLED: Optional[bool] = None
+    
     PROJECT_NAME: str = "아주대학교병원 의료빅데이터센터 데이터 포털"
     VERSION: str = "1.0.0"
     
+    @property
+    def crypto_api_enabled(self) -> bool:
+        if self.CRYPTO_API_ENABLED is not None:
+            return self.CRYPTO_API_ENABLED
+        return self.ENVIRONMENT != "production"
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
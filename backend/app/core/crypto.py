@@ -1,10 +1,9 @@
 import base64
 import os
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import unpad, pad
-from Crypto.Random import get_random_bytes
 import hashlib
 
+# pycryptodome 은 import 비용이 커서 암복호화 함수 안에서 로드
+
 # 암호화 키 (프론트엔드와 동일해야 함)
 SECRET_KEY = os.getenv('CRYPTO_KEY', 'data-portal-secure-key-2024')
 
@@ -17,6 +16,9 @@ def decrypt_password(encrypted_password: str) -> str:
     AES로 암호화된 비밀번호를 복호화
     CryptoJS.AES.decrypt와 호환되는 방식
     """
+    from Crypto.Cipher import AES
+    from Crypto.Util.Padding import unpad
+
     try:
         # CryptoJS 형식의 암호화된 데이터 파싱
         encrypted_data = base64.b64decode(encrypted_password)
@@ -67,6 +69,10 @@ def encrypt_string(plaintext: str) -> str:
     """
     CryptoJS와 호환되는 방식으로 문자열 암호화
     """
+    from Crypto.Cipher import AES
+    from Crypto.Random import get_random_bytes
+    from Crypto.Util.Padding import pad
+
     try:
         # 랜덤 salt 생성
         salt = get_random_bytes(8)
@@ -3,7 +3,6 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
-from jose import JWTError
 
 from app.db.session import get_db
 from app.core.security import decode_token
@@ -0,0 +1,85 @@
+"""
+ETag / 조건부 요청 처리
+
+- 단일 리소스의 ETag 는 version 컬럼(version_id_col)으로 만듭니다: "<version>" 또는 "<version>.<연관 리소스 version>..."
+- 목록/통계처럼 여러 행으로 만든 응답은 내용 해시로 약한(weak) ETag 를 만듭니다.
+- GET 의 If-None-Match 가 일치하면 304, PUT/POST 의 If-Match 가 현재 version 과 다르면 412 를 반환합니다.
+"""
+import hashlib
+from typing import Iterable, List, Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+
+def make_etag(*versions) -> str:
+    """version 값으로 강한 ETag 생성 (첫 번째 값이 리소스 자신의 version)"""
+    return '"' + ".".join(str(version) for version in versions) + '"'
+
+
+def weak_etag(parts: Iterable) -> str:
+    """여러 행으로 구성된 응답용 약한 ETag"""
+    hasher = hashlib.sha1()
+    for part in parts:
+        hasher.update(str(part).encode("utf-8"))
+        hasher.update(b"\x00")
+    return f'W/"{hasher.hexdigest()}"'
+
+
+def _split_etags(header: str) -> List[str]:
+    return [value.strip() for value in header.split(",") if value.strip()]
+
+
+def _opaque(etag: str) -> str:
+    # 약한 비교: W/ 접두어 무시
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag 와 일치하는지 (약한 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return _opaque(etag) in {_opaque(value) for value in _split_etags(header)}
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def get_if_match_versions(request: Request) -> Optional[List[int]]:
+    """
+    If-Match 헤더에서 기대하는 version 목록 추출 (의존성으로 사용)
+
+    헤더가 없거나 '*' 이면 None (조건 없음)
+    """
+    header = request.headers.get("if-match")
+    if not header or header.strip() == "*":
+        return None
+
+    versions = []
+    for value in _split_etags(header):
+        if value.startswith("W/"):
+            # If-Match 는 강한 비교만 허용
+            continue
+        try:
+            versions.append(int(value.strip('"').split(".", 1)[0]))
+        except ValueError:
+            continue
+    if not versions:
+        raise precondition_failed()
+    return versions
+
+
+def precondition_failed() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Resource has been modified (ETag mismatch)"
+    )
+
+
+def check_if_match(current_version: int, expected_versions: Optional[List[int]]):
+    """If-Match 조건 검사 (ORM 으로 로드한 리소스용)"""
+    if expected_versions is not None and current_version not in expected_versions:
+        raise precondition_failed()
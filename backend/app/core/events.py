@@ -0,0 +1,180 @@
+"""
+신청서 변경 이벤트 (프로세스 내 pub/sub)
+
+- 쓰기 엔드포인트가 기록하는 ApplicationLog(감사 로그)가 곧 이벤트입니다.
+  세션 flush 시 새로 추가된 ApplicationLog 를 모아 두었다가 커밋이 성공하면 발행하고, 롤백되면 버립니다.
+  Core insert 로 로그를 일괄 기록하는 경우에는 queue_log_rows() 로 직접 등록합니다.
+- 구독자마다 크기가 제한된 큐를 가지며, 큐가 가득 찬(느린) 구독자는 끊어서 메모리가 늘어나지 않게 합니다.
+  끊긴 클라이언트는 Last-Event-ID 로 재접속하면 감사 로그에서 놓친 이벤트를 다시 받습니다.
+- 워커 프로세스마다 별도의 버스이므로, 다중 워커에서는 다른 워커에서 발생한 이벤트가 실시간으로 전달되지 않습니다.
+"""
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import registry as metrics_registry
+from app.models import ApplicationLog, LogAction
+
+logger = logging.getLogger(__name__)
+
+# 감사 로그 액션 -> 이벤트 타입 (다운로드 등 상태와 무관한 액션은 발행하지 않음)
+EVENT_TYPES = {
+    LogAction.CREATED: "application.created",
+    LogAction.UPDATED: "application.updated",
+    LogAction.SUBMITTED: "application.submitted",
+    LogAction.APPROVED: "application.reviewed",
+    LogAction.REJECTED: "application.reviewed",
+    LogAction.REVISION_REQUESTED: "application.reviewed",
+    LogAction.PROCESSING: "application.status_changed",
+    LogAction.COMPLETED: "application.status_changed",
+    LogAction.DELETED: "application.deleted",
+}
+
+PENDING_EVENTS_KEY = "pending_application_events"
+
+
+@dataclass(frozen=True)
+class ApplicationEvent:
+    id: str  # ApplicationLog.id (Last-Event-ID 로 사용)
+    type: str
+    application_id: str
+    actor_id: str
+    action: str
+    created_at: Optional[datetime]
+
+    def to_sse(self) -> str:
+        data = {
+            "id": self.id,
+            "type": self.type,
+            "application_id": self.application_id,
+            "actor_id": self.actor_id,
+            "action": self.action,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+        return f"id: {self.id}\nevent: {self.type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def event_from_log(log_id: str, application_id: str, user_id: str, action, created_at) -> Optional[ApplicationEvent]:
+    action = LogAction(action)
+    event_type = EVENT_TYPES.get(action)
+    if event_type is None:
+        return None
+    return ApplicationEvent(
+        id=log_id,
+        type=event_type,
+        application_id=application_id,
+        actor_id=user_id,
+        action=action.value,
+        created_at=created_at,
+    )
+
+
+class Subscription:
+    """구독자별 제한 크기 버퍼"""
+
+    def __init__(self, bus: "EventBus", buffer_size: int):
+        self._bus = bus
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.overflowed = False
+
+    def offer(self, application_event: ApplicationEvent) -> bool:
+        try:
+            self.queue.put_nowait(application_event)
+            return True
+        except asyncio.QueueFull:
+            self.overflowed = True
+            return False
+
+    async def get(self, timeout: float) -> Optional[ApplicationEvent]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self._bus.unsubscribe(self)
+
+
+class EventBus:
+    def __init__(self, buffer_size: int):
+        self.buffer_size = buffer_size
+        self._subscribers: Set[Subscription] = set()
+        self.published = 0
+        self.dropped_subscribers = 0
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self, self.buffer_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, events: Iterable[ApplicationEvent]):
+        for application_event in events:
+            self.published += 1
+            for subscription in list(self._subscribers):
+                if not subscription.offer(application_event):
+                    # 버퍼가 찬 구독자는 끊고 Last-Event-ID 재접속으로 따라잡게 함
+                    self.unsubscribe(subscription)
+                    self.dropped_subscribers += 1
+                    logger.warning("이벤트 구독자 버퍼 초과로 연결 종료 (buffer=%d)", self.buffer_size)
+
+
+bus = EventBus(settings.EVENTS_BUFFER_SIZE)
+
+metrics_registry.register_gauge("application_event_subscribers", lambda: bus.subscriber_count)
+metrics_registry.register_gauge("application_events_published_total", lambda: bus.published)
+metrics_registry.register_gauge("application_event_subscribers_dropped_total", lambda: bus.dropped_subscribers)
+
+
+def _pending(session: Session) -> List[ApplicationEvent]:
+    return session.info.setdefault(PENDING_EVENTS_KEY, [])
+
+
+def queue_log_rows(session, rows: Iterable[dict]):
+    """Core insert 로 기록한 로그 행을 커밋 후 발행 대상으로 등록 (각 행에 id, created_at 필요)"""
+    sync_session = getattr(session, "sync_session", session)
+    pending = _pending(sync_session)
+    for row in rows:
+        application_event = event_from_log(
+            row["id"], row["application_id"], row["user_id"], row["action"], row.get("created_at")
+        )
+        if application_event is not None:
+            pending.append(application_event)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_log_events(session: Session, flush_context):
+    # after_flush 시점의 session.new 는 flush 이전 상태(방금 INSERT 된 객체)를 담고 있음
+    logs = [instance for instance in session.new if isinstance(instance, ApplicationLog)]
+    if not logs:
+        return
+    pending = _pending(session)
+    for log in logs:
+        application_event = event_from_log(log.id, log.application_id, log.user_id, log.action, log.created_at)
+        if application_event is not None:
+            pending.append(application_event)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session):
+    pending = session.info.pop(PENDING_EVENTS_KEY, None)
+    if pending:
+        bus.publish(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session):
+    session.info.pop(PENDING_EVENTS_KEY, None)
@@ -0,0 +1,239 @@
+"""
+Request timing and DB query instrumentation
+
+- 라우트 템플릿별로 처리 시간, SQL 실행 횟수/시간, 응답 크기, 상태 코드를 프로세스 내에 집계
+- 집계는 HDR 히스토그램 방식(로그-선형 버킷)으로 메모리 사용량이 값 범위와 무관하게 일정
+- /metrics 에서 Prometheus 텍스트 포맷으로 노출하고, 응답에 Server-Timing 헤더를 추가
+"""
+import math
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 2의 거듭제곱 구간마다 나누는 하위 버킷 수 (상대 오차 약 1/16)
+SUB_BUCKETS = 16
+
+# 노출할 분위수
+QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+class HdrHistogram:
+    """로그-선형 버킷 히스토그램 (HdrHistogram 단순화 버전)"""
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    @staticmethod
+    def _bucket_index(value: float) -> int:
+        if value <= 0:
+            return -(1 << 30)
+        mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent, 0.5 <= mantissa < 1
+        return exponent * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+
+    @staticmethod
+    def _bucket_upper_bound(index: int) -> float:
+        if index == -(1 << 30):
+            return 0.0
+        exponent, sub_bucket = divmod(index, SUB_BUCKETS)
+        return math.ldexp(0.5 + (sub_bucket + 1) / (2 * SUB_BUCKETS), exponent)
+
+    def record(self, value: float):
+        index = self._bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, quantile: float) -> float:
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._bucket_upper_bound(index), self.max)
+        return self.max
+
+
+@dataclass
+class RequestStats:
+    """요청 1건 동안 누적되는 DB 실행 통계"""
+    query_count: int = 0
+    query_time: float = 0.0
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+class RouteMetrics:
+    def __init__(self):
+        self.duration = HdrHistogram()
+        self.db_queries = HdrHistogram()
+        self.db_time = HdrHistogram()
+        self.response_size = HdrHistogram()
+        self.status_counts: Dict[int, int] = {}
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+
+    def observe(self, method: str, route: str, status_code: int, duration: float,
+                stats: RequestStats, response_size: int):
+        with self._lock:
+            metrics = self._routes.get((method, route))
+            if metrics is None:
+                metrics = self._routes[(method, route)] = RouteMetrics()
+            metrics.duration.record(duration)
+            metrics.db_queries.record(stats.query_count)
+            metrics.db_time.record(stats.query_time)
+            metrics.response_size.record(response_size)
+            metrics.status_counts[status_code] = metrics.status_counts.get(status_code, 0) + 1
+
+    def register_gauge(self, name: str, callback: Callable[[], float]):
+        """렌더링 시점에 값을 읽어오는 게이지/카운터 등록 (예: 캐시 적중률)"""
+        self._gauges[name] = callback
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷으로 출력"""
+        summaries = (
+            ("http_request_duration_seconds", "Request wall time", "duration"),
+            ("http_request_db_queries", "SQL statements executed per request", "db_queries"),
+            ("http_request_db_seconds", "Total SQL execution time per request", "db_time"),
+            ("http_response_size_bytes", "Response body size", "response_size"),
+        )
+        with self._lock:
+            routes = sorted(self._routes.items())
+            lines = []
+            for name, help_text, attr in summaries:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} summary")
+                for (method, route), metrics in routes:
+                    histogram = getattr(metrics, attr)
+                    labels = f'method="{method}",route="{_escape(route)}"'
+                    for quantile in QUANTILES:
+                        lines.append(f'{name}{{{labels},quantile="{quantile}"}} {histogram.percentile(quantile):.6g}')
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.total:.6g}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+            lines.append("# HELP http_requests_total Requests by route and status code")
+            lines.append("# TYPE http_requests_total counter")
+            for (method, route), metrics in routes:
+                for status_code, count in sorted(metrics.status_counts.items()):
+                    lines.append(
+                        f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status_code}"}} {count}'
+                    )
+
+        for name, callback in sorted(self._gauges.items()):
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {callback():.6g}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+registry = MetricsRegistry()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    stats = _current_request.get()
+    if stats is not None:
+        stats.query_count += 1
+        stats.query_time += elapsed
+
+
+def instrument_engine(engine: Engine, name: str = "db"):
+    """
+    SQLAlchemy 엔진에 SQL 실행 계측 이벤트 등록 (AsyncEngine 은 sync_engine 전달)
+
+    name: 커넥션 풀 게이지 이름 접두어 (읽기 전용 DB 엔진은 db_read)
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    # 커넥션 풀 사용량 (QueuePool 계열만; SQLite 메모리 DB 의 StaticPool 등은 제외)
+    pool = engine.pool
+    if hasattr(pool, "checkedout") and hasattr(pool, "size"):
+        registry.register_gauge(f"{name}_pool_size", pool.size)
+        registry.register_gauge(f"{name}_pool_checked_out", pool.checkedout)
+        registry.register_gauge(f"{name}_pool_overflow", lambda: max(pool.overflow(), 0))
+
+
+class MetricsMiddleware:
+    """라우트 템플릿별 요청 계측 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        start = time.perf_counter()
+        response = {"status": 500, "size": 0}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                elapsed = time.perf_counter() - start
+                server_timing = (
+                    f'db;dur={stats.query_time * 1000:.1f};desc="{stats.query_count} queries", '
+                    f"app;dur={(elapsed - stats.query_time) * 1000:.1f}, "
+                    f"total;dur={elapsed * 1000:.1f}"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                response["size"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_request.reset(token)
+            route = scope.get("route")
+            # 매칭되지 않은 경로는 카디널리티 폭증을 막기 위해 하나로 묶음
+            route_path = getattr(route, "path", None) or "<unmatched>"
+            registry.observe(
+                scope["method"],
+                route_path,
+                response["status"],
+                time.perf_counter() - start,
+                stats,
+                response["size"],
+            )
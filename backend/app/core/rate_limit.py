@@ -8,9 +8,12 @@ from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 import time
 
+from app.core.config import settings
+
 # Create limiter instance
 limiter = Limiter(
     key_func=get_remote_address,
+    enabled=settings.RATE_LIMIT_ENABLED,
     default_limits=["200 per day", "50 per hour"],
     storage_uri="memory://",
     headers_enabled=True  # Add rate limit headers to responses
@@ -0,0 +1,100 @@
+"""
+직렬화된 JSON 응답 캐시 (프로세스 내 LRU)
+
+- 키마다 (세대, JSON 본문, ETag)를 저장하고, 조회 시 세대가 다르면 버리고 미스로 처리합니다.
+  세대는 호출하는 쪽이 관리합니다 (예: 사용자별 카운터를 쓰기 시 1 증가).
+- 본문 크기 합계가 max_bytes 를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+- 적중/미스/제거 횟수와 사용량을 /metrics 게이지로 노출합니다.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional
+
+from fastapi import Response
+
+from app.core.metrics import registry as metrics_registry
+
+# 항목별 키/객체 오버헤드 추정치 (바이트)
+ENTRY_OVERHEAD = 256
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    generation: int
+    body: bytes
+    etag: str
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.etag) + ENTRY_OVERHEAD
+
+    def to_response(self) -> Response:
+        return Response(content=self.body, media_type="application/json", headers={"ETag": self.etag})
+
+
+class ResponseCache:
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, generation: int) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.generation != generation:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, generation: int, body: bytes, etag: str) -> CachedResponse:
+        entry = CachedResponse(generation, body, etag)
+        if entry.size > self.max_bytes:
+            return entry
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.bytes += entry.size
+            while self.bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def _remove(self, key: Hashable):
+        self.bytes -= self._entries.pop(key).size
+
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def register_metrics(self):
+        prefix = f"{self.name}_cache"
+        metrics_registry.register_gauge(f"{prefix}_hits_total", lambda: self.hits)
+        metrics_registry.register_gauge(f"{prefix}_misses_total", lambda: self.misses)
+        metrics_registry.register_gauge(f"{prefix}_evictions_total", lambda: self.evictions)
+        metrics_registry.register_gauge(f"{prefix}_hit_ratio", self.hit_ratio)
+        metrics_registry.register_gauge(f"{prefix}_entries", lambda: len(self._entries))
+        metrics_registry.register_gauge(f"{prefix}_bytes", lambda: self.bytes)
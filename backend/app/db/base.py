@@ -1,7 +1,9 @@
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, DateTime, String, Boolean
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime, timezone, timedelta
-import uuid
+
+from app.db.ids import UUIDKey, new_id
 
 
 Base = declarative_base()
@@ -14,10 +16,26 @@ def get_korean_time():
     return datetime.now(KST)
 
 
+class KSTDateTime(TypeDecorator):
+    """
+    timezone 정보가 있는 값은 KST 로 변환한 뒤 naive 값으로 저장하는 DateTime
+
+    SQLite 는 tzinfo 를 무시하고 시각만 저장하지만, PostgreSQL(asyncpg)은
+    timestamp without time zone 컬럼에 timezone 이 있는 값을 거부하므로 저장 전에 맞춰 줍니다.
+    """
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and getattr(value, "tzinfo", None) is not None:
+            value = value.astimezone(KST).replace(tzinfo=None)
+        return value
+
+
 class BaseModel(Base):
     __abstract__ = True
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    created_at = Column(DateTime, default=get_korean_time, nullable=False)
-    updated_at = Column(DateTime, default=get_korean_time, onupdate=get_korean_time, nullable=False)
+    id = Column(UUIDKey, primary_key=True, default=new_id)  # UUIDv7, 16바이트 저장 (app.db.ids)
+    created_at = Column(KSTDateTime, default=get_korean_time, nullable=False)
+    updated_at = Column(KSTDateTime, default=get_korean_time, onupdate=get_korean_time, nullable=False)
     dcyn = Column(String(1), default='N', nullable=False)  # 삭제여부: Y=삭제됨, N=활성
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+유지보수 명령 진행 상황(체크포인트) 저장
+
+배치로 나눠 처리하는 유지보수 명령(scripts/)이 마지막으로 처리한 키를 배치 변경과 같은 트랜잭션으로 기록해 두고,
+중단된 뒤 다시 실행하면 그 다음 키부터 이어서 처리합니다.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, DateTime, JSON, MetaData, String, Table, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 마이그레이션(0007)으로 생성되며, 모델 metadata 에는 포함하지 않음
+maintenance_checkpoints_table = Table(
+    "maintenance_checkpoints",
+    MetaData(),
+    Column("name", String, primary_key=True),
+    Column("position", String),  # 마지막으로 처리한 키 (keyset)
+    Column("stats", JSON),
+    Column("started_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Column("completed_at", DateTime),
+)
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    name: str
+    position: Optional[str]
+    stats: dict
+    started_at: datetime
+    completed_at: Optional[datetime]
+
+    @property
+    def completed(self) -> bool:
+        return self.completed_at is not None
+
+
+async def load_checkpoint(conn: AsyncConnection, name: str) -> Optional[Checkpoint]:
+    table = maintenance_checkpoints_table
+    result = await conn.execute(
+        select(table.c.name, table.c.position, table.c.stats, table.c.started_at, table.c.completed_at)
+        .where(table.c.name == name)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    return Checkpoint(
+        name=row.name,
+        position=row.position,
+        stats=row.stats or {},
+        started_at=row.started_at,
+        completed_at=row.completed_at,
+    )
+
+
+async def save_checkpoint(
+    conn: AsyncConnection,
+    name: str,
+    position: Optional[str],
+    stats: dict,
+    *,
+    started_at: datetime,
+    completed: bool = False,
+):
+    """체크포인트 저장 (호출한 쪽의 트랜잭션 안에서 실행)"""
+    table = maintenance_checkpoints_table
+    now = datetime.utcnow()
+    values = {
+        "position": position,
+        "stats": stats,
+        "started_at": started_at,
+        "updated_at": now,
+        "completed_at": now if completed else None,
+    }
+    result = await conn.execute(update(table).where(table.c.name == name).values(**values))
+    if result.rowcount == 0:
+        await conn.execute(insert(table).values(name=name, **values))
+
+
+async def clear_checkpoint(conn: AsyncConnection, name: str):
+    table = maintenance_checkpoints_table
+    await conn.execute(delete(table).where(table.c.name == name))
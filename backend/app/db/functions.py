@@ -0,0 +1,53 @@
+"""
+DB 종류(SQLite / PostgreSQL)에 따라 다르게 컴파일되는 SQL 함수
+"""
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import Float
+
+
+class days_between(FunctionElement):
+    """
+    두 시각 사이의 일수 (소수 포함): days_between(end, start)
+
+    SQLite: julianday(end) - julianday(start)
+    PostgreSQL: EXTRACT(EPOCH FROM end - start) / 86400
+    """
+    type = Float()
+    name = "days_between"
+    inherit_cache = True
+
+
+@compiles(days_between)
+def _days_between_default(element, compiler, **kw):
+    end, start = list(element.clauses)
+    return f"(julianday({compiler.process(end, **kw)}) - julianday({compiler.process(start, **kw)}))"
+
+
+@compiles(days_between, "postgresql")
+def _days_between_postgresql(element, compiler, **kw):
+    end, start = list(element.clauses)
+    return f"(EXTRACT(EPOCH FROM ({compiler.process(end, **kw)} - {compiler.process(start, **kw)})) / 86400.0)"
+
+
+class code_point_order(FunctionElement):
+    """
+    문자열을 유니코드 코드 포인트 순서(= Python str 비교 순서)로 정렬하기 위한 정렬 규칙 지정
+
+    SQLite: expr COLLATE BINARY (UTF-8 바이트 비교)
+    PostgreSQL: expr COLLATE "C" (DB 기본 정렬 규칙이 ko_KR.UTF-8 등이어도 바이트 순서)
+    """
+    name = "code_point_order"
+    inherit_cache = True
+
+
+@compiles(code_point_order)
+def _code_point_order_default(element, compiler, **kw):
+    (expr,) = list(element.clauses)
+    return f"{compiler.process(expr, **kw)} COLLATE BINARY"
+
+
+@compiles(code_point_order, "postgresql")
+def _code_point_order_postgresql(element, compiler, **kw):
+    (expr,) = list(element.clauses)
+    return f'{compiler.process(expr, **kw)} COLLATE "C"'
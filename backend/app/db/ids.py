@@ -0,0 +1,90 @@
+"""
+기본 키(id) 생성과 저장 형식
+
+- 새 id 는 UUIDv7(RFC 9562) 입니다. 앞 48비트가 밀리초 단위 생성 시각이므로 나중에 만든 키가 항상 뒤에
+  정렬되어, 기본 키와 외래 키 인덱스에 삽입할 때 B-tree 의 오른쪽 끝 페이지만 채워집니다.
+  (uuid4 는 무작위 위치에 삽입되어 페이지 분할과 캐시 미스가 많음)
+- DB 에는 16바이트로 저장하고(PostgreSQL: uuid, SQLite 등: BLOB(16)), 파이썬/API 에서는 기존과 같은
+  하이픈 포함 36자 문자열로 다룹니다.
+"""
+import os
+import threading
+import time
+import uuid
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+_RAND_BITS = 74  # rand_a(12) + rand_b(62)
+_RAND_MAX = (1 << _RAND_BITS) - 1
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_rand = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    UUIDv7 생성
+
+    같은 밀리초 안에서는 난수 부분을 1씩 증가시켜 프로세스 내 단조 증가를 보장합니다 (RFC 9562 6.2 Method 2).
+    """
+    global _last_ms, _last_rand
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            # 증가 여유를 남기도록 최상위 비트는 0
+            rand = int.from_bytes(os.urandom(10), "big") & (_RAND_MAX >> 1)
+        else:
+            # 같은 밀리초이거나 시계가 뒤로 간 경우 직전 값에서 증가
+            now_ms = _last_ms
+            rand = _last_rand + 1
+            if rand > _RAND_MAX:
+                now_ms += 1
+                rand = int.from_bytes(os.urandom(10), "big") & (_RAND_MAX >> 1)
+        _last_ms, _last_rand = now_ms, rand
+
+    value = (now_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= (rand >> 62) << 64
+    value |= 0b10 << 62
+    value |= rand & ((1 << 62) - 1)
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """새 기본 키 (문자열)"""
+    return str(uuid7())
+
+
+class UUIDKey(TypeDecorator):
+    """
+    UUID 를 16바이트로 저장하고 문자열로 읽는 키 타입 (기본 키와 외래 키에 사용)
+
+    바인딩 값은 UUID 문자열 또는 uuid.UUID. 형식이 잘못된 문자열(예: 경로의 임의 값)은 어떤 행과도
+    일치하지 않도록 NULL 로 바인딩하므로, 조회는 예외 대신 "없음"이 됩니다.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            try:
+                value = uuid.UUID(value)
+            except (TypeError, ValueError, AttributeError):
+                return None
+        return value if dialect.name == "postgresql" else value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        return str(uuid.UUID(bytes=bytes(value)))
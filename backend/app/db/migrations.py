@@ -0,0 +1,163 @@
+"""
+DB 스키마 마이그레이션 및 기동 시 스키마 확인
+
+- 스키마 변경은 alembic/versions 의 마이그레이션으로 관리합니다.
+- 모델 정의와 마이그레이션 파일 목록으로 스키마 지문(fingerprint)을 계산해 DB에 저장해 두고,
+  기동 시에는 저장된 지문과 쿼리 1회로 비교만 합니다. 일치하면 리플렉션/마이그레이션을 모두 건너뜁니다.
+- 지문이 다르면(신규 DB, 신규 마이그레이션, 모델 변경) alembic upgrade head 를 실행한 뒤 지문을 갱신합니다.
+"""
+import hashlib
+import logging
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, delete, func, inspect, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.db.base import Base
+import app.models  # noqa: F401  모든 모델을 metadata에 등록
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+ALEMBIC_INI = BACKEND_DIR / "alembic.ini"
+ALEMBIC_DIR = BACKEND_DIR / "alembic"
+VERSIONS_DIR = ALEMBIC_DIR / "versions"
+
+# create_all 로 생성된 기존 DB가 해당하는 기준 리비전
+LEGACY_BASELINE_REVISION = "0001"
+
+SCHEMA_FINGERPRINT_ID = 1
+
+# 여러 워커가 동시에 기동할 때 마이그레이션을 한 번만 실행하기 위한 잠금
+# PostgreSQL: 트랜잭션 범위 advisory lock 키 (임의의 고정값), SQLite: BEGIN IMMEDIATE 대기 시간 (ms)
+SCHEMA_LOCK_KEY = 0x6461_7461_706F_7274
+SQLITE_LOCK_TIMEOUT_MS = 300_000
+
+# 마이그레이션(0003)으로 생성되며, 모델 metadata 에는 포함하지 않음
+schema_fingerprint_table = Table(
+    "schema_fingerprint",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+
+def compute_schema_fingerprint(metadata: MetaData = Base.metadata) -> str:
+    """모델 정의 + 마이그레이션 파일 목록으로 스키마 지문 계산 (DB 접근 없음)"""
+    hasher = hashlib.sha256()
+    for file_name in sorted(os.listdir(VERSIONS_DIR)):
+        if file_name.endswith(".py"):
+            hasher.update(file_name.encode("utf-8"))
+    for table in sorted(metadata.tables.values(), key=lambda table: table.name):
+        hasher.update(f"table:{table.name}".encode("utf-8"))
+        for column in table.columns:
+            hasher.update(
+                f"column:{column.name}:{column.type!r}:{column.nullable}:{column.primary_key}".encode("utf-8")
+            )
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            columns = ",".join(column.name for column in index.columns)
+            hasher.update(f"index:{index.name}:{columns}:{index.unique}".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+async def _read_fingerprint(conn: AsyncConnection) -> Optional[str]:
+    result = await conn.execute(
+        select(schema_fingerprint_table.c.fingerprint)
+        .where(schema_fingerprint_table.c.id == SCHEMA_FINGERPRINT_ID)
+    )
+    return result.scalar_one_or_none()
+
+
+async def read_stored_fingerprint(engine: AsyncEngine) -> Optional[str]:
+    """저장된 지문 조회 (테이블이 없으면 None)"""
+    try:
+        async with engine.connect() as conn:
+            return await _read_fingerprint(conn)
+    except Exception:
+        return None
+
+
+def _run_alembic_upgrade(sync_conn):
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.attributes["connection"] = sync_conn
+    config.attributes["configure_logger"] = False
+
+    table_names = set(inspect(sync_conn).get_table_names())
+    if "users" in table_names and "alembic_version" not in table_names:
+        logger.info("create_all 로 생성된 기존 DB를 리비전 %s 로 stamp 합니다", LEGACY_BASELINE_REVISION)
+        command.stamp(config, LEGACY_BASELINE_REVISION)
+
+    command.upgrade(config, "head")
+
+
+@asynccontextmanager
+async def _schema_lock(conn: AsyncConnection):
+    """
+    트랜잭션이 끝날 때까지 다른 워커의 확인+마이그레이션을 막음
+
+    PostgreSQL 은 advisory lock, SQLite 는 BEGIN IMMEDIATE 로 쓰기 잠금을 먼저 잡습니다.
+    (pysqlite 는 첫 DML 전까지 BEGIN 을 보내지 않으므로 트랜잭션 첫 문장으로 직접 시작)
+    """
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        await conn.execute(select(func.pg_advisory_xact_lock(SCHEMA_LOCK_KEY)))
+    elif dialect == "sqlite":
+        previous = (await conn.exec_driver_sql("PRAGMA busy_timeout")).scalar()
+        await conn.exec_driver_sql(f"PRAGMA busy_timeout = {SQLITE_LOCK_TIMEOUT_MS}")
+        await conn.exec_driver_sql("BEGIN IMMEDIATE")
+    try:
+        yield
+    finally:
+        if dialect == "sqlite":
+            # 풀로 돌아간 커넥션이 이후 요청에서 오래 기다리지 않도록 원래 대기 시간으로 되돌림
+            await conn.exec_driver_sql(f"PRAGMA busy_timeout = {int(previous)}")
+
+
+def _fingerprint_table_exists(sync_conn) -> bool:
+    return inspect(sync_conn).has_table(schema_fingerprint_table.name)
+
+
+async def ensure_schema(engine: AsyncEngine, auto_migrate: bool = True) -> str:
+    """
+    기동 시 스키마 확인
+
+    반환값: "current" (지문 일치, 아무 작업 안 함) / "migrated" (마이그레이션 실행)
+    """
+    expected = compute_schema_fingerprint()
+    if await read_stored_fingerprint(engine) == expected:
+        return "current"
+
+    if not auto_migrate:
+        raise RuntimeError(
+            "DB 스키마가 최신 상태가 아닙니다. 'alembic upgrade head' 를 실행하거나 AUTO_MIGRATE=true 로 설정하세요."
+        )
+
+    async with engine.begin() as conn, _schema_lock(conn):
+        # 여러 워커가 동시에 기동한 경우 잠금을 기다리는 동안 다른 워커가 먼저 마이그레이션했을 수 있음
+        if await conn.run_sync(_fingerprint_table_exists) and await _read_fingerprint(conn) == expected:
+            return "current"
+
+        await conn.run_sync(_run_alembic_upgrade)
+
+        await conn.execute(
+            delete(schema_fingerprint_table).where(schema_fingerprint_table.c.id == SCHEMA_FINGERPRINT_ID)
+        )
+        await conn.execute(
+            insert(schema_fingerprint_table).values(
+                id=SCHEMA_FINGERPRINT_ID,
+                fingerprint=expected,
+                updated_at=datetime.utcnow(),
+            )
+        )
+
+    logger.info("DB 스키마 마이그레이션 완료 (fingerprint=%s)", expected[:12])
+    return "migrated"
@@ -1,12 +1,80 @@
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=True,
-    future=True
-)
+# 읽기 전용 DB 로 보낼 수 있는 요청 메서드
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def engine_options(database_url: str, read_only: bool = False) -> dict:
+    """
+    DB 종류별 엔진 옵션
+
+    SQLite(aiosqlite)는 파일 하나에 쓰기가 직렬화되므로 기본 풀을 그대로 사용하고,
+    PostgreSQL 은 워커 프로세스마다 설정한 크기의 커넥션 풀을 유지합니다.
+    read_only: 읽기 전용 DB 엔진 (PostgreSQL 은 트랜잭션을 읽기 전용으로 시작)
+    """
+    url = make_url(database_url)
+    options = {"echo": settings.DATABASE_ECHO, "future": True}
+    if url.get_backend_name() == "postgresql":
+        options.update(
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
+            pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        )
+        if url.get_driver_name() == "asyncpg":
+            server_settings = {"application_name": "data-portal"}
+            if settings.DATABASE_STATEMENT_TIMEOUT_MS:
+                server_settings["statement_timeout"] = str(settings.DATABASE_STATEMENT_TIMEOUT_MS)
+            if read_only:
+                server_settings["default_transaction_read_only"] = "on"
+            options["connect_args"] = {"server_settings": server_settings}
+    return options
+
+
+def _sqlite_query_only(dbapi_connection, connection_record):
+    """SQLite 커넥션에서 쓰기 금지 (mode=ro 로 열지 않은 경우에도 적용)"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only = ON")
+    cursor.close()
+
+
+def _is_sqlite_file(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def create_read_engine(database_url: str):
+    options = engine_options(database_url, read_only=True)
+    if _is_sqlite_file(database_url):
+        # aiosqlite 파일 DB 의 기본 풀(NullPool)은 요청마다 커넥션(과 스레드)을 새로 열기 때문에
+        # 쓰기가 없는 query_only 커넥션은 풀에 유지해서 재사용.
+        # sqlite3 는 SELECT 에 트랜잭션을 열지 않으므로 풀에 반환할 때의 ROLLBACK 도 생략
+        options.update(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+            pool_reset_on_return=None,
+        )
+    read_engine = create_async_engine(database_url, **options)
+    if read_engine.dialect.name == "sqlite":
+        event.listen(read_engine.sync_engine, "connect", _sqlite_query_only)
+    return read_engine
+
+
+engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -16,14 +84,166 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# 조회 요청용 엔진: DATABASE_READ_URL(복제본) > 기본 DB 와 같은 SQLite 파일(query_only) > 없음(기본 엔진)
+read_replica = bool(settings.DATABASE_READ_URL)
+if read_replica:
+    read_engine = create_read_engine(settings.DATABASE_READ_URL)
+elif _is_sqlite_file(settings.DATABASE_URL):
+    read_engine = create_read_engine(settings.DATABASE_URL)
+else:
+    read_engine = None
+
+
+def _read_sessionmaker(bind):
+    """조회 전용 세션: 커밋/autoflush 없이 SELECT 만 실행 (flush 하려 하면 오류)"""
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        info={"read_only": True},
+    )
+
+
+AsyncReadSessionLocal = _read_sessionmaker(read_engine or engine)
+# 복제본 사용 시 read-your-writes 대상 사용자의 조회용
+AsyncPrimaryReadSessionLocal = _read_sessionmaker(engine)
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session, flush_context, instances):
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise InvalidRequestError("읽기 전용 세션에서는 변경할 수 없습니다 (get_write_db 사용)")
+
+
+class ReadYourWrites:
+    """
+    사용자별 최근 쓰기 기록 (read-your-writes)
+
+    복제본은 기본 DB 보다 늦게 반영될 수 있으므로, 쓰기 요청을 커밋한 사용자의 조회는
+    window 초 동안 기본 DB 로 보냅니다. 프로세스 메모리에 기록하므로 uvicorn 워커가
+    여러 개면 같은 워커로 들어온 요청에만 적용됩니다.
+    """
+
+    def __init__(self, window: float, max_users: int = 10000):
+        self.window = window
+        self.max_users = max_users
+        self._deadlines: Dict[str, float] = {}
+        self.replica_sessions = 0
+        self.primary_fallbacks = 0
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def mark(self, user_id: str):
+        if self.window <= 0:
+            return
+        now = time.monotonic()
+        if len(self._deadlines) >= self.max_users:
+            self._prune(now)
+        self._deadlines[user_id] = now + self.window
 
-async def get_db() -> AsyncSession:
-    async with AsyncSessionLocal() as session:
+    def is_recent(self, user_id: str) -> bool:
+        deadline = self._deadlines.get(user_id)
+        if deadline is None:
+            return False
+        if deadline < time.monotonic():
+            self._deadlines.pop(user_id, None)
+            return False
+        return True
+
+    def _prune(self, now: float):
+        expired = [user_id for user_id, deadline in self._deadlines.items() if deadline < now]
+        for user_id in expired:
+            del self._deadlines[user_id]
+        if len(self._deadlines) >= self.max_users:
+            # 모두 유효하면 가장 먼저 만료될 절반을 버림 (해당 사용자는 복제본 지연을 볼 수 있음)
+            for user_id in sorted(self._deadlines, key=self._deadlines.get)[: self.max_users // 2]:
+                del self._deadlines[user_id]
+
+
+read_your_writes = ReadYourWrites(settings.DATABASE_READ_YOUR_WRITES_SECONDS)
+
+
+def _request_user_id(request: Request) -> Optional[str]:
+    """Authorization 헤더의 access token 에서 사용자 id 추출 (DB 조회 없음)"""
+    from app.core.security import decode_token
+
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = decode_token(token)
+    return payload.get("sub") if payload else None
+
+
+@asynccontextmanager
+async def _read_only_scope(session_factory) -> AsyncIterator[AsyncSession]:
+    """조회 전용: 커밋 없이 세션만 닫음 (커넥션 반환 시 풀이 트랜잭션 정리)"""
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+@asynccontextmanager
+async def _session_scope(session_factory, on_commit=None) -> AsyncIterator[AsyncSession]:
+    async with session_factory() as session:
         try:
             yield session
             await session.commit()
+            if on_commit is not None:
+                on_commit()
         except Exception:
             await session.rollback()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+def _write_scope(request: Request):
+    on_commit = None
+    if read_replica and read_your_writes.window > 0 and request.method not in SAFE_METHODS:
+        def on_commit():
+            user_id = _request_user_id(request)
+            if user_id:
+                read_your_writes.mark(user_id)
+    return _session_scope(AsyncSessionLocal, on_commit)
+
+
+def _read_scope(request: Request):
+    if not read_replica:
+        return _read_only_scope(AsyncReadSessionLocal)
+    if len(read_your_writes):
+        user_id = _request_user_id(request)
+        if user_id and read_your_writes.is_recent(user_id):
+            read_your_writes.primary_fallbacks += 1
+            return _read_only_scope(AsyncPrimaryReadSessionLocal)
+    read_your_writes.replica_sessions += 1
+    return _read_only_scope(AsyncReadSessionLocal)
+
+
+async def get_db(request: Request) -> AsyncSession:
+    """
+    요청 메서드에 따라 세션 선택
+
+    GET/HEAD/OPTIONS 는 커밋하지 않는 조회 전용 세션(DATABASE_READ_URL 설정 시 복제본),
+    그 외는 기본 DB 세션 (요청이 끝나면 커밋).
+    방금 쓰기 요청을 한 사용자의 조회는 기본 DB 로 보냅니다 (ReadYourWrites).
+    """
+    scope = _read_scope(request) if request.method in SAFE_METHODS else _write_scope(request)
+    async with scope as session:
+        yield session
+
+
+async def get_write_db(request: Request) -> AsyncSession:
+    """항상 기본 DB 세션 (조회 요청이지만 복제 지연 없이 최신 데이터가 필요한 경우)"""
+    async with _write_scope(request) as session:
+        yield session
+
+
+async def get_read_db(request: Request) -> AsyncSession:
+    """조회 전용 세션 (요청 메서드와 무관하게 조회만 하는 경우)"""
+    async with _read_scope(request) as session:
+        yield session
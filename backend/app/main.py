@@ -1,59 +1,136 @@
-from fastapi import FastAPI
+from importlib import import_module
+from typing import Optional
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from contextlib import asynccontextmanager
 from slowapi.errors import RateLimitExceeded
+from sqlalchemy.orm.exc import StaleDataError
 
-from app.core.config import settings
+from app.core.config import Settings, get_settings
 from app.core.rate_limit import limiter, rate_limit_exceeded_handler
-from app.db.session import engine
-from app.db.base import Base
-from app.api import auth, applications, admin, crypto
-from app.models import *
-
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
-
-
-app = FastAPI(
-    title=settings.PROJECT_NAME,
-    version=settings.VERSION,
-    lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json"
-)
+from app.core.metrics import MetricsMiddleware, instrument_engine, registry as metrics_registry
+from app.db.session import engine, read_engine, read_replica, read_your_writes, AsyncSessionLocal
+from app.db.migrations import ensure_schema
 
-# Add rate limiter to app state
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 모든 origin 허용 (개발 환경)
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+# 설정에 따라 등록할 라우터 모듈 (create_app 에서 필요한 것만 import)
+CORE_ROUTERS = (
+    "app.api.auth",
+    "app.api.applications",
+    "app.api.extractions",
+    "app.api.admin",
+    "app.api.events",
+    "app.api.jobs",
+    "app.api.catalog",
 )
+DEV_ROUTERS = ("app.api.crypto",)
+
+
+def _router_modules(settings: Settings):
+    modules = list(CORE_ROUTERS)
+    if settings.crypto_api_enabled:
+        modules.extend(DEV_ROUTERS)
+    return modules
+
+
+async def stale_data_handler(request: Request, exc: StaleDataError):
+    """version_id_col 검사 실패 (읽은 뒤 다른 요청이 먼저 수정함)"""
+    return JSONResponse(
+        status_code=412,
+        content={"detail": "Resource has been modified (ETag mismatch)"}
+    )
+
+
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """
+    FastAPI 앱 생성
+
+    uvicorn 에서 직접 사용할 때: uvicorn app.main:create_app --factory
+    """
+    settings = settings or get_settings()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # 저장된 스키마 지문이 일치하면 쿼리 1회로 끝나고, 다르면 alembic upgrade head 실행
+        await ensure_schema(engine, auto_migrate=settings.AUTO_MIGRATE)
+        from app.services.login_activity import login_activity
+        await login_activity.start(AsyncSessionLocal)
+        runner = None
+        if settings.JOBS_ENABLED:
+            from app.services.jobs import create_runner
+            runner = create_runner(AsyncSessionLocal)
+            await runner.start()
+        yield
+        if runner is not None:
+            await runner.stop()
+        # 모아 둔 로그인 시각 기록
+        await login_activity.stop()
+
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        version=settings.VERSION,
+        lifespan=lifespan,
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/openapi.json"
+    )
+
+    # Add rate limiter to app state
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+    app.add_exception_handler(StaleDataError, stale_data_handler)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # 모든 origin 허용 (개발 환경)
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["Server-Timing", "ETag"],
+    )
+
+    if settings.METRICS_ENABLED:
+        instrument_engine(engine.sync_engine)
+        if read_engine is not None:
+            instrument_engine(read_engine.sync_engine, "db_read")
+        if read_replica:
+            metrics_registry.register_gauge("db_read_replica_sessions_total", lambda: read_your_writes.replica_sessions)
+            metrics_registry.register_gauge("db_read_primary_fallbacks_total", lambda: read_your_writes.primary_fallbacks)
+        app.add_middleware(MetricsMiddleware)
+
+    for module_name in _router_modules(settings):
+        app.include_router(import_module(module_name).router)
+
+    @app.get("/")
+    async def root():
+        return {
+            "name": settings.PROJECT_NAME,
+            "version": settings.VERSION,
+            "status": "running"
+        }
 
-app.include_router(auth.router)
-app.include_router(applications.router)
-app.include_router(admin.router)
-app.include_router(crypto.router)
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
 
+    if settings.METRICS_ENABLED:
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            return PlainTextResponse(
+                metrics_registry.render(),
+                media_type="text/plain; version=0.0.4"
+            )
 
-@app.get("/")
-async def root():
-    return {
-        "name": settings.PROJECT_NAME,
-        "version": settings.VERSION,
-        "status": "running"
-    }
+    return app
 
 
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+def __getattr__(name: str):
+    # uvicorn app.main:app / from app.main import app 호환
+    # 모듈 import 시점이 아니라 app 에 처음 접근할 때 기본 설정으로 생성
+    if name == "app":
+        application = create_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,17 @@
-from app.models.user import User, UserRole
+from app.models.user import User, UserRole, ApplicationListGeneration
 from app.models.application import Application, ApplicationStatus
 from app.models.log import ApplicationLog, LogAction
 from app.models.download import Download
 from app.models.token import RefreshToken
 from app.models.password_reset import PasswordResetToken
+from app.models.job import Job, JobStatus
+from app.models.catalog import CatalogDataset, CatalogColumn, SensitivityLevel
+from app.models.extraction import Extraction, ExtractionStatus
 
 __all__ = [
     "User",
     "UserRole",
+    "ApplicationListGeneration",
     "Application",
     "ApplicationStatus",
     "ApplicationLog",
@@ -15,4 +19,11 @@ __all__ = [
     "Download",
     "RefreshToken",
     "PasswordResetToken",
+    "Job",
+    "JobStatus",
+    "CatalogDataset",
+    "CatalogColumn",
+    "SensitivityLevel",
+    "Extraction",
+    "ExtractionStatus",
 ]
\ No newline at end of file
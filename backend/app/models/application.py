@@ -1,7 +1,8 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, JSON, Date, Enum as SQLEnum, Boolean
+from sqlalchemy import Column, String, ForeignKey, Text, JSON, Date, Integer, Index, Enum as SQLEnum, Boolean, event
 from sqlalchemy.orm import relationship
 import enum
-from app.db.base import BaseModel
+from typing import Iterable, List
+from app.db.base import BaseModel, KSTDateTime, UUIDKey
 
 
 class ApplicationStatus(str, enum.Enum):
@@ -22,10 +23,38 @@ class ServiceType(str, enum.Enum):
     EXTERNAL_LINKAGE = "EXTERNAL_LINKAGE"  # 타기관 결합
 
 
+# 서비스 유형 -> service_types_mask 비트 (저장된 값이 있으므로 기존 비트는 바꾸지 말고 새 유형은 다음 비트 사용)
+SERVICE_TYPE_BITS = {
+    ServiceType.STRUCTURED_EXTRACTION: 1,
+    ServiceType.UNSTRUCTURED_EXTRACTION: 2,
+    ServiceType.PSEUDONYMIZATION: 4,
+    ServiceType.EXTERNAL_LINKAGE: 8,
+}
+SERVICE_TYPE_MASK_LIMIT = 1 << len(SERVICE_TYPE_BITS)
+
+
+def service_types_mask(service_types: Iterable) -> int:
+    """서비스 유형 목록(JSON 값 또는 Enum) -> 비트마스크"""
+    mask = 0
+    for service_type in service_types or ():
+        mask |= SERVICE_TYPE_BITS[ServiceType(service_type)]
+    return mask
+
+
+def masks_with(service_type: ServiceType) -> List[int]:
+    """해당 유형 비트를 포함하는 모든 마스크 값 (IN 조건으로 인덱스 검색)"""
+    bit = SERVICE_TYPE_BITS[ServiceType(service_type)]
+    return [mask for mask in range(1, SERVICE_TYPE_MASK_LIMIT) if mask & bit]
+
+
+def service_types_from_mask(mask: int) -> List[ServiceType]:
+    return [service_type for service_type, bit in SERVICE_TYPE_BITS.items() if mask & bit]
+
+
 class Application(BaseModel):
     __tablename__ = "applications"
     
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUIDKey, ForeignKey("users.id"), nullable=False)
     
     # 기본 정보
     project_name = Column(String, nullable=False)  # 연구과제명
@@ -40,7 +69,11 @@ class Application(BaseModel):
     
     # 데이터 상세 내용
     service_types = Column(JSON, nullable=False)  # 서비스 유형 (체크박스 다중 선택)
+    # service_types 의 비트마스크 (SERVICE_TYPE_BITS), 유형별 검색/집계용. ORM 저장 시 자동 계산,
+    # Core UPDATE/INSERT 로 service_types 를 쓸 때는 service_types_mask() 로 함께 지정해야 함
+    service_types_mask = Column(Integer, nullable=False, default=0, server_default="0")
     unstructured_data_type = Column(Text)  # 비정형 데이터 유형
+    requested_columns = Column(JSON)  # 요청 데이터 항목 (카탈로그 컬럼 키 "<데이터 종류>.<컬럼>" 목록)
     target_patients = Column(Text, nullable=False)  # 대상환자
     
     # 요청 상세 내용
@@ -56,17 +89,40 @@ class Application(BaseModel):
     status = Column(SQLEnum(ApplicationStatus), default=ApplicationStatus.DRAFT, nullable=False)
     rejection_reason = Column(Text)
     revision_request_reason = Column(Text)
-    submitted_at = Column(DateTime)
-    reviewed_at = Column(DateTime)
-    reviewed_by = Column(String, ForeignKey("users.id"))
-    completed_at = Column(DateTime)
-    rejected_at = Column(DateTime)
-    deleted_at = Column(DateTime)
-    deleted_by = Column(String, ForeignKey("users.id"))
+    submitted_at = Column(KSTDateTime)
+    reviewed_at = Column(KSTDateTime)
+    reviewed_by = Column(UUIDKey, ForeignKey("users.id"))
+    completed_at = Column(KSTDateTime)
+    rejected_at = Column(KSTDateTime)
+    deleted_at = Column(KSTDateTime)
+    deleted_by = Column(UUIDKey, ForeignKey("users.id"))
     deletion_reason = Column(Text)
     dcyn = Column(String(1), default='N', nullable=False)
+    # 낙관적 동시성 제어 (ORM UPDATE 시 WHERE version = ? 검사 후 1 증가), ETag 로도 사용
+    # Core UPDATE 로 변경할 때는 version=Application.version + 1 을 직접 지정해야 함
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     
     user = relationship("User", back_populates="applications", foreign_keys=[user_id])
     reviewer = relationship("User", back_populates="reviewed_applications", foreign_keys=[reviewed_by])
     logs = relationship("ApplicationLog", back_populates="application", cascade="all, delete-orphan")
-    downloads = relationship("Download", back_populates="application", cascade="all, delete-orphan")
\ No newline at end of file
+    downloads = relationship("Download", back_populates="application", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # 유형별 기간 조회: service_types_mask IN (...) AND created_at 범위
+        Index("ix_applications_service_types_mask_created", "service_types_mask", "created_at"),
+    )
+    
+    __mapper_args__ = {"version_id_col": version}
+    
+    @classmethod
+    def has_service_type(cls, service_type: ServiceType):
+        """해당 서비스 유형을 포함하는 신청서 조건 (service_types_mask 인덱스 사용)"""
+        return cls.service_types_mask.in_(masks_with(service_type))
+
+
+@event.listens_for(Application, "before_insert")
+@event.listens_for(Application, "before_update")
+def _sync_service_types_mask(mapper, connection, target):
+    mask = service_types_mask(target.service_types)
+    if target.service_types_mask != mask:
+        target.service_types_mask = mask
@@ -0,0 +1,48 @@
+from sqlalchemy import Column, String, Text, Integer, Boolean, ForeignKey, Index, Enum as SQLEnum
+from sqlalchemy.orm import relationship
+import enum
+from app.db.base import BaseModel, UUIDKey
+
+
+class SensitivityLevel(str, enum.Enum):
+    LOW = "LOW"  # 코드/명칭, 신체계측 등 단독으로는 개인을 알아보기 어려운 항목
+    MEDIUM = "MEDIUM"  # 진단명, 처방, 검사 결과, 병리 소견 등 건강정보
+    HIGH = "HIGH"  # 생년월일, 일자/일시 등 다른 정보와 결합하면 재식별 위험이 큰 준식별자
+
+
+class CatalogDataset(BaseModel):
+    """데이터 카탈로그의 데이터 종류 (진단, 약처방, 검사결과 ...)"""
+    __tablename__ = "catalog_datasets"
+
+    key = Column(String, nullable=False, unique=True)  # API/신청서에서 쓰는 키 (diagnosis, medication ...)
+    name = Column(String, nullable=False)  # 탭 이름 (진단)
+    title = Column(String, nullable=False)  # 제목 (진단 데이터)
+    description = Column(Text)
+    sort_order = Column(Integer, nullable=False, default=0)
+    # 변경 시 1 증가, 전체 합계가 카탈로그 스냅샷 리비전 (app.services.catalog)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    columns = relationship("CatalogColumn", back_populates="dataset")
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+class CatalogColumn(BaseModel):
+    """데이터 종류별 제공 가능한 컬럼"""
+    __tablename__ = "catalog_columns"
+
+    dataset_id = Column(UUIDKey, ForeignKey("catalog_datasets.id"), nullable=False)
+    key = Column(String, nullable=False)  # 데이터 종류 안에서 고유 (diagCode ...)
+    label = Column(String, nullable=False)  # 한글 항목명
+    default_selected = Column(Boolean, nullable=False, default=False)  # 기본 선택 여부
+    sensitivity = Column(SQLEnum(SensitivityLevel), nullable=False, default=SensitivityLevel.LOW)
+    sort_order = Column(Integer, nullable=False, default=0)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    dataset = relationship("CatalogDataset", back_populates="columns")
+
+    __table_args__ = (
+        Index("ix_catalog_columns_dataset_key", "dataset_id", "key", unique=True),
+    )
+
+    __mapper_args__ = {"version_id_col": version}
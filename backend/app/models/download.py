@@ -1,13 +1,13 @@
 from sqlalchemy import Column, String, ForeignKey, Integer
 from sqlalchemy.orm import relationship
-from app.db.base import BaseModel
+from app.db.base import BaseModel, UUIDKey
 
 
 class Download(BaseModel):
     __tablename__ = "downloads"
     
-    application_id = Column(String, ForeignKey("applications.id"), nullable=False)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    application_id = Column(UUIDKey, ForeignKey("applications.id"), nullable=False)
+    user_id = Column(UUIDKey, ForeignKey("users.id"), nullable=False)
     file_name = Column(String, nullable=False)
     file_size = Column(Integer)
     file_path = Column(String, nullable=False)
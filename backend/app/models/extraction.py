@@ -0,0 +1,38 @@
+from sqlalchemy import Column, String, ForeignKey, Text, JSON, Integer, Float, Index, Enum as SQLEnum
+import enum
+from app.db.base import BaseModel, UUIDKey, KSTDateTime
+
+
+class ExtractionStatus(str, enum.Enum):
+    PENDING = "PENDING"  # 작업 실행 대기
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"  # 결과 파일 생성 완료
+    FAILED = "FAILED"
+
+
+class Extraction(BaseModel):
+    """정형 추출 실행 (신청서의 requested_columns + 코호트 조건 -> 결과 파일)"""
+    __tablename__ = "extractions"
+
+    application_id = Column(UUIDKey, ForeignKey("applications.id"), nullable=False)
+    requested_by = Column(UUIDKey, ForeignKey("users.id"), nullable=False)
+    job_id = Column(UUIDKey)  # 실행 작업 (jobs.id)
+    status = Column(SQLEnum(ExtractionStatus), default=ExtractionStatus.PENDING, nullable=False)
+    columns = Column(JSON, nullable=False)  # 실행 시점의 requested_columns
+    cohort = Column(JSON, nullable=False)  # 코호트 조건 (app.schemas.extraction.CohortFilter)
+    pseudonymization = Column(JSON)  # 가명화 규칙 (app.schemas.extraction.PseudonymizationSpec, 없으면 원본 제공)
+    progress = Column(Float, default=0.0, nullable=False)  # 0 ~ 1 (처리한 행 / 처리할 행)
+    rows_total = Column(Integer, default=0, nullable=False)  # 처리할 전체 행 수 (코호트 + 추출 데이터 종류 + 가명화할 결과 행)
+    rows_scanned = Column(Integer, default=0, nullable=False)
+    rows_written = Column(Integer, default=0, nullable=False)
+    cohort_size = Column(Integer)  # 코호트 환자 수
+    file_path = Column(String)
+    file_size = Column(Integer)
+    started_at = Column(KSTDateTime)
+    finished_at = Column(KSTDateTime)
+    error = Column(Text)
+
+    __table_args__ = (
+        # 신청서의 최근 추출 조회
+        Index("ix_extractions_application_created", "application_id", "created_at"),
+    )
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, String, Text, JSON, Integer, Index, Enum as SQLEnum
+import enum
+from app.db.base import BaseModel, KSTDateTime
+
+
+class JobStatus(str, enum.Enum):
+    PENDING = "PENDING"  # 실행 대기 (run_at 이후 실행)
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"  # 재시도 횟수 소진
+    CANCELLED = "CANCELLED"
+
+
+class Job(BaseModel):
+    __tablename__ = "jobs"
+
+    name = Column(String, nullable=False)  # 등록된 작업 이름 (app.services.jobs.job 데코레이터)
+    payload = Column(JSON)
+    status = Column(SQLEnum(JobStatus), default=JobStatus.PENDING, nullable=False)
+    run_at = Column(KSTDateTime, nullable=False)  # 이 시각 이후 실행 (재시도 시 backoff 반영)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=3, nullable=False)
+    started_at = Column(KSTDateTime)
+    finished_at = Column(KSTDateTime)
+    locked_by = Column(String)  # 실행 중인 워커 (프로세스 식별자)
+    last_error = Column(Text)
+    result = Column(JSON)
+
+    __table_args__ = (
+        # 워커가 실행할 작업을 꺼낼 때: status = PENDING AND run_at <= now ORDER BY run_at
+        Index("ix_jobs_status_run_at", "status", "run_at"),
+        Index("ix_jobs_name_status", "name", "status"),
+    )
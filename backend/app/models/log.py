@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, ForeignKey, Text, JSON, Enum as SQLEnum
+from sqlalchemy import Column, String, ForeignKey, Text, JSON, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 import enum
-from app.db.base import BaseModel
+from app.db.base import BaseModel, UUIDKey
 
 
 class LogAction(str, enum.Enum):
@@ -20,11 +20,16 @@ class LogAction(str, enum.Enum):
 class ApplicationLog(BaseModel):
     __tablename__ = "application_logs"
     
-    application_id = Column(String, ForeignKey("applications.id"), nullable=False)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    application_id = Column(UUIDKey, ForeignKey("applications.id"), nullable=False)
+    user_id = Column(UUIDKey, ForeignKey("users.id"), nullable=False)
     action = Column(SQLEnum(LogAction), nullable=False)
     reason = Column(Text)
     details = Column(JSON)
     
     application = relationship("Application", back_populates="logs")
-    user = relationship("User", back_populates="logs")
\ No newline at end of file
+    user = relationship("User", back_populates="logs")
+    
+    __table_args__ = (
+        # 이벤트 스트림 Last-Event-ID 재접속 시 (created_at, id) 이후 로그 조회
+        Index("ix_application_logs_created_id", "created_at", "id"),
+    )
@@ -1,16 +1,16 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, ForeignKey, Boolean
 from sqlalchemy.orm import relationship
 from datetime import datetime, timedelta
 import secrets
-from app.db.base import BaseModel
+from app.db.base import BaseModel, KSTDateTime, UUIDKey
 
 
 class PasswordResetToken(BaseModel):
     __tablename__ = "password_reset_tokens"
     
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUIDKey, ForeignKey("users.id"), nullable=False)
     token = Column(String, unique=True, nullable=False, index=True)
-    expires_at = Column(DateTime, nullable=False)
+    expires_at = Column(KSTDateTime, nullable=False)
     used = Column(Boolean, default=False, nullable=False)
     
     user = relationship("User", back_populates="password_reset_tokens")
@@ -1,13 +1,13 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime
+from sqlalchemy import Column, String, ForeignKey
 from sqlalchemy.orm import relationship
-from app.db.base import BaseModel
+from app.db.base import BaseModel, KSTDateTime, UUIDKey
 
 
 class RefreshToken(BaseModel):
     __tablename__ = "refresh_tokens"
     
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUIDKey, ForeignKey("users.id"), nullable=False)
     token = Column(String, unique=True, index=True, nullable=False)
-    expires_at = Column(DateTime, nullable=False)
+    expires_at = Column(KSTDateTime, nullable=False)
     
     user = relationship("User", back_populates="refresh_tokens")
\ No newline at end of file
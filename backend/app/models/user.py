@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Boolean, Integer, Index, ForeignKey, Enum as SQLEnum, func, select
+from sqlalchemy.orm import relationship, column_property
 import enum
 from datetime import datetime
-from app.db.base import BaseModel
+from app.db.base import Base, BaseModel, KSTDateTime, UUIDKey
 
 
 class UserRole(str, enum.Enum):
@@ -15,17 +15,53 @@ class User(BaseModel):
     
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, index=True)
     role = Column(SQLEnum(UserRole), default=UserRole.RESEARCHER, nullable=False)
-    department = Column(String)
-    position = Column(String)
+    department = Column(String, index=True)
+    position = Column(String, index=True)
     phone = Column(String)
     is_active = Column(Boolean, default=True, nullable=False)
-    last_login_at = Column(DateTime)
+    last_login_at = Column(KSTDateTime)
+    # 낙관적 동시성 제어 (ORM UPDATE 시 WHERE version = ? 검사 후 1 증가), ETag 로도 사용
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     
     applications = relationship("Application", back_populates="user", foreign_keys="Application.user_id")
     reviewed_applications = relationship("Application", back_populates="reviewer", foreign_keys="Application.reviewed_by")
     logs = relationship("ApplicationLog", back_populates="user")
     downloads = relationship("Download", back_populates="user")
     refresh_tokens = relationship("RefreshToken", back_populates="user")
-    password_reset_tokens = relationship("PasswordResetToken", back_populates="user")
\ No newline at end of file
+    password_reset_tokens = relationship("PasswordResetToken", back_populates="user")
+    
+    __table_args__ = (
+        # 관리자 사용자 검색: role/is_active 필터 + (created_at, id) 키셋 페이지네이션
+        Index("ix_users_role_active_created", "role", "is_active", "created_at", "id"),
+        Index("ix_users_created_id", "created_at", "id"),
+        # 대소문자 무시 접두어 검색 (lower(컬럼) 범위 조건), PostgreSQL 부분 일치용 트라이그램 인덱스는 0014 에서 생성
+        Index("ix_users_name_lower", func.lower(name)),
+        Index("ix_users_email_lower", func.lower(email)),
+        Index("ix_users_department_lower", func.lower(department)),
+        Index("ix_users_position_lower", func.lower(position)),
+    )
+    
+    __mapper_args__ = {"version_id_col": version}
+
+
+class ApplicationListGeneration(Base):
+    """
+    연구자 신청서 목록 응답 캐시 세대 (app.services.application_cache)
+
+    본인 신청서가 바뀔 때마다 1 증가합니다. 신청서 쓰기마다 users 행을 잠그지 않도록 별도 테이블에 둡니다.
+    """
+    __tablename__ = "application_list_generations"
+
+    user_id = Column(UUIDKey, ForeignKey("users.id"), primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
+
+
+# 사용자 조회와 같은 쿼리에서 세대를 함께 읽음 (행이 없으면 0)
+User.applications_generation = column_property(
+    select(func.coalesce(func.max(ApplicationListGeneration.generation), 0))
+    .where(ApplicationListGeneration.user_id == User.id)
+    .correlate_except(ApplicationListGeneration)
+    .scalar_subquery()
+)
@@ -1,9 +1,26 @@
+import re
+
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
 from datetime import datetime, date
 from app.models.application import ApplicationStatus, ServiceType
 
 
+# 요청 데이터 항목 키: "<데이터 종류 키>.<컬럼 키>" (존재 여부는 API 에서 카탈로그로 검증)
+REQUESTED_COLUMN_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9_]*\.[A-Za-z][A-Za-z0-9_]*$")
+MAX_REQUESTED_COLUMNS = 500
+
+
+def normalize_requested_columns(keys: Optional[List[str]]) -> Optional[List[str]]:
+    """형식 검사 + 중복 제거 (순서 유지)"""
+    if keys is None:
+        return None
+    invalid = [key for key in keys if not REQUESTED_COLUMN_PATTERN.match(key)]
+    if invalid:
+        raise ValueError(f"데이터 항목 키 형식이 올바르지 않습니다 (<데이터 종류>.<컬럼>): {', '.join(invalid[:10])}")
+    return list(dict.fromkeys(keys))
+
+
 class ApplicationBase(BaseModel):
     # 기본 정보
     project_name: str = Field(..., min_length=1, description="연구과제명")
@@ -17,10 +34,17 @@ class ApplicationBase(BaseModel):
     service_types: List[ServiceType] = Field(..., min_items=1, description="서비스 유형")
     unstructured_data_type: Optional[str] = Field(None, description="비정형 데이터 유형")
     target_patients: str = Field(..., min_length=10, description="대상환자")
+    requested_columns: Optional[List[str]] = Field(
+        None, max_length=MAX_REQUESTED_COLUMNS, description="요청 데이터 항목 (카탈로그 컬럼 키: diagnosis.diagCode)"
+    )
     
     # 요청 상세 내용
     request_details: str = Field(..., min_length=20, description="요청 상세 내용")
     
+    @field_validator('requested_columns')
+    def validate_requested_columns(cls, v):
+        return normalize_requested_columns(v)
+    
     @field_validator('service_types')
     def validate_service_types(cls, v):
         if not v or len(v) == 0:
@@ -63,9 +87,14 @@ class ApplicationUpdate(BaseModel):
     service_types: Optional[List[ServiceType]] = Field(None, min_items=1)
     unstructured_data_type: Optional[str] = None
     target_patients: Optional[str] = Field(None, min_length=10)
+    requested_columns: Optional[List[str]] = Field(None, max_length=MAX_REQUESTED_COLUMNS)
     
     # 요청 상세 내용 (수정 가능)
     request_details: Optional[str] = Field(None, min_length=20)
+    
+    @field_validator('requested_columns')
+    def validate_requested_columns(cls, v):
+        return normalize_requested_columns(v)
 
 
 class ApplicationReview(BaseModel):
@@ -93,6 +122,7 @@ class ApplicationInDB(BaseModel):
     service_types: List[ServiceType]
     unstructured_data_type: Optional[str] = None
     target_patients: str
+    requested_columns: Optional[List[str]] = None
     
     # 요청 상세 내용
     request_details: str
@@ -144,6 +174,7 @@ class Application(BaseModel):
     service_types: List[ServiceType]
     unstructured_data_type: Optional[str] = None
     target_patients: str
+    requested_columns: Optional[List[str]] = None
     
     # 요청 상세 내용
     request_details: str
@@ -174,6 +205,7 @@ class Application(BaseModel):
     deleted_by: Optional[str] = None
     deletion_reason: Optional[str] = None
     dcyn: str = 'N'
+    version: int = 1
     
     class Config:
         from_attributes = True
@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List, Literal
+from app.models.application import ApplicationStatus
+
+
+# 한 번의 요청으로 처리할 수 있는 최대 ID 수
+MAX_BULK_IDS = 500
+
+
+class UserBulkAction(BaseModel):
+    user_ids: List[str] = Field(..., min_length=1, max_length=MAX_BULK_IDS, description="대상 사용자 ID 목록")
+    action: Literal["activate", "deactivate", "delete"] = Field(..., description="일괄 작업 종류")
+
+
+class ApplicationBulkStatusUpdate(BaseModel):
+    application_ids: List[str] = Field(..., min_length=1, max_length=MAX_BULK_IDS, description="대상 신청서 ID 목록")
+    status: ApplicationStatus = Field(..., description="변경할 상태")
+
+
+class ApplicationBulkDelete(BaseModel):
+    application_ids: List[str] = Field(..., min_length=1, max_length=MAX_BULK_IDS, description="대상 신청서 ID 목록")
+    reason: str = Field(..., min_length=1, description="삭제 사유")
+
+
+class BulkItemResult(BaseModel):
+    id: str
+    success: bool
+    detail: Optional[str] = None
+
+
+class BulkOperationResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
@@ -0,0 +1,46 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from app.models.catalog import SensitivityLevel
+
+
+# 데이터 종류/컬럼 키 형식 (신청서의 requested_columns 는 "<데이터 종류 키>.<컬럼 키>")
+CATALOG_KEY_PATTERN = r"^[A-Za-z][A-Za-z0-9_]*$"
+
+
+class CatalogColumn(BaseModel):
+    key: str
+    label: str
+    default_selected: bool
+    sensitivity: SensitivityLevel
+    sort_order: int
+
+    class Config:
+        from_attributes = True
+
+
+class CatalogDataset(BaseModel):
+    key: str
+    name: str
+    title: str
+    description: Optional[str] = None
+    sort_order: int
+    columns: List[CatalogColumn]
+
+
+class Catalog(BaseModel):
+    revision: int = Field(..., description="카탈로그 리비전 (변경될 때마다 증가, ETag 와 같음)")
+    datasets: List[CatalogDataset]
+
+
+class CatalogDatasetUpsert(BaseModel):
+    name: str = Field(..., min_length=1, description="탭 이름")
+    title: str = Field(..., min_length=1, description="제목")
+    description: Optional[str] = None
+    sort_order: int = 0
+
+
+class CatalogColumnUpsert(BaseModel):
+    label: str = Field(..., min_length=1, description="한글 항목명")
+    default_selected: bool = Field(False, description="기본 선택 여부")
+    sensitivity: SensitivityLevel = Field(SensitivityLevel.LOW, description="민감도")
+    sort_order: int = 0
@@ -0,0 +1,120 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List, Any, Literal
+from datetime import datetime
+from app.models.extraction import ExtractionStatus
+from app.schemas.catalog import CATALOG_KEY_PATTERN
+
+
+class CohortCondition(BaseModel):
+    """
+    코호트 조건 하나 (문자열 값은 문자열로, 숫자 값은 숫자로 비교)
+
+    - eq: 같음 / in: 목록 중 하나 / prefix: 접두어 (문자열 또는 목록, 예: 진단코드 "E11")
+    - between: [하한, 상한] 포함 / gte, lte: 이상, 이하 (날짜는 "YYYY-MM-DD" 문자열 비교)
+    """
+    column: str = Field(..., pattern=CATALOG_KEY_PATTERN, description="코호트 데이터 종류의 컬럼 키")
+    op: Literal["eq", "in", "prefix", "between", "gte", "lte"]
+    value: Any
+
+    @model_validator(mode="after")
+    def check_value(self):
+        if self.op == "between" and (not isinstance(self.value, list) or len(self.value) != 2):
+            raise ValueError("between 조건의 값은 [하한, 상한] 이어야 합니다")
+        if self.op == "in" and (not isinstance(self.value, list) or not self.value):
+            raise ValueError("in 조건의 값은 비어 있지 않은 목록이어야 합니다")
+        if self.op == "prefix" and not (
+            isinstance(self.value, str)
+            or (isinstance(self.value, list) and self.value and all(isinstance(item, str) for item in self.value))
+        ):
+            raise ValueError("prefix 조건의 값은 문자열 또는 문자열 목록이어야 합니다")
+        if self.value is None or isinstance(self.value, dict):
+            raise ValueError("조건 값이 올바르지 않습니다")
+        return self
+
+
+class CohortFilter(BaseModel):
+    """대상 환자 선정 조건: dataset 에서 모든 조건을 만족하는 행의 환자(id)"""
+    dataset: str = Field("diagnosis", pattern=CATALOG_KEY_PATTERN, description="코호트 데이터 종류 키")
+    conditions: List[CohortCondition] = Field(..., min_length=1, max_length=50)
+
+
+# 코호트와 추출 행을 잇는 환자 식별 컬럼 (카탈로그의 "대체번호") 과 이 컬럼에 허용하는 가명화 방법
+PATIENT_ID_COLUMN = "id"
+PATIENT_ID_METHODS = ("hmac", "drop")
+
+# 기본 가명화 규칙: 대체번호는 HMAC, 생년월일은 연도만, 나머지 날짜/일시 컬럼은 환자별 날짜 이동
+DEFAULT_PSEUDONYMIZATION_RULES = (
+    ("id", "hmac"),
+    ("birth", "year"),
+    ("date", "date_shift"),
+    ("dischargeDate", "date_shift"),
+    ("prescDate", "date_shift"),
+    ("surgDate", "date_shift"),
+    ("visitTime", "date_shift"),
+    ("dischargeTime", "date_shift"),
+    ("receiveTime", "date_shift"),
+    ("reportTime", "date_shift"),
+)
+
+
+class PseudonymizationRule(BaseModel):
+    column: str = Field(..., pattern=CATALOG_KEY_PATTERN, description="컬럼 키 (이 컬럼이 있는 모든 데이터 종류에 적용)")
+    method: Literal["hmac", "date_shift", "year", "drop"]
+
+
+class PseudonymizationSpec(BaseModel):
+    """
+    가명화 규칙 (app.services.pseudonymization)
+
+    - hmac: 키 기반 가명 (대체번호, 주민등록번호 등) / date_shift: 환자별 날짜 이동
+    - year: 연도만 남김 / drop: 컬럼 삭제
+    """
+    rules: List[PseudonymizationRule] = Field(
+        default_factory=lambda: [
+            PseudonymizationRule(column=column, method=method) for column, method in DEFAULT_PSEUDONYMIZATION_RULES
+        ],
+        min_length=1,
+        max_length=200,
+    )
+    date_shift_days: int = Field(30, ge=1, le=3650, description="최대 이동 일수 (환자마다 ±1 ~ 이 값)")
+
+
+class ExtractionCreate(BaseModel):
+    cohort: CohortFilter
+    pseudonymization: Optional[PseudonymizationSpec] = Field(
+        None, description="지정하면 결과 파일을 가명화해 제공 (가명화 신청서만)"
+    )
+
+    @model_validator(mode="after")
+    def check_patient_id_rule(self):
+        # 가명화할 때는 날짜 이동을 위해 대체번호(id)를 모든 데이터 종류에 함께 추출하므로
+        # id 를 가명(hmac)으로 바꾸거나 삭제(drop)하는 규칙이 없으면 원래 대체번호가 그대로 제공됨
+        if self.pseudonymization and not any(
+            rule.column == PATIENT_ID_COLUMN and rule.method in PATIENT_ID_METHODS
+            for rule in self.pseudonymization.rules
+        ):
+            raise ValueError(f"가명화 규칙에 {PATIENT_ID_COLUMN} 컬럼의 hmac 또는 drop 규칙이 필요합니다")
+        return self
+
+
+class Extraction(BaseModel):
+    id: str
+    application_id: str
+    status: ExtractionStatus
+    columns: List[str]
+    cohort: CohortFilter
+    pseudonymization: Optional[PseudonymizationSpec] = None
+    progress: float
+    rows_total: int
+    rows_scanned: int
+    rows_written: int
+    cohort_size: Optional[int] = None
+    file_size: Optional[int] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,44 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+from app.models.job import JobStatus
+
+
+class JobCreate(BaseModel):
+    name: str = Field(..., min_length=1, description="등록된 작업 이름")
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    delay_seconds: float = Field(0, ge=0, description="실행 지연 (초)")
+
+
+class Job(BaseModel):
+    id: str
+    name: str
+    payload: Optional[Dict[str, Any]] = None
+    status: JobStatus
+    run_at: datetime
+    attempts: int
+    max_attempts: int
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    result: Optional[Any] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class JobDefinitionInfo(BaseModel):
+    name: str
+    max_attempts: int
+    timeout: Optional[float] = None
+    every: Optional[float] = None
+
+
+class JobSummary(BaseModel):
+    runner_running: bool
+    concurrency: int
+    workers_busy: int
+    counts: Dict[str, int]
+    definitions: List[JobDefinitionInfo]
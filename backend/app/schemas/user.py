@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 from app.models.user import UserRole
 
@@ -36,6 +36,7 @@ class UserInDB(UserBase):
     created_at: datetime
     updated_at: datetime
     last_login_at: Optional[datetime] = None
+    version: int = 1
     
     class Config:
         from_attributes = True
@@ -45,6 +46,11 @@ class User(UserInDB):
     pass
 
 
+class UserSearchResponse(BaseModel):
+    items: List[User]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서 (마지막 페이지면 null)")
+
+
 class UserLogin(BaseModel):
     email: str = Field(
         ...,
@@ -0,0 +1,76 @@
+"""
+연구자 신청서 목록(GET /api/applications/) 응답 캐시
+
+연구자의 목록은 본인이 신청서를 작성/수정/제출하거나 관리자가 본인 신청서를 처리할 때만 바뀝니다.
+(사용자 id, 조회 조건)별로 직렬화한 JSON 을 캐시하고, 무효화는 application_list_generations
+세대 카운터로 합니다. 쓰기 엔드포인트가 같은 트랜잭션에서 소유자의 세대를 1 올리면(upsert), 다음 조회 때
+인증 과정에서 사용자와 함께 읽은 세대(User.applications_generation)가 캐시 항목과 달라 미스가 됩니다.
+세대는 users 와 별도 테이블이라 신청서 쓰기가 사용자 행(로그인 기록, 관리자 수정 등)과 잠금을 다투지 않습니다.
+세대가 DB 에 있으므로 uvicorn 워커가 여러 개여도 다른 워커의 변경이 반영됩니다.
+관리자 목록은 모든 신청서 변경에 영향을 받으므로 캐시하지 않습니다.
+"""
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy import literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.response_cache import ResponseCache
+from app.models import Application, ApplicationListGeneration, ApplicationStatus, User
+from app.models.application import ServiceType
+from app.schemas.application import Application as ApplicationSchema
+
+application_list_cache = ResponseCache("application_list", settings.APPLICATION_LIST_CACHE_MAX_BYTES)
+application_list_cache.register_metrics()
+
+_list_adapter = TypeAdapter(List[ApplicationSchema])
+
+
+def list_cache_key(
+    user: User,
+    status: Optional[ApplicationStatus],
+    service_type: Optional[ServiceType],
+    skip: int,
+    limit: int,
+) -> Optional[Tuple]:
+    """캐시 대상이면 키, 아니면 None (관리자 / 캐시 비활성화)"""
+    if not application_list_cache.enabled or user.role.value == "ADMIN":
+        return None
+    return (user.id, status.value if status else None, service_type.value if service_type else None, skip, limit)
+
+
+def serialize_applications(applications: Sequence[Application]) -> bytes:
+    """response_model(List[ApplicationSchema]) 과 같은 JSON 으로 직렬화"""
+    return _list_adapter.dump_json(_list_adapter.validate_python(applications, from_attributes=True))
+
+
+async def invalidate_application_lists(
+    db: AsyncSession,
+    user_ids: Iterable[str] = (),
+    application_ids: Iterable[str] = (),
+):
+    """
+    신청서 소유자들의 목록 캐시 무효화 (호출한 쪽의 트랜잭션에서 세대 증가)
+
+    user_ids: 소유자 id / application_ids: 소유자를 모르는 경우 신청서 id (서브쿼리로 소유자 조회)
+    """
+    user_ids = set(user_ids)
+    application_ids = list(application_ids)
+    if user_ids and application_ids:
+        raise ValueError("user_ids 와 application_ids 중 하나만 지정")
+    if user_ids:
+        owners = select(User.id, literal(1)).where(User.id.in_(user_ids))
+    elif application_ids:
+        owners = select(Application.user_id, literal(1)).where(Application.id.in_(application_ids)).distinct()
+    else:
+        return
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    statement = dialect.insert(ApplicationListGeneration).from_select(["user_id", "generation"], owners)
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[ApplicationListGeneration.user_id],
+            set_={"generation": ApplicationListGeneration.generation + 1},
+        )
+    )
@@ -0,0 +1,188 @@
+"""
+데이터 카탈로그 스냅샷 (GET /api/catalog, 신청서 요청 컬럼 검증)
+
+카탈로그(데이터 종류와 컬럼)는 관리자가 가끔 바꾸고 연구자는 자주 읽으므로, DB 에서 한 번 읽어
+불변 스냅샷(직렬화된 JSON 본문, ETag, 컬럼 키 색인)으로 메모리에 두고 사용합니다.
+
+- 리비전: 두 테이블의 version 합계. 행 추가/수정/삭제(dcyn)마다 증가하므로 리비전이 같으면 내용도 같습니다.
+  (DB 에서 행을 직접 DELETE 하거나 version 을 올리지 않고 UPDATE 하면 반영되지 않음)
+- 다른 워커의 변경은 CATALOG_REFRESH_SECONDS 마다 리비전만 조회(쿼리 1회)해 확인하고, 달라졌을 때만 다시 읽습니다.
+  같은 워커에서 변경한 경우(mark_catalog_changed)는 커밋 직후 다음 조회에서 바로 확인합니다.
+- 신청서의 requested_columns("<데이터 종류 키>.<컬럼 키>")는 스냅샷의 키 색인(dict)으로 검증합니다.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from fastapi import HTTPException, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.etag import make_etag
+from app.core.metrics import registry as metrics_registry
+from app.models import CatalogColumn, CatalogDataset
+from app.schemas.catalog import (
+    Catalog as CatalogSchema,
+    CatalogColumn as CatalogColumnSchema,
+    CatalogDataset as CatalogDatasetSchema,
+)
+
+CATALOG_CHANGED_KEY = "catalog_changed"
+
+REVISION_QUERY = select(
+    select(func.coalesce(func.sum(CatalogDataset.version), 0)).scalar_subquery()
+    + select(func.coalesce(func.sum(CatalogColumn.version), 0)).scalar_subquery()
+)
+
+_dataset_adapter = TypeAdapter(CatalogDatasetSchema)
+
+
+def column_key(dataset_key: str, key: str) -> str:
+    """신청서에서 쓰는 컬럼 키"""
+    return f"{dataset_key}.{key}"
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    revision: int
+    catalog: CatalogSchema
+    body: bytes
+    dataset_bodies: Dict[str, bytes] = field(repr=False)
+    columns: Dict[str, CatalogColumnSchema] = field(repr=False)  # "<데이터 종류>.<컬럼>" -> 컬럼
+
+    @property
+    def etag(self) -> str:
+        return make_etag(self.revision)
+
+    def unknown_columns(self, keys: Iterable[str]) -> List[str]:
+        return [key for key in keys if key not in self.columns]
+
+    def to_response(self, dataset_key: Optional[str] = None) -> Response:
+        body = self.body if dataset_key is None else self.dataset_bodies[dataset_key]
+        return Response(content=body, media_type="application/json", headers={"ETag": self.etag})
+
+
+def build_snapshot(datasets: List[CatalogDataset], columns: List[CatalogColumn]) -> CatalogSnapshot:
+    """삭제된 행을 포함한 전체 행으로 스냅샷 생성 (리비전은 전체 행 기준, 내용은 활성 행만)"""
+    revision = sum(dataset.version for dataset in datasets) + sum(column.version for column in columns)
+
+    columns_by_dataset: Dict[str, List[CatalogColumn]] = {}
+    for column in columns:
+        if column.dcyn == 'N':
+            columns_by_dataset.setdefault(column.dataset_id, []).append(column)
+
+    dataset_schemas = []
+    index: Dict[str, CatalogColumnSchema] = {}
+    for dataset in sorted(datasets, key=lambda dataset: (dataset.sort_order, dataset.key)):
+        if dataset.dcyn != 'N':
+            continue
+        dataset_columns = sorted(
+            columns_by_dataset.get(dataset.id, ()), key=lambda column: (column.sort_order, column.key)
+        )
+        column_schemas = [CatalogColumnSchema.model_validate(column) for column in dataset_columns]
+        for column in column_schemas:
+            index[column_key(dataset.key, column.key)] = column
+        dataset_schemas.append(CatalogDatasetSchema(
+            key=dataset.key,
+            name=dataset.name,
+            title=dataset.title,
+            description=dataset.description,
+            sort_order=dataset.sort_order,
+            columns=column_schemas,
+        ))
+
+    catalog = CatalogSchema(revision=revision, datasets=dataset_schemas)
+    return CatalogSnapshot(
+        revision=revision,
+        catalog=catalog,
+        body=catalog.model_dump_json().encode("utf-8"),
+        dataset_bodies={dataset.key: _dataset_adapter.dump_json(dataset) for dataset in dataset_schemas},
+        columns=index,
+    )
+
+
+class CatalogRegistry:
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._checked_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self.checks = 0
+        self.loads = 0
+
+    @property
+    def revision(self) -> int:
+        return self._snapshot.revision if self._snapshot is not None else 0
+
+    def invalidate(self):
+        """다음 조회 때 리비전을 다시 확인"""
+        self._checked_at = None
+
+    def _fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and self._checked_at is not None
+            and time.monotonic() - self._checked_at < self.refresh_seconds
+        )
+
+    async def get(self, db: AsyncSession) -> CatalogSnapshot:
+        """현재 스냅샷 (확인 주기가 지났으면 리비전 조회, 바뀌었으면 다시 읽음)"""
+        if self._fresh():
+            return self._snapshot
+        async with self._lock:
+            # 기다리는 동안 다른 요청이 갱신했을 수 있음
+            if self._fresh():
+                return self._snapshot
+            snapshot = self._snapshot
+            if snapshot is not None:
+                self.checks += 1
+                if (await db.execute(REVISION_QUERY)).scalar_one() != snapshot.revision:
+                    snapshot = None
+            if snapshot is None:
+                datasets = (await db.execute(select(CatalogDataset))).scalars().all()
+                columns = (await db.execute(select(CatalogColumn))).scalars().all()
+                snapshot = build_snapshot(datasets, columns)
+                self._snapshot = snapshot
+                self.loads += 1
+            self._checked_at = time.monotonic()
+            return snapshot
+
+
+catalog_registry = CatalogRegistry(settings.CATALOG_REFRESH_SECONDS)
+
+metrics_registry.register_gauge("catalog_revision", lambda: catalog_registry.revision)
+metrics_registry.register_gauge("catalog_revision_checks_total", lambda: catalog_registry.checks)
+metrics_registry.register_gauge("catalog_loads_total", lambda: catalog_registry.loads)
+
+
+def mark_catalog_changed(db: AsyncSession):
+    """카탈로그를 변경한 세션 표시 (커밋되면 이 워커의 스냅샷을 바로 다시 확인)"""
+    db.sync_session.info[CATALOG_CHANGED_KEY] = True
+
+
+async def ensure_catalog_columns(db: AsyncSession, keys: Optional[List[str]]):
+    """요청 컬럼 키가 모두 카탈로그에 있는지 확인 (없으면 422, 스냅샷이 최신이면 쿼리 없음)"""
+    if not keys:
+        return
+    snapshot = await catalog_registry.get(db)
+    unknown = snapshot.unknown_columns(keys)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"카탈로그에 없는 데이터 항목입니다: {', '.join(unknown[:10])}"
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_changes(session: Session):
+    if session.info.pop(CATALOG_CHANGED_KEY, False):
+        catalog_registry.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session):
+    session.info.pop(CATALOG_CHANGED_KEY, None)
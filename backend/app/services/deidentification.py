@@ -0,0 +1,398 @@
+"""
+비정형 데이터 비식별화 (UNSTRUCTURED_EXTRACTION): 퇴원요약지, 병리 판독지 등 임상 문서의 식별정보를 대체값으로 치환
+
+찾는 식별정보 (kind)
+- name: 이름 사전(환자/직원 명단 등)에 있는 이름. Aho-Corasick 오토마톤으로 문서를 한 번 훑어 모든 이름을 찾으므로
+  사전 크기와 관계없이 문서 길이에 비례하고, 조사가 붙은 경우("홍길동님은")도 찾습니다.
+  pyahocorasick 이 설치되어 있으면 그것을, 없으면 같은 알고리즘의 순수 파이썬 구현을 사용합니다.
+- rrn: 주민등록번호 / phone: 전화번호 / record: 등록번호·병록번호 등 (키워드 뒤의 번호, record_pattern 으로 변경 가능)
+- date: 날짜 ("2023-01-05", "2023.1.5", "2023년 1월 5일", "20230105")
+  정규식은 하나의 정규식(이름 있는 그룹의 선택)으로 미리 컴파일해 문서를 한 번만 훑습니다.
+
+대체값
+- 이름: 키 기반으로 고른 가상 이름 (같은 이름은 문서가 달라도 같은 대체 이름)
+- 번호: 형식(구분 기호, 자릿수)은 두고 숫자만 키 기반으로 바꿈
+- 날짜: 문서마다 키로 정한 일수만큼 이동 (문서 안 날짜 간격 유지, 원래 표기 형식 유지)
+
+문서 묶음은 JSON Lines(한 줄에 문서 하나, {"id": ..., "text": ...})로 읽고 씁니다.
+주 프로세스는 입력을 줄 단위 블록(block_bytes)으로 잘라 프로세스 풀(app.services.process_pool)에 보내고
+결과를 입력 순서대로 쓰기만 합니다.
+"""
+import hashlib
+import hmac
+import json
+import re
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import cached_property
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from app.services import process_pool
+from app.services.process_pool import default_workers  # noqa: F401  스크립트/벤치마크에서 사용
+
+KINDS = ("name", "rrn", "phone", "record", "date")
+
+# 등록번호 등: 키워드 뒤의 번호만 치환 ("주민등록번호" 는 제외)
+DEFAULT_RECORD_PATTERN = (
+    r"(?<!주민)(?:등록번호|병록번호|환자번호|차트번호|MRN|Chart\s*No\.?)\s*[:：]?\s*"
+    r"(?P<record_value>[A-Z]{0,2}\d{6,10})(?![-\d])"
+)
+_RECORD_PREFIXES = "등병환차MC"
+
+_RRN = r"(?<!\d)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\s?-\s?[1-8]\d{6}(?!\d)"
+_PHONE = r"(?<!\d)(?:01[016789]|0[2-6]\d?|070)[-.)\s]\s?\d{3,4}[-.\s]\d{4}(?!\d)"
+_DATE = (
+    r"(?<!\d)(?:19|20)\d{2}(?:[-./]\s?\d{1,2}[-./]\s?\d{1,2}|년\s?\d{1,2}월\s?\d{1,2}일)(?!\d)"
+    r"|(?<!\d)(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])(?!\d)"
+)
+_NUMBER = re.compile(r"\d+")
+
+# 대체 이름 후보 (성 x 이름 두 글자)
+SURROGATE_SURNAMES = ("김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권", "황")
+SURROGATE_SYLLABLES = ("가", "나", "다", "라", "마", "바", "사", "아", "자", "차", "하", "도", "은", "솔", "빈", "율")
+
+
+class NameAutomaton:
+    """
+    이름 사전 Aho-Corasick 오토마톤 (순수 파이썬 구현)
+
+    각 위치에서 끝나는 이름 중 가장 긴 것 하나를 (시작, 끝) 으로 돌려줍니다.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._length: List[int] = [0]  # 이 상태(또는 실패 링크)에서 끝나는 가장 긴 이름 길이
+        for name in names:
+            state = 0
+            for char in name:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = self._goto[state][char] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._length.append(0)
+                state = next_state
+            self._length[state] = max(self._length[state], len(name))
+        # 너비 우선으로 실패 링크 계산
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._length[next_state] = max(self._length[next_state], self._length[self._fail[next_state]])
+
+        # 이름에 쓰인 글자가 min_length 자 이상 이어진 구간만 훑음 (영문, 숫자, 기호는 정규식이 건너뜀)
+        alphabet = "".join(sorted(self._goto[0].keys() | {char for edges in self._goto for char in edges}))
+        min_length = min((value for value in self._length[1:] if value), default=1)
+        self._runs = re.compile(f"[{re.escape(alphabet)}]{{{min_length},}}") if alphabet else None
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int]]:
+        if self._runs is None:
+            return
+        goto, fail, length = self._goto, self._fail, self._length
+        root = goto[0]
+        for run in self._runs.finditer(text):
+            state = 0
+            offset = run.start() + 1
+            for index, char in enumerate(run.group()):
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0) if state else root.get(char, 0)
+                if length[state]:
+                    yield offset + index - length[state], offset + index
+
+
+class _PyAhoCorasick:
+    """pyahocorasick 오토마톤 (NameAutomaton 과 같은 인터페이스)"""
+
+    def __init__(self, names: Iterable[str]):
+        import ahocorasick
+
+        self._automaton = ahocorasick.Automaton()
+        for name in names:
+            self._automaton.add_word(name, len(name))
+        self._automaton.make_automaton()
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int]]:
+        for end, length in self._automaton.iter(text):
+            yield end + 1 - length, end + 1
+
+
+def build_automaton(names: Iterable[str]):
+    names = list(names)
+    try:
+        return _PyAhoCorasick(names)
+    except ImportError:
+        return NameAutomaton(names)
+
+
+def load_names(path, min_length: int = 2) -> List[str]:
+    """이름 사전 파일 (UTF-8, 한 줄에 이름 하나, 공백 제거, min_length 글자 미만 제외)"""
+    with open(path, encoding="utf-8-sig") as file:
+        names = {"".join(line.split()) for line in file}
+    return sorted(name for name in names if len(name) >= min_length)
+
+
+@dataclass(frozen=True)
+class Deidentifier:
+    """
+    문서 비식별화기 (작업 프로세스로 한 번만 전달되며, 오토마톤/정규식은 프로세스마다 만듦)
+
+    names: 이름 사전 / kinds: 치환할 종류 (KINDS) / date_shift_days: 최대 이동 일수 (문서마다 ±1 ~ 이 값)
+    """
+    key: bytes = field(repr=False)
+    names: Tuple[str, ...] = field(default=(), repr=False)
+    kinds: Tuple[str, ...] = KINDS
+    record_pattern: str = DEFAULT_RECORD_PATTERN
+    date_shift_days: int = 30
+
+    def __post_init__(self):
+        unknown = set(self.kinds) - set(KINDS)
+        if unknown:
+            raise ValueError(f"Unknown de-identification kind: {', '.join(sorted(unknown))}")
+
+    def __getstate__(self):
+        return {name: value for name, value in self.__dict__.items() if not name.startswith("_")}
+
+    @cached_property
+    def _automaton(self):
+        return build_automaton(self.names) if "name" in self.kinds and self.names else None
+
+    @cached_property
+    def _pattern(self) -> "Optional[re.Pattern[str]]":
+        """정규식 종류를 모두 합친 정규식 (정규식 종류를 고르지 않았으면 None)"""
+        patterns = {"rrn": _RRN, "phone": _PHONE, "record": self.record_pattern, "date": _DATE}
+        kinds = [kind for kind in ("rrn", "phone", "record", "date") if kind in self.kinds]
+        if not kinds:
+            return None
+        # 앞의 것이 우선 (주민등록번호 > 전화번호 > 등록번호 > 날짜)
+        pattern = "|".join(f"(?P<{kind}>{patterns[kind]})" for kind in kinds)
+        # 시작 글자로 먼저 걸러 대부분의 위치에서 선택지 전체를 시도하지 않도록 함 (사용자 등록번호 정규식은 제외)
+        if "record" not in self.kinds:
+            pattern = f"(?=\\d)(?:{pattern})"
+        elif self.record_pattern == DEFAULT_RECORD_PATTERN:
+            pattern = f"(?=[\\d{_RECORD_PREFIXES}])(?:{pattern})"
+        return re.compile(pattern)
+
+    @cached_property
+    def _surrogate_names(self) -> Dict[str, str]:
+        return {}
+
+    def _digest(self, message: str) -> bytes:
+        return hmac.new(self.key, message.encode("utf-8"), hashlib.sha256).digest()
+
+    def _surrogate_name(self, name: str) -> str:
+        cached = self._surrogate_names.get(name)
+        if cached is None:
+            number = int.from_bytes(self._digest(f"name:{name}")[:8], "big")
+            surname = SURROGATE_SURNAMES[number % len(SURROGATE_SURNAMES)]
+            number //= len(SURROGATE_SURNAMES)
+            given = "".join(
+                SURROGATE_SYLLABLES[(number >> (4 * index)) % len(SURROGATE_SYLLABLES)]
+                for index in range(max(len(name) - 1, 1))
+            )
+            cached = self._surrogate_names[name] = surname + given
+        return cached
+
+    def _surrogate_digits(self, kind: str, value: str, keep: int = 0) -> str:
+        """구분 기호와 자릿수는 그대로, 앞 keep 글자 뒤의 숫자만 키 기반으로 바꿈"""
+        digits = self._digest(f"{kind}:{value}").hex()
+        replaced = iter(str(int(digits[index:index + 2], 16) % 10) for index in range(0, len(digits), 2))
+        return value[:keep] + "".join(next(replaced, "0") if char.isdigit() else char for char in value[keep:])
+
+    def _shift_days(self, document_id: str) -> int:
+        number = int.from_bytes(self._digest(f"date_shift:{document_id}")[:8], "big")
+        days = number % self.date_shift_days + 1
+        return days if number & (1 << 63) else -days
+
+    def _shift_date(self, value: str, days: int) -> Optional[str]:
+        """원래 표기(구분 기호, 0 채움) 그대로 이동한 날짜, 없는 날짜면 None"""
+        numbers = _NUMBER.findall(value)
+        try:
+            if len(numbers) == 1:
+                shifted = date(int(value[:4]), int(value[4:6]), int(value[6:8])) + timedelta(days=days)
+                return shifted.strftime("%Y%m%d")
+            shifted = date(*(int(number) for number in numbers)) + timedelta(days=days)
+        except (ValueError, OverflowError):
+            return None
+        # 월/일 0 채움 여부는 원래 표기를 따름 ("2023-01-05", "2023.1.5", "2023년 1월 5일")
+        padded = any(number.startswith("0") for number in numbers[1:]) or (
+            "년" not in value and all(len(number) == 2 for number in numbers[1:])
+        )
+        parts = iter((str(shifted.year), f"{shifted.month:02d}" if padded else str(shifted.month),
+                      f"{shifted.day:02d}" if padded else str(shifted.day)))
+        return _NUMBER.sub(lambda match: next(parts), value)
+
+    def spans(self, text: str) -> List[Tuple[int, int, str]]:
+        """(시작, 끝, 종류) 겹치지 않는 식별정보 위치 (정규식 결과 우선, 같은 시작이면 긴 것)"""
+        found: List[Tuple[int, int, str]] = []
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                kind = match.lastgroup
+                if kind == "record_value":
+                    kind = "record"
+                if kind == "record" and match.groupdict().get("record_value"):
+                    start, end = match.span("record_value")
+                else:
+                    start, end = match.span()
+                found.append((start, end, kind))
+        if self._automaton is not None:
+            found.extend((start, end, "name") for start, end in self._automaton.finditer(text))
+            found.sort(key=lambda span: (span[0], -(span[1] - span[0])))
+        spans = []
+        last_end = 0
+        for start, end, kind in found:
+            if start >= last_end:
+                spans.append((start, end, kind))
+                last_end = end
+        return spans
+
+    def deidentify(self, text: str, document_id: str = "") -> Tuple[str, Counter]:
+        """비식별화한 문서와 종류별 치환 수"""
+        counts: Counter = Counter()
+        parts = []
+        position = 0
+        days = None
+        for start, end, kind in self.spans(text):
+            value = text[start:end]
+            if kind == "name":
+                replacement = self._surrogate_name(value)
+            elif kind == "date":
+                if days is None:
+                    days = self._shift_days(document_id)
+                replacement = self._shift_date(value, days) or self._surrogate_digits(kind, value)
+            elif kind == "phone":
+                # 지역번호/통신사 식별번호는 유지
+                replacement = self._surrogate_digits(kind, value, keep=len(_NUMBER.match(value).group()))
+            else:
+                replacement = self._surrogate_digits(kind, value)
+            parts.append(text[position:start])
+            parts.append(replacement)
+            position = end
+            counts[kind] += 1
+        parts.append(text[position:])
+        return "".join(parts), counts
+
+
+@dataclass
+class DeidentificationStats:
+    documents: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    blocks: int = 0
+    counts: Counter = field(default_factory=Counter)
+
+
+# 작업 프로세스 상태 (initializer 로 한 번 설정)
+_worker_deidentifier: Optional[Deidentifier] = None
+
+
+def _init_worker(deidentifier: Deidentifier):
+    global _worker_deidentifier
+    _worker_deidentifier = deidentifier
+
+
+def _process_block(block: str, text_field: str, id_field: str, deidentifier: Optional[Deidentifier] = None):
+    """JSON Lines 블록 -> (문서 수, 비식별화한 JSON Lines, 종류별 치환 수)"""
+    deidentifier = deidentifier or _worker_deidentifier
+    lines = []
+    counts: Counter = Counter()
+    for line in block.splitlines():
+        if not line.strip():
+            continue
+        document = json.loads(line)
+        text = document.get(text_field)
+        if isinstance(text, str):
+            document[text_field], document_counts = deidentifier.deidentify(text, str(document.get(id_field, "")))
+            counts.update(document_counts)
+        lines.append(json.dumps(document, ensure_ascii=False))
+    return len(lines), "".join(line + "\n" for line in lines), counts
+
+
+def iter_line_blocks(reader: TextIO, block_bytes: int) -> Iterator[str]:
+    """약 block_bytes 크기의 줄 단위 블록 (문서 하나가 한 줄이므로 문서 중간에서 자르지 않음)"""
+    lines: List[str] = []
+    size = 0
+    for line in reader:
+        lines.append(line)
+        size += len(line)
+        if size >= block_bytes:
+            yield "".join(lines)
+            lines, size = [], 0
+    if lines:
+        yield "".join(lines)
+
+
+def create_pool(deidentifier: Deidentifier, workers: int) -> ProcessPoolExecutor:
+    return process_pool.create_pool(workers, _init_worker, (deidentifier,))
+
+
+def deidentify_stream(
+    reader: TextIO,
+    writer: TextIO,
+    deidentifier: Deidentifier,
+    *,
+    text_field: str = "text",
+    id_field: str = "id",
+    block_bytes: int = 4 * 1024 * 1024,
+    workers: int = 1,
+    pool: Optional[ProcessPoolExecutor] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    cancel: Optional[Callable[[], bool]] = None,
+) -> DeidentificationStats:
+    """
+    JSON Lines 문서 스트림 비식별화
+
+    pool 을 주지 않고 workers 가 1 이하이면 현재 프로세스에서 처리합니다.
+    date 이동은 문서 id_field 값마다 정해지므로 id 가 없는 문서끼리는 같은 일수만큼 이동합니다.
+    progress 는 블록이 기록될 때마다 처리한 문서 수로 호출됩니다.
+    """
+    stats = DeidentificationStats()
+
+    def write(result):
+        documents, text, counts = result
+        writer.write(text)
+        stats.documents += documents
+        stats.bytes_out += len(text)
+        stats.blocks += 1
+        stats.counts.update(counts)
+        if progress is not None:
+            progress(documents)
+
+    def blocks():
+        for block in iter_line_blocks(reader, block_bytes):
+            if cancel is not None and cancel():
+                raise InterruptedError("비식별화가 중단되었습니다")
+            stats.bytes_in += len(block)
+            yield block
+
+    if pool is None and workers <= 1:
+        for block in blocks():
+            write(_process_block(block, text_field, id_field, deidentifier))
+        return stats
+
+    process_pool.map_in_order(
+        _process_block,
+        ((block, text_field, id_field) for block in blocks()),
+        write,
+        workers=workers,
+        pool=pool,
+        initializer=_init_worker,
+        initargs=(deidentifier,),
+    )
+    return stats
+
+
+def deidentify_jsonl(src, dst, deidentifier: Deidentifier, **kwargs) -> DeidentificationStats:
+    """JSON Lines 파일 비식별화 (UTF-8, BOM 허용)"""
+    with open(src, encoding="utf-8-sig", newline="") as reader, \
+            open(dst, "w", encoding="utf-8", newline="") as writer:
+        return deidentify_stream(reader, writer, deidentifier, **kwargs)
@@ -6,6 +6,14 @@ like SendGrid, AWS SES, or SMTP server.
 import logging
 from typing import Optional
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.models.password_reset import PasswordResetToken
+from app.services.jobs import job
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,4 +72,27 @@ class EmailService:
             return False
 
 
-email_service = EmailService()
\ No newline at end of file
+email_service = EmailService()
+
+@job("email.password_reset", max_attempts=5, timeout=60)
+async def send_password_reset_email_job(db: AsyncSession, payload: dict) -> dict:
+    """비밀번호 재설정 메일 발송 작업 (토큰이 이미 사용/만료되었으면 발송하지 않음)"""
+    result = await db.execute(
+        select(PasswordResetToken)
+        .options(selectinload(PasswordResetToken.user))
+        .where(PasswordResetToken.id == payload["token_id"])
+    )
+    reset_token = result.scalar_one_or_none()
+    if reset_token is None or not reset_token.is_valid():
+        return {"sent": False}
+
+    reset_url = f"{settings.FRONTEND_URL}/reset-password?token={reset_token.token}"
+    sent = await email_service.send_password_reset_email(
+        email=reset_token.user.email,
+        reset_url=reset_url,
+        user_name=reset_token.user.name
+    )
+    if not sent:
+        # 실행기가 backoff 후 재시도
+        raise RuntimeError("Failed to send password reset email")
+    return {"sent": True}
@@ -0,0 +1,328 @@
+"""
+정형 추출 실행 (STRUCTURED_EXTRACTION 신청서 -> 결과 ZIP 파일)
+
+관리자가 승인된 신청서에 코호트 조건을 지정해 추출을 시작하면(POST /api/applications/{id}/extraction)
+extraction.structured 작업이 웨어하우스 스냅샷(app.services.warehouse)에서 다음 순서로 실행합니다.
+
+1. 코호트: 코호트 데이터 종류에서 환자 id 와 조건 컬럼만 청크 단위로 읽어 조건(AND)을 만족하는 환자 id 수집
+2. 추출: 요청 컬럼이 있는 데이터 종류마다 id 와 요청 컬럼만 읽어 코호트 환자의 행만 골라(np.isin)
+   ZIP 안의 <데이터 종류>.csv 로 청크마다 바로 기록 (결과 전체를 메모리에 두지 않음)
+3. 가명화 규칙이 있으면 결과 ZIP 의 CSV 를 가명화해 교체 (app.services.pseudonymization, 프로세스 풀)
+
+읽기/필터/쓰기는 스레드에서 실행하고, 작업 코루틴은 EXTRACTION_PROGRESS_SECONDS 마다
+진행률(처리한 행 / 처리할 행)을 extractions 행에 기록합니다.
+
+결과 파일은 임시 파일에 쓴 뒤 이름을 바꾸므로 작업이 다시 실행되어도(at-least-once) 같은 결과로 덮어씁니다.
+"""
+import asyncio
+import csv
+import io
+import logging
+import os
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.base import get_korean_time
+from app.models import Extraction, ExtractionStatus
+from app.schemas.extraction import PATIENT_ID_COLUMN, PATIENT_ID_METHODS
+from app.services.jobs import job
+from app.services.pseudonymization import (
+    Pseudonymizer,
+    create_pool,
+    default_workers,
+    derive_key,
+    pseudonymize_stream,
+)
+from app.services.warehouse import cohort_mask, open_warehouse, require_columns
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_JOB = "extraction.structured"
+
+
+class ExtractionCancelled(Exception):
+    """제한 시간 초과 등으로 중단됨"""
+
+
+@dataclass
+class ExtractionProgress:
+    rows_total: int = 0
+    rows_scanned: int = 0
+    rows_written: int = 0
+    cohort_size: Optional[int] = None
+
+    @property
+    def fraction(self) -> float:
+        return min(self.rows_scanned / self.rows_total, 1.0) if self.rows_total else 0.0
+
+
+def group_columns(columns: List[str]) -> Dict[str, List[str]]:
+    """"<데이터 종류>.<컬럼>" 목록 -> 데이터 종류별 컬럼 목록 (요청 순서 유지)"""
+    grouped: Dict[str, List[str]] = {}
+    for key in columns:
+        dataset, column = key.split(".", 1)
+        if column not in grouped.setdefault(dataset, []):
+            grouped[dataset].append(column)
+    return grouped
+
+
+def output_path(extraction: Extraction) -> Path:
+    return Path(settings.EXTRACTION_OUTPUT_DIR) / str(extraction.application_id) / f"{extraction.id}.zip"
+
+
+def _with_patient_id(columns: List[str]) -> List[str]:
+    return [PATIENT_ID_COLUMN] + [column for column in columns if column != PATIENT_ID_COLUMN]
+
+
+def extract_to_file(
+    warehouse_path,
+    columns: List[str],
+    cohort: dict,
+    path: Path,
+    *,
+    chunk_rows: int,
+    progress: Optional[ExtractionProgress] = None,
+    cancel: Optional[threading.Event] = None,
+) -> ExtractionProgress:
+    """
+    코호트 선정 후 요청 컬럼을 ZIP(<데이터 종류>.csv) 으로 기록 (동기 함수, 스레드에서 실행)
+
+    progress 는 청크마다 갱신되며 다른 스레드에서 읽어도 됩니다.
+    cancel 이 설정되면 다음 청크에서 ExtractionCancelled 를 발생시킵니다.
+    """
+    progress = progress or ExtractionProgress()
+    grouped = group_columns(columns)
+    conditions = cohort["conditions"]
+
+    def check_cancel():
+        if cancel is not None and cancel.is_set():
+            raise ExtractionCancelled("추출이 중단되었습니다")
+
+    warehouse = open_warehouse(warehouse_path)
+    try:
+        # 읽기 전에 컬럼부터 확인 (코호트를 다 읽은 뒤 실패하지 않도록)
+        cohort_columns = _with_patient_id(list(dict.fromkeys(condition["column"] for condition in conditions)))
+        require_columns(warehouse, cohort["dataset"], cohort_columns)
+        for dataset, dataset_columns in grouped.items():
+            require_columns(warehouse, dataset, _with_patient_id(dataset_columns))
+
+        progress.rows_total = warehouse.count_rows(cohort["dataset"]) + sum(
+            warehouse.count_rows(dataset) for dataset in grouped
+        )
+
+        # 1. 코호트 (환자 id + 조건 컬럼만 읽음)
+        cohort_ids = []
+        for chunk in warehouse.iter_chunks(cohort["dataset"], cohort_columns, chunk_rows):
+            check_cancel()
+            cohort_ids.append(chunk[PATIENT_ID_COLUMN][cohort_mask(chunk, conditions)].astype(str))
+            progress.rows_scanned += len(chunk[PATIENT_ID_COLUMN])
+        patient_ids = np.unique(np.concatenate(cohort_ids)) if cohort_ids else np.array([], dtype=str)
+        progress.cohort_size = len(patient_ids)
+
+        # 2. 추출 (환자 id + 요청 컬럼만 읽고 코호트 환자 행만 기록)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = path.with_name(path.name + ".part")
+        with zipfile.ZipFile(partial_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for dataset, dataset_columns in grouped.items():
+                with archive.open(f"{dataset}.csv", "w", force_zip64=True) as raw:
+                    # Excel 에서 한글이 깨지지 않도록 BOM 포함
+                    text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+                    writer = csv.writer(text)
+                    writer.writerow(dataset_columns)
+                    for chunk in warehouse.iter_chunks(dataset, _with_patient_id(dataset_columns), chunk_rows):
+                        check_cancel()
+                        ids = chunk[PATIENT_ID_COLUMN]
+                        mask = np.isin(ids.astype(str), patient_ids)
+                        selected = int(mask.sum())
+                        if selected:
+                            writer.writerows(zip(*(chunk[column][mask] for column in dataset_columns)))
+                        progress.rows_scanned += len(ids)
+                        progress.rows_written += selected
+                    text.flush()
+                    text.detach()
+        os.replace(partial_path, path)
+    except BaseException:
+        path.with_name(path.name + ".part").unlink(missing_ok=True)
+        raise
+    finally:
+        warehouse.close()
+    return progress
+
+
+def pseudonymize_archive(
+    path: Path,
+    pseudonymizer: Pseudonymizer,
+    *,
+    chunk_rows: int,
+    workers: int,
+    progress: Optional[ExtractionProgress] = None,
+    cancel: Optional[threading.Event] = None,
+):
+    """결과 ZIP 의 CSV 를 모두 가명화해 같은 경로로 교체 (프로세스 풀은 파일들이 함께 사용)"""
+    progress = progress or ExtractionProgress()
+    progress.rows_total += progress.rows_written
+
+    def advance(rows: int):
+        progress.rows_scanned += rows
+
+    partial_path = path.with_name(path.name + ".pseudonymized.part")
+    # 결과가 작으면 프로세스를 띄우는 비용이 더 크므로 현재 스레드에서 처리
+    pool = create_pool(pseudonymizer, workers) if workers > 1 and progress.rows_written > chunk_rows else None
+    try:
+        with zipfile.ZipFile(path) as source, \
+                zipfile.ZipFile(partial_path, "w", compression=zipfile.ZIP_DEFLATED) as target:
+            for name in source.namelist():
+                with source.open(name) as raw_in, target.open(name, "w", force_zip64=True) as raw_out:
+                    reader = io.TextIOWrapper(raw_in, encoding="utf-8-sig", newline="")
+                    writer = io.TextIOWrapper(raw_out, encoding="utf-8-sig", newline="")
+                    pseudonymize_stream(
+                        reader, writer, pseudonymizer,
+                        chunk_rows=chunk_rows,
+                        workers=workers,
+                        pool=pool,
+                        progress=advance,
+                        cancel=cancel.is_set if cancel is not None else None,
+                    )
+                    writer.flush()
+                    writer.detach()
+        os.replace(partial_path, path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def build_pseudonymizer(extraction: Extraction) -> Pseudonymizer:
+    """신청서별 키로 가명화 규칙 적용기 생성"""
+    spec = extraction.pseudonymization
+    return Pseudonymizer(
+        key=derive_key(settings.PSEUDONYMIZATION_KEY or settings.SECRET_KEY, str(extraction.application_id)),
+        rules={rule["column"]: rule["method"] for rule in spec["rules"]},
+        patient_column=PATIENT_ID_COLUMN,
+        date_shift_days=spec["date_shift_days"],
+    )
+
+
+def deliver(
+    warehouse_path,
+    columns: List[str],
+    cohort: dict,
+    path: Path,
+    *,
+    chunk_rows: int,
+    pseudonymizer: Optional[Pseudonymizer] = None,
+    workers: int = 1,
+    progress: Optional[ExtractionProgress] = None,
+    cancel: Optional[threading.Event] = None,
+) -> ExtractionProgress:
+    """
+    추출 후 (규칙이 있으면) 가명화한 결과 파일 생성
+
+    가명화할 때는 환자별 날짜 이동을 위해 데이터 종류마다 대체번호 컬럼을 함께 추출합니다.
+    """
+    progress = progress or ExtractionProgress()
+    if pseudonymizer is not None:
+        # 규칙 검증 전에 저장된 추출도 원래 대체번호를 내보내지 않도록 실행 전에 확인
+        if pseudonymizer.rules.get(PATIENT_ID_COLUMN) not in PATIENT_ID_METHODS:
+            raise ValueError(f"가명화 규칙에 {PATIENT_ID_COLUMN} 컬럼의 hmac 또는 drop 규칙이 필요합니다")
+        columns = list(columns) + [
+            f"{dataset}.{PATIENT_ID_COLUMN}" for dataset in group_columns(columns)
+            if f"{dataset}.{PATIENT_ID_COLUMN}" not in columns
+        ]
+    extract_to_file(warehouse_path, columns, cohort, path, chunk_rows=chunk_rows, progress=progress, cancel=cancel)
+    if pseudonymizer is not None:
+        pseudonymize_archive(path, pseudonymizer, chunk_rows=chunk_rows, workers=workers,
+                             progress=progress, cancel=cancel)
+    return progress
+
+
+def _apply_progress(extraction: Extraction, progress: ExtractionProgress):
+    extraction.progress = progress.fraction
+    extraction.rows_total = progress.rows_total
+    extraction.rows_scanned = progress.rows_scanned
+    extraction.rows_written = progress.rows_written
+    extraction.cohort_size = progress.cohort_size
+
+
+@job(EXTRACTION_JOB, max_attempts=1)
+async def run_extraction_job(db: AsyncSession, payload: dict) -> dict:
+    """payload: {"extraction_id": ...} (실패하면 관리자가 다시 시작, 제한 시간은 EXTRACTION_TIMEOUT_SECONDS)"""
+    extraction = await db.get(Extraction, payload["extraction_id"])
+    if extraction is None:
+        return {"skipped": "not_found"}
+    path = output_path(extraction)
+    if extraction.status == ExtractionStatus.SUCCEEDED and path.exists():
+        return {"skipped": "already_succeeded"}
+
+    extraction.status = ExtractionStatus.RUNNING
+    extraction.started_at = get_korean_time()
+    extraction.finished_at = None
+    extraction.error = None
+    await db.commit()
+
+    progress = ExtractionProgress()
+    cancel = threading.Event()
+    deadline = time.monotonic() + settings.EXTRACTION_TIMEOUT_SECONDS
+    task = asyncio.ensure_future(asyncio.to_thread(
+        deliver,
+        settings.EXTRACTION_WAREHOUSE_PATH,
+        extraction.columns,
+        extraction.cohort,
+        path,
+        chunk_rows=settings.EXTRACTION_CHUNK_ROWS,
+        pseudonymizer=build_pseudonymizer(extraction) if extraction.pseudonymization else None,
+        workers=settings.PSEUDONYMIZATION_WORKERS or default_workers(),
+        progress=progress,
+        cancel=cancel,
+    ))
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=settings.EXTRACTION_PROGRESS_SECONDS)
+            if done:
+                break
+            if time.monotonic() > deadline:
+                cancel.set()
+            _apply_progress(extraction, progress)
+            await db.commit()
+        task.result()
+    except asyncio.CancelledError:
+        # 종료 중 취소: 스레드를 멈추고, 작업이 다시 실행될 때 처음부터 추출
+        cancel.set()
+        raise
+    except Exception as exc:
+        if isinstance(exc, (ExtractionCancelled, InterruptedError)) and time.monotonic() > deadline:
+            exc = ExtractionCancelled(f"제한 시간({settings.EXTRACTION_TIMEOUT_SECONDS:.0f}초)을 넘어 중단했습니다")
+        _apply_progress(extraction, progress)
+        extraction.status = ExtractionStatus.FAILED
+        extraction.error = str(exc)
+        extraction.finished_at = get_korean_time()
+        await db.commit()
+        raise exc
+
+    _apply_progress(extraction, progress)
+    extraction.progress = 1.0
+    extraction.status = ExtractionStatus.SUCCEEDED
+    extraction.file_path = str(path)
+    extraction.file_size = path.stat().st_size
+    extraction.finished_at = get_korean_time()
+    logger.info(
+        "정형 추출 완료: %s (코호트 %d명, %d/%d행 기록)",
+        extraction.id, progress.cohort_size or 0, progress.rows_written, progress.rows_scanned,
+    )
+    return {
+        "extraction_id": extraction.id,
+        "cohort_size": progress.cohort_size,
+        "rows_scanned": progress.rows_scanned,
+        "rows_written": progress.rows_written,
+        "file_size": extraction.file_size,
+    }
@@ -0,0 +1,442 @@
+"""
+백그라운드 작업 실행기 (프로세스 내 asyncio 워커 + DB 작업 테이블)
+
+- 작업은 jobs 테이블에 기록되므로 재기동해도 유실되지 않습니다. 요청 처리 중에는 enqueue() 로
+  같은 트랜잭션에 작업 행만 추가하고, 실제 실행은 JobRunner 워커가 요청 경로 밖에서 수행합니다.
+- 워커는 `UPDATE jobs SET status = RUNNING ... WHERE id = (가장 먼저 실행할 PENDING 작업) RETURNING`
+  한 번으로 작업을 가져오므로 여러 워커(프로세스)가 같은 작업을 동시에 실행하지 않습니다.
+- 실행 중에는 워커가 updated_at 을 주기적으로 갱신(heartbeat)하고, 갱신이 stale_after 초 이상 끊긴
+  RUNNING 작업만 중단된 것으로 보고 다시 대기 상태로 돌립니다 (실행 시간이 긴 작업은 그대로 둠).
+- 실패하면 지수 backoff 후 재시도하고, max_attempts 를 넘으면 FAILED 로 남깁니다.
+  작업은 재시도/중단 후 재실행될 수 있으므로(at-least-once) 핸들러는 멱등하게 작성해야 합니다.
+- @job(..., every=초) 로 등록한 작업은 스케줄러가 주기적으로 등록합니다.
+
+작업 등록:
+    @job("tokens.sweep", every=3600)
+    async def sweep_tokens(db: AsyncSession, payload: dict) -> dict:
+        ...
+"""
+import asyncio
+import logging
+import os
+import socket
+import traceback
+from dataclasses import dataclass
+from datetime import timedelta
+from importlib import import_module
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import registry as metrics_registry
+from app.db.base import get_korean_time
+from app.models import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+# @job 으로 작업을 등록하는 모듈 (실행기/API 가 시작할 때 import)
+TASK_MODULES = (
+    "app.services.email",
+    "app.services.maintenance",
+    "app.services.upload_gc",
+    "app.services.extraction",
+)
+
+# 아직 실행이 끝나지 않은 상태 (주기 작업 중복 등록 방지)
+ACTIVE_STATUSES = (JobStatus.PENDING, JobStatus.RUNNING)
+
+JOBS_ENQUEUED_KEY = "jobs_enqueued"
+
+JobHandler = Callable[[AsyncSession, dict], Awaitable[Optional[Any]]]
+
+
+@dataclass(frozen=True)
+class JobDefinition:
+    name: str
+    handler: JobHandler
+    max_attempts: int
+    timeout: Optional[float]  # 초 (None 이면 제한 없음)
+    every: Optional[float]  # 주기 작업 간격 (초)
+
+
+JOB_DEFINITIONS: Dict[str, JobDefinition] = {}
+
+
+def job(name: str, *, max_attempts: Optional[int] = None, timeout: Optional[float] = None,
+        every: Optional[float] = None):
+    """작업 핸들러 등록 데코레이터 (핸들러는 전용 세션과 payload 를 받고, 반환값은 result 로 저장)"""
+    def decorator(handler: JobHandler) -> JobHandler:
+        if name in JOB_DEFINITIONS:
+            raise ValueError(f"Job already registered: {name}")
+        JOB_DEFINITIONS[name] = JobDefinition(
+            name=name,
+            handler=handler,
+            max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+            timeout=timeout,
+            every=every,
+        )
+        return handler
+    return decorator
+
+
+def load_task_modules():
+    for module_name in TASK_MODULES:
+        import_module(module_name)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """attempts 번째 실패 후 다음 실행까지 대기 시간 (지수 backoff)"""
+    return timedelta(seconds=settings.JOBS_RETRY_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0)))
+
+
+def enqueue(
+    db: AsyncSession,
+    name: str,
+    payload: Optional[dict] = None,
+    *,
+    delay: Optional[float] = None,
+    run_at=None,
+    max_attempts: Optional[int] = None,
+) -> Job:
+    """
+    작업 등록 (세션에 추가만 하며 커밋은 호출한 쪽에서 수행)
+
+    요청의 다른 변경과 같은 트랜잭션으로 커밋되므로, 롤백되면 작업도 등록되지 않습니다.
+    커밋되면 같은 프로세스의 실행기를 깨워 폴링 간격을 기다리지 않고 바로 실행합니다.
+    """
+    definition = JOB_DEFINITIONS.get(name)
+    if run_at is None:
+        run_at = get_korean_time() + timedelta(seconds=delay or 0)
+    job_row = Job(
+        name=name,
+        payload=payload or {},
+        status=JobStatus.PENDING,
+        run_at=run_at,
+        attempts=0,
+        max_attempts=max_attempts or (definition.max_attempts if definition else settings.JOBS_MAX_ATTEMPTS),
+    )
+    db.add(job_row)
+    wake_after_commit(db)
+    return job_row
+
+
+def wake_after_commit(db: AsyncSession):
+    """세션이 커밋되면 같은 프로세스의 실행기를 깨움"""
+    sync_session = getattr(db, "sync_session", db)
+    sync_session.info[JOBS_ENQUEUED_KEY] = True
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    id: str
+    name: str
+    payload: Optional[dict]
+    attempts: int
+    max_attempts: int
+
+
+class JobRunner:
+    def __init__(self, session_factory: async_sessionmaker, concurrency: int = 2, poll_interval: float = 2.0,
+                 scheduler_interval: float = 30.0, stale_after: float = 900.0):
+        self.session_factory = session_factory
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.scheduler_interval = scheduler_interval
+        self.stale_after = stale_after
+        # 복구 기준보다 충분히 자주 갱신해야 DB 가 잠시 느려도 실행 중인 작업을 다시 실행하지 않음
+        self.heartbeat_interval = stale_after / 3
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
+        self._wakeup = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._stopping = False
+        self._tasks: List[asyncio.Task] = []
+        self.busy = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retried = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks) and not self._stopping
+
+    def wake(self):
+        self._wakeup.set()
+
+    async def start(self):
+        load_task_modules()
+        self._stopping = False
+        self._stop_event.clear()
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(), name=f"job-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._scheduler_loop(), name="job-scheduler"))
+        logger.info("작업 실행기 시작 (workers=%d, id=%s)", self.concurrency, self.worker_id)
+
+    async def stop(self, timeout: float = 10.0):
+        """새 작업은 가져오지 않고, 실행 중인 작업은 timeout 까지 기다린 뒤 취소"""
+        self._stopping = True
+        self._stop_event.set()
+        self._wakeup.set()
+        if not self._tasks:
+            return
+        done, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+        logger.info("작업 실행기 종료 (취소된 워커=%d)", len(pending))
+
+    async def _worker_loop(self):
+        while not self._stopping:
+            # 조회 전에 초기화해야 조회 중에 등록된 작업의 wake 를 놓치지 않음
+            self._wakeup.clear()
+            try:
+                claimed = await self._claim()
+            except Exception:
+                logger.exception("작업 조회 실패")
+                claimed = None
+            if claimed is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._execute(claimed)
+
+    async def _claim(self) -> Optional[ClaimedJob]:
+        now = get_korean_time()
+        next_job_id = (
+            select(Job.id)
+            .where(Job.status == JobStatus.PENDING, Job.run_at <= now)
+            .order_by(Job.run_at)
+            .limit(1)
+            # PostgreSQL: 다른 워커가 잠근 행은 건너뜀 (SQLite 에서는 무시됨)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(Job)
+                .where(Job.id == next_job_id, Job.status == JobStatus.PENDING)
+                .values(
+                    status=JobStatus.RUNNING,
+                    locked_by=self.worker_id,
+                    started_at=now,
+                    updated_at=now,
+                    attempts=Job.attempts + 1,
+                )
+                .returning(Job.id, Job.name, Job.payload, Job.attempts, Job.max_attempts)
+                .execution_options(synchronize_session=False)
+            )
+            row = result.one_or_none()
+            await db.commit()
+        return ClaimedJob(*row) if row else None
+
+    async def _execute(self, claimed: ClaimedJob):
+        definition = JOB_DEFINITIONS.get(claimed.name)
+        if definition is None:
+            await self._finish(claimed, JobStatus.FAILED, error=f"Unknown job: {claimed.name}")
+            self.failed += 1
+            return
+
+        self.busy += 1
+        heartbeat = asyncio.create_task(self._heartbeat(claimed), name=f"job-heartbeat-{claimed.id}")
+        try:
+            async with self.session_factory() as db:
+                result = await asyncio.wait_for(definition.handler(db, claimed.payload or {}), definition.timeout)
+                await db.commit()
+        except asyncio.CancelledError:
+            # 종료 중 취소: 다음 기동 때 다시 실행되도록 대기 상태로 되돌림
+            await asyncio.shield(self._release(claimed))
+            raise
+        except Exception as exc:
+            error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+            logger.warning("작업 실패: %s (%s, %d/%d)", claimed.name, error, claimed.attempts, claimed.max_attempts)
+            if claimed.attempts < claimed.max_attempts:
+                self.retried += 1
+                await self._finish(claimed, JobStatus.PENDING, error=error,
+                                   run_at=get_korean_time() + retry_delay(claimed.attempts))
+            else:
+                self.failed += 1
+                await self._finish(claimed, JobStatus.FAILED, error=error)
+        else:
+            self.succeeded += 1
+            await self._finish(claimed, JobStatus.SUCCEEDED, result=result)
+        finally:
+            heartbeat.cancel()
+            self.busy -= 1
+
+    async def _heartbeat(self, claimed: ClaimedJob):
+        """실행하는 동안 updated_at 을 갱신해 다른 워커가 중단된 작업으로 복구하지 않게 함"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                async with self.session_factory() as db:
+                    await db.execute(
+                        update(Job)
+                        .where(Job.id == claimed.id, Job.locked_by == self.worker_id)
+                        .values(updated_at=get_korean_time())
+                        .execution_options(synchronize_session=False)
+                    )
+                    await db.commit()
+            except Exception:
+                logger.exception("작업 heartbeat 기록 실패: %s", claimed.id)
+
+    async def _finish(self, claimed: ClaimedJob, new_status: JobStatus, *, error: Optional[str] = None,
+                      result=None, run_at=None):
+        now = get_korean_time()
+        values = {"status": new_status, "locked_by": None, "last_error": error, "updated_at": now}
+        if new_status == JobStatus.PENDING:
+            values["run_at"] = run_at
+        else:
+            values["finished_at"] = now
+            values["result"] = result if isinstance(result, (dict, list)) or result is None else {"value": result}
+        async with self.session_factory() as db:
+            await db.execute(
+                update(Job)
+                .where(Job.id == claimed.id, Job.locked_by == self.worker_id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+    async def _release(self, claimed: ClaimedJob):
+        try:
+            async with self.session_factory() as db:
+                await db.execute(
+                    update(Job)
+                    .where(Job.id == claimed.id, Job.locked_by == self.worker_id)
+                    .values(status=JobStatus.PENDING, locked_by=None, attempts=Job.attempts - 1,
+                            updated_at=get_korean_time())
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+        except Exception:
+            logger.exception("작업 반환 실패: %s", claimed.id)
+
+    async def _scheduler_loop(self):
+        while not self._stopping:
+            try:
+                await self.run_scheduler_once()
+            except Exception:
+                logger.exception("작업 스케줄러 실행 실패")
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), self.scheduler_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run_scheduler_once(self):
+        """중단된 작업 복구 + 주기 작업 등록"""
+        async with self.session_factory() as db:
+            recovered = await recover_stale_jobs(db, self.stale_after)
+            scheduled = await schedule_periodic_jobs(db)
+            await db.commit()
+        if recovered:
+            logger.warning("중단된 작업 %d건을 다시 대기 상태로 변경", recovered)
+        if recovered or scheduled:
+            self.wake()
+
+
+async def recover_stale_jobs(db: AsyncSession, stale_after: float) -> int:
+    """
+    RUNNING 상태에서 stale_after 초 이상 heartbeat(updated_at 갱신)가 없는 작업을 대기 상태로 되돌림
+
+    워커 프로세스가 강제 종료되면 작업이 RUNNING 으로 남으므로, 다른 워커/다음 기동 때 다시 실행합니다.
+    시작 시각이 아니라 마지막 heartbeat 를 기준으로 하므로 추출/업로드 정리처럼 오래 걸리는 작업도
+    실행 중인 동안에는 다시 실행되지 않습니다.
+    이미 max_attempts 번 시도한 작업은 다시 실행하지 않고 FAILED 로 남깁니다 (워커를 계속 죽이는 작업이
+    무한히 재실행되지 않도록, max_attempts=1 인 정형 추출은 다시 실행되지 않도록).
+    """
+    now = get_korean_time()
+    stale = (Job.status == JobStatus.RUNNING, Job.updated_at < now - timedelta(seconds=stale_after))
+    requeued = await db.execute(
+        update(Job)
+        .where(*stale, Job.attempts < Job.max_attempts)
+        .values(status=JobStatus.PENDING, locked_by=None, run_at=now, updated_at=now,
+                last_error="Recovered after worker stopped responding")
+        .execution_options(synchronize_session=False)
+    )
+    failed = await db.execute(
+        update(Job)
+        .where(*stale, Job.attempts >= Job.max_attempts)
+        .values(status=JobStatus.FAILED, locked_by=None, finished_at=now, updated_at=now,
+                last_error="Failed after worker stopped responding")
+        .execution_options(synchronize_session=False)
+    )
+    if failed.rowcount:
+        logger.warning("시도 횟수를 모두 쓴 중단된 작업 %d건을 실패로 처리", failed.rowcount)
+    return requeued.rowcount or 0
+
+
+async def schedule_periodic_jobs(db: AsyncSession) -> int:
+    """
+    주기 작업 중 대기/실행 중인 것이 없으면 다음 실행을 등록
+
+    다음 실행 시각은 마지막 실행 시작 시각 + 주기이며, 한 번도 실행된 적이 없으면 바로 실행합니다.
+    """
+    periodic = {name: definition for name, definition in JOB_DEFINITIONS.items() if definition.every}
+    if not periodic:
+        return 0
+
+    result = await db.execute(
+        select(Job.name).where(Job.name.in_(list(periodic)), Job.status.in_(ACTIVE_STATUSES)).distinct()
+    )
+    active = set(result.scalars())
+    due = [name for name in periodic if name not in active]
+    if not due:
+        return 0
+
+    result = await db.execute(
+        select(Job.name, func.max(Job.started_at)).where(Job.name.in_(due)).group_by(Job.name)
+    )
+    last_started = dict(result.all())
+    # DB 에서 읽은 시각은 timezone 정보가 없으므로 같은 기준(KST)의 naive 값으로 비교
+    now = get_korean_time().replace(tzinfo=None)
+    for name in due:
+        started_at = last_started.get(name)
+        run_at = now
+        if started_at is not None:
+            run_at = max(now, started_at.replace(tzinfo=None) + timedelta(seconds=periodic[name].every))
+        enqueue(db, name, run_at=run_at)
+    return len(due)
+
+
+# 프로세스 내 실행기 (lifespan 에서 시작/종료)
+runner: Optional[JobRunner] = None
+
+
+def get_runner() -> Optional[JobRunner]:
+    return runner
+
+
+def create_runner(session_factory: async_sessionmaker) -> JobRunner:
+    global runner
+    runner = JobRunner(
+        session_factory,
+        concurrency=settings.JOBS_CONCURRENCY,
+        poll_interval=settings.JOBS_POLL_SECONDS,
+        scheduler_interval=settings.JOBS_SCHEDULER_SECONDS,
+        stale_after=settings.JOBS_STALE_SECONDS,
+    )
+    return runner
+
+
+metrics_registry.register_gauge("jobs_workers_busy", lambda: runner.busy if runner else 0)
+metrics_registry.register_gauge("jobs_succeeded_total", lambda: runner.succeeded if runner else 0)
+metrics_registry.register_gauge("jobs_failed_total", lambda: runner.failed if runner else 0)
+metrics_registry.register_gauge("jobs_retried_total", lambda: runner.retried if runner else 0)
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_runner(session: Session):
+    if session.info.pop(JOBS_ENQUEUED_KEY, False) and runner is not None:
+        runner.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_enqueued(session: Session):
+    session.info.pop(JOBS_ENQUEUED_KEY, None)
@@ -0,0 +1,388 @@
+"""
+타기관 결합 (EXTERNAL_LINKAGE): 식별정보를 주고받지 않는 레코드 연계 (privacy-preserving record linkage)
+
+두 기관은 미리 합의한 비밀 키로 각자의 식별 컬럼(이름, 생년월일, 성별 등)을 CLK(cryptographic long-term key)로
+부호화해 CLK 파일만 결합 수행 측에 넘깁니다. 원래 값은 기관 밖으로 나가지 않습니다.
+
+- 부호화(CLKEncoder): 컬럼 값을 정규화한 뒤 q-gram(기본 2글자)으로 나누고, q-gram 마다
+  HMAC-SHA256(키, 컬럼 + q-gram) 으로 정한 k 개 비트를 bits 비트 Bloom filter 에 켭니다 (double hashing).
+  같은 값은 한 번만 부호화하며, 결과는 (레코드 수, bits / 64) uint64 배열입니다.
+- 블로킹(LSHBlocking): 비트 위치 band_bits 개를 고른 band 를 bands 개 만들고(Hamming LSH),
+  어느 한 band 의 비트가 모두 같은 레코드 쌍만 후보로 봅니다. 전체 쌍(N x M)을 비교하지 않습니다.
+- 점수: 후보 쌍의 Dice 계수 2|A∧B| / (|A| + |B|) 를 비트 AND + popcount(np.bitwise_count) 로 한 번에 계산
+- 결과: threshold 이상인 (A 행 번호, B 행 번호, 점수). 기본은 점수가 높은 쌍부터 1:1 로 고름
+
+큰 파일은 A 를 chunk_rows 행씩 나눠 프로세스 풀(app.services.process_pool)에서 처리합니다. B 의 CLK 와
+블로킹 색인은 임시 .npy 파일로 한 번 저장하고 작업 프로세스가 메모리 매핑(mmap)으로 읽으므로 프로세스 수만큼 복사되지 않습니다.
+"""
+import csv
+import hashlib
+import hmac
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services import process_pool
+from app.services.process_pool import default_workers  # noqa: F401  스크립트/벤치마크에서 사용
+
+# 컬럼 키 -> q-gram 당 비트 수 (값이 긴 컬럼일수록 q-gram 이 많으므로 작게)
+DEFAULT_LINKAGE_FIELDS = {"name": 30, "birth": 15, "sex": 10}
+
+WORD_BITS = 64
+
+
+def derive_linkage_key(shared_secret: str, scope: str) -> bytes:
+    """결합 건(scope)별 부호화 키 (양 기관이 같은 비밀 값과 scope 를 사용해야 함)"""
+    return hmac.new(shared_secret.encode("utf-8"), f"linkage:{scope}".encode("utf-8"), hashlib.sha256).digest()
+
+
+def normalize(value: str) -> str:
+    """대소문자, 공백과 구분 기호(-, /, . 등) 차이를 무시"""
+    return "".join(char for char in value.lower() if char.isalnum())
+
+
+def qgrams(value: str, q: int = 2) -> List[str]:
+    """앞뒤를 채운 q-gram (예: "홍길동" -> _홍, 홍길, 길동, 동_)"""
+    if not value:
+        return []
+    padded = "_" * (q - 1) + value + "_" * (q - 1)
+    return [padded[index:index + q] for index in range(len(padded) - q + 1)]
+
+
+@dataclass(frozen=True)
+class CLKEncoder:
+    """
+    식별 컬럼 -> CLK 부호화기
+
+    fields: 컬럼 키 -> q-gram 당 켜는 비트 수. 두 기관이 같은 키/fields/bits/q 를 써야 비교할 수 있습니다.
+    """
+    key: bytes = field(repr=False)
+    fields: Mapping[str, int] = field(default_factory=lambda: dict(DEFAULT_LINKAGE_FIELDS))
+    bits: int = 1024
+    q: int = 2
+
+    def __post_init__(self):
+        if self.bits <= 0 or self.bits % WORD_BITS or self.bits & (self.bits - 1):
+            raise ValueError("bits must be a power of two and a multiple of 64")
+        if not self.fields:
+            raise ValueError("At least one linkage field is required")
+
+    @property
+    def words(self) -> int:
+        return self.bits // WORD_BITS
+
+    @cached_property
+    def _positions(self) -> Dict[Tuple[str, str], Tuple[int, ...]]:
+        # (컬럼, q-gram) -> 비트 위치 (q-gram 종류는 많지 않으므로 프로세스 안에서 메모)
+        return {}
+
+    def _token_positions(self, column: str, token: str) -> Tuple[int, ...]:
+        cached = self._positions.get((column, token))
+        if cached is None:
+            digest = hmac.new(self.key, f"{column}\x1f{token}".encode("utf-8"), hashlib.sha256).digest()
+            first = int.from_bytes(digest[:8], "big")
+            step = int.from_bytes(digest[8:16], "big") | 1
+            cached = self._positions[(column, token)] = tuple(
+                (first + index * step) % self.bits for index in range(self.fields[column])
+            )
+        return cached
+
+    def _encode_values(self, column: str, values: Sequence[str]) -> np.ndarray:
+        """고유값마다 Bloom filter 를 만든 뒤 행 순서로 펼침"""
+        raw: Dict[str, int] = {}
+        raw_inverse = np.fromiter(
+            (raw.setdefault(value or "", len(raw)) for value in values), dtype=np.int64, count=len(values)
+        )
+        # 정규화는 원래 고유값마다 한 번만
+        codes: Dict[str, int] = {}
+        inverse = np.fromiter(
+            (codes.setdefault(normalize(value), len(codes)) for value in raw), dtype=np.int64, count=len(raw)
+        )[raw_inverse]
+        rows: List[int] = []
+        positions: List[int] = []
+        for code, value in enumerate(codes):
+            for token in qgrams(value, self.q):
+                token_positions = self._token_positions(column, token)
+                positions.extend(token_positions)
+                rows.extend([code] * len(token_positions))
+        unpacked = np.zeros((len(codes), self.bits), dtype=bool)
+        unpacked[np.asarray(rows, dtype=np.int64), np.asarray(positions, dtype=np.int64)] = True
+        packed = np.packbits(unpacked, axis=1, bitorder="little").view("<u8")
+        return packed[inverse]
+
+    def encode(self, columns: Mapping[str, Sequence[str]]) -> np.ndarray:
+        """{컬럼 키: 값 목록} -> (행 수, words) uint64 CLK (빈 값은 비트를 켜지 않음)"""
+        missing = [column for column in self.fields if column not in columns]
+        if missing:
+            raise ValueError(f"결합 컬럼이 없습니다: {', '.join(missing)}")
+        clks = None
+        for column in self.fields:
+            encoded = self._encode_values(column, columns[column])
+            if clks is None:
+                clks = encoded
+            else:
+                clks |= encoded
+        return np.ascontiguousarray(clks, dtype=np.uint64)
+
+    def encode_csv(self, path, chunk_rows: int = 200_000) -> np.ndarray:
+        """CSV 파일(UTF-8, BOM 허용, 첫 행은 헤더) 부호화, 행 번호는 헤더를 뺀 0부터"""
+        chunks = []
+        with open(path, encoding="utf-8-sig", newline="") as file:
+            reader = csv.DictReader(file)
+            while True:
+                rows = [row for _, row in zip(range(chunk_rows), reader)]
+                if not rows:
+                    break
+                chunks.append(self.encode({column: [row.get(column) or "" for row in rows] for column in self.fields}))
+        if not chunks:
+            return np.zeros((0, self.words), dtype=np.uint64)
+        return np.concatenate(chunks)
+
+
+def popcount(clks: np.ndarray) -> np.ndarray:
+    """레코드별 켜진 비트 수"""
+    return np.bitwise_count(clks).sum(axis=1, dtype=np.int32)
+
+
+def dice(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """같은 행끼리의 Dice 계수 (둘 다 비트가 없으면 0)"""
+    common = np.bitwise_count(a & b).sum(axis=1, dtype=np.int32)
+    total = popcount(a) + popcount(b)
+    return np.divide(2 * common, total, out=np.zeros(len(total)), where=total > 0)
+
+
+@dataclass(frozen=True)
+class LSHBlocking:
+    """
+    비트 샘플링 LSH 블로킹
+
+    비트가 p 비율로 같은 두 레코드가 후보가 될 확률은 1 - (1 - p^band_bits)^bands 입니다.
+    band 하나에 max_bucket 개보다 많이 몰린 값(빈 값 등)은 그 band 에서 후보로 쓰지 않습니다.
+    """
+    bands: int = 32
+    band_bits: int = 40
+    max_bucket: int = 500
+    seed: int = 0
+
+    def __post_init__(self):
+        if not 1 <= self.band_bits <= WORD_BITS:
+            raise ValueError("band_bits must be between 1 and 64")
+
+    def positions(self, bits: int) -> np.ndarray:
+        """(bands, band_bits) 비트 위치"""
+        rng = np.random.default_rng(self.seed)
+        return np.stack([rng.choice(bits, self.band_bits, replace=False) for _ in range(self.bands)])
+
+
+def signatures(clks: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """(bands, 레코드 수) band 값: band 비트들을 정수 하나로 묶음"""
+    # 워드별로 연속된 메모리에서 비트를 꺼내도록 (words, 레코드 수) 로 전치
+    words = np.ascontiguousarray(clks.T)
+    result = np.zeros((len(positions), len(clks)), dtype=np.uint64)
+    bit = np.empty(len(clks), dtype=np.uint64)
+    one = np.uint64(1)
+    for band, band_positions in enumerate(positions):
+        signature = result[band]
+        for offset, position in enumerate(band_positions.tolist()):
+            np.right_shift(words[position // WORD_BITS], np.uint64(position % WORD_BITS), out=bit)
+            np.bitwise_and(bit, one, out=bit)
+            np.left_shift(bit, np.uint64(offset), out=bit)
+            signature |= bit
+    return result
+
+
+@dataclass
+class LinkageIndex:
+    """B 쪽 블로킹 색인: band 마다 정렬한 band 값과 그 순서의 행 번호"""
+    clks: np.ndarray
+    popcounts: np.ndarray
+    positions: np.ndarray
+    sorted_signatures: np.ndarray  # (bands, M) uint64
+    order: np.ndarray  # (bands, M) int32
+
+    @classmethod
+    def build(cls, clks: np.ndarray, blocking: LSHBlocking) -> "LinkageIndex":
+        positions = blocking.positions(clks.shape[1] * WORD_BITS)
+        band_signatures = signatures(clks, positions)
+        order = np.argsort(band_signatures, axis=1, kind="stable").astype(np.int32)
+        return cls(
+            clks=clks,
+            popcounts=popcount(clks),
+            positions=positions,
+            sorted_signatures=np.take_along_axis(band_signatures, order, axis=1),
+            order=order,
+        )
+
+    _ARRAYS = ("clks", "popcounts", "positions", "sorted_signatures", "order")
+
+    def save(self, directory: Path):
+        for name in self._ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+
+    @classmethod
+    def load(cls, directory: Path) -> "LinkageIndex":
+        """save() 한 색인을 메모리 매핑으로 (여러 프로세스가 같은 페이지를 공유)"""
+        return cls(**{name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in cls._ARRAYS})
+
+
+def candidate_pairs(clks: np.ndarray, index: LinkageIndex, max_bucket: int) -> Tuple[np.ndarray, np.ndarray]:
+    """A 레코드 블록과 한 band 이상 값이 같은 B 레코드 쌍 (중복 제거)"""
+    band_signatures = signatures(clks, index.positions)
+    keys = []
+    for band, signature in enumerate(band_signatures):
+        sorted_signature = index.sorted_signatures[band]
+        # 찾을 값도 정렬해 두면 searchsorted 가 훨씬 빠름 (rows: 정렬 순서의 A 행 번호)
+        rows = np.argsort(signature)
+        signature = signature[rows]
+        left = np.searchsorted(sorted_signature, signature, side="left")
+        counts = np.searchsorted(sorted_signature, signature, side="right") - left
+        counts[counts > max_bucket] = 0
+        total = int(counts.sum())
+        if not total:
+            continue
+        a = np.repeat(rows, counts)
+        # 쌍마다 B 정렬 위치: 자기 구간 시작 + 구간 안 순번
+        starts = np.repeat(left - (np.cumsum(counts) - counts), counts)
+        b = np.asarray(index.order[band])[starts + np.arange(total)]
+        keys.append(a * len(index.clks) + b)
+    if not keys:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    unique = np.unique(np.concatenate(keys))
+    return unique // len(index.clks), unique % len(index.clks)
+
+
+def score_block(clks: np.ndarray, index: LinkageIndex, threshold: float, max_bucket: int,
+                score_batch: int = 500_000) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """A 레코드 블록 -> (A 블록 안 행 번호, B 행 번호, Dice 점수, 후보 수), threshold 이상만"""
+    a, b = candidate_pairs(clks, index, max_bucket)
+    a_popcounts = popcount(clks)
+    kept_a, kept_b, kept_scores = [], [], []
+    for start in range(0, len(a), score_batch):
+        batch_a, batch_b = a[start:start + score_batch], b[start:start + score_batch]
+        common = np.bitwise_count(clks[batch_a] & index.clks[batch_b]).sum(axis=1, dtype=np.int32)
+        total = a_popcounts[batch_a] + index.popcounts[batch_b]
+        scores = np.divide(2 * common, total, out=np.zeros(len(total)), where=total > 0)
+        keep = scores >= threshold
+        kept_a.append(batch_a[keep])
+        kept_b.append(batch_b[keep])
+        kept_scores.append(scores[keep])
+    if not kept_a:
+        return a, b, np.zeros(0), 0
+    return np.concatenate(kept_a), np.concatenate(kept_b), np.concatenate(kept_scores), len(a)
+
+
+# 작업 프로세스 상태 (initializer 로 한 번 설정)
+_worker_index: Optional[LinkageIndex] = None
+
+
+def _init_worker(index_directory: str):
+    global _worker_index
+    _worker_index = LinkageIndex.load(Path(index_directory))
+
+
+def _score_worker_block(offset: int, clks: np.ndarray, threshold: float, max_bucket: int):
+    """-> ((A 행 번호, B 행 번호, 점수, 후보 쌍 수), 블록 행 수)"""
+    a, b, scores, candidates = score_block(clks, _worker_index, threshold, max_bucket)
+    return (a + offset, b, scores, candidates), len(clks)
+
+
+@dataclass
+class LinkageResult:
+    a: np.ndarray  # A 행 번호
+    b: np.ndarray  # B 행 번호
+    scores: np.ndarray
+    candidates: int = 0  # 점수를 계산한 후보 쌍 수
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+
+def one_to_one(result: LinkageResult) -> LinkageResult:
+    """점수가 높은 쌍부터 A, B 각각 한 번씩만 쓰도록 고름 (greedy)"""
+    order = np.lexsort((result.b, result.a, -result.scores))
+    used_a: set = set()
+    used_b: set = set()
+    keep = []
+    for position, a, b in zip(order.tolist(), result.a[order].tolist(), result.b[order].tolist()):
+        if a in used_a or b in used_b:
+            continue
+        used_a.add(a)
+        used_b.add(b)
+        keep.append(position)
+    keep = np.sort(np.asarray(keep, dtype=np.int64))
+    return LinkageResult(result.a[keep], result.b[keep], result.scores[keep], result.candidates)
+
+
+def _blocks(clks: np.ndarray, chunk_rows: int) -> Iterator[Tuple[int, np.ndarray]]:
+    for offset in range(0, len(clks), chunk_rows):
+        yield offset, np.ascontiguousarray(clks[offset:offset + chunk_rows])
+
+
+def link(
+    clks_a: np.ndarray,
+    clks_b: np.ndarray,
+    *,
+    threshold: float = 0.8,
+    blocking: LSHBlocking = LSHBlocking(),
+    chunk_rows: int = 50_000,
+    workers: int = 1,
+    match_one_to_one: bool = True,
+    progress: Optional[Callable[[int], None]] = None,
+) -> LinkageResult:
+    """
+    A, B CLK 결합 -> threshold 이상인 쌍
+
+    workers 가 1 이하이면 현재 프로세스에서 처리합니다.
+    progress 는 A 블록이 끝날 때마다 처리한 A 행 수로 호출됩니다.
+    """
+    if clks_a.shape[1] != clks_b.shape[1]:
+        raise ValueError("CLK 비트 수가 다릅니다 (양 기관의 부호화 설정이 같아야 합니다)")
+    index = LinkageIndex.build(np.ascontiguousarray(clks_b, dtype=np.uint64), blocking)
+    parts: List[Tuple[np.ndarray, np.ndarray, np.ndarray, int]] = []
+
+    def collect(part, rows: int):
+        parts.append(part)
+        if progress is not None:
+            progress(rows)
+
+    if workers <= 1:
+        for offset, block in _blocks(clks_a, chunk_rows):
+            a, b, scores, candidates = score_block(block, index, threshold, blocking.max_bucket)
+            collect((a + offset, b, scores, candidates), len(block))
+    else:
+        index_directory = Path(tempfile.mkdtemp(prefix="data-portal-linkage-"))
+        try:
+            index.save(index_directory)
+            del index
+            process_pool.map_in_order(
+                _score_worker_block,
+                ((offset, block, threshold, blocking.max_bucket) for offset, block in _blocks(clks_a, chunk_rows)),
+                lambda result: collect(*result),
+                workers=workers,
+                initializer=_init_worker,
+                initargs=(str(index_directory),),
+            )
+        finally:
+            shutil.rmtree(index_directory, ignore_errors=True)
+
+    result = LinkageResult(
+        a=np.concatenate([part[0] for part in parts]) if parts else np.zeros(0, dtype=np.int64),
+        b=np.concatenate([part[1] for part in parts]) if parts else np.zeros(0, dtype=np.int64),
+        scores=np.concatenate([part[2] for part in parts]) if parts else np.zeros(0),
+        candidates=sum(part[3] for part in parts),
+    )
+    return one_to_one(result) if match_one_to_one else result
+
+
+def write_pairs(path, result: LinkageResult):
+    """결합 결과 CSV (a_row, b_row, score), 행 번호는 각 기관 입력 파일의 0부터 세는 데이터 행 번호"""
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["a_row", "b_row", "score"])
+        writer.writerows(zip(result.a.tolist(), result.b.tolist(), np.round(result.scores, 4).tolist()))
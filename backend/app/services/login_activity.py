@@ -0,0 +1,156 @@
+"""
+마지막 로그인 시각(users.last_login_at) 일괄 기록
+
+로그인마다 users 행을 UPDATE 하면 SQLite 에서 다른 쓰기와 직렬화되므로, 로그인 시각은 메모리에
+사용자별 최신 값만 모아 두었다가 LOGIN_ACTIVITY_FLUSH_SECONDS 마다 executemany UPDATE 한 번으로 기록합니다.
+
+- 지연 상한: 프로세스가 살아 있는 동안 last_login_at 은 최대 flush 간격만큼 늦게 반영됩니다.
+  대기 중인 사용자 수가 LOGIN_ACTIVITY_MAX_PENDING 에 도달하면 간격을 기다리지 않고 바로 기록합니다.
+- 종료 시(lifespan) 남은 값을 기록합니다. 비정상 종료 시에는 마지막 간격 동안의 값이 유실될 수 있습니다.
+- 기록은 더 최근 시각일 때만 덮어쓰므로, 워커가 여러 개여도 늦게 flush 된 오래된 값이 최신 값을 덮지 않습니다.
+- 간격이 0 이거나 기록기가 실행 중이 아니면(스크립트, 테스트 등) 로그인 트랜잭션에서 바로 UPDATE 합니다.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, event, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import registry as metrics_registry
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+users_table = User.__table__
+
+PENDING_LOGINS_KEY = "pending_login_activity"
+
+# 대기 중인 값을 사용자당 한 행씩 갱신 (더 최근 시각일 때만)
+# version 은 올리지 않음: last_login_at 은 관리자가 수정하는 사용자 정보가 아니므로, 로그인 기록 때문에
+# 먼저 읽어 둔 관리자 수정이 version_id_col 검사(412)에 걸리거나 ETag 가 바뀌면 안 됨
+FLUSH_STATEMENT = (
+    update(users_table)
+    .where(
+        users_table.c.id == bindparam("b_id"),
+        or_(users_table.c.last_login_at.is_(None), users_table.c.last_login_at < bindparam("b_at")),
+    )
+    .values(last_login_at=bindparam("b_at"))
+)
+
+
+class LoginActivityRecorder:
+    def __init__(self, flush_interval: float, max_pending: int):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[str, datetime] = {}
+        self._session_factory: Optional[async_sessionmaker] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self.flushes = 0
+        self.flushed_rows = 0
+        self.direct_writes = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._stopping
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def record(self, db: AsyncSession, user_id: str, logged_in_at: Optional[datetime] = None):
+        """
+        로그인 시각 기록 (로그인 트랜잭션 안에서 호출)
+
+        일괄 기록 중이면 세션이 커밋될 때 대기열에 넣고(롤백되면 버림), 아니면 db 트랜잭션에서 바로 UPDATE
+        """
+        logged_in_at = logged_in_at or datetime.utcnow()
+        if not self.running:
+            self.direct_writes += 1
+            await db.execute(FLUSH_STATEMENT, [{"b_id": user_id, "b_at": logged_in_at}])
+            return
+        sync_session = getattr(db, "sync_session", db)
+        sync_session.info.setdefault(PENDING_LOGINS_KEY, {})[user_id] = logged_in_at
+
+    def _enqueue(self, logins: Dict[str, datetime]):
+        for user_id, logged_in_at in logins.items():
+            previous = self._pending.get(user_id)
+            if previous is None or previous < logged_in_at:
+                self._pending[user_id] = logged_in_at
+        if len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+
+    async def start(self, session_factory: async_sessionmaker):
+        if self.flush_interval <= 0:
+            return
+        self._session_factory = session_factory
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._flush_loop(), name="login-activity-flush")
+
+    async def stop(self):
+        """주기 기록을 멈추고 남은 값을 기록"""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """대기 중인 값을 UPDATE 한 번(executemany)으로 기록, 실패하면 다시 대기열에 넣음"""
+        if not self._pending or self._session_factory is None:
+            return 0
+        batch, self._pending = self._pending, {}
+        params = [{"b_id": user_id, "b_at": logged_in_at} for user_id, logged_in_at in batch.items()]
+        try:
+            async with self._session_factory() as db:
+                await db.execute(FLUSH_STATEMENT, params)
+                await db.commit()
+        except Exception:
+            logger.exception("로그인 시각 기록 실패 (%d건, 다음 주기에 재시도)", len(batch))
+            self._enqueue(batch)
+            return 0
+        self.flushes += 1
+        self.flushed_rows += len(batch)
+        return len(batch)
+
+    async def _flush_loop(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._stopping:
+                break
+            await self.flush()
+
+
+login_activity = LoginActivityRecorder(
+    flush_interval=settings.LOGIN_ACTIVITY_FLUSH_SECONDS,
+    max_pending=settings.LOGIN_ACTIVITY_MAX_PENDING,
+)
+
+metrics_registry.register_gauge("login_activity_pending", lambda: login_activity.pending)
+metrics_registry.register_gauge("login_activity_flushes_total", lambda: login_activity.flushes)
+metrics_registry.register_gauge("login_activity_flushed_rows_total", lambda: login_activity.flushed_rows)
+metrics_registry.register_gauge("login_activity_direct_writes_total", lambda: login_activity.direct_writes)
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_committed_logins(session: Session):
+    logins = session.info.pop(PENDING_LOGINS_KEY, None)
+    if logins:
+        login_activity._enqueue(logins)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_logins(session: Session):
+    session.info.pop(PENDING_LOGINS_KEY, None)
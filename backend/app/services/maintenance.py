@@ -0,0 +1,48 @@
+"""
+주기 정리 작업 (백그라운드 작업 실행기에서 실행)
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.base import get_korean_time
+from app.models import Job, JobStatus, RefreshToken, PasswordResetToken
+from app.services.jobs import job
+
+
+@job("tokens.sweep", every=settings.TOKEN_SWEEP_INTERVAL_SECONDS)
+async def sweep_tokens(db: AsyncSession, payload: dict) -> dict:
+    """만료된 리프레시 토큰과 만료/사용된 비밀번호 재설정 토큰 삭제"""
+    # 토큰 만료 시각은 UTC 기준으로 저장됨
+    now = datetime.utcnow()
+    refresh_result = await db.execute(
+        delete(RefreshToken)
+        .where(RefreshToken.expires_at < now)
+        .execution_options(synchronize_session=False)
+    )
+    reset_result = await db.execute(
+        delete(PasswordResetToken)
+        .where(or_(PasswordResetToken.expires_at < now, PasswordResetToken.used == True))
+        .execution_options(synchronize_session=False)
+    )
+    return {
+        "refresh_tokens_deleted": refresh_result.rowcount or 0,
+        "password_reset_tokens_deleted": reset_result.rowcount or 0,
+    }
+
+
+@job("jobs.prune", every=24 * 3600)
+async def prune_jobs(db: AsyncSession, payload: dict) -> dict:
+    """보관 기간(JOBS_RETENTION_DAYS)이 지난 완료/취소 작업 삭제 (실패 작업은 확인용으로 남김)"""
+    cutoff = get_korean_time() - timedelta(days=settings.JOBS_RETENTION_DAYS)
+    result = await db.execute(
+        delete(Job)
+        .where(
+            Job.status.in_((JobStatus.SUCCEEDED, JobStatus.CANCELLED)),
+            Job.updated_at < cutoff
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return {"jobs_deleted": result.rowcount or 0}
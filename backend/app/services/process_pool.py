@@ -0,0 +1,61 @@
+"""
+작업 프로세스 풀에서 블록 단위 작업을 처리하고 결과를 입력 순서대로 넘기는 공통 도우미
+(비식별화, 가명화, 타기관 결합에서 사용)
+
+동시에 처리 중인 블록 수를 workers * 2 로 제한하므로 입력 크기와 관계없이 메모리 사용량이 일정합니다.
+작업 프로세스는 spawn 으로 시작해 작업 함수가 있는 모듈을 다시 import 하므로, 이 모듈과 작업 함수가 있는 모듈은
+앱 설정/DB 모듈을 import 하지 않습니다.
+"""
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Optional, Sequence
+
+
+def create_pool(workers: int, initializer: Optional[Callable] = None, initargs: Sequence = ()) -> ProcessPoolExecutor:
+    # 스레드가 있는 앱 프로세스에서 fork 하지 않도록 spawn 사용
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=tuple(initargs),
+    )
+
+
+def map_in_order(
+    function: Callable,
+    arguments: Iterable[Sequence],
+    consume: Callable[[Any], None],
+    *,
+    workers: int,
+    pool: Optional[ProcessPoolExecutor] = None,
+    initializer: Optional[Callable] = None,
+    initargs: Sequence = (),
+):
+    """
+    arguments 의 각 인자 묶음으로 function 을 풀에서 실행하고, 결과를 입력 순서대로 consume 에 넘김
+
+    pool 을 주지 않으면 workers 개 프로세스의 풀을 만들어 쓰고 끝나면 종료합니다
+    (pool 을 주면 workers 는 그 프로세스 수). 입력이나 consume 에서 예외가 나면 아직 시작하지 않은 작업은 취소합니다.
+    """
+    own_pool = pool is None
+    if own_pool:
+        pool = create_pool(workers, initializer, initargs)
+    pending: Deque[Future] = deque()
+    try:
+        for args in arguments:
+            pending.append(pool.submit(function, *args))
+            while len(pending) >= max(workers, 1) * 2:
+                consume(pending.popleft().result())
+        while pending:
+            consume(pending.popleft().result())
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_pool:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def default_workers() -> int:
+    return max(os.cpu_count() or 1, 1)
@@ -0,0 +1,337 @@
+"""
+가명화 (PSEUDONYMIZATION): 결과 데이터의 식별 컬럼을 키 기반 가명으로 변환
+
+규칙(app.schemas.extraction.PseudonymizationRule)은 컬럼 키별로 적용하며, 해당 컬럼이 있는 모든 파일에 적용됩니다.
+- hmac: HMAC-SHA256(키, 값) 앞부분 (대체번호, 주민등록번호 등). 같은 값은 항상 같은 가명이므로 파일 간 연결은 유지됩니다.
+- date_shift: 환자(patient_column)마다 키로 정한 일수만큼 날짜 이동 (환자 안의 날짜 간격 유지, "YYYY-MM-DD..." 앞 10자)
+- year: 연도만 남김 (생년월일 등)
+- drop: 컬럼 삭제
+
+키는 신청서마다 따로 파생하므로(derive_key) 다른 신청서에 제공한 가명과 연결되지 않습니다.
+
+큰 파일은 처리량을 위해 프로세스 풀(app.services.process_pool)로 나눠 처리합니다. 주 프로세스는 입력을
+행 블록(chunk_rows 행의 원문)으로 잘라 보내고 결과 블록을 순서대로 쓰기만 하며, CSV 해석/변환/직렬화는 작업 프로세스에서 합니다.
+같은 환자의 행이 여러 블록에 걸쳐 나오므로 프로세스마다 가명/이동 일수를 메모(memo_size 개)해 값마다 한 번만 HMAC 을 계산하고,
+날짜 이동은 블록의 날짜 컬럼 전체를 datetime64 배열로 한 번에 계산합니다.
+"""
+import csv
+import hashlib
+import hmac
+import io
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, TextIO
+
+import numpy as np
+
+from app.services import process_pool
+from app.services.process_pool import default_workers  # noqa: F401  추출 작업/벤치마크에서 사용
+
+METHODS = ("hmac", "date_shift", "year", "drop")
+
+# 날짜 컬럼의 날짜 부분 ("YYYY-MM-DD", 뒤의 시각은 그대로 둠)
+DATE_LENGTH = 10
+
+
+def derive_key(master_key: str, scope: str) -> bytes:
+    """신청서(scope)별 가명화 키"""
+    return hmac.new(master_key.encode("utf-8"), f"pseudonymization:{scope}".encode("utf-8"), hashlib.sha256).digest()
+
+
+@dataclass(frozen=True)
+class Pseudonymizer:
+    """
+    행 블록 변환기 (작업 프로세스로 한 번만 전달되므로 키/규칙 외의 상태는 전달하지 않음)
+
+    rules: 컬럼 키 -> 방법 (METHODS)
+    """
+    key: bytes = field(repr=False)
+    rules: Dict[str, str]
+    patient_column: str = "id"
+    date_shift_days: int = 30
+    pseudonym_length: int = 20  # hex 문자 수
+    memo_size: int = 500_000  # 프로세스별로 기억하는 가명/이동 일수 수 (넘으면 비움)
+
+    def __post_init__(self):
+        unknown = set(self.rules.values()) - set(METHODS)
+        if unknown:
+            raise ValueError(f"Unknown pseudonymization method: {', '.join(sorted(unknown))}")
+
+    def __getstate__(self):
+        # 해시 상태/메모는 작업 프로세스에서 다시 만듦
+        return {name: value for name, value in self.__dict__.items() if not name.startswith("_")}
+
+    def output_header(self, header: Sequence[str]) -> List[str]:
+        return [column for column in header if self.rules.get(column) != "drop"]
+
+    @cached_property
+    def _hmac_states(self):
+        """키를 적용한 HMAC 내부/외부 해시 상태 (RFC 2104, 값마다 복사해 사용)"""
+        block_size = hashlib.sha256().block_size
+        key = self.key if len(self.key) <= block_size else hashlib.sha256(self.key).digest()
+        key = key.ljust(block_size, b"\0")
+        return hashlib.sha256(bytes(byte ^ 0x36 for byte in key)), hashlib.sha256(bytes(byte ^ 0x5C for byte in key))
+
+    @cached_property
+    def _pseudonyms(self) -> Dict[str, str]:
+        return {}
+
+    @cached_property
+    def _shifts(self) -> Dict[str, int]:
+        return {}
+
+    def _digest(self, message: bytes) -> bytes:
+        """HMAC-SHA256(key, message)"""
+        inner, outer = self._hmac_states
+        inner = inner.copy()
+        inner.update(message)
+        outer = outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+    def _pseudonym(self, value: str) -> str:
+        memo = self._pseudonyms
+        if len(memo) >= self.memo_size:
+            memo.clear()
+        pseudonym = memo[value] = self._digest(value.encode("utf-8")).hex()[:self.pseudonym_length] if value else ""
+        return pseudonym
+
+    def _shift(self, patient: str) -> int:
+        """환자별 이동 일수 (1 ~ date_shift_days, 부호 포함, 0 은 사용하지 않음)"""
+        memo = self._shifts
+        if len(memo) >= self.memo_size:
+            memo.clear()
+        number = int.from_bytes(self._digest(b"date_shift:" + patient.encode("utf-8"))[:8], "big")
+        days = number % self.date_shift_days + 1
+        shift = memo[patient] = days if number & (1 << 63) else -days
+        return shift
+
+    def _hash(self, values: Sequence[str]) -> List[str]:
+        """같은 값(같은 환자의 여러 행 등)은 메모에서 꺼내고 새 값만 HMAC 계산"""
+        memo = self._pseudonyms
+        return [memo[value] if value in memo else self._pseudonym(value) for value in values]
+
+    def _shift_days(self, patients: Sequence[str]) -> np.ndarray:
+        memo = self._shifts
+        return np.fromiter(
+            (memo[patient] if patient in memo else self._shift(patient) for patient in patients),
+            dtype=np.int64,
+            count=len(patients),
+        )
+
+    def _shift_dates(self, values: Sequence[str], shifts: np.ndarray) -> List[str]:
+        """
+        앞 10자("YYYY-MM-DD")만 이동하고 뒤(시각 등)는 그대로 둠
+
+        고정 폭 문자 배열을 (행, 문자) 2차원으로 보고 날짜 부분의 문자만 바꿔 씁니다.
+        """
+        array = np.array(values, dtype=str)
+        width = array.dtype.itemsize // 4
+        if width < DATE_LENGTH:
+            return list(values)
+        chars = array.view("U1").reshape(len(array), width)
+        mask = (chars[:, 4] == "-") & (chars[:, 7] == "-")
+        dates = _parse_dates(np.where(mask, array.astype(f"U{DATE_LENGTH}"), ""))
+        valid = mask & ~np.isnat(dates)
+        shifted = (dates[valid] + shifts[valid].astype("timedelta64[D]")).astype(f"U{DATE_LENGTH}")
+        chars[valid, :DATE_LENGTH] = shifted.view("U1").reshape(len(shifted), DATE_LENGTH)
+        return array.tolist()
+
+    def transform(self, header: Sequence[str], rows: List[List[str]]) -> List[Sequence[str]]:
+        """행 블록 변환 (컬럼 단위)"""
+        if not rows:
+            return []
+        columns = dict(zip(header, zip(*rows)))
+        shifts = None
+        output = []
+        for name in header:
+            method = self.rules.get(name)
+            values = columns[name]
+            if method == "drop":
+                continue
+            if method == "hmac":
+                values = self._hash(values)
+            elif method == "date_shift":
+                if self.patient_column not in columns:
+                    # 환자별 이동 없이 원래 날짜를 내보내지 않도록 실패 처리
+                    raise ValueError(f"날짜 이동({name})에는 {self.patient_column} 컬럼이 필요합니다")
+                if shifts is None:
+                    shifts = self._shift_days(columns[self.patient_column])
+                values = self._shift_dates(values, shifts)
+            elif method == "year":
+                values = [value[:4] if value[:4].isdigit() else "" for value in values]
+            output.append(values)
+        return list(zip(*output)) if output else [[] for _ in rows]
+
+
+def _parse_dates(values: np.ndarray) -> np.ndarray:
+    """날짜 배열 (형식이 다른 값과 빈 값은 NaT)"""
+    try:
+        return values.astype("datetime64[D]")
+    except ValueError:
+        parsed = np.empty(len(values), dtype="datetime64[D]")
+        for index, value in enumerate(values.tolist()):
+            try:
+                parsed[index] = np.datetime64(value, "D")
+            except ValueError:
+                parsed[index] = np.datetime64("NaT")
+        return parsed
+
+
+@dataclass
+class PseudonymizationStats:
+    rows: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    blocks: int = 0
+
+
+# 작업 프로세스 상태 (initializer 로 한 번 설정)
+_worker_pseudonymizer: Optional[Pseudonymizer] = None
+
+
+def _init_worker(pseudonymizer: Pseudonymizer):
+    global _worker_pseudonymizer
+    _worker_pseudonymizer = pseudonymizer
+
+
+def _process_block(header: List[str], block: str, pseudonymizer: Optional[Pseudonymizer] = None):
+    """CSV 원문 블록 -> (행 수, 변환된 CSV 원문)"""
+    pseudonymizer = pseudonymizer or _worker_pseudonymizer
+    rows = [row for row in csv.reader(io.StringIO(block, newline="")) if row]
+    output = io.StringIO()
+    csv.writer(output).writerows(pseudonymizer.transform(header, rows))
+    return len(rows), output.getvalue()
+
+
+def iter_csv_blocks(reader: TextIO, chunk_rows: int) -> Iterator[str]:
+    """
+    chunk_rows 행씩 CSV 원문 블록 (해석하지 않고 줄 단위로 자름)
+
+    따옴표 안의 줄바꿈에서 자르지 않도록 따옴표 수가 짝수일 때만 행이 끝난 것으로 봅니다.
+    """
+    lines: List[str] = []
+    rows = 0
+    quotes = 0
+    for line in reader:
+        lines.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        rows += 1
+        if rows >= chunk_rows:
+            yield "".join(lines)
+            lines, rows, quotes = [], 0, 0
+    if lines:
+        yield "".join(lines)
+
+
+def create_pool(pseudonymizer: Pseudonymizer, workers: int) -> ProcessPoolExecutor:
+    """여러 파일을 같은 규칙으로 처리할 때 재사용할 작업 프로세스 풀"""
+    return process_pool.create_pool(workers, _init_worker, (pseudonymizer,))
+
+
+def pseudonymize_stream(
+    reader: TextIO,
+    writer: TextIO,
+    pseudonymizer: Pseudonymizer,
+    *,
+    chunk_rows: int = 50000,
+    workers: int = 1,
+    pool: Optional[ProcessPoolExecutor] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    cancel: Optional[Callable[[], bool]] = None,
+) -> PseudonymizationStats:
+    """
+    CSV 스트림 가명화 (첫 행은 헤더)
+
+    pool 을 주지 않고 workers 가 1 이하이면 현재 프로세스에서 처리합니다.
+    (pool 은 같은 pseudonymizer 로 create_pool 한 것이어야 하며, workers 는 그 프로세스 수)
+    progress 는 블록이 기록될 때마다 처리한 행 수로 호출됩니다.
+    """
+    stats = PseudonymizationStats()
+    header_line = reader.readline()
+    if not header_line:
+        return stats
+    header = next(csv.reader([header_line]))
+    csv.writer(writer).writerow(pseudonymizer.output_header(header))
+
+    def write(result):
+        rows, text = result
+        writer.write(text)
+        stats.rows += rows
+        stats.bytes_out += len(text)
+        stats.blocks += 1
+        if progress is not None:
+            progress(rows)
+
+    def blocks():
+        for block in iter_csv_blocks(reader, chunk_rows):
+            if cancel is not None and cancel():
+                raise InterruptedError("가명화가 중단되었습니다")
+            stats.bytes_in += len(block)
+            yield block
+
+    if pool is None and workers <= 1:
+        for block in blocks():
+            write(_process_block(header, block, pseudonymizer))
+        return stats
+
+    process_pool.map_in_order(
+        _process_block,
+        ((header, block) for block in blocks()),
+        write,
+        workers=workers,
+        pool=pool,
+        initializer=_init_worker,
+        initargs=(pseudonymizer,),
+    )
+    return stats
+
+
+def pseudonymize_csv(src, dst, pseudonymizer: Pseudonymizer, **kwargs) -> PseudonymizationStats:
+    """CSV 파일 가명화 (UTF-8, BOM 허용)"""
+    with open(src, encoding="utf-8-sig", newline="") as reader, \
+            open(dst, "w", encoding="utf-8-sig", newline="") as writer:
+        return pseudonymize_stream(reader, writer, pseudonymizer, **kwargs)
+
+
+def parquet_as_csv(src, chunk_rows: int = 50000) -> Iterator[str]:
+    """Parquet 파일을 CSV 원문 조각으로 (pyarrow 필요, 필요한 만큼씩 읽음)"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Parquet 파일을 읽으려면 pyarrow 가 필요합니다 (pip install pyarrow)") from exc
+    parquet_file = pq.ParquetFile(src)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(parquet_file.schema_arrow.names)
+    for batch in parquet_file.iter_batches(batch_size=chunk_rows):
+        writer.writerows(zip(*(column.to_pylist() for column in batch.columns)))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+class _ChunkReader(io.TextIOBase):
+    """문자열 조각 iterator 를 줄 단위로 읽는 텍스트 스트림"""
+
+    def __init__(self, chunks: Iterator[str]):
+        self._lines = (line for chunk in chunks for line in io.StringIO(chunk, newline=""))
+
+    def readline(self, size=-1) -> str:
+        return next(self._lines, "")
+
+    def __iter__(self):
+        return self._lines
+
+
+def pseudonymize_parquet(src, dst, pseudonymizer: Pseudonymizer, *, chunk_rows: int = 50000,
+                         **kwargs) -> PseudonymizationStats:
+    """Parquet 파일 가명화 (결과는 CSV)"""
+    with open(dst, "w", encoding="utf-8-sig", newline="") as writer:
+        return pseudonymize_stream(
+            _ChunkReader(parquet_as_csv(src, chunk_rows)), writer, pseudonymizer, chunk_rows=chunk_rows, **kwargs
+        )
@@ -0,0 +1,359 @@
+"""
+업로드 파일 정리 (고아 파일 GC)
+
+업로드 디렉터리(uploads/applications/<신청서 id>/...)에는 DB 가 더 이상 참조하지 않는 파일이 남습니다.
+(첨부 삭제 시 경로만 NULL 로 변경, 업로드 후 상태 검사 실패, 삭제된 신청서 등)
+
+- 디스크는 os.scandir 로 순회하면서 경로 문자열 순서로 정렬된 파일 목록을 만들고,
+  DB 는 참조 중인 경로를 ORDER BY 로 정렬해 배치 단위로 스트리밍합니다.
+  두 정렬된 목록을 병합(sorted merge)하므로 파일마다 DB 를 조회하지 않고, 메모리도 배치 크기만큼만 사용합니다.
+- 수정된 지 grace 기간이 지나지 않은 파일은 건드리지 않습니다. (업로드 직후 DB 반영 전인 파일 보호)
+- 삭제된 신청서의 첨부파일은 deleted_retention_days 동안은 참조 중으로 취급합니다.
+- 모드: report(삭제 없이 보고만), quarantine(uploads/.quarantine/<실행 시각>/ 로 이동), delete(즉시 삭제)
+"""
+import asyncio
+import enum
+import logging
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Iterator, List, Optional
+
+from sqlalchemy import select, union_all, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import registry as metrics_registry
+from app.db.functions import code_point_order
+from app.models import Application
+from app.services.jobs import job
+
+logger = logging.getLogger(__name__)
+
+# save_uploaded_file 과 같은 기준 (작업 디렉터리 기준 상대 경로로 DB 에 저장됨)
+UPLOAD_ROOT = Path("uploads")
+QUARANTINE_DIR_NAME = ".quarantine"
+QUARANTINE_STAMP_FORMAT = "%Y%m%dT%H%M%S"
+
+# 디스크 순회 결과를 스레드에서 가져올 때 한 번에 가져올 파일 수
+SCAN_CHUNK_SIZE = 1000
+
+
+class GCMode(str, enum.Enum):
+    REPORT = "report"
+    QUARANTINE = "quarantine"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    path: str  # 업로드 루트 기준 상대 경로 (posix)
+    size: int
+    mtime: float
+
+
+@dataclass
+class UploadGCReport:
+    mode: str
+    root: str
+    scanned_files: int = 0
+    scanned_bytes: int = 0
+    referenced_paths: int = 0  # DB 가 참조하는 경로 수
+    referenced_found: int = 0  # 그 중 디스크에 있는 파일 수
+    missing: int = 0  # DB 가 참조하지만 디스크에 없는 파일 수
+    orphans: int = 0
+    orphan_bytes: int = 0
+    skipped_recent: int = 0  # grace 기간 안이라 건너뛴 고아 파일
+    removed: int = 0  # 격리/삭제한 파일
+    removed_bytes: int = 0
+    errors: int = 0
+    quarantine_purged: int = 0  # 보관 기간이 지나 삭제한 격리 디렉터리
+    elapsed_seconds: float = 0.0
+    orphan_samples: List[str] = field(default_factory=list)
+
+    @property
+    def files_per_second(self) -> float:
+        return self.scanned_files / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "mode": self.mode,
+            "root": self.root,
+            "scanned_files": self.scanned_files,
+            "scanned_bytes": self.scanned_bytes,
+            "referenced_paths": self.referenced_paths,
+            "referenced_found": self.referenced_found,
+            "missing": self.missing,
+            "orphans": self.orphans,
+            "orphan_bytes": self.orphan_bytes,
+            "skipped_recent": self.skipped_recent,
+            "removed": self.removed,
+            "removed_bytes": self.removed_bytes,
+            "errors": self.errors,
+            "quarantine_purged": self.quarantine_purged,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "files_per_second": round(self.files_per_second, 1),
+            "orphan_samples": self.orphan_samples,
+        }
+
+
+# 마지막 실행 결과 (/metrics)
+last_report: Optional[UploadGCReport] = None
+removed_bytes_total = 0
+
+metrics_registry.register_gauge("upload_gc_last_orphans", lambda: last_report.orphans if last_report else 0)
+metrics_registry.register_gauge("upload_gc_last_removed", lambda: last_report.removed if last_report else 0)
+metrics_registry.register_gauge("upload_gc_last_duration_seconds",
+                                lambda: last_report.elapsed_seconds if last_report else 0)
+metrics_registry.register_gauge("upload_gc_last_files_per_second",
+                                lambda: last_report.files_per_second if last_report else 0)
+metrics_registry.register_gauge("upload_gc_removed_bytes_total", lambda: removed_bytes_total)
+
+
+def _scan_sort_key(entry: os.DirEntry) -> str:
+    # 디렉터리 이름 뒤에 '/' 를 붙여 정렬하면 깊이 우선 순회 결과가 전체 경로 문자열 순서와 같아짐
+    # (예: 파일 "a-b" 는 디렉터리 "a" 의 하위 "a/x" 보다 앞)
+    return entry.name + "/" if entry.is_dir(follow_symlinks=False) else entry.name
+
+
+def walk_upload_tree(root: Path) -> Iterator[FileEntry]:
+    """업로드 루트 아래 파일을 상대 경로 문자열 순서로 반환 (격리 디렉터리, 심볼릭 링크 제외)"""
+    def walk(directory: str, prefix: str) -> Iterator[FileEntry]:
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=_scan_sort_key)
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if not prefix and entry.name == QUARANTINE_DIR_NAME:
+                    continue
+                yield from walk(entry.path, f"{prefix}{entry.name}/")
+            elif entry.is_file(follow_symlinks=False):
+                stat = entry.stat(follow_symlinks=False)
+                yield FileEntry(path=f"{prefix}{entry.name}", size=stat.st_size, mtime=stat.st_mtime)
+
+    return walk(str(root), "")
+
+
+async def _scan_chunks(root: Path) -> AsyncIterator[List[FileEntry]]:
+    """디스크 순회는 이벤트 루프를 막지 않도록 스레드에서 SCAN_CHUNK_SIZE 단위로 수행"""
+    iterator = walk_upload_tree(root)
+
+    def next_chunk() -> List[FileEntry]:
+        chunk = []
+        for entry in iterator:
+            chunk.append(entry)
+            if len(chunk) >= SCAN_CHUNK_SIZE:
+                break
+        return chunk
+
+    while True:
+        chunk = await asyncio.to_thread(next_chunk)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _normalize_db_path(value: str, root_prefix: str) -> Optional[str]:
+    path = value.replace("\\", "/")
+    if not path.startswith(root_prefix):
+        return None
+    return path[len(root_prefix):]
+
+
+async def iter_referenced_paths(
+    db: AsyncSession,
+    root: Path,
+    batch_size: int,
+    deleted_retention_days: Optional[int],
+    report: UploadGCReport,
+) -> AsyncIterator[str]:
+    """
+    DB 가 참조하는 첨부파일 경로를 업로드 루트 기준 상대 경로 순서로 배치 스트리밍
+
+    DB 정렬은 DB 기본 정렬 규칙과 무관하게 코드 포인트 순서(code_point_order)로 요청해 Python 문자열 비교와 맞추며,
+    그래도 정규화한 경로 순서가 다르면(예: 다른 구분자로 저장된 경로) 잘못된 삭제를 막기 위해 중단합니다.
+    """
+    conditions = []
+    if deleted_retention_days is not None:
+        # 삭제 시각은 UTC 기준으로 저장됨
+        cutoff = datetime.utcnow() - timedelta(days=deleted_retention_days)
+        conditions.append(or_(
+            Application.dcyn == 'N',
+            Application.deleted_at.is_(None),
+            Application.deleted_at >= cutoff
+        ))
+
+    selects = [
+        select(column.label("path")).where(column.is_not(None), *conditions)
+        for column in (Application.irb_document_path, Application.research_plan_path)
+    ]
+    combined = union_all(*selects).subquery()
+    statement = (
+        select(combined.c.path)
+        .order_by(code_point_order(combined.c.path))
+        .execution_options(yield_per=batch_size)
+    )
+
+    root_prefix = root.as_posix().rstrip("/") + "/"
+    previous = None
+    result = await db.stream(statement)
+    async for partition in result.partitions():
+        for (value,) in partition:
+            path = _normalize_db_path(value, root_prefix)
+            if path is None:
+                continue
+            if previous is not None and path < previous:
+                raise RuntimeError(f"Referenced paths are not in sorted order after normalization: {value!r}")
+            if path == previous:
+                continue
+            previous = path
+            report.referenced_paths += 1
+            yield path
+
+
+def _quarantine_stamp_dir(root: Path, started_at: datetime) -> Path:
+    return root / QUARANTINE_DIR_NAME / started_at.strftime(QUARANTINE_STAMP_FORMAT)
+
+
+def _remove_empty_parents(path: Path, root: Path):
+    parent = path.parent
+    while parent != root and root in parent.parents:
+        try:
+            parent.rmdir()
+        except OSError:
+            return
+        parent = parent.parent
+
+
+def _apply(entries: List[FileEntry], root: Path, mode: GCMode, quarantine_dir: Path, report: UploadGCReport):
+    for entry in entries:
+        source = root / entry.path
+        try:
+            if mode == GCMode.QUARANTINE:
+                target = quarantine_dir / entry.path
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(source, target)
+            else:
+                source.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError:
+            report.errors += 1
+            logger.exception("업로드 파일 정리 실패: %s", source)
+            continue
+        report.removed += 1
+        report.removed_bytes += entry.size
+        _remove_empty_parents(source, root)
+
+
+def purge_quarantine(root: Path, retention_days: int, now: datetime) -> int:
+    """보관 기간이 지난 격리 디렉터리 삭제"""
+    quarantine_root = root / QUARANTINE_DIR_NAME
+    purged = 0
+    try:
+        entries = list(os.scandir(quarantine_root))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        try:
+            stamp = datetime.strptime(entry.name, QUARANTINE_STAMP_FORMAT)
+        except ValueError:
+            continue
+        if entry.is_dir(follow_symlinks=False) and stamp < now - timedelta(days=retention_days):
+            shutil.rmtree(entry.path, ignore_errors=True)
+            purged += 1
+    return purged
+
+
+async def collect_garbage(
+    db: AsyncSession,
+    *,
+    root: Path = UPLOAD_ROOT,
+    mode: GCMode = GCMode.REPORT,
+    grace_seconds: Optional[float] = None,
+    deleted_retention_days: Optional[int] = None,
+    quarantine_retention_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    sample_limit: int = 100,
+) -> UploadGCReport:
+    """
+    고아 업로드 파일 찾기/정리
+
+    root 는 DB 에 저장된 경로와 같은 기준(기본: 작업 디렉터리 기준 uploads)이어야 합니다.
+    """
+    global last_report, removed_bytes_total
+
+    mode = GCMode(mode)
+    grace_seconds = settings.UPLOAD_GC_GRACE_HOURS * 3600 if grace_seconds is None else grace_seconds
+    if deleted_retention_days is None:
+        deleted_retention_days = settings.UPLOAD_GC_DELETED_RETENTION_DAYS
+    if quarantine_retention_days is None:
+        quarantine_retention_days = settings.UPLOAD_GC_QUARANTINE_DAYS
+    batch_size = batch_size or settings.UPLOAD_GC_BATCH_SIZE
+
+    report = UploadGCReport(mode=mode.value, root=str(root))
+    started = time.perf_counter()
+    started_at = datetime.now()
+    newest_allowed = time.time() - grace_seconds
+    quarantine_dir = _quarantine_stamp_dir(root, started_at)
+
+    referenced = iter_referenced_paths(db, root, batch_size, deleted_retention_days, report)
+    current = await anext(referenced, None)
+
+    async for chunk in _scan_chunks(root):
+        orphans: List[FileEntry] = []
+        for entry in chunk:
+            report.scanned_files += 1
+            report.scanned_bytes += entry.size
+            while current is not None and current < entry.path:
+                report.missing += 1
+                current = await anext(referenced, None)
+            if current == entry.path:
+                report.referenced_found += 1
+                current = await anext(referenced, None)
+                continue
+
+            if entry.mtime > newest_allowed:
+                report.skipped_recent += 1
+                continue
+            report.orphans += 1
+            report.orphan_bytes += entry.size
+            if len(report.orphan_samples) < sample_limit:
+                report.orphan_samples.append(entry.path)
+            orphans.append(entry)
+
+        if orphans and mode != GCMode.REPORT:
+            await asyncio.to_thread(_apply, orphans, root, mode, quarantine_dir, report)
+
+    while current is not None:
+        report.missing += 1
+        current = await anext(referenced, None)
+
+    if mode != GCMode.REPORT:
+        report.quarantine_purged = await asyncio.to_thread(
+            purge_quarantine, root, quarantine_retention_days, started_at
+        )
+
+    report.elapsed_seconds = time.perf_counter() - started
+    last_report = report
+    removed_bytes_total += report.removed_bytes
+    logger.info(
+        "업로드 GC (%s): 파일 %d개 검사, 고아 %d개 (%d bytes), 정리 %d개, %.1f files/s",
+        mode.value, report.scanned_files, report.orphans, report.orphan_bytes,
+        report.removed, report.files_per_second,
+    )
+    return report
+
+
+@job("uploads.gc", every=settings.UPLOAD_GC_INTERVAL_SECONDS, timeout=3600)
+async def collect_garbage_job(db: AsyncSession, payload: dict) -> dict:
+    """payload: {"mode": "report" | "quarantine" | "delete"} (기본값: UPLOAD_GC_MODE)"""
+    report = await collect_garbage(db, mode=GCMode(payload.get("mode", settings.UPLOAD_GC_MODE)))
+    return report.to_dict()
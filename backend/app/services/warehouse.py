@@ -0,0 +1,191 @@
+"""
+임상 데이터 웨어하우스 스냅샷 읽기 (정형 추출용)
+
+스냅샷은 데이터 종류(카탈로그 데이터 종류 키)마다 테이블 하나이며, 컬럼 이름은 카탈로그 컬럼 키와 같습니다.
+- SQLite: 파일 하나에 <데이터 종류> 테이블 (읽기 전용으로 열기)
+- Parquet: 디렉터리에 <데이터 종류>.parquet 파일 (pyarrow 가 설치된 경우만)
+
+두 형식 모두 필요한 컬럼만 읽고(projection pushdown: SELECT 컬럼 목록 / Parquet 컬럼 선택),
+청크(chunk_rows 행) 단위로 {컬럼 키: NumPy 배열} 을 돌려주므로 전체 테이블을 메모리에 올리지 않습니다.
+행 조건은 cohort_mask() 로 청크 배열 전체에 한 번에(벡터 연산) 적용합니다.
+"""
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence
+
+import numpy as np
+
+# 청크: 컬럼 키 -> 같은 길이의 1차원 배열
+Chunk = Dict[str, np.ndarray]
+
+PARQUET_SUFFIX = ".parquet"
+
+
+class WarehouseError(Exception):
+    """스냅샷이 없거나 요청한 데이터 종류/컬럼이 스냅샷에 없음"""
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _object_array(values: Sequence) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+class SQLiteWarehouse:
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+
+    def close(self):
+        self._conn.close()
+
+    def columns(self, dataset: str) -> List[str]:
+        rows = self._conn.execute(f"PRAGMA table_info({_quote(dataset)})").fetchall()
+        if not rows:
+            raise WarehouseError(f"웨어하우스에 {dataset} 테이블이 없습니다")
+        return [row[1] for row in rows]
+
+    def count_rows(self, dataset: str) -> int:
+        self.columns(dataset)
+        return self._conn.execute(f"SELECT count(*) FROM {_quote(dataset)}").fetchone()[0]
+
+    def iter_chunks(self, dataset: str, columns: Sequence[str], chunk_rows: int) -> Iterator[Chunk]:
+        require_columns(self, dataset, columns)
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(_quote(column) for column in columns)} FROM {_quote(dataset)}"
+        )
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_rows)
+                if not rows:
+                    break
+                yield {column: _object_array(values) for column, values in zip(columns, zip(*rows))}
+        finally:
+            cursor.close()
+
+
+class ParquetWarehouse:
+    def __init__(self, path: Path):
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as exc:
+            raise WarehouseError("Parquet 스냅샷을 읽으려면 pyarrow 가 필요합니다 (pip install pyarrow)") from exc
+        self.path = path
+
+    def close(self):
+        pass
+
+    def _file(self, dataset: str):
+        import pyarrow.parquet as pq
+
+        file_path = self.path / f"{dataset}{PARQUET_SUFFIX}"
+        if not file_path.exists():
+            raise WarehouseError(f"웨어하우스에 {dataset}{PARQUET_SUFFIX} 파일이 없습니다")
+        return pq.ParquetFile(file_path)
+
+    def columns(self, dataset: str) -> List[str]:
+        return list(self._file(dataset).schema_arrow.names)
+
+    def count_rows(self, dataset: str) -> int:
+        return self._file(dataset).metadata.num_rows
+
+    def iter_chunks(self, dataset: str, columns: Sequence[str], chunk_rows: int) -> Iterator[Chunk]:
+        require_columns(self, dataset, columns)
+        parquet_file = self._file(dataset)
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=list(columns)):
+            yield {
+                column: batch.column(index).to_numpy(zero_copy_only=False)
+                for index, column in enumerate(columns)
+            }
+
+
+def require_columns(warehouse, dataset: str, columns: Sequence[str]):
+    """데이터 종류에 없는 컬럼이 있으면 WarehouseError"""
+    available = set(warehouse.columns(dataset))
+    missing = [column for column in columns if column not in available]
+    if missing:
+        raise WarehouseError(f"웨어하우스 {dataset} 에 없는 컬럼: {', '.join(missing)}")
+
+
+def open_warehouse(path) -> "SQLiteWarehouse | ParquetWarehouse":
+    """디렉터리면 Parquet, 파일이면 SQLite 스냅샷"""
+    path = Path(path)
+    if path.is_dir():
+        return ParquetWarehouse(path)
+    if not path.exists():
+        raise WarehouseError(f"웨어하우스 스냅샷이 없습니다: {path}")
+    return SQLiteWarehouse(path)
+
+
+def _as_text(values: np.ndarray) -> np.ndarray:
+    """문자열 비교용 유니코드 배열 (NULL 은 빈 문자열)"""
+    if values.dtype.kind == "U":
+        return values
+    return np.where(np.equal(values, None), "", values).astype(str)
+
+
+def _as_number(values: np.ndarray) -> np.ndarray:
+    """숫자 비교용 float 배열 (NULL 은 NaN 이므로 어떤 비교도 거짓)"""
+    if values.dtype.kind in "iuf":
+        return values.astype(float, copy=False)
+    try:
+        return np.where(np.equal(values, None), np.nan, values).astype(float)
+    except (TypeError, ValueError):
+        # 숫자가 아닌 값이 섞인 컬럼: 해당 값만 NaN
+        return np.array([_to_float(value) for value in values], dtype=float)
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _compare(values: np.ndarray, value):
+    """비교 값 형식에 맞춰 변환한 배열"""
+    return _as_number(values) if _is_number(value) else _as_text(values)
+
+
+def condition_mask(values: np.ndarray, op: str, value) -> np.ndarray:
+    """조건 하나의 행 마스크 (op 는 app.schemas.extraction.CohortCondition 참고)"""
+    if op == "eq":
+        return _compare(values, value) == value
+    if op == "in":
+        value = list(value)
+        if value and all(_is_number(item) for item in value):
+            return np.isin(_as_number(values), value)
+        return np.isin(_as_text(values), [str(item) for item in value])
+    if op == "prefix":
+        text = _as_text(values)
+        prefixes = [value] if isinstance(value, str) else list(value)
+        mask = np.zeros(len(text), dtype=bool)
+        for prefix in prefixes:
+            mask |= np.char.startswith(text, prefix)
+        return mask
+    if op == "between":
+        low, high = value
+        compared = _compare(values, low)
+        return (compared >= low) & (compared <= high)
+    if op == "gte":
+        return _compare(values, value) >= value
+    if op == "lte":
+        return _compare(values, value) <= value
+    raise ValueError(f"Unknown condition op: {op}")
+
+
+def cohort_mask(chunk: Chunk, conditions: Sequence[dict]) -> np.ndarray:
+    """모든 조건(AND)을 만족하는 행 마스크"""
+    length = len(next(iter(chunk.values()))) if chunk else 0
+    mask = np.ones(length, dtype=bool)
+    for condition in conditions:
+        mask &= condition_mask(chunk[condition["column"]], condition["op"], condition["value"])
+    return mask
@@ -0,0 +1,304 @@
+"""
+신청서 상태 전이(워크플로) 엔진
+
+상태 전이 규칙은 TRANSITIONS 한 곳에서만 정의하고, import 시점에 (이벤트, 목표 상태) -> 허용되는
+현재 상태 집합 테이블로 미리 계산합니다. 전이는 SELECT 후 검사하지 않고
+`UPDATE ... WHERE id = ? AND status IN (...) RETURNING ...` 한 번으로 검사와 적용을 동시에 수행하므로,
+두 관리자가 같은 신청서를 동시에 처리해도 한 쪽만 성공합니다. 실패한 경우에만 원인(404/412/400)을 조회합니다.
+If-Match 로 받은 version 이 있으면 `AND version IN (...)` 조건도 함께 겁니다.
+허용 상태가 여럿인 전이(APPROVED/PROCESSING -> COMPLETED 등)는 허용 상태마다 `status = ?` 조건의 UPDATE 를
+차례로 시도해, 성공한 UPDATE 의 조건으로 이전 상태를 확정합니다 (첫 시도가 맞으면 쿼리 1회 그대로).
+"""
+import enum
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.etag import precondition_failed
+from app.db.base import get_korean_time
+from app.models import Application, ApplicationStatus, ApplicationLog, LogAction, User
+from app.models.application import service_types_mask
+
+
+class WorkflowEvent(str, enum.Enum):
+    SUBMIT = "SUBMIT"  # 연구자 제출/재제출
+    REVIEW = "REVIEW"  # 관리자 검토 (승인/반려/보완요청)
+    PROGRESS = "PROGRESS"  # 관리자 진행 상태 변경 (처리중/완료)
+
+
+@dataclass(frozen=True)
+class Transition:
+    event: WorkflowEvent
+    source: ApplicationStatus
+    target: ApplicationStatus
+    log_action: LogAction
+
+
+def _review_transitions():
+    for source in (ApplicationStatus.SUBMITTED, ApplicationStatus.UNDER_REVIEW):
+        yield Transition(WorkflowEvent.REVIEW, source, ApplicationStatus.UNDER_REVIEW, LogAction.UPDATED)
+        yield Transition(WorkflowEvent.REVIEW, source, ApplicationStatus.APPROVED, LogAction.APPROVED)
+        yield Transition(WorkflowEvent.REVIEW, source, ApplicationStatus.REJECTED, LogAction.REJECTED)
+        yield Transition(WorkflowEvent.REVIEW, source, ApplicationStatus.REVISION_REQUESTED, LogAction.REVISION_REQUESTED)
+
+
+TRANSITIONS: Tuple[Transition, ...] = (
+    Transition(WorkflowEvent.SUBMIT, ApplicationStatus.DRAFT, ApplicationStatus.SUBMITTED, LogAction.SUBMITTED),
+    Transition(WorkflowEvent.SUBMIT, ApplicationStatus.REVISION_REQUESTED, ApplicationStatus.SUBMITTED, LogAction.SUBMITTED),
+    *_review_transitions(),
+    Transition(WorkflowEvent.PROGRESS, ApplicationStatus.APPROVED, ApplicationStatus.PROCESSING, LogAction.PROCESSING),
+    Transition(WorkflowEvent.PROGRESS, ApplicationStatus.APPROVED, ApplicationStatus.COMPLETED, LogAction.COMPLETED),
+    Transition(WorkflowEvent.PROGRESS, ApplicationStatus.PROCESSING, ApplicationStatus.COMPLETED, LogAction.COMPLETED),
+)
+
+# 연구자가 내용/첨부파일을 수정할 수 있는 상태
+EDITABLE_STATUSES: FrozenSet[ApplicationStatus] = frozenset({
+    ApplicationStatus.DRAFT,
+    ApplicationStatus.REVISION_REQUESTED,
+})
+
+# 목표 상태에 도달할 때 함께 기록하는 시각 컬럼
+STATUS_TIMESTAMP_COLUMNS = {
+    ApplicationStatus.SUBMITTED: "submitted_at",
+    ApplicationStatus.COMPLETED: "completed_at",
+}
+
+
+def _build_tables(transitions: Iterable[Transition]):
+    sources: Dict[Tuple[WorkflowEvent, ApplicationStatus], set] = {}
+    log_actions: Dict[Tuple[WorkflowEvent, ApplicationStatus], LogAction] = {}
+    for transition in transitions:
+        key = (transition.event, transition.target)
+        sources.setdefault(key, set()).add(transition.source)
+        log_actions[key] = transition.log_action
+    return {key: frozenset(value) for key, value in sources.items()}, log_actions
+
+
+# (이벤트, 목표 상태) -> 허용되는 현재 상태 / 기록할 로그 액션
+TRANSITION_TABLE, TRANSITION_LOG_ACTIONS = _build_tables(TRANSITIONS)
+
+
+STATUS_ORDER: Tuple[ApplicationStatus, ...] = tuple(ApplicationStatus)
+
+
+def allowed_sources(event: WorkflowEvent, target: ApplicationStatus) -> FrozenSet[ApplicationStatus]:
+    return TRANSITION_TABLE.get((event, target), frozenset())
+
+
+def ordered_sources(allowed: Iterable[ApplicationStatus]) -> List[ApplicationStatus]:
+    """허용 상태를 ApplicationStatus 정의 순서(워크플로 진행 순서)로 정렬"""
+    return sorted(allowed, key=STATUS_ORDER.index)
+
+
+def can_transition(event: WorkflowEvent, source: ApplicationStatus, target: ApplicationStatus) -> bool:
+    return source in allowed_sources(event, target)
+
+
+def log_action_for(event: WorkflowEvent, target: ApplicationStatus) -> LogAction:
+    return TRANSITION_LOG_ACTIONS.get((event, target), LogAction.UPDATED)
+
+
+def transition_values(event: WorkflowEvent, target: ApplicationStatus, actor: User) -> dict:
+    """전이 시 상태와 함께 기록할 컬럼 값"""
+    now = get_korean_time()
+    values = {"status": target, "updated_at": now}
+    if target in STATUS_TIMESTAMP_COLUMNS:
+        values[STATUS_TIMESTAMP_COLUMNS[target]] = now
+    if event == WorkflowEvent.REVIEW:
+        values["reviewed_at"] = now
+        values["reviewed_by"] = actor.id
+    return values
+
+
+async def _conditional_update(
+    db: AsyncSession,
+    application_id: str,
+    allowed: FrozenSet[ApplicationStatus],
+    values: dict,
+    owner_id: Optional[str],
+    conditions: tuple,
+    expected_versions: Optional[List[int]],
+) -> Optional[Application]:
+    statement = (
+        update(Application)
+        .where(
+            Application.id == application_id,
+            Application.status.in_(allowed),
+            *conditions
+        )
+        # Core UPDATE 는 version_id_col 을 자동으로 올리지 않으므로 직접 증가
+        .values(**values, version=Application.version + 1)
+        .returning(Application)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    if owner_id is not None:
+        statement = statement.where(Application.user_id == owner_id)
+    if expected_versions is not None:
+        statement = statement.where(Application.version.in_(expected_versions))
+    result = await db.execute(statement)
+    return result.scalar_one_or_none()
+
+
+async def _raise_for_failed_update(
+    db: AsyncSession,
+    application_id: str,
+    owner_id: Optional[str],
+    conditions: tuple,
+    error_detail,
+    expected_versions: Optional[List[int]],
+):
+    """조건부 UPDATE 가 0건일 때 원인 판별 (실패 경로에서만 조회)"""
+    query = select(Application.status, Application.version).where(Application.id == application_id, *conditions)
+    if owner_id is not None:
+        query = query.where(Application.user_id == owner_id)
+    row = (await db.execute(query)).one_or_none()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
+    current_status, current_version = row
+    if expected_versions is not None and current_version not in expected_versions:
+        raise precondition_failed()
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=error_detail(current_status) if callable(error_detail) else error_detail
+    )
+
+
+async def apply_transition(
+    db: AsyncSession,
+    application_id: str,
+    event: WorkflowEvent,
+    target: ApplicationStatus,
+    actor: User,
+    *,
+    owner_id: Optional[str] = None,
+    reason: Optional[str] = None,
+    values: Optional[dict] = None,
+    details: Optional[dict] = None,
+    error_detail=None,
+    conditions: tuple = (),
+    expected_versions: Optional[List[int]] = None,
+) -> Application:
+    """
+    상태 전이 검사/적용 + 로그 기록 (커밋은 호출한 쪽에서 수행)
+
+    owner_id 를 지정하면 해당 사용자의 신청서만 대상으로 합니다.
+    expected_versions 는 If-Match 로 받은 version 목록 (불일치 시 412)
+    error_detail 은 허용되지 않는 전이일 때의 메시지 (문자열 또는 현재 상태를 받는 함수)
+    """
+    allowed = allowed_sources(event, target)
+    if error_detail is None:
+        error_detail = lambda current: f"Invalid status transition from {current} to {target.value}"
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid status: {target.value}"
+        )
+
+    update_values = transition_values(event, target, actor)
+    update_values.update(values or {})
+
+    # 보통은 `status IN (허용 상태)` 조건부 UPDATE 한 번으로 적용하고, 로그에 이전 상태를 남겨야 할 때만
+    # 허용 상태별로 나눠 시도해 이전 상태를 확정 (RETURNING 은 바뀐 값만 돌려주므로, 한 행은 최대 한 번만 갱신됨)
+    if details is None:
+        source_groups = [frozenset(allowed)]
+    else:
+        source_groups = [frozenset({source}) for source in ordered_sources(allowed)]
+    for sources in source_groups:
+        application = await _conditional_update(
+            db, application_id, sources, update_values, owner_id, conditions, expected_versions
+        )
+        if application is not None:
+            break
+    else:
+        await _raise_for_failed_update(db, application_id, owner_id, conditions, error_detail, expected_versions)
+
+    log_details = None
+    if details is not None:
+        (old_status,) = sources
+        log_details = {"old_status": old_status.value, "new_status": target.value, **details}
+
+    db.add(ApplicationLog(
+        application_id=application.id,
+        user_id=actor.id,
+        action=log_action_for(event, target),
+        reason=reason,
+        details=log_details,
+    ))
+    return application
+
+
+async def update_editable(
+    db: AsyncSession,
+    application_id: str,
+    owner: User,
+    values: dict,
+    *,
+    log_reason: Optional[str] = None,
+    log: bool = True,
+    error_detail: str = "Cannot update application in current status",
+    conditions: tuple = (),
+    expected_versions: Optional[List[int]] = None,
+) -> Application:
+    """수정 가능한 상태(EDITABLE_STATUSES)인 본인 신청서를 조건부 UPDATE 로 수정"""
+    update_values = {"updated_at": get_korean_time(), **values}
+    if "service_types" in update_values:
+        update_values["service_types_mask"] = service_types_mask(update_values["service_types"])
+    application = await _conditional_update(
+        db, application_id, EDITABLE_STATUSES, update_values, owner.id, conditions, expected_versions
+    )
+    if application is None:
+        await _raise_for_failed_update(db, application_id, owner.id, conditions, error_detail, expected_versions)
+
+    if log:
+        db.add(ApplicationLog(
+            application_id=application.id,
+            user_id=owner.id,
+            action=LogAction.UPDATED,
+            reason=log_reason,
+        ))
+    return application
+
+
+async def get_editable(
+    db: AsyncSession,
+    application_id: str,
+    owner: User,
+    *,
+    error_detail: str = "Cannot update application in current status",
+    conditions: tuple = (),
+    expected_versions: Optional[List[int]] = None,
+) -> Application:
+    """
+    수정 가능한 상태인 본인 신청서 조회
+
+    파일 저장처럼 DB 밖에서 먼저 작업해야 하는 경우의 사전 검사용이며,
+    실제 반영은 update_editable 로 다시 상태를 조건으로 걸어 수행합니다.
+    """
+    result = await db.execute(
+        select(Application).where(
+            Application.id == application_id,
+            Application.user_id == owner.id,
+            *conditions
+        )
+    )
+    application = result.scalar_one_or_none()
+    if not application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
+    if expected_versions is not None and application.version not in expected_versions:
+        raise precondition_failed()
+    if application.status not in EDITABLE_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_detail
+        )
+    return application
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+두 벤치마크 결과(JSON)를 비교
+
+사용 예:
+    python -m benchmarks.compare baseline.json candidate.json
+"""
+import argparse
+import json
+from pathlib import Path
+
+METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def _delta(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def compare(baseline: dict, candidate: dict) -> str:
+    lines = [
+        f"baseline:  {baseline['meta']['commit']} {baseline['meta'].get('database', 'sqlite')} "
+        f"({baseline['meta']['timestamp']})",
+        f"candidate: {candidate['meta']['commit']} {candidate['meta'].get('database', 'sqlite')} "
+        f"({candidate['meta']['timestamp']})",
+        "",
+    ]
+    for scenario, after in candidate["scenarios"].items():
+        before = baseline["scenarios"].get(scenario)
+        if before is None:
+            lines.append(f"[{scenario}] baseline 없음")
+            continue
+        lines.append(f"[{scenario}] throughput {before['throughput_rps']} -> {after['throughput_rps']} rps "
+                     f"({_delta(before['throughput_rps'], after['throughput_rps'])})")
+        for endpoint, after_stats in after["endpoints"].items():
+            before_stats = before["endpoints"].get(endpoint)
+            if before_stats is None:
+                lines.append(f"  {endpoint}: 신규")
+                continue
+            cells = [
+                f"{metric} {before_stats[metric]} -> {after_stats[metric]} ({_delta(before_stats[metric], after_stats[metric])})"
+                for metric in METRICS
+            ]
+            lines.append(f"  {endpoint}: " + ", ".join(cells))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    args = parser.parse_args(argv)
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    candidate = json.loads(Path(args.candidate).read_text(encoding="utf-8"))
+    print(compare(baseline, candidate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+비정형 문서 비식별화 처리량 측정 (app.services.deidentification)
+
+합성 이름 사전과 합성 임상 문서 묶음(JSON Lines: 퇴원요약지, 병리 판독지, 경과기록)을 만든 뒤
+단일 프로세스(inline)와 프로세스 풀(pool)로 비식별화하면서 처리량(MB/분)과 종류별 치환 수를 기록합니다.
+문서에 넣은 식별정보 수(injected)와 찾은 수(found)를 함께 기록해 놓친 항목이 없는지 확인합니다.
+
+말뭉치만 만들기 (다른 도구와 비교하거나 scripts/deidentify_notes.py 시험용):
+    python -m benchmarks.deidentify --generate-only corpus.jsonl --names-output names.txt
+
+사용 예:
+    cd backend
+    python -m benchmarks.deidentify --megabytes 500 --output deidentify.json
+    python -m benchmarks.deidentify --megabytes 100 --modes pool --workers 8
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.deidentification import Deidentifier, deidentify_jsonl, default_workers  # noqa: E402
+from app.services.pseudonymization import derive_key  # noqa: E402
+
+MODES = ("inline", "pool")
+SURNAMES = ("김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권", "황", "안", "송", "류", "홍")
+SYLLABLES = (
+    "민", "서", "지", "현", "준", "예", "도", "하", "수", "우", "윤", "은", "영", "진", "성", "희", "경", "미", "태", "호",
+    "재", "승", "유", "연", "주", "아", "원", "혜", "동", "상", "정", "채", "다", "시", "건", "나", "소", "인", "선", "철",
+)
+FINDINGS = (
+    "흉부 X-ray 에서 우하엽 consolidation 소견 보여 pneumonia 의심하에 항생제(ceftriaxone 2g IV q24h) 시작함.",
+    "HbA1c 8.2% 로 혈당 조절 불량하여 metformin 1000mg bid 로 증량하고 당뇨 교육 시행함.",
+    "수술 후 경과 양호하며 창상 감염 징후 없음. 통증 조절 위해 PCA 유지 중.",
+    "복부 CT 상 간 S6 에 2.3cm 크기의 저음영 병변 관찰되어 추가 MRI 권고함.",
+    "Microscopic: The specimen shows infiltrating adenocarcinoma, moderately differentiated, with lymphovascular invasion.",
+    "활력징후 안정적이며 산소포화도 room air 에서 96% 유지. 식이 진행 잘 됨.",
+    "혈압 150/95 mmHg 로 amlodipine 5mg qd 추가. 다음 외래에서 재평가 예정.",
+    "Gross: Received in formalin is a segment of colon measuring 15.0 x 4.5 cm.",
+)
+TYPES = ("퇴원요약지", "병리판독지", "경과기록")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="비정형 문서 비식별화 처리량 측정")
+    parser.add_argument("--megabytes", type=float, default=200, help="합성 문서 묶음 크기 (MB)")
+    parser.add_argument("--names", type=int, default=20_000,
+                        help=f"이름 사전 크기 (최대 {len(SURNAMES) * len(SYLLABLES) ** 2:,})")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--workers", type=int, default=default_workers(), help="pool 모드 프로세스 수")
+    parser.add_argument("--block-kb", type=int, default=4096, help="블록 크기 (KB)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: stdout)")
+    parser.add_argument("--generate-only", metavar="PATH", help="측정 없이 문서 묶음만 이 경로에 생성")
+    parser.add_argument("--names-output", metavar="PATH", help="--generate-only 일 때 이름 사전 저장 경로")
+    return parser.parse_args(argv)
+
+
+def generate_names(rng: random.Random, size: int) -> list:
+    size = min(size, len(SURNAMES) * len(SYLLABLES) ** 2)
+    names = set()
+    while len(names) < size:
+        names.add(rng.choice(SURNAMES) + rng.choice(SYLLABLES) + rng.choice(SYLLABLES))
+    return sorted(names)
+
+
+def _date(rng: random.Random) -> str:
+    year, month, day = rng.randint(2010, 2024), rng.randint(1, 12), rng.randint(1, 28)
+    style = rng.randrange(4)
+    if style == 0:
+        return f"{year}-{month:02d}-{day:02d}"
+    if style == 1:
+        return f"{year}.{month}.{day}"
+    if style == 2:
+        return f"{year}년 {month}월 {day}일"
+    return f"{year}{month:02d}{day:02d}"
+
+
+def _document(rng: random.Random, names: list, index: int, injected: Counter) -> dict:
+    patient, guardian, doctor = rng.choice(names), rng.choice(names), rng.choice(names)
+    rrn = f"{rng.randint(40, 99)}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}-{rng.randint(1, 2)}{rng.randint(0, 999999):06d}"
+    phone = f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}"
+    record = f"{rng.randint(10_000_000, 99_999_999)}"
+    admitted, discharged = _date(rng), _date(rng)
+    findings = " ".join(rng.choice(FINDINGS) for _ in range(rng.randint(6, 16)))
+    text = (
+        f"[{rng.choice(TYPES)}]\n등록번호: {record}\n환자명: {patient} (주민등록번호 {rrn})\n"
+        f"보호자 {guardian}님 연락처 {phone}\n입원일 {admitted}, 퇴원일 {discharged}\n\n{findings}\n\n"
+        f"{patient}님은 {discharged} 퇴원하였으며 외래 추적 예정. 담당의 {doctor}"
+    )
+    injected.update({"name": 4, "rrn": 1, "phone": 1, "record": 1, "date": 3})
+    return {"id": f"NOTE{index:09d}", "text": text}
+
+
+def generate_corpus(path: Path, megabytes: float, names: list, seed: int) -> Counter:
+    """합성 문서 묶음 (JSON Lines), 넣은 식별정보 수를 돌려줌"""
+    rng = random.Random(seed)
+    injected: Counter = Counter()
+    target = int(megabytes * 1024 * 1024)
+    written = 0
+    index = 0
+    with open(path, "w", encoding="utf-8") as file:
+        while written < target:
+            lines = [json.dumps(_document(rng, names, index + offset, injected), ensure_ascii=False) + "\n"
+                     for offset in range(1000)]
+            index += len(lines)
+            chunk = "".join(lines)
+            file.write(chunk)
+            written += len(chunk.encode("utf-8"))
+    injected["documents"] = index
+    return injected
+
+
+def _peak_rss_mb() -> float:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return round(int(line.split()[1]) / 1024, 1)
+    return 0.0
+
+
+def run_mode(args, mode: str, src: Path, work_dir: Path, deidentifier: Deidentifier) -> dict:
+    dst = work_dir / f"{mode}.jsonl"
+    workers = args.workers if mode == "pool" else 1
+    started = time.perf_counter()
+    stats = deidentify_jsonl(src, dst, deidentifier, block_bytes=args.block_kb * 1024, workers=workers)
+    elapsed = time.perf_counter() - started
+    megabytes = src.stat().st_size / 1024 / 1024
+    result = {
+        "documents": stats.documents,
+        "seconds": round(elapsed, 2),
+        "mb_per_min": round(megabytes / elapsed * 60, 1),
+        "documents_per_sec": round(stats.documents / elapsed),
+        "found": dict(stats.counts),
+        "max_rss_mb": _peak_rss_mb(),
+    }
+    if mode == "pool":
+        result["workers"] = workers
+    dst.unlink()
+    return result
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rng = random.Random(args.seed)
+    names = generate_names(rng, args.names)
+    if args.generate_only:
+        injected = generate_corpus(Path(args.generate_only), args.megabytes, names, args.seed)
+        if args.names_output:
+            Path(args.names_output).write_text("\n".join(names) + "\n", encoding="utf-8")
+        print(json.dumps(dict(injected), ensure_ascii=False))
+        return
+
+    work_dir = Path(tempfile.mkdtemp(prefix="data-portal-deidentify-"))
+    try:
+        src = work_dir / "corpus.jsonl"
+        print(f"합성 문서 {args.megabytes:g}MB 생성 중...", file=sys.stderr)
+        started = time.perf_counter()
+        injected = generate_corpus(src, args.megabytes, names, args.seed)
+        generate_seconds = time.perf_counter() - started
+
+        deidentifier = Deidentifier(key=derive_key("benchmark", "application"), names=tuple(names))
+        results = {}
+        for mode in args.modes:
+            print(f"[{mode}] 비식별화 중...", file=sys.stderr)
+            results[mode] = run_mode(args, mode, src, work_dir, deidentifier)
+
+        report = {
+            "file_mb": round(src.stat().st_size / 1024 / 1024, 1),
+            "names": len(names),
+            "generate_seconds": round(generate_seconds, 2),
+            "cpu_count": os.cpu_count(),
+            "injected": dict(injected),
+            "modes": results,
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+벤치마크 공용 도구: 엔드포인트별 지연시간 기록과 HTTP 클라이언트 래퍼
+"""
+import math
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.core.crypto import encrypt_string
+
+
+def percentile(sorted_values: List[float], quantile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(quantile * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+class EndpointRecorder:
+    """라벨(메서드 + 라우트 템플릿)별 지연시간과 오류 수 기록"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+
+    def stop(self):
+        self.finished_at = time.perf_counter()
+
+    def record(self, label: str, elapsed: float, ok: bool):
+        self.latencies.setdefault(label, []).append(elapsed)
+        if not ok:
+            self.errors[label] = self.errors.get(label, 0) + 1
+
+    def summary(self) -> dict:
+        duration = (self.finished_at or time.perf_counter()) - (self.started_at or 0)
+        endpoints = {}
+        total_requests = 0
+        total_errors = 0
+        for label, values in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            errors = self.errors.get(label, 0)
+            total_requests += len(ordered)
+            total_errors += errors
+            endpoints[label] = {
+                "count": len(ordered),
+                "errors": errors,
+                "throughput_rps": round(len(ordered) / duration, 2) if duration > 0 else 0.0,
+                "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+                "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+                "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+                "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return {
+            "duration_s": round(duration, 3),
+            "requests": total_requests,
+            "errors": total_errors,
+            "throughput_rps": round(total_requests / duration, 2) if duration > 0 else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+class BenchClient:
+    """httpx.AsyncClient 래퍼: 요청마다 라우트 템플릿 라벨로 지연시간을 기록"""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: EndpointRecorder):
+        self.client = client
+        self.recorder = recorder
+
+    async def request(self, method: str, template: str, *, path_params: Optional[dict] = None,
+                      record: bool = True, expected: tuple = (200,), **kwargs) -> httpx.Response:
+        url = template.format(**(path_params or {}))
+        start = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        if record:
+            self.recorder.record(
+                f"{method} {template}",
+                time.perf_counter() - start,
+                response.status_code in expected,
+            )
+        return response
+
+    async def login(self, email: str, password: str, record: bool = True) -> dict:
+        """프론트엔드와 동일하게 이메일/비밀번호를 암호화해서 로그인 후 인증 헤더 반환"""
+        response = await self.request(
+            "POST",
+            "/api/auth/login",
+            json={"email": encrypt_string(email), "password": encrypt_string(password)},
+            record=record,
+        )
+        response.raise_for_status()
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
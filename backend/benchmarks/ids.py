@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+기본 키 형식별 삽입/조회 성능 측정
+
+application_logs 와 같은 모양의 테이블(기본 키 + 외래 키 인덱스)에 행을 배치로 삽입하면서
+키 형식별 삽입 처리량, 파일 크기, 점 조회 지연시간을 비교합니다.
+- uuid4_text: 기존 방식 (무작위 UUID, 36자 문자열)
+- uuid4_blob: 무작위 UUID, 16바이트
+- uuid7_text: 시간 순서 UUID, 36자 문자열
+- uuid7_blob: 현재 방식 (app.db.ids.UUIDKey)
+정렬 순서와 키 크기의 효과를 나눠 보기 위해 네 가지를 모두 측정합니다.
+수천만 행에서는 ORM/드라이버 오버헤드가 결과를 가리므로 sqlite3 모듈로 직접 실행합니다.
+
+사용 예 (10M 행은 형식당 수 분~수십 분 소요):
+    cd backend
+    python -m benchmarks.ids --rows 10000000 --output ids.json
+    python -m benchmarks.ids --rows 1000000 --formats uuid4_text uuid7_blob
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.db.ids import uuid7  # noqa: E402
+
+FORMATS = ("uuid4_text", "uuid4_blob", "uuid7_text", "uuid7_blob")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="기본 키 형식별 삽입/조회 성능 측정")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="형식별 삽입 행 수")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="트랜잭션당 삽입 행 수")
+    parser.add_argument("--parents", type=int, default=100_000, help="외래 키가 참조하는 상위 키 수")
+    parser.add_argument("--lookups", type=int, default=100_000, help="형식별 점 조회 횟수")
+    parser.add_argument("--cache-mb", type=int, default=64, help="SQLite 페이지 캐시 크기 (MB)")
+    parser.add_argument("--checkpoints", type=int, default=10, help="삽입 처리량을 기록할 구간 수")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: stdout)")
+    return parser.parse_args(argv)
+
+
+def _key_factory(key_format: str):
+    generate = uuid7 if key_format.startswith("uuid7") else uuid.uuid4
+    if key_format.endswith("_blob"):
+        return lambda: generate().bytes
+    return lambda: str(generate())
+
+
+def _connect(path: Path, key_format: str, cache_mb: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{cache_mb * 1024}")
+    key_type = "BLOB" if key_format.endswith("_blob") else "VARCHAR"
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS logs ("
+        f"id {key_type} NOT NULL PRIMARY KEY, parent_id {key_type} NOT NULL, "
+        f"action VARCHAR(18) NOT NULL, created_at DATETIME NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_logs_parent_id ON logs (parent_id)")
+    return conn
+
+
+def _summary(samples):
+    from benchmarks.harness import percentile
+
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_us": round(sum(ordered) / len(ordered) * 1e6, 2),
+        "p50_us": round(percentile(ordered, 0.5) * 1e6, 2),
+        "p95_us": round(percentile(ordered, 0.95) * 1e6, 2),
+        "p99_us": round(percentile(ordered, 0.99) * 1e6, 2),
+    }
+
+
+def run_format(args, key_format: str, work_dir: Path) -> dict:
+    rng = random.Random(args.seed)
+    new_key = _key_factory(key_format)
+    path = work_dir / f"{key_format}.db"
+    conn = _connect(path, key_format, args.cache_mb)
+
+    # 외래 키 값: 상위 행(신청서)도 같은 형식으로 생성 순서대로 만들어 두고 최근 것 위주로 참조
+    parents = [new_key() for _ in range(args.parents)]
+
+    sample_every = max(1, args.rows // args.lookups)
+    sampled_keys = []
+    checkpoint_every = max(args.batch_size, args.rows // args.checkpoints)
+    checkpoints = []
+    insert_seconds = 0.0
+    window_seconds = 0.0
+    window_rows = 0
+    inserted = 0
+    created_at = "2026-10-19 12:00:00"
+
+    while inserted < args.rows:
+        count = min(args.batch_size, args.rows - inserted)
+        rows = []
+        for offset in range(count):
+            key = new_key()
+            parent = parents[min(args.parents - 1, int(args.parents * (1 - rng.random() ** 3)))]
+            rows.append((key, parent, "SUBMITTED", created_at))
+            if (inserted + offset) % sample_every == 0:
+                sampled_keys.append(key)
+
+        start = time.perf_counter()
+        conn.execute("BEGIN")
+        conn.executemany("INSERT INTO logs (id, parent_id, action, created_at) VALUES (?, ?, ?, ?)", rows)
+        conn.execute("COMMIT")
+        elapsed = time.perf_counter() - start
+
+        insert_seconds += elapsed
+        window_seconds += elapsed
+        window_rows += count
+        inserted += count
+        if inserted % checkpoint_every < count or inserted == args.rows:
+            checkpoints.append({
+                "rows": inserted,
+                "rows_per_sec": round(window_rows / window_seconds),
+            })
+            window_seconds = 0.0
+            window_rows = 0
+
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    file_bytes = path.stat().st_size
+    conn.close()
+
+    # 조회는 새 커넥션(빈 페이지 캐시)에서: 전체 중 무작위 키 / 최근 삽입된 1% 키 (실제 조회는 최근 행 위주)
+    # uuid7 은 최근 키가 인덱스의 끝 부분에 모여 있어 적은 페이지로 조회되고, uuid4 는 인덱스 전체에 흩어짐
+    conn = _connect(path, key_format, args.cache_mb)
+    recent_keys = sampled_keys[-max(1, len(sampled_keys) // 100):]
+    random_keys = sampled_keys[:]
+    rng.shuffle(random_keys)
+    rng.shuffle(recent_keys)
+    lookups = {}
+    for label, keys in (("random", random_keys), ("recent", recent_keys)):
+        samples = []
+        for key in keys:
+            start = time.perf_counter()
+            row = conn.execute("SELECT id, parent_id, action, created_at FROM logs WHERE id = ?", (key,)).fetchone()
+            samples.append(time.perf_counter() - start)
+            assert row is not None
+        lookups[label] = _summary(samples)
+
+    parent_samples = []
+    for parent in rng.sample(parents, min(len(parents), 10_000)):
+        start = time.perf_counter()
+        conn.execute("SELECT count(*) FROM logs WHERE parent_id = ?", (parent,)).fetchone()
+        parent_samples.append(time.perf_counter() - start)
+    lookups["by_parent"] = _summary(parent_samples)
+    conn.close()
+    path.unlink()
+
+    return {
+        "rows": inserted,
+        "insert_seconds": round(insert_seconds, 2),
+        "insert_rows_per_sec": round(inserted / insert_seconds),
+        "insert_checkpoints": checkpoints,
+        "file_bytes": file_bytes,
+        "bytes_per_row": round(file_bytes / inserted, 1),
+        "lookups": lookups,
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    work_dir = Path(tempfile.mkdtemp(prefix="data-portal-ids-"))
+    try:
+        results = {}
+        for key_format in args.formats:
+            print(f"[{key_format}] {args.rows:,}행 삽입 중...", file=sys.stderr)
+            results[key_format] = run_format(args, key_format, work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        "rows": args.rows,
+        "batch_size": args.batch_size,
+        "cache_mb": args.cache_mb,
+        "sqlite_version": sqlite3.sqlite_version,
+        "cpu_count": os.cpu_count(),
+        "formats": results,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+앱 import 시간 프로파일링 (python -X importtime 요약)
+
+새 인터프리터에서 대상 코드를 반복 실행하면서 -X importtime 출력을 수집하고,
+전체 소요 시간과 누적/자체 시간 기준 상위 모듈, 최상위 패키지별 합계를 JSON으로 출력합니다.
+
+사용 예:
+    cd backend
+    python -m benchmarks.importtime                           # import app.main
+    python -m benchmarks.importtime --target create_app       # 앱 생성까지 (라우터 import 포함)
+    python -m benchmarks.importtime --target create_app --production --output importtime.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+TARGETS = {
+    "main": "import app.main",
+    "create_app": "from app.main import create_app; create_app()",
+    "models": "import app.models",
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="앱 import 시간 프로파일링")
+    parser.add_argument("--target", choices=sorted(TARGETS), default="main", help="측정할 코드")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (모듈별 중앙값 사용)")
+    parser.add_argument("--top", type=int, default=25, help="출력할 상위 모듈 수")
+    parser.add_argument("--production", action="store_true", help="ENVIRONMENT=production 으로 실행")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: stdout)")
+    return parser.parse_args(argv)
+
+
+def parse_importtime(stderr: str) -> List[dict]:
+    """'import time: self | cumulative | module' 줄을 파싱"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|", 2)
+        entries.append({
+            "module": module.strip(),
+            "depth": (len(module) - len(module.lstrip()) - 1) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        })
+    return entries
+
+
+def run_once(code: str, env: Dict[str, str]) -> List[dict]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(result.stderr)
+    return parse_importtime(result.stderr)
+
+
+def _median(values: List[int]) -> int:
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2]
+
+
+def summarize(runs: List[List[dict]], top: int) -> dict:
+    self_times = defaultdict(list)
+    cumulative_times = defaultdict(list)
+    totals = []
+    for entries in runs:
+        totals.append(sum(entry["self_us"] for entry in entries))
+        for entry in entries:
+            self_times[entry["module"]].append(entry["self_us"])
+            cumulative_times[entry["module"]].append(entry["cumulative_us"])
+
+    self_median = {module: _median(values) for module, values in self_times.items()}
+    cumulative_median = {module: _median(values) for module, values in cumulative_times.items()}
+
+    packages = defaultdict(int)
+    for module, value in self_median.items():
+        packages[module.split(".", 1)[0]] += value
+
+    def ranked(values: Dict[str, int]):
+        return [
+            {"module": module, "ms": round(value / 1000, 2)}
+            for module, value in sorted(values.items(), key=lambda item: item[1], reverse=True)[:top]
+        ]
+
+    return {
+        "total_ms": round(_median(totals) / 1000, 2),
+        "modules_imported": len(self_median),
+        "top_cumulative": ranked(cumulative_median),
+        "top_self": ranked(self_median),
+        "packages": ranked(packages),
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    env = {
+        **os.environ,
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "benchmark-secret-key"),
+        "DATABASE_ECHO": "false",
+    }
+    if args.production:
+        env["ENVIRONMENT"] = "production"
+
+    code = TARGETS[args.target]
+    # 첫 실행은 .pyc 생성 등으로 느리므로 버림
+    run_once(code, env)
+    runs = [run_once(code, env) for _ in range(args.repeat)]
+
+    report = {
+        "target": args.target,
+        "code": code,
+        "environment": env.get("ENVIRONMENT", "development"),
+        "repeat": args.repeat,
+        **summarize(runs, args.top),
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+가명화 처리량 측정 (app.services.pseudonymization)
+
+합성 결과 파일(CSV, 기본 1천만 행)을 만든 뒤 같은 규칙으로 가명화하면서 처리량과 메모리를 비교합니다.
+- naive: 행마다 csv 해석 -> 값마다 hmac.new / datetime 으로 날짜 이동 (단일 프로세스, 비교 기준)
+- batched: 블록 단위 컬럼 처리 + 가명/이동 일수 메모 (단일 프로세스, workers=1)
+- pool: batched 를 프로세스 풀로 (--workers, 기본 CPU 수)
+모드마다 별도 프로세스로 실행해 주 프로세스와 작업 프로세스의 최대 RSS 를 따로 기록합니다
+(파일 크기와 무관하게 메모리가 일정한지 확인).
+
+사용 예 (10M 행 생성에 수 분 소요, 결과 파일은 약 1GB):
+    cd backend
+    python -m benchmarks.pseudonymize --rows 10000000 --output pseudonymize.json
+    python -m benchmarks.pseudonymize --rows 1000000 --modes batched pool --workers 4
+"""
+import argparse
+import csv
+import hashlib
+import hmac
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.pseudonymization import Pseudonymizer, default_workers, derive_key, pseudonymize_csv  # noqa: E402
+
+MODES = ("naive", "batched", "pool")
+HEADER = ("id", "rrn", "birth", "date", "visitTime", "diagCode", "result")
+RULES = {"id": "hmac", "rrn": "hmac", "birth": "year", "date": "date_shift", "visitTime": "date_shift"}
+DIAGNOSES = ("E11.9", "I10", "C34.1", "J45.9", "N18.3", "E78.5")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="가명화 처리량 측정")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="합성 파일 행 수")
+    parser.add_argument("--patients", type=int, default=500_000,
+                        help="환자 수 (행마다 무작위 환자, 기본값은 환자당 약 20행)")
+    parser.add_argument("--chunk-rows", type=int, default=50_000, help="블록 행 수")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="pool 모드 프로세스 수")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--naive-rows", type=int, default=1_000_000,
+                        help="naive 모드는 느리므로 앞부분 이 행 수만 측정 (0 이면 전체)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: stdout)")
+    # 모드 하나를 별도 프로세스로 실행할 때 (내부용)
+    parser.add_argument("--run-mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--source", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def generate_file(path: Path, rows: int, patients: int, seed: int, chunk_rows: int = 100_000):
+    """합성 결과 파일 (numpy 로 블록 단위 생성)"""
+    rng = np.random.default_rng(seed)
+    patient_ids = np.char.add("P", np.char.zfill(np.arange(patients).astype(str), 8))
+    births = (np.datetime64("1940-01-01") + rng.integers(0, 365 * 80, patients)).astype(str)
+    # 주민등록번호 형식 (생년월일 YYMMDD-7자리)
+    rrns = np.array([
+        f"{birth[2:4]}{birth[5:7]}{birth[8:10]}-{serial}"
+        for birth, serial in zip(births.tolist(), rng.integers(1_000_000, 4_999_999, patients).tolist())
+    ])
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.write(",".join(HEADER) + "\n")
+        for offset in range(0, rows, chunk_rows):
+            size = min(chunk_rows, rows - offset)
+            patient = rng.integers(0, patients, size)
+            dates = (np.datetime64("2010-01-01") + rng.integers(0, 365 * 15, size)).astype(str)
+            minutes = rng.integers(0, 24 * 60, size)
+            times = np.char.add(np.char.add(dates, " "), np.char.add(
+                np.char.zfill((minutes // 60).astype(str), 2), np.char.add(":", np.char.zfill((minutes % 60).astype(str), 2))
+            ))
+            columns = (
+                patient_ids[patient], rrns[patient], births[patient], dates, times,
+                np.array(DIAGNOSES)[rng.integers(0, len(DIAGNOSES), size)],
+                np.round(rng.normal(100, 20, size), 2).astype(str),
+            )
+            lines = columns[0]
+            for column in columns[1:]:
+                lines = np.char.add(np.char.add(lines, ","), column)
+            file.write("\n".join(lines.tolist()) + "\n")
+
+
+def naive_pseudonymize(src: Path, dst: Path, key: bytes, max_rows: int) -> int:
+    """행 단위 처리 (비교 기준)"""
+    rows = 0
+    with open(src, encoding="utf-8", newline="") as reader, open(dst, "w", encoding="utf-8", newline="") as writer:
+        records = csv.reader(reader)
+        output = csv.writer(writer)
+        header = next(records)
+        output.writerow(header)
+        index = {name: position for position, name in enumerate(header)}
+        for record in records:
+            patient = record[index["id"]]
+            number = int.from_bytes(hmac.new(key, b"date_shift:" + patient.encode(), hashlib.sha256).digest()[:8], "big")
+            days = number % 30 + 1
+            shift = timedelta(days=days if number & (1 << 63) else -days)
+            for name, method in RULES.items():
+                value = record[index[name]]
+                if method == "hmac":
+                    record[index[name]] = hmac.new(key, value.encode(), hashlib.sha256).hexdigest()[:20]
+                elif method == "year":
+                    record[index[name]] = value[:4]
+                else:
+                    record[index[name]] = (date.fromisoformat(value[:10]) + shift).isoformat() + value[10:]
+            output.writerow(record)
+            rows += 1
+            if max_rows and rows >= max_rows:
+                break
+    return rows
+
+
+def _peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (VmHWM: exec 이후 값이라 fork 한 부모의 메모리가 섞이지 않음)"""
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return round(int(line.split()[1]) / 1024, 1)
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def _children_max_rss_mb() -> float:
+    # Linux: KB 단위, 종료된 작업 프로세스 중 최댓값
+    return round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1)
+
+
+def run_mode(args, mode: str, src: Path) -> dict:
+    """모드 하나 측정 (--run-mode 프로세스 안에서 실행)"""
+    pseudonymizer = Pseudonymizer(key=derive_key("benchmark", "application"), rules=RULES)
+    dst = src.with_name(f"{mode}.csv")
+    started = time.perf_counter()
+    if mode == "naive":
+        rows = naive_pseudonymize(src, dst, pseudonymizer.key, args.naive_rows)
+        bytes_in = src.stat().st_size * rows / args.rows
+    else:
+        workers = args.workers if mode == "pool" else 1
+        stats = pseudonymize_csv(src, dst, pseudonymizer, chunk_rows=args.chunk_rows, workers=workers)
+        rows, bytes_in = stats.rows, stats.bytes_in
+    elapsed = time.perf_counter() - started
+    result = {
+        "rows": rows,
+        "seconds": round(elapsed, 2),
+        "rows_per_sec": round(rows / elapsed),
+        "mb_per_sec": round(bytes_in / elapsed / 1024 / 1024, 1),
+        "max_rss_mb": _peak_rss_mb(),
+        "worker_max_rss_mb": _children_max_rss_mb(),
+    }
+    if mode == "pool":
+        result["workers"] = args.workers
+    dst.unlink()
+    return result
+
+
+def run_mode_process(argv, mode: str, src: Path) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.pseudonymize", *argv, "--run-mode", mode, "--source", str(src)],
+        cwd=BACKEND_DIR, check=True, stdout=subprocess.PIPE, text=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    args = parse_args(argv)
+    if args.run_mode:
+        print(json.dumps(run_mode(args, args.run_mode, Path(args.source))))
+        return
+
+    work_dir = Path(tempfile.mkdtemp(prefix="data-portal-pseudonymize-"))
+    try:
+        src = work_dir / "source.csv"
+        print(f"합성 파일 {args.rows:,}행 생성 중...", file=sys.stderr)
+        started = time.perf_counter()
+        generate_file(src, args.rows, args.patients, args.seed)
+        generate_seconds = time.perf_counter() - started
+
+        results = {}
+        for mode in args.modes:
+            print(f"[{mode}] 가명화 중...", file=sys.stderr)
+            results[mode] = run_mode_process(argv, mode, src)
+
+        report = {
+            "rows": args.rows,
+            "patients": args.patients,
+            "file_bytes": src.stat().st_size,
+            "generate_seconds": round(generate_seconds, 2),
+            "chunk_rows": args.chunk_rows,
+            "cpu_count": os.cpu_count(),
+            "modes": results,
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
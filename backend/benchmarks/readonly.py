@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+조회 전용 세션 효과 측정
+
+같은 데이터셋에 대해 목록/상세 조회 요청을 순차 실행하면서 다음 두 경우의 요청당 지연시간을 비교합니다.
+- commit: 기존 방식 (기본 DB 세션, 요청이 끝나면 COMMIT, 커넥션 반환 시 ROLLBACK)
+- read_only: 조회 전용 세션 (커밋 없음, SQLite 는 query_only 커넥션에서 반환 시 ROLLBACK 생략)
+두 경우를 라운드마다 번갈아 실행해 측정 순서에 따른 편차를 줄입니다.
+
+사용 예:
+    cd backend
+    python -m benchmarks.readonly --rounds 5 --requests 200 --output readonly.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+ENDPOINTS = (
+    ("GET", "/api/applications/"),
+    ("GET", "/api/applications/{application_id}"),
+    ("GET", "/api/auth/me"),
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="조회 전용 세션 효과 측정")
+    parser.add_argument("--rounds", type=int, default=5, help="경우별 반복 라운드 수")
+    parser.add_argument("--requests", type=int, default=200, help="라운드당 엔드포인트별 요청 수")
+    parser.add_argument("--researchers", type=int, default=50)
+    parser.add_argument("--applications-per-researcher", type=int, default=5)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: stdout)")
+    return parser.parse_args(argv)
+
+
+def _configure_environment(work_dir: Path):
+    """앱 모듈 import 전에 벤치마크 전용 설정 주입"""
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{work_dir / 'bench.db'}"
+    os.environ.pop("DATABASE_READ_URL", None)
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ["DATABASE_ECHO"] = "false"
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    os.environ["METRICS_ENABLED"] = "false"
+    os.environ["JOBS_ENABLED"] = "false"
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+
+
+def _summary(samples):
+    from benchmarks.harness import percentile
+
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": round(percentile(ordered, 0.5) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+    }
+
+
+async def run_readonly_benchmark(args) -> dict:
+    import httpx
+
+    from app.db.session import engine, get_db, get_write_db, read_engine
+    from app.main import app
+    from benchmarks.harness import BenchClient, EndpointRecorder
+    from benchmarks.seed import BENCH_PASSWORD, SeedConfig, seed_database
+
+    seeded = await seed_database(
+        SeedConfig(researchers=args.researchers, admins=1,
+                   applications_per_researcher=args.applications_per_researcher, attachment_ratio=0),
+        Path("uploads"),
+    )
+    application_ids = [application_id for ids in seeded.application_ids_by_status.values() for application_id in ids]
+
+    samples = {mode: {f"{method} {template}": [] for method, template in ENDPOINTS} for mode in ("commit", "read_only")}
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as http_client:
+            client = BenchClient(http_client, EndpointRecorder())
+            headers = await client.login(seeded.admin_emails[0], BENCH_PASSWORD, record=False)
+
+            for round_index in range(args.rounds):
+                modes = ("commit", "read_only") if round_index % 2 == 0 else ("read_only", "commit")
+                for mode in modes:
+                    if mode == "commit":
+                        # 기존 동작: 조회 요청도 기본 DB 세션에서 커밋
+                        app.dependency_overrides[get_db] = get_write_db
+                    else:
+                        app.dependency_overrides.pop(get_db, None)
+                    for method, template in ENDPOINTS:
+                        label = f"{method} {template}"
+                        for index in range(args.requests):
+                            path_params = {"application_id": application_ids[index % len(application_ids)]}
+                            start = time.perf_counter()
+                            response = await client.request(method, template, path_params=path_params,
+                                                            record=False, headers=headers)
+                            samples[mode][label].append(time.perf_counter() - start)
+                            response.raise_for_status()
+    finally:
+        app.dependency_overrides.clear()
+        await engine.dispose()
+        if read_engine is not None:
+            await read_engine.dispose()
+
+    endpoints = {}
+    for method, template in ENDPOINTS:
+        label = f"{method} {template}"
+        commit = _summary(samples["commit"][label])
+        read_only = _summary(samples["read_only"][label])
+        endpoints[label] = {
+            "commit": commit,
+            "read_only": read_only,
+            "saving_ms": round(commit["mean_ms"] - read_only["mean_ms"], 3),
+            "saving_pct": round((commit["mean_ms"] - read_only["mean_ms"]) / commit["mean_ms"] * 100, 1),
+        }
+    return {"dataset": seeded.counts, "rounds": args.rounds, "requests": args.requests, "endpoints": endpoints}
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    work_dir = Path(tempfile.mkdtemp(prefix="data-portal-readonly-"))
+    _configure_environment(work_dir)
+
+    previous_cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        report = asyncio.run(run_readonly_benchmark(args))
+    finally:
+        os.chdir(previous_cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+부하 테스트 시나리오
+
+각 시나리오는 (client, seeded, options) 를 받아 가상 사용자 `concurrency` 명이
+`iterations` 회씩 동작을 반복합니다.
+"""
+import asyncio
+import random
+from dataclasses import dataclass
+
+from benchmarks.harness import BenchClient
+from benchmarks.seed import BENCH_PASSWORD, SeededData
+
+
+@dataclass
+class ScenarioOptions:
+    concurrency: int = 10
+    iterations: int = 20
+    random_seed: int = 42
+
+
+async def researcher_login_storm(client: BenchClient, seeded: SeededData, options: ScenarioOptions):
+    """출근 시간대처럼 다수의 연구자가 동시에 로그인하고 내 정보를 조회"""
+    async def virtual_user(index: int):
+        rng = random.Random(options.random_seed + index)
+        for _ in range(options.iterations):
+            email = rng.choice(seeded.researcher_emails)
+            headers = await client.login(email, BENCH_PASSWORD)
+            await client.request("GET", "/api/auth/me", headers=headers)
+
+    await asyncio.gather(*(virtual_user(index) for index in range(options.concurrency)))
+
+
+async def admin_review_session(client: BenchClient, seeded: SeededData, options: ScenarioOptions):
+    """관리자가 검토 대기 목록을 보고, 상세/첨부파일을 확인한 뒤 승인·반려"""
+    # 가상 관리자끼리 같은 신청서를 동시에 검토하지 않도록 공용 큐에서 하나씩 꺼냄
+    pending = list(seeded.application_ids_by_status.get("SUBMITTED", []))
+    with_attachments = set(seeded.applications_with_attachments)
+    decisions = ["APPROVED", "APPROVED", "APPROVED", "REJECTED", "REVISION_REQUESTED"]
+
+    async def virtual_admin(index: int):
+        rng = random.Random(options.random_seed + index)
+        email = seeded.admin_emails[index % len(seeded.admin_emails)]
+        headers = await client.login(email, BENCH_PASSWORD, record=False)
+        for _ in range(options.iterations):
+            await client.request(
+                "GET", "/api/applications/",
+                params={"status": "SUBMITTED", "limit": 20}, headers=headers,
+            )
+            if not pending:
+                continue
+            application_id = pending.pop()
+            path_params = {"application_id": application_id}
+            await client.request("GET", "/api/applications/{application_id}", path_params=path_params, headers=headers)
+            if application_id in with_attachments:
+                await client.request(
+                    "GET", "/api/applications/{application_id}/download/irb",
+                    path_params=path_params, headers=headers,
+                )
+            decision = rng.choice(decisions)
+            await client.request(
+                "POST", "/api/applications/{application_id}/review",
+                path_params=path_params, headers=headers,
+                json={"status": decision, "reason": None if decision == "APPROVED" else "보완 필요"},
+            )
+
+    admins = min(options.concurrency, len(seeded.admin_emails))
+    await asyncio.gather(*(virtual_admin(index) for index in range(admins)))
+
+
+async def dashboard_refresh(client: BenchClient, seeded: SeededData, options: ScenarioOptions):
+    """연구자/관리자 대시보드의 주기적 새로고침 (목록, 내 정보, 통계)"""
+    async def virtual_researcher(index: int):
+        email = seeded.researcher_emails[index % len(seeded.researcher_emails)]
+        headers = await client.login(email, BENCH_PASSWORD, record=False)
+        for _ in range(options.iterations):
+            await client.request("GET", "/api/auth/me", headers=headers)
+            await client.request("GET", "/api/applications/", headers=headers)
+
+    async def virtual_admin(index: int):
+        email = seeded.admin_emails[index % len(seeded.admin_emails)]
+        headers = await client.login(email, BENCH_PASSWORD, record=False)
+        for _ in range(options.iterations):
+            await client.request("GET", "/api/admin/statistics", headers=headers)
+            await client.request("GET", "/api/applications/", params={"limit": 100}, headers=headers)
+            await client.request("GET", "/api/admin/users", headers=headers)
+
+    # 관리자 1명당 연구자 4명 비율
+    admins = max(1, options.concurrency // 5)
+    researchers = max(1, options.concurrency - admins)
+    await asyncio.gather(
+        *(virtual_researcher(index) for index in range(researchers)),
+        *(virtual_admin(index) for index in range(admins)),
+    )
+
+
+SCENARIOS = {
+    "researcher_login_storm": researcher_login_storm,
+    "admin_review_session": admin_review_session,
+    "dashboard_refresh": dashboard_refresh,
+}
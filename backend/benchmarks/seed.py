@@ -0,0 +1,187 @@
+"""
+벤치마크용 데이터셋 생성
+
+사용자, 신청서, 처리 로그, 첨부파일을 실제 서비스와 비슷한 분포로 생성합니다.
+앱 모듈을 import 하기 전에 DATABASE_URL 환경변수가 설정되어 있어야 합니다.
+"""
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+from sqlalchemy import insert
+
+from app.core.security import get_password_hash
+from app.db.ids import new_id
+from app.db.migrations import ensure_schema
+from app.db.session import engine
+from app.models import (
+    User,
+    UserRole,
+    Application,
+    ApplicationStatus,
+    ApplicationLog,
+    LogAction,
+)
+from app.models.application import ServiceType, service_types_mask
+
+BENCH_PASSWORD = "benchpassword123"
+
+DEPARTMENTS = ["내과", "외과", "소아청소년과", "신경과", "영상의학과", "병리과", "응급의학과", "예방의학교실"]
+POSITIONS = ["교수", "부교수", "조교수", "임상강사", "전공의", "연구원"]
+FAMILY_NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임"]
+GIVEN_NAMES = ["민준", "서연", "도윤", "하은", "지호", "수아", "예준", "지유", "현우", "서윤"]
+
+# 신청서 상태 분포 (운영 데이터 기준 대략적인 비율)
+STATUS_WEIGHTS = {
+    ApplicationStatus.SUBMITTED: 15,
+    ApplicationStatus.UNDER_REVIEW: 5,
+    ApplicationStatus.APPROVED: 15,
+    ApplicationStatus.REJECTED: 5,
+    ApplicationStatus.REVISION_REQUESTED: 5,
+    ApplicationStatus.PROCESSING: 10,
+    ApplicationStatus.COMPLETED: 45,
+}
+
+STATUS_LOG_ACTIONS = {
+    ApplicationStatus.APPROVED: [LogAction.APPROVED],
+    ApplicationStatus.REJECTED: [LogAction.REJECTED],
+    ApplicationStatus.REVISION_REQUESTED: [LogAction.REVISION_REQUESTED],
+    ApplicationStatus.PROCESSING: [LogAction.APPROVED, LogAction.PROCESSING],
+    ApplicationStatus.COMPLETED: [LogAction.APPROVED, LogAction.PROCESSING, LogAction.COMPLETED],
+}
+
+
+@dataclass
+class SeedConfig:
+    researchers: int = 200
+    admins: int = 5
+    applications_per_researcher: int = 5
+    attachment_ratio: float = 0.7
+    attachment_size: int = 64 * 1024
+    random_seed: int = 42
+
+
+@dataclass
+class SeededData:
+    researcher_emails: List[str] = field(default_factory=list)
+    admin_emails: List[str] = field(default_factory=list)
+    researcher_ids: List[str] = field(default_factory=list)
+    admin_ids: List[str] = field(default_factory=list)
+    application_ids_by_status: Dict[str, List[str]] = field(default_factory=dict)
+    applications_with_attachments: List[str] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+def _random_name(rng: random.Random) -> str:
+    return rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES)
+
+
+async def seed_database(config: SeedConfig, upload_root: Path) -> SeededData:
+    """스키마를 생성하고 벤치마크 데이터를 적재"""
+    rng = random.Random(config.random_seed)
+    seeded = SeededData()
+    now = datetime.utcnow()
+    # bcrypt 해시는 비용이 크므로 한 번만 계산해서 모든 계정에 재사용
+    hashed_password = get_password_hash(BENCH_PASSWORD)
+
+    users = []
+    for index in range(config.admins):
+        user_id = new_id()
+        email = f"bench-admin{index}@aumc.ac.kr"
+        users.append(dict(
+            id=user_id, email=email, hashed_password=hashed_password, name=_random_name(rng),
+            role=UserRole.ADMIN, department="의료빅데이터센터", position="연구원", is_active=True,
+            created_at=now - timedelta(days=365), updated_at=now, dcyn='N',
+        ))
+        seeded.admin_ids.append(user_id)
+        seeded.admin_emails.append(email)
+
+    for index in range(config.researchers):
+        user_id = new_id()
+        email = f"bench-researcher{index}@aumc.ac.kr"
+        created_at = now - timedelta(days=rng.randint(1, 365))
+        users.append(dict(
+            id=user_id, email=email, hashed_password=hashed_password, name=_random_name(rng),
+            role=UserRole.RESEARCHER, department=rng.choice(DEPARTMENTS), position=rng.choice(POSITIONS),
+            phone=f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}", is_active=True,
+            created_at=created_at, updated_at=created_at, dcyn='N',
+        ))
+        seeded.researcher_ids.append(user_id)
+        seeded.researcher_emails.append(email)
+
+    statuses = list(STATUS_WEIGHTS)
+    weights = list(STATUS_WEIGHTS.values())
+    applications = []
+    logs = []
+    attachment_payload = b"%PDF-1.4\n" + bytes(config.attachment_size)
+
+    for researcher in users[config.admins:]:
+        for _ in range(config.applications_per_researcher):
+            application_id = new_id()
+            application_status = rng.choices(statuses, weights)[0]
+            created_at = now - timedelta(days=rng.randint(0, 180), minutes=rng.randint(0, 1440))
+            submitted_at = created_at + timedelta(minutes=5)
+            reviewer_id = rng.choice(seeded.admin_ids)
+            reviewed = application_status not in (ApplicationStatus.SUBMITTED, ApplicationStatus.UNDER_REVIEW)
+            reviewed_at = submitted_at + timedelta(days=rng.randint(1, 14)) if reviewed else None
+
+            row = dict(
+                id=application_id, user_id=researcher["id"],
+                project_name=f"{researcher['department']} 코호트 연구 {rng.randint(1, 9999)}",
+                applicant_name=researcher["name"], applicant_department=researcher["department"],
+                applicant_phone=researcher["phone"], applicant_email=researcher["email"],
+                principal_investigator=_random_name(rng), pi_department=researcher["department"],
+                irb_number=f"AJOUIRB-{rng.randint(2020, 2025)}-{rng.randint(1, 999):03d}",
+                service_types=rng.sample([service_type.value for service_type in ServiceType], rng.randint(1, 2)),
+                target_patients="2015년 1월 1일부터 2024년 12월 31일까지 내원한 환자 중 해당 진단 코드를 가진 환자",
+                request_details="진단, 처방, 검사 결과 데이터를 연구 목적으로 추출 요청합니다. " * 3,
+                status=application_status, submitted_at=submitted_at,
+                reviewed_at=reviewed_at, reviewed_by=reviewer_id if reviewed else None,
+                completed_at=reviewed_at + timedelta(days=7) if application_status == ApplicationStatus.COMPLETED else None,
+                rejection_reason="IRB 승인 범위를 초과합니다" if application_status == ApplicationStatus.REJECTED else None,
+                irb_document_path=None, irb_document_original_name=None,
+                research_plan_path=None, research_plan_original_name=None,
+                created_at=created_at, updated_at=reviewed_at or submitted_at, dcyn='N',
+            )
+            row["service_types_mask"] = service_types_mask(row["service_types"])
+
+            if rng.random() < config.attachment_ratio:
+                upload_dir = upload_root / "applications" / application_id
+                upload_dir.mkdir(parents=True, exist_ok=True)
+                for file_type, column in (("irb", "irb_document"), ("research_plan", "research_plan")):
+                    file_name = f"{file_type}_{created_at.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4()}.pdf"
+                    (upload_dir / file_name).write_bytes(attachment_payload)
+                    row[f"{column}_path"] = str(Path("uploads") / "applications" / application_id / file_name)
+                    row[f"{column}_original_name"] = f"{file_type}.pdf"
+                seeded.applications_with_attachments.append(application_id)
+
+            applications.append(row)
+            seeded.application_ids_by_status.setdefault(application_status.value, []).append(application_id)
+
+            logs.append(dict(
+                id=new_id(), application_id=application_id, user_id=researcher["id"],
+                action=LogAction.SUBMITTED, created_at=submitted_at, updated_at=submitted_at, dcyn='N',
+            ))
+            for offset, action in enumerate(STATUS_LOG_ACTIONS.get(application_status, [])):
+                log_time = (reviewed_at or submitted_at) + timedelta(days=offset)
+                logs.append(dict(
+                    id=new_id(), application_id=application_id, user_id=reviewer_id,
+                    action=action, created_at=log_time, updated_at=log_time, dcyn='N',
+                ))
+
+    await ensure_schema(engine)
+    async with engine.begin() as conn:
+        await conn.execute(insert(User), users)
+        await conn.execute(insert(Application), applications)
+        await conn.execute(insert(ApplicationLog), logs)
+
+    seeded.counts = {
+        "users": len(users),
+        "applications": len(applications),
+        "application_logs": len(logs),
+        "applications_with_attachments": len(seeded.applications_with_attachments),
+    }
+    return seeded
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+기동 시 스키마 확인 시간 측정
+
+다음 세 경우에 ensure_schema() 소요 시간을 반복 측정해 JSON으로 출력합니다.
+- cold: 빈 DB (전체 마이그레이션 실행)
+- legacy: create_all 로 만든 기존 DB (stamp 후 나머지 마이그레이션 실행)
+- warm: 지문이 일치하는 DB (지문 조회 1회)
+비교 기준으로 기존 기동 방식인 create_all (warm DB) 소요 시간도 함께 측정합니다.
+
+사용 예:
+    cd backend
+    python -m benchmarks.startup --repeat 20 --output startup.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="기동 시 스키마 확인 시간 측정")
+    parser.add_argument("--repeat", type=int, default=10, help="경우별 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: stdout)")
+    return parser.parse_args(argv)
+
+
+def _summary(samples):
+    from benchmarks.harness import percentile
+
+    return {
+        "runs": len(samples),
+        "mean_ms": round(sum(samples) / len(samples), 3),
+        "p50_ms": round(percentile(sorted(samples), 0.5), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+async def _timed(url: str, action) -> float:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(url)
+    try:
+        start = time.perf_counter()
+        await action(engine)
+        return (time.perf_counter() - start) * 1000
+    finally:
+        await engine.dispose()
+
+
+async def run_startup_benchmark(repeat: int, work_dir: Path) -> dict:
+    from app.db.base import Base
+    from app.db.migrations import compute_schema_fingerprint, ensure_schema
+
+    async def create_all(engine):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    samples = {"cold": [], "legacy": [], "warm": [], "create_all_warm": []}
+    for index in range(repeat):
+        url = f"sqlite+aiosqlite:///{work_dir / f'cold{index}.db'}"
+        samples["cold"].append(await _timed(url, ensure_schema))
+
+        url = f"sqlite+aiosqlite:///{work_dir / f'legacy{index}.db'}"
+        await _timed(url, create_all)
+        samples["legacy"].append(await _timed(url, ensure_schema))
+
+    warm_url = f"sqlite+aiosqlite:///{work_dir / 'cold0.db'}"
+    for _ in range(repeat):
+        samples["warm"].append(await _timed(warm_url, ensure_schema))
+        samples["create_all_warm"].append(await _timed(warm_url, create_all))
+
+    fingerprint_start = time.perf_counter()
+    compute_schema_fingerprint()
+    fingerprint_ms = (time.perf_counter() - fingerprint_start) * 1000
+
+    return {
+        "fingerprint_compute_ms": round(fingerprint_ms, 3),
+        "paths": {name: _summary(values) for name, values in samples.items()},
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ["DATABASE_ECHO"] = "false"
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+
+    work_dir = Path(tempfile.mkdtemp(prefix="data-portal-startup-"))
+    try:
+        report = asyncio.run(run_startup_benchmark(args.repeat, work_dir))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
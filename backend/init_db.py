@@ -1,25 +1,25 @@
 #!/usr/bin/env python3
 """
 데이터베이스 초기화 스크립트
+
+DATABASE_URL 설정의 DB에 alembic 마이그레이션을 적용합니다 (alembic upgrade head 와 동일).
 """
 
 import asyncio
-from sqlalchemy.ext.asyncio import create_async_engine
-from app.db.base import Base
-from app.models import *  # 모든 모델 import
+from app.core.config import settings
+from app.db.session import engine
+from app.db.migrations import ensure_schema
 
-DATABASE_URL = "sqlite+aiosqlite:///./data_portal.db"
 
 async def init_database():
-    engine = create_async_engine(DATABASE_URL, echo=True)
-    
-    async with engine.begin() as conn:
-        # 모든 테이블 생성
-        await conn.run_sync(Base.metadata.create_all)
-        print("✅ 데이터베이스 테이블 생성 완료")
+    result = await ensure_schema(engine)
+    if result == "current":
+        print("✅ 데이터베이스 스키마가 이미 최신 상태입니다")
+    else:
+        print("✅ 데이터베이스 마이그레이션 완료")
     
     await engine.dispose()
 
 if __name__ == "__main__":
-    print("🔄 데이터베이스 초기화 시작...")
-    asyncio.run(init_database())
\ No newline at end of file
+    print(f"🔄 데이터베이스 초기화 시작... ({settings.DATABASE_URL})")
+    asyncio.run(init_database())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+비정형 데이터(임상 문서) 비식별화 스크립트 (app.services.deidentification)
+
+UNSTRUCTURED_EXTRACTION 신청서의 문서 묶음(JSON Lines, 한 줄에 {"id": ..., "text": ...})을 비식별화합니다.
+대체값 키는 정형 추출 가명화와 같이 PSEUDONYMIZATION_KEY(없으면 SECRET_KEY)에서 신청서별로 파생합니다.
+
+사용 예 (backend 디렉터리에서 실행):
+    python scripts/deidentify_notes.py --application-id <신청서 ID> --names names.txt notes.jsonl notes.deid.jsonl
+    python scripts/deidentify_notes.py --application-id <신청서 ID> --names names.txt --workers 8 \\
+        --text-field body --kinds name rrn phone date notes.jsonl notes.deid.jsonl
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 경로 설정
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.deidentification import (  # noqa: E402
+    DEFAULT_RECORD_PATTERN,
+    KINDS,
+    Deidentifier,
+    deidentify_jsonl,
+    default_workers,
+    load_names,
+)
+from app.services.pseudonymization import derive_key  # noqa: E402
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="임상 문서 비식별화 (JSON Lines)")
+    parser.add_argument("source", help="입력 JSON Lines 파일")
+    parser.add_argument("output", help="출력 JSON Lines 파일")
+    parser.add_argument("--application-id", required=True, help="신청서 ID (대체값 키 범위)")
+    parser.add_argument("--names", help="이름 사전 파일 (한 줄에 이름 하나)")
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=list(KINDS), help="치환할 식별정보 종류")
+    parser.add_argument("--record-pattern", default=DEFAULT_RECORD_PATTERN,
+                        help="등록번호 정규식 (record_value 그룹이 있으면 그 부분만 치환)")
+    parser.add_argument("--date-shift-days", type=int, default=30)
+    parser.add_argument("--text-field", default="text")
+    parser.add_argument("--id-field", default="id", help="날짜 이동 일수를 정하는 문서 ID 필드")
+    parser.add_argument("--workers", type=int, help="프로세스 수 (기본: PSEUDONYMIZATION_WORKERS 또는 CPU 수)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    from app.core.config import settings
+
+    if "name" in args.kinds and not args.names:
+        print("--names 이름 사전이 없으면 이름은 치환하지 않습니다 (--kinds 에서 name 을 빼거나 사전을 지정하세요)",
+              file=sys.stderr)
+        return 2
+    deidentifier = Deidentifier(
+        key=derive_key(settings.PSEUDONYMIZATION_KEY or settings.SECRET_KEY, args.application_id),
+        names=tuple(load_names(args.names)) if args.names else (),
+        kinds=tuple(args.kinds),
+        record_pattern=args.record_pattern,
+        date_shift_days=args.date_shift_days,
+    )
+    started = time.perf_counter()
+    stats = deidentify_jsonl(
+        args.source,
+        args.output,
+        deidentifier,
+        text_field=args.text_field,
+        id_field=args.id_field,
+        workers=args.workers or settings.PSEUDONYMIZATION_WORKERS or default_workers(),
+    )
+    print(json.dumps({
+        "documents": stats.documents,
+        "replaced": dict(stats.counts),
+        "seconds": round(time.perf_counter() - started, 2),
+    }, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
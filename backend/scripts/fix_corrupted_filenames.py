@@ -2,16 +2,35 @@
 """
 파일명 인코딩 복구 스크립트
 이중 인코딩으로 깨진 한글 파일명을 복구합니다.
+
+- 설정된 DATABASE_URL 의 DB 를 대상으로 하며, 확인 입력 없이 실행됩니다. (--dry-run 으로 먼저 확인)
+- applications 를 id 순 keyset 배치로 읽고, 배치마다 executemany 로 한 번에 업데이트합니다.
+- 수정하는 행의 원본 파일명만 application_filename_backup 에 run_id 와 함께 백업합니다.
+- 배치마다 마지막 id 를 체크포인트로 같은 트랜잭션에 기록하므로, 중단 후 다시 실행하면 이어서 처리합니다.
+
+사용 예 (backend 디렉터리에서 실행):
+    python scripts/fix_corrupted_filenames.py --dry-run
+    python scripts/fix_corrupted_filenames.py --batch-size 1000
+    python scripts/fix_corrupted_filenames.py --restart       # 체크포인트 무시하고 처음부터
 """
 
-import sqlite3
+import argparse
+import asyncio
+import json
 import sys
+import time
+import uuid
+from datetime import datetime
 from pathlib import Path
 
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, bindparam, insert, or_, select, update
+
 # 프로젝트 루트 경로 설정
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from app.db.ids import UUIDKey  # noqa: E402
+
 def fix_double_encoded_filename(corrupted_name):
     """
     이중 인코딩된 파일명을 복구
@@ -55,134 +74,182 @@ def is_corrupted(filename):
     
     return False
 
-def fix_database_filenames():
+CHECKPOINT_NAME = "fix_corrupted_filenames"
+
+
+# 수정 전 원본 파일명 백업 (마이그레이션 0007 로 생성, 수정 대상 행만 기록)
+# application_id 는 applications.id 와 같은 UUIDKey (0016) 여야 복원 UPDATE 의 조인이 맞음
+backup_table = Table(
+    "application_filename_backup",
+    MetaData(),
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("run_id", String, nullable=False),
+    Column("application_id", UUIDKey, nullable=False),
+    Column("irb_document_original_name", String),
+    Column("research_plan_original_name", String),
+    Column("backed_up_at", DateTime, nullable=False),
+)
+
+
+def fix_row(irb_name, research_name):
+    """복구가 필요하면 (새 IRB 파일명, 새 연구계획서 파일명), 아니면 None"""
+    new_irb_name = irb_name
+    new_research_name = research_name
+    if irb_name and is_corrupted(irb_name):
+        new_irb_name = fix_double_encoded_filename(irb_name)
+    if research_name and is_corrupted(research_name):
+        new_research_name = fix_double_encoded_filename(research_name)
+    if new_irb_name == irb_name and new_research_name == research_name:
+        return None
+    return new_irb_name, new_research_name
+
+
+async def fix_database_filenames(batch_size=500, dry_run=False, restart=False, verbose=False):
     """
     데이터베이스의 깨진 파일명을 복구
     """
-    # 데이터베이스 연결
-    db_path = project_root / "data_portal.db"
-    if not db_path.exists():
-        print(f"데이터베이스 파일을 찾을 수 없습니다: {db_path}")
-        return
-    
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
-    
-    # 백업 테이블 생성 (안전을 위해)
-    print("백업 테이블 생성 중...")
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS applications_backup AS 
-        SELECT * FROM applications
-    """)
-    conn.commit()
-    
-    # 모든 파일명 조회
-    cursor.execute("""
-        SELECT id, irb_document_original_name, research_plan_original_name 
-        FROM applications 
-        WHERE irb_document_original_name IS NOT NULL 
-           OR research_plan_original_name IS NOT NULL
-    """)
-    
-    rows = cursor.fetchall()
-    fixed_count = 0
-    error_count = 0
-    
-    print(f"총 {len(rows)}개의 레코드를 검사합니다...")
-    print("-" * 60)
-    
-    for row_id, irb_name, research_name in rows:
-        changes_made = False
-        new_irb_name = irb_name
-        new_research_name = research_name
-        
-        # IRB 문서 파일명 복구
-        if irb_name and is_corrupted(irb_name):
-            fixed_name = fix_double_encoded_filename(irb_name)
-            if fixed_name != irb_name:
-                print(f"[IRB 문서 복구]")
-                print(f"  ID: {row_id}")
-                print(f"  원본: {irb_name[:50]}...")
-                print(f"  복구: {fixed_name[:50]}...")
-                new_irb_name = fixed_name
-                changes_made = True
-        
-        # 연구계획서 파일명 복구
-        if research_name and is_corrupted(research_name):
-            fixed_name = fix_double_encoded_filename(research_name)
-            if fixed_name != research_name:
-                print(f"[연구계획서 복구]")
-                print(f"  ID: {row_id}")
-                print(f"  원본: {research_name[:50]}...")
-                print(f"  복구: {fixed_name[:50]}...")
-                new_research_name = fixed_name
-                changes_made = True
-        
-        # 변경사항이 있으면 업데이트
-        if changes_made:
-            try:
-                cursor.execute("""
-                    UPDATE applications 
-                    SET irb_document_original_name = ?,
-                        research_plan_original_name = ?
-                    WHERE id = ?
-                """, (new_irb_name, new_research_name, row_id))
-                fixed_count += 1
-                print(f"  ✓ 업데이트 완료")
-                print("-" * 60)
-            except Exception as e:
-                error_count += 1
-                print(f"  ✗ 업데이트 실패: {e}")
-                print("-" * 60)
-    
-    # 커밋
-    if fixed_count > 0:
-        conn.commit()
-        print(f"\n복구 완료!")
-        print(f"  - 복구된 레코드: {fixed_count}개")
-        print(f"  - 오류 발생: {error_count}개")
-        print(f"  - 백업 테이블: applications_backup")
+    # 앱 모듈은 설정(DATABASE_URL 등)을 읽으므로 실행 시점에 import
+    from app.db.checkpoints import load_checkpoint, save_checkpoint
+    from app.db.migrations import ensure_schema
+    from app.db.session import engine
+    from app.models import Application
+
+    applications = Application.__table__
+
+    await ensure_schema(engine)
+
+    async with engine.connect() as conn:
+        checkpoint = await load_checkpoint(conn, CHECKPOINT_NAME)
+
+    if checkpoint is not None and not checkpoint.completed and not restart and not dry_run:
+        last_id = checkpoint.position
+        stats = dict(checkpoint.stats)
+        started_at = checkpoint.started_at
+        print(f"체크포인트에서 재개합니다 (run_id={stats['run_id']}, 마지막 id={last_id}, "
+              f"검사 {stats['scanned']}건, 복구 {stats['fixed']}건)")
     else:
-        print("\n복구할 파일명이 없습니다.")
-    
-    # 복구 결과 샘플 출력
-    print("\n[복구 결과 샘플]")
-    cursor.execute("""
-        SELECT id, irb_document_original_name, research_plan_original_name 
-        FROM applications 
-        WHERE irb_document_original_name IS NOT NULL 
-           OR research_plan_original_name IS NOT NULL
-        LIMIT 5
-    """)
-    
-    for row in cursor.fetchall():
-        print(f"ID: {row[0]}")
-        if row[1]:
-            print(f"  IRB: {row[1]}")
-        if row[2]:
-            print(f"  연구계획서: {row[2]}")
-    
-    conn.close()
+        last_id = None
+        stats = {"run_id": uuid.uuid4().hex[:12], "scanned": 0, "fixed": 0, "batches": 0}
+        started_at = datetime.utcnow()
+
+    update_statement = (
+        update(applications)
+        .where(applications.c.id == bindparam("b_id"))
+        .values(
+            irb_document_original_name=bindparam("b_irb"),
+            research_plan_original_name=bindparam("b_research"),
+            # Core UPDATE 는 version_id_col 을 자동으로 올리지 않으므로 직접 증가 (ETag 갱신)
+            version=applications.c.version + 1,
+        )
+    )
+
+    run_started = time.perf_counter()
+    run_scanned = 0
+    while True:
+        query = (
+            select(
+                applications.c.id,
+                applications.c.irb_document_original_name,
+                applications.c.research_plan_original_name,
+            )
+            .where(or_(
+                applications.c.irb_document_original_name.is_not(None),
+                applications.c.research_plan_original_name.is_not(None),
+            ))
+            .order_by(applications.c.id)
+            .limit(batch_size)
+        )
+        if last_id is not None:
+            query = query.where(applications.c.id > last_id)
+
+        # 배치 변경 + 백업 + 체크포인트를 한 트랜잭션으로 (중단되면 배치 단위로 재실행)
+        async with engine.begin() as conn:
+            rows = (await conn.execute(query)).all()
+            if not rows:
+                if not dry_run:
+                    await save_checkpoint(conn, CHECKPOINT_NAME, last_id, stats, started_at=started_at, completed=True)
+                break
+
+            now = datetime.utcnow()
+            changes = []
+            backups = []
+            for row_id, irb_name, research_name in rows:
+                fixed = fix_row(irb_name, research_name)
+                if fixed is None:
+                    continue
+                changes.append({"b_id": row_id, "b_irb": fixed[0], "b_research": fixed[1]})
+                backups.append({
+                    "run_id": stats["run_id"],
+                    "application_id": row_id,
+                    "irb_document_original_name": irb_name,
+                    "research_plan_original_name": research_name,
+                    "backed_up_at": now,
+                })
+                if verbose:
+                    print(f"  ID: {row_id}")
+                    print(f"    원본: {(irb_name or '')[:50]} / {(research_name or '')[:50]}")
+                    print(f"    복구: {(fixed[0] or '')[:50]} / {(fixed[1] or '')[:50]}")
+
+            if changes and not dry_run:
+                await conn.execute(insert(backup_table), backups)
+                await conn.execute(update_statement, changes)
+
+            last_id = rows[-1][0]
+            stats["scanned"] += len(rows)
+            stats["fixed"] += len(changes)
+            stats["batches"] += 1
+            if not dry_run:
+                await save_checkpoint(conn, CHECKPOINT_NAME, last_id, stats, started_at=started_at)
+
+        run_scanned += len(rows)
+        elapsed = time.perf_counter() - run_started
+        print(f"[배치 {stats['batches']}] 검사 {stats['scanned']}건, 복구 {stats['fixed']}건 "
+              f"({run_scanned / elapsed if elapsed else 0:.0f} rows/s)")
+
+    await engine.dispose()
 
-def main():
+    elapsed = time.perf_counter() - run_started
+    return {
+        **stats,
+        "dry_run": dry_run,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(run_scanned / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="깨진 첨부파일 원본 파일명 복구")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 번에 읽고 업데이트할 행 수")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 복구 대상만 확인")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 실행")
+    parser.add_argument("--verbose", action="store_true", help="복구하는 행마다 원본/복구 파일명 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     메인 실행 함수
     """
+    args = parse_args(argv)
     print("=" * 60)
-    print("파일명 인코딩 복구 스크립트")
+    print("파일명 인코딩 복구 스크립트" + (" (dry-run)" if args.dry_run else ""))
     print("=" * 60)
-    
-    # 사용자 확인
-    response = input("\n데이터베이스의 깨진 파일명을 복구하시겠습니까? (y/n): ")
-    if response.lower() != 'y':
-        print("작업을 취소했습니다.")
-        return
-    
-    print("\n복구 작업을 시작합니다...")
-    fix_database_filenames()
-    
-    print("\n작업이 완료되었습니다.")
-    print("문제가 발생한 경우 applications_backup 테이블에서 원본 데이터를 복구할 수 있습니다.")
+
+    result = asyncio.run(fix_database_filenames(
+        batch_size=args.batch_size,
+        dry_run=args.dry_run,
+        restart=args.restart,
+        verbose=args.verbose,
+    ))
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if result["fixed"] and not args.dry_run:
+        print("\n문제가 발생한 경우 application_filename_backup 테이블에서 원본 파일명을 복구할 수 있습니다:")
+        print("  UPDATE applications SET")
+        print("    irb_document_original_name = b.irb_document_original_name,")
+        print("    research_plan_original_name = b.research_plan_original_name")
+        print(f"  FROM application_filename_backup b WHERE b.application_id = applications.id AND b.run_id = '{result['run_id']}';")
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
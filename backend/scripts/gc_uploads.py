@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+고아 업로드 파일 정리 스크립트
+DB 가 참조하지 않는 uploads/ 아래 파일을 찾아 보고(기본), 격리 또는 삭제합니다.
+백그라운드 작업 실행기에서도 uploads.gc 작업으로 주기 실행됩니다.
+
+사용 예 (backend 디렉터리에서 실행):
+    python scripts/gc_uploads.py                          # 삭제 없이 보고만 (dry-run)
+    python scripts/gc_uploads.py --mode quarantine        # uploads/.quarantine/<시각>/ 로 이동
+    python scripts/gc_uploads.py --mode delete --grace-hours 48
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 설정
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="고아 업로드 파일 정리")
+    parser.add_argument("--mode", choices=["report", "quarantine", "delete"], default="report",
+                        help="report: 보고만 / quarantine: 격리 디렉터리로 이동 / delete: 삭제")
+    parser.add_argument("--root", default="uploads", help="업로드 루트 (DB 에 저장된 경로와 같은 기준)")
+    parser.add_argument("--grace-hours", type=float, help="수정된 지 이 시간이 지나지 않은 파일 제외")
+    parser.add_argument("--deleted-retention-days", type=int, help="삭제된 신청서 첨부파일 보관 기간")
+    parser.add_argument("--batch-size", type=int, help="DB 경로 스트리밍 배치 크기")
+    parser.add_argument("--samples", type=int, default=20, help="보고서에 포함할 고아 파일 예시 수")
+    return parser.parse_args(argv)
+
+
+async def run(args) -> dict:
+    from app.db.session import AsyncSessionLocal, engine
+    from app.services.upload_gc import GCMode, collect_garbage
+
+    try:
+        async with AsyncSessionLocal() as db:
+            report = await collect_garbage(
+                db,
+                root=Path(args.root),
+                mode=GCMode(args.mode),
+                grace_seconds=args.grace_hours * 3600 if args.grace_hours is not None else None,
+                deleted_retention_days=args.deleted_retention_days,
+                batch_size=args.batch_size,
+                sample_limit=args.samples,
+            )
+    finally:
+        await engine.dispose()
+    return report.to_dict()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = asyncio.run(run(args))
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
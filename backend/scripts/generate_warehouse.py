@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+합성 임상 데이터 웨어하우스 스냅샷 생성 스크립트 (정형 추출 개발/테스트용)
+
+카탈로그 초기 데이터(0011 마이그레이션)의 데이터 종류/컬럼 키로 테이블을 만들고 무작위 값을 채웁니다.
+실제 환자 데이터가 아니며, 같은 --seed 면 같은 데이터가 생성됩니다.
+
+사용 예 (backend 디렉터리에서 실행):
+    python scripts/generate_warehouse.py                                  # warehouse/warehouse.db (SQLite)
+    python scripts/generate_warehouse.py --patients 100000 --rows-per-patient 30
+    python scripts/generate_warehouse.py --format parquet --output warehouse/parquet   # pyarrow 필요
+"""
+import argparse
+import importlib.util
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 경로 설정
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+CATALOG_MIGRATION = project_root / "alembic" / "versions" / "0011_data_catalog.py"
+
+VISITS = {"O": "외래", "I": "입원", "E": "응급"}
+DEPARTMENTS = {"IM": "내과", "GS": "외과", "OS": "정형외과", "NR": "신경과", "PD": "소아청소년과", "OG": "산부인과"}
+DIAGNOSES = {
+    "E11.9": "합병증을 동반하지 않은 2형 당뇨병", "I10": "본태성(원발성) 고혈압", "C34.1": "상엽, 기관지 또는 폐의 악성 신생물",
+    "J45.9": "상세불명의 천식", "N18.3": "만성 신장병(3기)", "E78.5": "상세불명의 고지혈증",
+    "I25.1": "죽상경화성 심장병", "K21.0": "식도염을 동반한 위-식도역류병",
+}
+DRUGS = {
+    "A10BA02": "metformin", "C09CA01": "losartan", "C10AA05": "atorvastatin",
+    "R03AC02": "salbutamol", "B01AC06": "aspirin", "A02BC01": "omeprazole",
+}
+TESTS = {"L001": ("HbA1c", "%", 4.0, 6.0), "L002": ("Creatinine", "mg/dL", 0.6, 1.2),
+         "L003": ("LDL-C", "mg/dL", 0.0, 130.0), "L004": ("Hemoglobin", "g/dL", 12.0, 16.0)}
+SURGERIES = {"S101": "복강경 담낭절제술", "S202": "슬관절 전치환술", "S303": "제왕절개술", "S404": "폐엽 절제술"}
+ANESTHESIA = ("전신마취", "척추마취", "국소마취")
+PATHOLOGY = {"H": "조직검사", "C": "세포검사"}
+FINDINGS = ("No evidence of malignancy", "Adenocarcinoma", "Chronic inflammation", "Squamous cell carcinoma")
+
+
+def load_catalog():
+    """0011 마이그레이션의 DATASETS 에서 데이터 종류별 컬럼 키"""
+    spec = importlib.util.spec_from_file_location("catalog_migration", CATALOG_MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return {key: [column[0] for column in columns] for key, _name, _title, _description, columns in module.DATASETS}
+
+
+def _dates(rng, size, start="2010-01-01", days=365 * 15):
+    return (np.datetime64(start) + rng.integers(0, days, size)).astype(str)
+
+
+def _times(rng, size):
+    dates = _dates(rng, size)
+    minutes = rng.integers(0, 24 * 60, size)
+    return np.char.add(np.char.add(dates, " "), [f"{m // 60:02d}:{m % 60:02d}" for m in minutes])
+
+
+def _coded(rng, size, codes: dict):
+    """코드와 코드명 배열"""
+    index = rng.integers(0, len(codes), size)
+    return np.array(list(codes))[index], np.array(list(codes.values()))[index]
+
+
+def generate_chunk(rng, dataset: str, columns, patients: dict, size: int) -> dict:
+    """데이터 종류 하나의 행 size 개 (컬럼 키 -> 배열)"""
+    patient = rng.integers(0, len(patients["id"]), size)
+    values = {"id": patients["id"][patient], "birth": patients["birth"][patient], "gender": patients["gender"][patient]}
+    height = np.round(rng.normal(165, 9, size), 1)
+    weight = np.round(rng.normal(65, 12, size), 1)
+    values.update(height=height, weight=weight, bmi=np.round(weight / (height / 100) ** 2, 1))
+    values["visitCode"], values["visitName"] = _coded(rng, size, VISITS)
+    values["deptCode"], values["deptName"] = _coded(rng, size, DEPARTMENTS)
+    values["surgVisitCode"], values["surgVisitName"] = values["visitCode"], values["visitName"]
+    values["surgDeptCode"], values["surgDeptName"] = values["deptCode"], values["deptName"]
+    for key in ("date", "dischargeDate", "prescDate", "surgDate"):
+        values[key] = _dates(rng, size)
+    for key in ("visitTime", "dischargeTime", "receiveTime", "reportTime"):
+        values[key] = _times(rng, size)
+    values["diagCode"], values["diagName"] = _coded(rng, size, DIAGNOSES)
+    values["mainDiag"] = np.where(rng.random(size) < 0.3, "Y", "N")
+    for key in ("prescOrder", "surgOrder"):
+        values[key] = rng.integers(1, 10, size)
+
+    if dataset == "medication":
+        values["atcCode"], values["ingredName"] = _coded(rng, size, DRUGS)
+        values["atcName"] = values["prescName"] = values["ingredName"]
+        values["prescCode"] = values["ingredCode"] = np.char.add("M", values["atcCode"])
+        values["usage"] = np.array(("1일 1회", "1일 2회", "1일 3회"))[rng.integers(0, 3, size)]
+        values["dose"] = rng.integers(1, 4, size)
+        values["days"] = rng.choice((7, 14, 28, 30, 90), size)
+    elif dataset == "lab":
+        codes = np.array(list(TESTS))[rng.integers(0, len(TESTS), size)]
+        low = np.array([TESTS[code][2] for code in codes])
+        high = np.array([TESTS[code][3] for code in codes])
+        result = np.round(low + (high - low) * rng.normal(0.5, 0.4, size), 2)
+        values.update(
+            testCode=codes, testName=np.array([TESTS[code][0] for code in codes]),
+            prescName=np.array([TESTS[code][0] for code in codes]),
+            unit=np.array([TESTS[code][1] for code in codes]),
+            result=result, normalLow=low, normalHigh=high,
+            normalFlag=np.where(result > high, "H", np.where(result < low, "L", "N")),
+            normalRange=np.char.add(np.char.add(low.astype(str), "-"), high.astype(str)),
+        )
+    elif dataset == "surgery":
+        values["surgCode"], values["surgName"] = _coded(rng, size, SURGERIES)
+        values["specimen"] = np.where(rng.random(size) < 0.4, "Y", "N")
+        values["anesthesia"] = np.array(ANESTHESIA)[rng.integers(0, len(ANESTHESIA), size)]
+    elif dataset == "pathology":
+        values["pathType"], values["pathTypeName"] = _coded(rng, size, PATHOLOGY)
+        values["prescCode"] = np.char.add("P", values["pathType"])
+        values["prescName"] = values["pathTypeName"]
+        for key in ("pathFindings", "pathFindings2", "grossFindings", "grossFindings2"):
+            values[key] = np.array(FINDINGS)[rng.integers(0, len(FINDINGS), size)]
+
+    return {column: values.get(column, np.full(size, "")) for column in columns}
+
+
+def _python_rows(chunk: dict, columns):
+    return zip(*(chunk[column].tolist() for column in columns))
+
+
+def write_sqlite(path: Path, catalog: dict, chunks_for):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        for dataset, columns in catalog.items():
+            column_list = ", ".join(f'"{column}"' for column in columns)
+            conn.execute(f'CREATE TABLE "{dataset}" ({column_list})')
+            placeholders = ", ".join("?" for _ in columns)
+            for chunk in chunks_for(dataset, columns):
+                conn.executemany(f'INSERT INTO "{dataset}" VALUES ({placeholders})', _python_rows(chunk, columns))
+            conn.commit()
+    finally:
+        conn.close()
+
+
+def write_parquet(path: Path, catalog: dict, chunks_for):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        sys.exit("Parquet 스냅샷을 만들려면 pyarrow 가 필요합니다 (pip install pyarrow)")
+    path.mkdir(parents=True, exist_ok=True)
+    for dataset, columns in catalog.items():
+        writer = None
+        try:
+            for chunk in chunks_for(dataset, columns):
+                table = pa.table({column: chunk[column] for column in columns})
+                if writer is None:
+                    writer = pq.ParquetWriter(path / f"{dataset}.parquet", table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="합성 임상 데이터 웨어하우스 스냅샷 생성")
+    parser.add_argument("--output", default="warehouse/warehouse.db",
+                        help="SQLite 파일 (--format sqlite) 또는 디렉터리 (--format parquet)")
+    parser.add_argument("--format", choices=["sqlite", "parquet"], default="sqlite")
+    parser.add_argument("--patients", type=int, default=10000, help="환자 수")
+    parser.add_argument("--rows-per-patient", type=int, default=20, help="데이터 종류별 환자당 평균 행 수")
+    parser.add_argument("--chunk-rows", type=int, default=100000, help="한 번에 생성/기록할 행 수")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rng = np.random.default_rng(args.seed)
+    catalog = load_catalog()
+    patients = {
+        "id": np.char.add("P", np.char.zfill(np.arange(1, args.patients + 1).astype(str), 8)),
+        "birth": _dates(rng, args.patients, start="1940-01-01", days=365 * 80),
+        "gender": np.where(rng.random(args.patients) < 0.5, "M", "F"),
+    }
+    total_rows = args.patients * args.rows_per_patient
+
+    def chunks_for(dataset, columns):
+        for offset in range(0, total_rows, args.chunk_rows):
+            yield generate_chunk(rng, dataset, columns, patients, min(args.chunk_rows, total_rows - offset))
+
+    started = time.perf_counter()
+    writer = write_sqlite if args.format == "sqlite" else write_parquet
+    writer(Path(args.output), catalog, chunks_for)
+    print(f"{args.output}: 데이터 종류 {len(catalog)}개 x {total_rows:,}행 ({time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+타기관 결합 (EXTERNAL_LINKAGE) 스크립트 (app.services.linkage)
+
+두 기관이 같은 비밀 값(--secret-file)과 결합 건 ID(--scope, 보통 신청서 ID)로 각자 식별정보 CSV 를 부호화하고,
+CLK 파일(.npy)만 결합 수행 측에 넘깁니다. 결과는 각 기관 CSV 의 데이터 행 번호(0부터) 쌍과 Dice 점수입니다.
+
+사용 예 (backend 디렉터리에서 실행):
+    python scripts/linkage.py encode --secret-file secret.txt --scope <신청서 ID> identities.csv ours.npy
+    python scripts/linkage.py link ours.npy theirs.npy pairs.csv --threshold 0.85 --workers 8
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 경로 설정
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.linkage import (  # noqa: E402
+    DEFAULT_LINKAGE_FIELDS,
+    CLKEncoder,
+    LSHBlocking,
+    default_workers,
+    derive_linkage_key,
+    link,
+    write_pairs,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="타기관 결합 (식별정보 없이 CLK 로 연계)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    encode = commands.add_parser("encode", help="식별정보 CSV -> CLK 파일 (.npy)")
+    encode.add_argument("source", help="식별정보 CSV (UTF-8, 첫 행은 헤더)")
+    encode.add_argument("output", help="CLK 파일 경로 (.npy)")
+    encode.add_argument("--secret-file", required=True, help="두 기관이 합의한 비밀 값 파일")
+    encode.add_argument("--scope", required=True, help="결합 건 ID (보통 신청서 ID, 두 기관이 같아야 함)")
+    encode.add_argument("--field", action="append", metavar="COLUMN=HASHES",
+                        help=f"결합 컬럼과 q-gram 당 비트 수 (여러 번 지정, 기본: {DEFAULT_LINKAGE_FIELDS})")
+    encode.add_argument("--bits", type=int, default=1024)
+
+    link_command = commands.add_parser("link", help="두 CLK 파일 결합 -> 쌍 CSV")
+    link_command.add_argument("a", help="A 기관 CLK 파일")
+    link_command.add_argument("b", help="B 기관 CLK 파일")
+    link_command.add_argument("output", help="결과 CSV (a_row, b_row, score)")
+    link_command.add_argument("--threshold", type=float, default=0.8, help="Dice 계수 하한")
+    link_command.add_argument("--bands", type=int, default=LSHBlocking.bands)
+    link_command.add_argument("--band-bits", type=int, default=LSHBlocking.band_bits)
+    link_command.add_argument("--workers", type=int, default=default_workers())
+    link_command.add_argument("--all-pairs", action="store_true", help="1:1 로 고르지 않고 threshold 이상 모든 쌍")
+    return parser.parse_args(argv)
+
+
+def parse_fields(values):
+    if not values:
+        return dict(DEFAULT_LINKAGE_FIELDS)
+    fields = {}
+    for value in values:
+        column, _, hashes = value.partition("=")
+        fields[column] = int(hashes) if hashes else 20
+    return fields
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    started = time.perf_counter()
+    if args.command == "encode":
+        secret = Path(args.secret_file).read_text(encoding="utf-8").strip()
+        encoder = CLKEncoder(
+            key=derive_linkage_key(secret, args.scope), fields=parse_fields(args.field), bits=args.bits
+        )
+        clks = encoder.encode_csv(args.source)
+        np.save(args.output, clks)
+        report = {"records": len(clks), "bits": encoder.bits}
+    else:
+        clks_a = np.load(args.a, mmap_mode="r")
+        clks_b = np.load(args.b, mmap_mode="r")
+        result = link(
+            clks_a,
+            clks_b,
+            threshold=args.threshold,
+            blocking=LSHBlocking(bands=args.bands, band_bits=args.band_bits),
+            workers=args.workers,
+            match_one_to_one=not args.all_pairs,
+        )
+        write_pairs(args.output, result)
+        report = {"a": len(clks_a), "b": len(clks_b), "candidates": result.candidates, "pairs": len(result)}
+    report["seconds"] = round(time.perf_counter() - started, 2)
+    print(json.dumps(report, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
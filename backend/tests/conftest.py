@@ -1,28 +1,38 @@
 """
 Test configuration and fixtures
 """
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("DATABASE_ECHO", "false")
+
 import pytest
 import asyncio
 from typing import AsyncGenerator
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.main import app
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db, get_write_db
 from app.core.security import get_password_hash
 
 
-# Use in-memory SQLite for tests
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Use in-memory SQLite for tests (TEST_DATABASE_URL 로 PostgreSQL 지정 가능: scripts/test_postgres.sh)
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
 
 # Create test engine
-test_engine = create_async_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=NullPool,
-)
+if TEST_DATABASE_URL.startswith("sqlite"):
+    # In-memory SQLite는 커넥션마다 별도 DB이므로 StaticPool로 단일 커넥션을 공유
+    test_engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+else:
+    # 테스트마다 이벤트 루프가 달라질 수 있으므로 커넥션을 재사용하지 않음
+    test_engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
 
 # Create test session factory
 TestSessionLocal = async_sessionmaker(
@@ -59,7 +69,8 @@ def override_get_db(db_session: AsyncSession):
     async def _override_get_db():
         yield db_session
     
-    app.dependency_overrides[get_db] = _override_get_db
+    for dependency in (get_db, get_read_db, get_write_db):
+        app.dependency_overrides[dependency] = _override_get_db
     yield
     app.dependency_overrides.clear()
 
@@ -129,4 +140,61 @@ async def admin_auth_headers(client: TestClient, test_admin):
         json={"email": "admin@aumc.ac.kr", "password": "adminpassword123"}
     )
     token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
\ No newline at end of file
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="function")
+async def async_client(override_get_db) -> AsyncGenerator:
+    """Create an async client that runs on the test event loop."""
+    import httpx
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def query_counter():
+    """Count SQL statements executed against the test engine.
+    
+    Usage:
+        with query_counter() as counter:
+            await async_client.get(...)
+        counter.assert_at_most(3)
+    """
+    from tests.query_counter import QueryCounter
+    
+    return lambda: QueryCounter(test_engine.sync_engine)
+
+
+@pytest.fixture
+def make_application(db_session: AsyncSession):
+    """Create an application owned by the given user.
+    
+    The instance is expunged after commit so routes load it fresh, the same way
+    they do with a per-request session.
+    """
+    from app.models import Application, ApplicationStatus
+    
+    async def _make_application(owner, status=ApplicationStatus.SUBMITTED, **fields):
+        application = Application(
+            user_id=owner.id,
+            applicant_name=owner.name,
+            applicant_department=owner.department or "",
+            applicant_email=owner.email,
+            status=status,
+            project_name=fields.pop("project_name", "Test project"),
+            applicant_phone="010-0000-0000",
+            principal_investigator="PI",
+            pi_department="Test Department",
+            irb_number="IRB-0001",
+            service_types=fields.pop("service_types", ["STRUCTURED_EXTRACTION"]),
+            target_patients="Patients admitted in 2024",
+            request_details="Diagnosis and lab results for cohort study",
+            **fields,
+        )
+        db_session.add(application)
+        await db_session.commit()
+        db_session.expunge(application)
+        return application
+    
+    return _make_application
@@ -0,0 +1,36 @@
+"""
+SQL statement counting helpers for query-budget tests
+"""
+from typing import List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """Context manager that records every statement executed on an engine."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.statements: List[str] = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(" ".join(statement.split()))
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def assert_at_most(self, budget: int, label: str = "block"):
+        if self.count > budget:
+            listing = "\n".join(f"  {index}. {statement}" for index, statement in enumerate(self.statements, 1))
+            raise AssertionError(
+                f"{label} executed {self.count} SQL statements (budget {budget}):\n{listing}"
+            )
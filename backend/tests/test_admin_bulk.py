@@ -0,0 +1,87 @@
+"""
+Admin bulk operation tests (/api/admin/users/bulk, /api/admin/applications/bulk-delete)
+"""
+from contextlib import contextmanager
+
+from sqlalchemy import event, select
+
+from app.core.security import create_access_token, get_password_hash
+from app.models import Application, ApplicationLog, LogAction, User, UserRole
+from tests.conftest import test_engine
+
+
+def _headers(user) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': user.id})}"}
+
+
+@contextmanager
+def concurrent_write(table: str, sql: str):
+    """일괄 처리의 SELECT 와 UPDATE 사이에 다른 관리자의 변경(sql)이 먼저 커밋된 상황"""
+    done = []
+
+    def run_first(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith(f"UPDATE {table}") and not done:
+            done.append(statement)
+            conn.exec_driver_sql(sql)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", run_first)
+    try:
+        yield done
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", run_first)
+
+
+async def test_bulk_delete_reports_rows_deleted_after_select(db_session, test_user, test_admin, async_client,
+                                                             make_application):
+    kept = await make_application(test_user)
+    raced = await make_application(test_user, project_name="raced")
+
+    with concurrent_write(
+        "applications", "UPDATE applications SET dcyn = 'Y', deletion_reason = 'first' WHERE project_name = 'raced'"
+    ) as done:
+        response = await async_client.post(
+            "/api/admin/applications/bulk-delete",
+            headers=_headers(test_admin),
+            json={"application_ids": [raced.id, kept.id], "reason": "second"},
+        )
+
+    assert done
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (1, 1)
+    assert [(item["id"], item["success"]) for item in body["results"]] == [(raced.id, False), (kept.id, True)]
+    assert body["results"][0]["detail"] == "Application was modified concurrently"
+    # 먼저 삭제한 요청의 삭제 정보는 그대로이고, 삭제 로그도 실제로 삭제한 행만
+    reasons = dict((await db_session.execute(select(Application.id, Application.deletion_reason))).all())
+    assert reasons == {kept.id: "second", raced.id: "first"}
+    logged = (await db_session.execute(
+        select(ApplicationLog.application_id).where(ApplicationLog.action == LogAction.DELETED)
+    )).scalars().all()
+    assert logged == [kept.id]
+
+
+async def test_bulk_activate_skips_users_deleted_after_select(db_session, test_user, test_admin, async_client):
+    other = User(email="other@aumc.ac.kr", hashed_password=get_password_hash("password123"), name="Other",
+                 role=UserRole.RESEARCHER, is_active=False, dcyn='N')
+    db_session.add(other)
+    await db_session.commit()
+    other_id, user_id = other.id, test_user.id
+
+    with concurrent_write(
+        "users", "UPDATE users SET dcyn = 'Y', is_active = 0 WHERE email = 'other@aumc.ac.kr'"
+    ) as done:
+        response = await async_client.post(
+            "/api/admin/users/bulk",
+            headers=_headers(test_admin),
+            json={"user_ids": [other_id, user_id], "action": "activate"},
+        )
+
+    assert done
+    body = response.json()
+    assert [(item["id"], item["success"]) for item in body["results"]] == [(other_id, False), (user_id, True)]
+    assert body["results"][0]["detail"] == "User was modified concurrently"
+    db_session.expire_all()
+    # 삭제된 사용자가 다시 활성화되지 않음 (dcyn='Y', is_active=True 인 행이 생기지 않음)
+    rows = (await db_session.execute(
+        select(User.id, User.dcyn, User.is_active).where(User.id.in_([other_id, user_id]))
+    )).all()
+    assert {row[0]: tuple(row[1:]) for row in rows} == {other_id: ("Y", False), user_id: ("N", True)}
@@ -0,0 +1,61 @@
+"""
+Researcher application list cache tests (app.services.application_cache)
+"""
+import pytest
+from sqlalchemy import select
+
+from app.core.security import create_access_token
+from app.db.session import get_db, get_read_db, get_write_db
+from app.main import app
+from app.models import User
+from app.services.application_cache import invalidate_application_lists
+from tests.conftest import TestSessionLocal
+from tests.test_query_budget import APPLICATION_FIELDS
+
+
+async def _generation(db, user_id) -> int:
+    return await db.scalar(select(User.applications_generation).where(User.id == user_id))
+
+
+async def test_generation_counts_invalidations_without_touching_user_row(db_session, test_user, make_application):
+    user_id, version = test_user.id, test_user.version
+    application = await make_application(test_user)
+    assert await _generation(db_session, user_id) == 0
+
+    await invalidate_application_lists(db_session, user_ids=[user_id])
+    await invalidate_application_lists(db_session, application_ids=[application.id, application.id])
+    await db_session.commit()
+
+    assert await _generation(db_session, user_id) == 2
+    db_session.expire_all()
+    assert await db_session.scalar(select(User.version).where(User.id == user_id)) == version
+
+
+@pytest.fixture
+def per_request_sessions(async_client):
+    """운영 환경처럼 요청마다 새 세션 (공유 세션의 식별자 맵에 남은 사용자 행의 세대를 읽지 않도록)"""
+    async def _session():
+        async with TestSessionLocal() as session:
+            yield session
+
+    for dependency in (get_db, get_read_db, get_write_db):
+        app.dependency_overrides[dependency] = _session
+    return async_client
+
+
+async def test_list_cache_is_invalidated_by_writes(test_user, per_request_sessions, make_application):
+    async_client = per_request_sessions
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': test_user.id})}"}
+    await make_application(test_user, project_name="first")
+
+    first = await async_client.get("/api/applications/", headers=headers)
+    cached = await async_client.get("/api/applications/", headers=headers)
+    assert first.headers["ETag"] == cached.headers["ETag"]
+
+    created = await async_client.post(
+        "/api/applications/", headers=headers, json={**APPLICATION_FIELDS, "project_name": "second"}
+    )
+    assert created.status_code == 200, created.text
+
+    after = await async_client.get("/api/applications/", headers=headers)
+    assert sorted(item["project_name"] for item in after.json()) == ["first", "second"]
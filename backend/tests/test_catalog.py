@@ -0,0 +1,91 @@
+"""
+Data catalog snapshot tests (app.services.catalog, /api/catalog)
+"""
+import pytest
+from sqlalchemy import update
+
+from app.api import catalog as catalog_api
+from app.core.security import create_access_token
+from app.models import CatalogColumn, CatalogDataset
+from app.services import catalog as catalog_service
+from app.services.catalog import CatalogRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """테스트마다 빈 스냅샷에서 시작 (리비전 확인 주기는 길게 두고 필요한 테스트에서 줄임)"""
+    registry = CatalogRegistry(refresh_seconds=3600)
+    monkeypatch.setattr(catalog_service, "catalog_registry", registry)
+    monkeypatch.setattr(catalog_api, "catalog_registry", registry)
+    return registry
+
+
+@pytest.fixture
+async def diagnosis(db_session):
+    dataset = CatalogDataset(key="diagnosis", name="진단", title="진단 데이터", sort_order=1)
+    other = CatalogDataset(key="lab", name="검사", title="검사 데이터", sort_order=0)
+    db_session.add_all([dataset, other])
+    await db_session.flush()
+    db_session.add_all([
+        CatalogColumn(dataset_id=dataset.id, key="diagName", label="진단명", sort_order=2),
+        CatalogColumn(dataset_id=dataset.id, key="diagCode", label="진단코드", sort_order=1),
+        CatalogColumn(dataset_id=dataset.id, key="legacy", label="이전 항목", dcyn="Y"),
+    ])
+    await db_session.commit()
+    return dataset
+
+
+async def test_snapshot_lists_active_rows_in_order(db_session, diagnosis, registry):
+    snapshot = await registry.get(db_session)
+
+    assert [dataset.key for dataset in snapshot.catalog.datasets] == ["lab", "diagnosis"]
+    assert [column.key for column in snapshot.catalog.datasets[1].columns] == ["diagCode", "diagName"]
+    # 삭제된 행은 내용에서 빠지지만 리비전에는 포함
+    assert snapshot.revision == 5
+    assert snapshot.unknown_columns(["diagnosis.diagCode", "diagnosis.legacy", "lab.x"]) == [
+        "diagnosis.legacy", "lab.x"
+    ]
+
+
+async def test_snapshot_is_reused_until_revision_changes(db_session, diagnosis, registry, query_counter):
+    first = await registry.get(db_session)
+    with query_counter() as counter:
+        assert await registry.get(db_session) is first
+    assert counter.count == 0
+
+    # 다른 워커의 변경은 확인 주기가 지나야 반영
+    await db_session.execute(
+        update(CatalogDataset).where(CatalogDataset.key == "lab").values(title="검사 결과", version=CatalogDataset.version + 1)
+    )
+    await db_session.commit()
+    assert await registry.get(db_session) is first
+
+    registry.refresh_seconds = 0
+    refreshed = await registry.get(db_session)
+    assert refreshed.revision == first.revision + 1
+    assert refreshed.catalog.datasets[0].title == "검사 결과"
+    assert (registry.checks, registry.loads) == (1, 2)
+
+    # 리비전이 같으면 다시 읽지 않음
+    assert await registry.get(db_session) is refreshed
+    assert (registry.checks, registry.loads) == (2, 2)
+
+
+async def test_admin_change_is_visible_on_next_request(diagnosis, registry, test_admin, async_client):
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': test_admin.id})}"}
+    before = await async_client.get("/api/catalog/")
+    assert (await async_client.get("/api/catalog/", headers={"If-None-Match": before.headers["ETag"]})).status_code == 304
+
+    response = await async_client.put(
+        "/api/catalog/diagnosis/columns/diagDate", headers=headers, json={"label": "진단일자", "sort_order": 3}
+    )
+    assert response.status_code == 200, response.text
+
+    after = await async_client.get("/api/catalog/diagnosis", headers={"If-None-Match": before.headers["ETag"]})
+    assert after.status_code == 200
+    assert [column["key"] for column in after.json()["columns"]] == ["diagCode", "diagName", "diagDate"]
+
+    response = await async_client.delete("/api/catalog/diagnosis/columns/diagName", headers=headers)
+    assert response.status_code == 200, response.text
+    columns = (await async_client.get("/api/catalog/diagnosis")).json()["columns"]
+    assert [column["key"] for column in columns] == ["diagCode", "diagDate"]
@@ -0,0 +1,187 @@
+"""
+Request session routing tests (app.db.session: get_db / get_read_db / get_write_db against file databases)
+
+conftest 의 db_session 은 모든 의존성을 쓰기 가능한 세션 하나로 바꾸므로, 여기서는 실제 의존성을
+임시 SQLite 파일(기본 DB / 복제본)에 연결해 요청 메서드별 세션 선택을 확인합니다.
+"""
+from collections import Counter
+
+import httpx
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import InvalidRequestError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+from app.core.security import create_access_token, get_password_hash
+from app.db import session as session_module
+from app.db.base import Base
+from app.main import app
+from app.models import Application, User, UserRole
+
+APPLICATION = {
+    "project_name": "Replica routing",
+    "applicant_phone": "010-0000-0000",
+    "principal_investigator": "PI",
+    "pi_department": "Test Department",
+    "irb_number": "IRB-0001",
+    "service_types": ["STRUCTURED_EXTRACTION"],
+    "target_patients": "Patients admitted in 2024",
+    "request_details": "Diagnosis and lab results for cohort study",
+}
+
+
+def _request(method: str) -> Request:
+    return Request({"type": "http", "method": method, "path": "/", "headers": [], "query_string": b""})
+
+
+async def _create_schema(url: str):
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+class Databases:
+    """app.db.session 의 엔진/세션 팩토리를 임시 파일 DB 로 교체"""
+
+    def __init__(self, tmp_path, monkeypatch):
+        self.tmp_path = tmp_path
+        self.monkeypatch = monkeypatch
+        self.engines = []
+
+    async def use(self, *, replica: bool = False, read_engine: bool = True):
+        """
+        replica: 복제본(별도 파일)으로 조회 / read_engine=False: 조회 전용 엔진 없이 기본 엔진으로 조회
+        (복제본이 없는 PostgreSQL 과 같은 구성)
+        """
+        primary_url = f"sqlite+aiosqlite:///{self.tmp_path / 'primary.db'}"
+        read_url = f"sqlite+aiosqlite:///{self.tmp_path / 'replica.db'}" if replica else primary_url
+        for url in {primary_url, read_url}:
+            await _create_schema(url)
+        self.primary = create_async_engine(primary_url, **session_module.engine_options(primary_url))
+        self.read = session_module.create_read_engine(read_url) if read_engine else None
+        self.engines += [engine for engine in (self.primary, self.read) if engine is not None]
+
+        patch = self.monkeypatch.setattr
+        patch(session_module, "engine", self.primary)
+        patch(session_module, "read_engine", self.read)
+        patch(session_module, "read_replica", replica)
+        patch(session_module, "read_your_writes", session_module.ReadYourWrites(window=60))
+        patch(session_module, "AsyncSessionLocal", async_sessionmaker(
+            self.primary, class_=AsyncSession, expire_on_commit=False, autoflush=False
+        ))
+        patch(session_module, "AsyncReadSessionLocal", session_module._read_sessionmaker(self.read or self.primary))
+        patch(session_module, "AsyncPrimaryReadSessionLocal", session_module._read_sessionmaker(self.primary))
+        return self
+
+    async def add_user(self, **fields) -> str:
+        """기본 DB 와 (복제된 것처럼) 복제본 파일 모두에 같은 사용자 추가"""
+        user_id = None
+        for url in {str(self.primary.url), str((self.read or self.primary).url)}:
+            engine = create_async_engine(url)
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                user = User(id=user_id, hashed_password=get_password_hash("password123"), is_active=True, dcyn="N",
+                            **fields)
+                db.add(user)
+                await db.commit()
+                user_id = user.id
+            await engine.dispose()
+        return user_id
+
+    async def close(self):
+        for engine in self.engines:
+            await engine.dispose()
+
+
+@pytest.fixture
+async def databases(tmp_path, monkeypatch):
+    app.dependency_overrides.clear()
+    databases = Databases(tmp_path, monkeypatch)
+    yield databases
+    await databases.close()
+
+
+async def test_get_session_is_read_only(databases):
+    await databases.use()
+    dependency = session_module.get_db(_request("GET"))
+    db = await dependency.__anext__()
+    try:
+        # ORM 변경은 before_flush 에서, 직접 실행한 쓰기는 query_only 커넥션에서 거부
+        db.add(User(email="new@aumc.ac.kr", hashed_password="x", name="New", role=UserRole.RESEARCHER))
+        with pytest.raises(InvalidRequestError, match="읽기 전용 세션"):
+            await db.flush()
+        db.expunge_all()
+        with pytest.raises(OperationalError, match="readonly"):
+            await db.execute(text("DELETE FROM users"))
+    finally:
+        await dependency.aclose()
+
+    # 쓰기 요청은 기본 DB 세션을 받고 요청이 끝나면 커밋
+    dependency = session_module.get_db(_request("POST"))
+    db = await dependency.__anext__()
+    db.add(User(email="new@aumc.ac.kr", hashed_password="x", name="New", role=UserRole.RESEARCHER))
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+    async with session_module.AsyncReadSessionLocal() as db:
+        assert await db.scalar(select(User.email)) == "new@aumc.ac.kr"
+
+
+async def test_write_then_read_by_same_user_uses_primary(databases):
+    await databases.use(replica=True)
+    user_id = await databases.add_user(email="researcher@aumc.ac.kr", name="Researcher", role=UserRole.RESEARCHER)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user_id})}"}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        created = await client.post("/api/applications/", headers=headers, json=APPLICATION)
+        assert created.status_code == 200, created.text
+        application_id = created.json()["id"]
+
+        # 복제본에는 아직 없지만, 방금 쓴 사용자의 조회는 기본 DB 로 감
+        response = await client.get(f"/api/applications/{application_id}", headers=headers)
+        assert response.status_code == 200, response.text
+        assert session_module.read_your_writes.primary_fallbacks == 1
+
+        # read-your-writes 기간이 지나면 다시 복제본에서 조회
+        session_module.read_your_writes.window = 0
+        session_module.read_your_writes._deadlines.clear()
+        response = await client.get(f"/api/applications/{application_id}", headers=headers)
+        assert response.status_code == 404
+
+    async with session_module.AsyncPrimaryReadSessionLocal() as db:
+        assert await db.scalar(select(Application.project_name)) == "Replica routing"
+
+
+@pytest.mark.parametrize("read_engine", [True, False], ids=["query-only-engine", "primary-engine"])
+async def test_get_session_never_commits_and_is_closed(databases, read_engine):
+    await databases.use(read_engine=read_engine)
+    bind = (databases.read or databases.primary).sync_engine
+    counts = Counter()
+    listeners = [
+        (bind, "commit", lambda conn: counts.update(["commit"])),
+        (bind.pool, "checkout", lambda dbapi_conn, record, proxy: counts.update(["checkout"])),
+        (bind.pool, "checkin", lambda dbapi_conn, record: counts.update(["checkin"])),
+    ]
+    for target, name, listener in listeners:
+        event.listen(target, name, listener)
+    try:
+        # 정상 종료: 요청이 끝나도 커밋하지 않고 커넥션만 반환
+        dependency = session_module.get_db(_request("GET"))
+        db = await dependency.__anext__()
+        assert db.info["read_only"]
+        assert await db.scalar(select(User.id)) is None
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+        assert not db.in_transaction()
+
+        # 처리 중 오류: 예외는 그대로 전달되고 커넥션은 반환
+        dependency = session_module.get_db(_request("GET"))
+        db = await dependency.__anext__()
+        await db.execute(select(User.id))
+        with pytest.raises(RuntimeError):
+            await dependency.athrow(RuntimeError("handler failed"))
+    finally:
+        for target, name, listener in listeners:
+            event.remove(target, name, listener)
+
+    assert counts == Counter({"checkout": 2, "checkin": 2})
@@ -0,0 +1,78 @@
+"""
+Clinical document de-identification tests (app.services.deidentification)
+"""
+import io
+import json
+import re
+from collections import Counter
+from datetime import date
+
+from app.services.deidentification import Deidentifier, NameAutomaton, deidentify_stream
+
+KEY = b"k" * 32
+NOTE = "홍길동님은 2023-01-05 입원, 2023-01-12 퇴원. 연락처 010-1234-5678, 주민번호 600501-1234567, 등록번호: 12345678"
+
+
+def test_all_kinds_are_replaced_keeping_format():
+    deidentifier = Deidentifier(key=KEY, names=("홍길동",), date_shift_days=10)
+
+    text, counts = deidentifier.deidentify(NOTE, "doc-1")
+
+    assert counts == Counter({"date": 2, "name": 1, "phone": 1, "rrn": 1, "record": 1})
+    for original in ("홍길동", "2023-01-05", "1234-5678", "600501-1234567", "12345678"):
+        assert original not in text
+    # 번호는 구분 기호와 자릿수, 전화번호 앞자리는 그대로
+    assert re.fullmatch(
+        r"[가-힣]{3}님은 \d{4}-\d{2}-\d{2} 입원, \d{4}-\d{2}-\d{2} 퇴원\. "
+        r"연락처 010-\d{4}-\d{4}, 주민번호 \d{6}-\d{7}, 등록번호: \d{8}",
+        text,
+    )
+    # 같은 키면 같은 결과 (문서가 달라도 같은 대체 이름)
+    assert deidentifier.deidentify(NOTE, "doc-1")[0] == text
+    assert deidentifier.deidentify("홍길동 외래", "doc-2")[0].split()[0] == text[:3]
+
+
+def test_dates_in_document_keep_their_interval():
+    text, _ = Deidentifier(key=KEY, kinds=("date",)).deidentify("2023-01-05 ~ 2023.1.12 ~ 2023년 1월 19일", "doc-1")
+
+    # 원래 표기 형식은 유지하고, 문서 안의 날짜는 모두 같은 일수만큼 이동
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2} ~ \d{4}\.\d{1,2}\.\d{1,2} ~ \d{4}년 \d{1,2}월 \d{1,2}일", text)
+    shifted = [date(*map(int, re.findall(r"\d+", value))) for value in text.split(" ~ ")]
+    assert shifted[0] != date(2023, 1, 5)
+    assert [(day - shifted[0]).days for day in shifted] == [0, 7, 14]
+
+
+def test_name_only_kinds_skip_regex_matching():
+    deidentifier = Deidentifier(key=KEY, names=("홍길동",), kinds=("name",))
+
+    text, counts = deidentifier.deidentify(NOTE, "doc-1")
+
+    assert counts == Counter({"name": 1})
+    assert "홍길동" not in text and text.endswith(NOTE[3:])
+
+
+def test_no_kinds_leaves_text_untouched():
+    assert Deidentifier(key=KEY, names=("홍길동",), kinds=()).deidentify(NOTE) == (NOTE, Counter())
+
+
+def test_name_automaton_prefers_longest_name():
+    # 각 위치에서 끝나는 가장 긴 이름만 ("철수" 는 "김철수" 와 같은 위치에서 끝남)
+    automaton = NameAutomaton(["김철", "김철수", "철수"])
+
+    assert list(automaton.finditer("환자 김철수씨")) == [(3, 5), (3, 6)]
+    spans = Deidentifier(key=KEY, names=("김철", "김철수", "철수"), kinds=("name",)).spans("환자 김철수씨")
+    assert spans == [(3, 6, "name")]
+
+
+def test_stream_deidentifies_each_document():
+    source = io.StringIO("".join(json.dumps({"id": str(index), "text": NOTE}, ensure_ascii=False) + "\n"
+                                 for index in range(3)))
+    target = io.StringIO()
+
+    stats = deidentify_stream(source, target, Deidentifier(key=KEY, names=("홍길동",)), block_bytes=100)
+
+    documents = [json.loads(line) for line in target.getvalue().splitlines()]
+    assert [document["id"] for document in documents] == ["0", "1", "2"]
+    assert all("홍길동" not in document["text"] for document in documents)
+    assert (stats.documents, stats.blocks, stats.counts["name"]) == (3, 3, 3)
+
@@ -0,0 +1,96 @@
+"""
+Conditional request tests (app.core.etag: If-Match 412 / If-None-Match 304 on applications and users)
+"""
+import pytest
+
+from app.core.security import create_access_token
+from app.models import ApplicationStatus
+
+
+def _headers(user, **extra) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': user.id})}", **extra}
+
+
+async def test_application_get_returns_304_for_current_etag(test_user, async_client, make_application):
+    application = await make_application(test_user)
+
+    response = await async_client.get(f"/api/applications/{application.id}", headers=_headers(test_user))
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    # 신청서 version + 신청자 version
+    assert etag == '"1.1"'
+
+    cached = await async_client.get(
+        f"/api/applications/{application.id}", headers=_headers(test_user, **{"If-None-Match": f'W/{etag}'})
+    )
+    assert (cached.status_code, cached.headers["ETag"], cached.content) == (304, etag, b"")
+
+    other = await async_client.get(
+        f"/api/applications/{application.id}", headers=_headers(test_user, **{"If-None-Match": '"0.1"'})
+    )
+    assert other.status_code == 200
+
+
+async def test_application_update_rejects_stale_if_match(test_user, async_client, make_application):
+    application = await make_application(test_user, status=ApplicationStatus.DRAFT)
+    url = f"/api/applications/{application.id}"
+
+    updated = await async_client.put(url, headers=_headers(test_user, **{"If-Match": '"1"'}),
+                                     json={"project_name": "first"})
+    assert (updated.status_code, updated.headers["ETag"]) == (200, '"2"')
+
+    # 이미 읽은 version 1 로 다시 수정하면 412, 내용은 그대로
+    stale = await async_client.put(url, headers=_headers(test_user, **{"If-Match": '"1"'}),
+                                   json={"project_name": "second"})
+    assert stale.status_code == 412
+    submitted = await async_client.post(f"{url}/submit", headers=_headers(test_user, **{"If-Match": '"1"'}))
+    assert submitted.status_code == 412
+    current = await async_client.get(url, headers=_headers(test_user))
+    assert (current.json()["project_name"], current.json()["status"]) == ("first", "DRAFT")
+
+
+@pytest.mark.parametrize("if_match", ['"abc"', 'W/"1"', '""'])
+async def test_application_update_rejects_unparseable_if_match(test_user, async_client, make_application, if_match):
+    application = await make_application(test_user, status=ApplicationStatus.DRAFT)
+
+    response = await async_client.put(f"/api/applications/{application.id}",
+                                      headers=_headers(test_user, **{"If-Match": if_match}),
+                                      json={"project_name": "changed"})
+
+    assert response.status_code == 412
+    current = await async_client.get(f"/api/applications/{application.id}", headers=_headers(test_user))
+    assert current.json()["project_name"] == "Test project"
+
+
+async def test_user_list_returns_304_for_current_etag(test_user, test_admin, async_client):
+    response = await async_client.get("/api/admin/users", headers=_headers(test_admin))
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    cached = await async_client.get("/api/admin/users", headers=_headers(test_admin, **{"If-None-Match": etag}))
+    assert (cached.status_code, cached.headers["ETag"]) == (304, etag)
+
+    # 사용자를 수정하면 목록 ETag 가 바뀜
+    updated = await async_client.put(f"/api/admin/users/{test_user.id}", headers=_headers(test_admin),
+                                     json={"department": "Changed"})
+    assert updated.status_code == 200
+    changed = await async_client.get("/api/admin/users", headers=_headers(test_admin, **{"If-None-Match": etag}))
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.parametrize("if_match", ['"0"', '"abc"', 'W/"1"'], ids=["stale", "unparseable", "weak-only"])
+async def test_user_update_rejects_failed_if_match(test_user, test_admin, async_client, if_match):
+    user_id, department = test_user.id, test_user.department
+
+    response = await async_client.put(f"/api/admin/users/{user_id}",
+                                      headers=_headers(test_admin, **{"If-Match": if_match}),
+                                      json={"department": "Changed"})
+    toggled = await async_client.post(f"/api/admin/users/{user_id}/toggle-active",
+                                      headers=_headers(test_admin, **{"If-Match": if_match}))
+
+    assert (response.status_code, toggled.status_code) == (412, 412)
+    users = (await async_client.get("/api/admin/users", headers=_headers(test_admin))).json()
+    user = next(user for user in users if user["id"] == user_id)
+    assert (user["department"], user["is_active"], user["version"]) == (department, True, 1)
@@ -0,0 +1,117 @@
+"""
+Application change feed tests (app.core.events, /api/events/applications resume)
+"""
+from datetime import timedelta
+
+from app.api import events as events_api
+from app.core.config import settings
+from app.core.events import EventBus, bus, event_from_log
+from app.db.base import get_korean_time
+from app.models import ApplicationLog, LogAction
+
+
+class _ConnectedRequest:
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+async def _logs(db, application, actor, actions):
+    """actions 순서대로 1초 간격의 감사 로그 기록"""
+    started = get_korean_time() - timedelta(minutes=1)
+    logs = [
+        ApplicationLog(application_id=application.id, user_id=actor.id, action=action,
+                       created_at=started + timedelta(seconds=offset))
+        for offset, action in enumerate(actions)
+    ]
+    db.add_all(logs)
+    await db.commit()
+    return logs
+
+
+async def _open_stream(db, admin, last_event_id):
+    response = await events_api.stream_application_events(
+        _ConnectedRequest(), last_event_id=last_event_id, last_event_id_param=None, current_user=admin, db=db
+    )
+    return response.body_iterator
+
+
+async def test_resume_replays_events_after_last_event_id(db_session, test_user, test_admin, make_application):
+    application = await make_application(test_user)
+    first, downloaded, submitted, approved = await _logs(
+        db_session, application, test_admin,
+        [LogAction.CREATED, LogAction.DOWNLOADED, LogAction.SUBMITTED, LogAction.APPROVED],
+    )
+
+    stream = await _open_stream(db_session, test_admin, first.id)
+    try:
+        assert (await stream.__anext__()).startswith("retry:")
+        replayed = [await stream.__anext__(), await stream.__anext__()]
+    finally:
+        await stream.aclose()
+
+    # 다운로드 로그는 이벤트가 아니므로 건너뛰고, 기준 이벤트 이후만 순서대로
+    assert [chunk.splitlines()[0] for chunk in replayed] == [f"id: {submitted.id}", f"id: {approved.id}"]
+    assert replayed[1].splitlines()[1] == "event: application.reviewed"
+    assert bus.subscriber_count == 0
+
+
+async def test_resume_skips_live_events_already_replayed(db_session, test_user, test_admin, make_application):
+    application = await make_application(test_user)
+    anchor, replayed = await _logs(db_session, application, test_admin, [LogAction.CREATED, LogAction.UPDATED])
+
+    stream = await _open_stream(db_session, test_admin, anchor.id)
+    try:
+        await stream.__anext__()
+        assert (await stream.__anext__()).startswith(f"id: {replayed.id}\n")
+        # 구독 후 조회 전에 커밋된 로그는 실시간으로도 도착하므로 한 번만 보내야 함
+        bus.publish([event_from_log(replayed.id, application.id, test_admin.id, replayed.action, replayed.created_at)])
+        live = ApplicationLog(application_id=application.id, user_id=test_admin.id, action=LogAction.SUBMITTED)
+        db_session.add(live)
+        await db_session.commit()
+        assert (await stream.__anext__()).startswith(f"id: {live.id}\n")
+    finally:
+        await stream.aclose()
+
+
+async def test_resume_resets_when_anchor_is_unknown_or_too_old(db_session, test_user, test_admin, make_application,
+                                                               monkeypatch):
+    application = await make_application(test_user)
+    logs = await _logs(db_session, application, test_admin, [LogAction.CREATED] + [LogAction.UPDATED] * 3)
+    monkeypatch.setattr(settings, "EVENTS_RESUME_LIMIT", 2)
+
+    for last_event_id in ("missing-event-id", logs[0].id):
+        stream = await _open_stream(db_session, test_admin, last_event_id)
+        try:
+            await stream.__anext__()
+            assert await stream.__anext__() == "event: reset\ndata: {}\n\n"
+        finally:
+            await stream.aclose()
+
+
+async def test_commit_publishes_and_rollback_discards(db_session, test_user, test_admin, make_application):
+    application = await make_application(test_user)
+    admin_id = test_admin.id  # 롤백 후에는 만료되므로 미리 읽어 둠
+    subscription = bus.subscribe()
+    try:
+        db_session.add(ApplicationLog(application_id=application.id, user_id=admin_id, action=LogAction.REJECTED))
+        await db_session.flush()
+        await db_session.rollback()
+        assert subscription.queue.empty()
+
+        log = ApplicationLog(application_id=application.id, user_id=admin_id, action=LogAction.COMPLETED)
+        db_session.add(log)
+        await db_session.commit()
+        published = await subscription.get(timeout=1)
+        assert (published.id, published.type) == (log.id, "application.status_changed")
+    finally:
+        subscription.close()
+
+
+def test_slow_subscriber_is_dropped():
+    small_bus = EventBus(buffer_size=1)
+    slow = small_bus.subscribe()
+    small_bus.publish([object(), object()])
+
+    assert slow.overflowed
+    assert small_bus.subscriber_count == 0
+    assert small_bus.dropped_subscribers == 1
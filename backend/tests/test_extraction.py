@@ -0,0 +1,115 @@
+"""
+Structured extraction tests (app.services.extraction, warehouse snapshot -> ZIP)
+"""
+import csv
+import io
+import sqlite3
+import zipfile
+
+import pytest
+
+from app.core.config import settings
+from app.models import Extraction, ExtractionStatus
+from app.services.extraction import deliver, run_extraction_job
+from app.services.pseudonymization import Pseudonymizer
+
+DIAGNOSIS_ROWS = [
+    ("p1", "E11.9", "2024-01-10"),
+    ("p1", "I10", "2024-02-01"),
+    ("p2", "J45.9", "2024-03-05"),
+    ("p3", "E11.9", "2024-04-20"),
+]
+PATIENT_ROWS = [("p1", "1960-05-01", "M"), ("p2", "1975-07-15", "F"), ("p3", "1982-11-30", "F")]
+
+DIABETES = {"dataset": "diagnosis", "conditions": [{"column": "diagCode", "op": "prefix", "value": "E11"}]}
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    """diagnosis / patient 두 데이터 종류만 있는 SQLite 스냅샷"""
+    path = tmp_path / "warehouse.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute('CREATE TABLE diagnosis (id TEXT, "diagCode" TEXT, date TEXT)')
+        conn.execute("CREATE TABLE patient (id TEXT, birth TEXT, sex TEXT)")
+        conn.executemany("INSERT INTO diagnosis VALUES (?, ?, ?)", DIAGNOSIS_ROWS)
+        conn.executemany("INSERT INTO patient VALUES (?, ?, ?)", PATIENT_ROWS)
+    conn.close()
+    return path
+
+
+def read_archive(path) -> dict:
+    """ZIP 의 <데이터 종류>.csv -> 헤더 포함 행 목록"""
+    with zipfile.ZipFile(path) as archive:
+        return {
+            name: list(csv.reader(io.TextIOWrapper(archive.open(name), encoding="utf-8-sig", newline="")))
+            for name in archive.namelist()
+        }
+
+
+def test_deliver_writes_requested_columns_for_cohort(warehouse, tmp_path):
+    path = tmp_path / "out" / "result.zip"
+
+    progress = deliver(warehouse, ["patient.sex", "diagnosis.diagCode", "patient.birth"], DIABETES, path, chunk_rows=2)
+
+    assert read_archive(path) == {
+        "patient.csv": [["sex", "birth"], ["M", "1960-05-01"], ["F", "1982-11-30"]],
+        "diagnosis.csv": [["diagCode"], ["E11.9"], ["I10"], ["E11.9"]],
+    }
+    assert progress.cohort_size == 2
+    assert (progress.rows_scanned, progress.rows_written, progress.fraction) == (11, 5, 1.0)
+    assert not list(path.parent.glob("*.part"))
+
+
+def test_pseudonymized_delivery_never_exposes_patient_ids(warehouse, tmp_path):
+    path = tmp_path / "result.zip"
+    dates_only = Pseudonymizer(key=b"k" * 32, rules={"date": "date_shift"})
+    with pytest.raises(ValueError, match="id 컬럼의 hmac 또는 drop"):
+        deliver(warehouse, ["diagnosis.date"], DIABETES, path, chunk_rows=2, pseudonymizer=dates_only)
+    assert not path.exists()
+
+    # 날짜 이동을 위해 함께 추출한 id 는 drop 규칙이면 결과에서 빠짐
+    dropped = Pseudonymizer(key=b"k" * 32, rules={"id": "drop", "date": "date_shift"})
+    deliver(warehouse, ["diagnosis.date", "patient.sex"], DIABETES, path, chunk_rows=2, pseudonymizer=dropped)
+    archive = read_archive(path)
+    assert archive["patient.csv"] == [["sex"], ["M"], ["F"]]
+    assert archive["diagnosis.csv"][0] == ["date"]
+    assert len(archive["diagnosis.csv"]) == 4
+    assert not {"2024-01-10", "2024-02-01", "2024-04-20"} & {row[0] for row in archive["diagnosis.csv"][1:]}
+
+
+async def test_extraction_job_records_result(db_session, test_user, test_admin, make_application, warehouse,
+                                             tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "EXTRACTION_WAREHOUSE_PATH", str(warehouse))
+    monkeypatch.setattr(settings, "EXTRACTION_OUTPUT_DIR", str(tmp_path / "deliveries"))
+    application = await make_application(test_user)
+    extraction = Extraction(application_id=application.id, requested_by=test_admin.id,
+                            columns=["diagnosis.id", "diagnosis.date"], cohort=DIABETES)
+    db_session.add(extraction)
+    await db_session.commit()
+
+    result = await run_extraction_job(db_session, {"extraction_id": extraction.id})
+
+    assert (extraction.status, extraction.progress, extraction.cohort_size) == (ExtractionStatus.SUCCEEDED, 1.0, 2)
+    assert result["rows_written"] == extraction.rows_written == 3
+    assert read_archive(extraction.file_path)["diagnosis.csv"] == [
+        ["id", "date"], ["p1", "2024-01-10"], ["p1", "2024-02-01"], ["p3", "2024-04-20"]
+    ]
+    # 다시 실행되어도(at-least-once) 이미 만든 결과를 그대로 둠
+    assert await run_extraction_job(db_session, {"extraction_id": extraction.id}) == {"skipped": "already_succeeded"}
+
+
+async def test_extraction_job_marks_failure(db_session, test_user, test_admin, make_application, warehouse,
+                                            tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "EXTRACTION_WAREHOUSE_PATH", str(warehouse))
+    monkeypatch.setattr(settings, "EXTRACTION_OUTPUT_DIR", str(tmp_path / "deliveries"))
+    application = await make_application(test_user)
+    extraction = Extraction(application_id=application.id, requested_by=test_admin.id,
+                            columns=["diagnosis.unknown"], cohort=DIABETES)
+    db_session.add(extraction)
+    await db_session.commit()
+
+    with pytest.raises(Exception, match="unknown"):
+        await run_extraction_job(db_session, {"extraction_id": extraction.id})
+
+    assert extraction.status == ExtractionStatus.FAILED
+    assert "unknown" in extraction.error
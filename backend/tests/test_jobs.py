@@ -0,0 +1,154 @@
+"""
+Background job runner tests (app.services.jobs)
+"""
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from app.db.base import get_korean_time
+from app.models import Job, JobStatus
+from app.services import jobs
+from tests.conftest import TestSessionLocal
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """테스트 작업만 등록된 빈 작업 목록"""
+    definitions = {}
+    monkeypatch.setattr(jobs, "JOB_DEFINITIONS", definitions)
+    return definitions
+
+
+@pytest.fixture
+def runner():
+    return jobs.JobRunner(TestSessionLocal, stale_after=60)
+
+
+async def _job(db, job_id) -> Job:
+    db.expire_all()
+    return (await db.execute(select(Job).where(Job.id == job_id))).scalar_one()
+
+
+async def test_claimed_job_runs_and_stores_result(db_session, registry, runner):
+    @jobs.job("test.echo")
+    async def echo(db, payload):
+        return {"echo": payload["value"]}
+
+    job_row = jobs.enqueue(db_session, "test.echo", {"value": 7})
+    await db_session.commit()
+
+    claimed = await runner._claim()
+    assert claimed.id == job_row.id and claimed.attempts == 1
+    # 이미 RUNNING 인 작업은 다른 워커가 다시 가져가지 않음
+    assert await jobs.JobRunner(TestSessionLocal)._claim() is None
+
+    await runner._execute(claimed)
+    stored = await _job(db_session, job_row.id)
+    assert (stored.status, stored.result, stored.locked_by) == (JobStatus.SUCCEEDED, {"echo": 7}, None)
+    assert runner.succeeded == 1
+
+
+async def test_failed_job_backs_off_then_gives_up(db_session, registry, runner):
+    @jobs.job("test.broken", max_attempts=2)
+    async def broken(db, payload):
+        raise RuntimeError("boom")
+
+    job_row = jobs.enqueue(db_session, "test.broken")
+    await db_session.commit()
+
+    await runner._execute(await runner._claim())
+    stored = await _job(db_session, job_row.id)
+    assert stored.status == JobStatus.PENDING
+    assert stored.attempts == 1 and "RuntimeError: boom" in stored.last_error
+    # backoff 동안은 가져가지 않음
+    assert await runner._claim() is None
+
+    await db_session.execute(update(Job).where(Job.id == job_row.id).values(run_at=get_korean_time()))
+    await db_session.commit()
+    await runner._execute(await runner._claim())
+    stored = await _job(db_session, job_row.id)
+    assert (stored.status, stored.attempts) == (JobStatus.FAILED, 2)
+    assert (runner.retried, runner.failed) == (1, 1)
+
+
+async def test_recover_stale_jobs_requeues_abandoned_work(db_session, registry):
+    now = get_korean_time()
+    long_ago = now - timedelta(hours=1)
+    abandoned = Job(name="test.any", status=JobStatus.RUNNING, run_at=long_ago, attempts=1, max_attempts=3,
+                    locked_by="dead-worker", started_at=long_ago, updated_at=long_ago)
+    # 오래전에 시작했어도 heartbeat 가 최근이면 아직 실행 중
+    long_running = Job(name="test.any", status=JobStatus.RUNNING, run_at=long_ago, attempts=1, max_attempts=3,
+                       locked_by="live-worker", started_at=long_ago, updated_at=now)
+    db_session.add_all([abandoned, long_running])
+    await db_session.commit()
+    abandoned_id, long_running_id = abandoned.id, long_running.id
+
+    assert await jobs.recover_stale_jobs(db_session, stale_after=60) == 1
+    await db_session.commit()
+    assert (await _job(db_session, abandoned_id)).status == JobStatus.PENDING
+    assert (await _job(db_session, long_running_id)).locked_by == "live-worker"
+
+
+async def test_recover_stale_jobs_fails_jobs_out_of_attempts(db_session, registry):
+    # 워커를 계속 죽이는 작업: 시도 횟수를 다 쓰면 다시 실행하지 않음 (정형 추출은 max_attempts=1)
+    long_ago = get_korean_time() - timedelta(hours=1)
+    crashing = Job(name="extraction.structured", status=JobStatus.RUNNING, run_at=long_ago, attempts=1,
+                   max_attempts=1, locked_by="killed-worker", started_at=long_ago, updated_at=long_ago)
+    db_session.add(crashing)
+    await db_session.commit()
+    crashing_id = crashing.id
+
+    assert await jobs.recover_stale_jobs(db_session, stale_after=60) == 0
+    await db_session.commit()
+    stored = await _job(db_session, crashing_id)
+    assert (stored.status, stored.locked_by) == (JobStatus.FAILED, None)
+    assert "stopped responding" in stored.last_error and stored.finished_at is not None
+    # 다음 스케줄러 실행에서도 다시 대기 상태가 되지 않음
+    assert await jobs.recover_stale_jobs(db_session, stale_after=60) == 0
+
+
+async def test_running_job_heartbeat_prevents_recovery(db_session, registry, runner):
+    release = asyncio.Event()
+
+    @jobs.job("test.slow")
+    async def slow(db, payload):
+        await release.wait()
+        return None
+
+    job_row = jobs.enqueue(db_session, "test.slow")
+    await db_session.commit()
+    claimed = await runner._claim()
+    long_ago = get_korean_time() - timedelta(hours=1)
+    await db_session.execute(update(Job).where(Job.id == job_row.id).values(started_at=long_ago, updated_at=long_ago))
+    await db_session.commit()
+
+    runner.heartbeat_interval = 0.01
+    execution = asyncio.create_task(runner._execute(claimed))
+    try:
+        for _ in range(100):
+            if (await _job(db_session, job_row.id)).updated_at.replace(tzinfo=None) > long_ago.replace(tzinfo=None):
+                break
+            await asyncio.sleep(0.01)
+        assert await jobs.recover_stale_jobs(db_session, stale_after=60) == 0
+        await db_session.commit()
+    finally:
+        release.set()
+        await execution
+
+    stored = await _job(db_session, job_row.id)
+    assert (stored.status, stored.attempts) == (JobStatus.SUCCEEDED, 1)
+
+
+async def test_periodic_jobs_are_scheduled_once(db_session, registry):
+    @jobs.job("test.periodic", every=3600)
+    async def periodic(db, payload):
+        return None
+
+    assert await jobs.schedule_periodic_jobs(db_session) == 1
+    await db_session.commit()
+    assert await jobs.schedule_periodic_jobs(db_session) == 0
+
+    names = (await db_session.execute(select(Job.name))).scalars().all()
+    assert names == ["test.periodic"]
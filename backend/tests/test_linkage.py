@@ -0,0 +1,76 @@
+"""
+Privacy-preserving record linkage tests (app.services.linkage)
+"""
+import numpy as np
+import pytest
+
+from app.services.linkage import CLKEncoder, LinkageResult, derive_linkage_key, dice, link, one_to_one, qgrams
+
+PEOPLE_A = {
+    "name": ["홍길동", "김철수", "이영희", "박민수"],
+    "birth": ["1960-05-01", "1975-07-15", "1982-11-30", "1990-01-01"],
+    "sex": ["M", "M", "F", "M"],
+}
+# 순서가 다르고 표기 차이/오타가 있는 다른 기관 명단 (박민수는 없고 최지은은 A 에 없음)
+PEOPLE_B = {
+    "name": ["이영희", "최지은", "홍 길동", "김철주"],
+    "birth": ["1982/11/30", "1988-03-03", "19600501", "1975-07-15"],
+    "sex": ["f", "F", "M", "M"],
+}
+
+
+@pytest.fixture
+def encoder():
+    return CLKEncoder(key=derive_linkage_key("shared-secret", "linkage-1"))
+
+
+def test_qgrams_are_padded():
+    assert qgrams("홍길동") == ["_홍", "홍길", "길동", "동_"]
+    assert qgrams("") == []
+
+
+def test_encoding_ignores_formatting_but_depends_on_key(encoder):
+    a = encoder.encode(PEOPLE_A)
+    b = encoder.encode(PEOPLE_B)
+
+    assert a.shape == (4, encoder.words) and a.dtype == np.uint64
+    # 공백/구분 기호/대소문자만 다르면 같은 CLK
+    assert dice(a[[2, 0]], b[[0, 2]]).tolist() == [1.0, 1.0]
+    assert 0.7 < dice(a[[1]], b[[3]])[0] < 1.0
+    other_key = CLKEncoder(key=derive_linkage_key("shared-secret", "linkage-2")).encode(PEOPLE_A)
+    assert dice(a, other_key).max() < 0.5
+    assert dice(np.zeros((1, encoder.words), dtype=np.uint64), np.zeros((1, encoder.words), dtype=np.uint64))[0] == 0
+
+
+def test_link_finds_matching_records(encoder):
+    result = link(encoder.encode(PEOPLE_A), encoder.encode(PEOPLE_B), threshold=0.8)
+
+    pairs = sorted(zip(result.a.tolist(), result.b.tolist()))
+    assert pairs == [(0, 2), (1, 3), (2, 0)]
+    assert result.scores.min() >= 0.8
+    assert 0 < result.candidates < 4 * 4
+
+
+def test_one_to_one_keeps_best_pair_per_record():
+    result = LinkageResult(a=np.array([0, 0, 1]), b=np.array([0, 1, 1]), scores=np.array([0.9, 0.95, 0.85]))
+
+    matched = one_to_one(result)
+
+    assert list(zip(matched.a.tolist(), matched.b.tolist())) == [(0, 1)]
+
+
+def test_link_rejects_different_encodings(encoder):
+    small = CLKEncoder(key=encoder.key, bits=512)
+    with pytest.raises(ValueError, match="CLK 비트 수"):
+        link(encoder.encode(PEOPLE_A), small.encode(PEOPLE_B))
+
+
+def test_link_with_workers_matches_single_process(encoder):
+    clks_a, clks_b = encoder.encode(PEOPLE_A), encoder.encode(PEOPLE_B)
+
+    single = link(clks_a, clks_b, threshold=0.8, chunk_rows=1)
+    pooled = link(clks_a, clks_b, threshold=0.8, chunk_rows=1, workers=2)
+
+    assert list(zip(pooled.a.tolist(), pooled.b.tolist())) == list(zip(single.a.tolist(), single.b.tolist()))
+    assert pooled.candidates == single.candidates
+    assert np.allclose(pooled.scores, single.scores)
@@ -0,0 +1,110 @@
+"""
+Batched last-login recording tests (app.services.login_activity)
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, select
+
+from app.core.security import create_access_token
+from app.models import User
+from app.services import login_activity as login_activity_module
+from app.services.login_activity import FLUSH_STATEMENT, LoginActivityRecorder
+from tests.conftest import TestSessionLocal, test_engine
+
+
+@pytest.fixture
+async def recorder(monkeypatch):
+    """커밋 훅이 기록할 대상을 테스트용 기록기로 교체"""
+    recorder = LoginActivityRecorder(flush_interval=3600, max_pending=100)
+    monkeypatch.setattr(login_activity_module, "login_activity", recorder)
+    yield recorder
+    await recorder.stop()
+
+
+async def _last_login(db, user_id):
+    db.expire_all()
+    return await db.scalar(select(User.last_login_at).where(User.id == user_id))
+
+
+async def test_logins_are_buffered_until_flush(db_session, test_user, recorder):
+    user_id = test_user.id
+    await recorder.start(TestSessionLocal)
+    first = datetime(2026, 10, 19, 9, 0)
+
+    await recorder.record(db_session, user_id, first)
+    await db_session.rollback()
+    assert recorder.pending == 0
+
+    await recorder.record(db_session, user_id, first)
+    await recorder.record(db_session, user_id, first + timedelta(minutes=5))
+    await db_session.commit()
+    assert recorder.pending == 1
+    assert await _last_login(db_session, user_id) is None
+
+    assert await recorder.flush() == 1
+    assert await _last_login(db_session, user_id) == first + timedelta(minutes=5)
+
+
+async def test_older_flush_does_not_overwrite_newer_login(db_session, test_user, recorder):
+    user_id = test_user.id
+    newer = datetime(2026, 10, 19, 12, 0)
+    await recorder.record(db_session, user_id, newer)  # 실행 중이 아니면 바로 UPDATE
+    await db_session.commit()
+    assert recorder.direct_writes == 1
+
+    await recorder.start(TestSessionLocal)
+    await recorder.record(db_session, user_id, newer - timedelta(hours=1))
+    await db_session.commit()
+    await recorder.flush()
+
+    assert await _last_login(db_session, user_id) == newer
+
+
+async def test_full_buffer_flushes_early_and_stop_flushes_rest(db_session, test_user, test_admin, recorder):
+    user_id, admin_id = test_user.id, test_admin.id
+    recorder.max_pending = 2
+    await recorder.start(TestSessionLocal)
+    logged_in_at = datetime(2026, 10, 19, 9, 0)
+
+    for pending_user_id in (user_id, admin_id):
+        await recorder.record(db_session, pending_user_id, logged_in_at)
+    await db_session.commit()
+    for _ in range(50):
+        if recorder.flushes:
+            break
+        await asyncio.sleep(0.01)
+    assert (recorder.flushes, recorder.flushed_rows) == (1, 2)
+
+    await recorder.record(db_session, user_id, logged_in_at + timedelta(minutes=1))
+    await db_session.commit()
+    await recorder.stop()
+    assert recorder.pending == 0
+    assert await _last_login(db_session, user_id) == logged_in_at + timedelta(minutes=1)
+
+
+async def test_login_flush_does_not_invalidate_admin_edit(db_session, test_user, test_admin, async_client):
+    user_id = test_user.id
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': test_admin.id})}"}
+    logged_in_at = datetime(2026, 10, 19, 9, 0)
+    flushed = []
+
+    def flush_between_read_and_write(conn, cursor, statement, parameters, context, executemany):
+        # 관리자 수정이 사용자를 읽은 뒤, UPDATE 하기 전에 로그인 시각 일괄 기록이 끝난 상황
+        if statement.startswith("UPDATE users SET") and not flushed:
+            flushed.append(statement)
+            conn.execute(FLUSH_STATEMENT, [{"b_id": user_id, "b_at": logged_in_at}])
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", flush_between_read_and_write)
+    try:
+        response = await async_client.put(
+            f"/api/admin/users/{user_id}", headers={**headers, "If-Match": '"1"'}, json={"department": "Cardiology"}
+        )
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", flush_between_read_and_write)
+
+    assert flushed
+    assert response.status_code == 200, response.text
+    assert (response.json()["department"], response.headers["ETag"]) == ("Cardiology", '"2"')
+    assert await _last_login(db_session, user_id) == logged_in_at
@@ -0,0 +1,125 @@
+"""
+Migration tests (alembic/versions against a SQLite file)
+"""
+import json
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.base import Base
+from app.db.migrations import (
+    ALEMBIC_DIR,
+    ALEMBIC_INI,
+    compute_schema_fingerprint,
+    ensure_schema,
+    read_stored_fingerprint,
+    schema_fingerprint_table,
+)
+
+
+def upgrade(conn, revision: str):
+    """열린 커넥션으로 alembic upgrade (app.db.migrations 와 같은 방식)"""
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.attributes["connection"] = conn
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, revision)
+
+
+def schema_differences(conn) -> list:
+    """DB 스키마와 모델 metadata 의 차이 (마이그레이션으로만 만드는 테이블은 제외)"""
+    context = MigrationContext.configure(conn, opts={"compare_type": True})
+    differences = []
+    for difference in compare_metadata(context, Base.metadata):
+        operation, target = difference[0], difference[1]
+        table = getattr(target, "table", target)
+        if operation in ("remove_table", "remove_index") and table.name not in Base.metadata.tables:
+            continue
+        differences.append(difference)
+    return differences
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    return tmp_path / "migrations.db"
+
+
+@pytest.fixture
+def sync_engine(database_path):
+    engine = create_engine(f"sqlite:///{database_path}")
+    yield engine
+    engine.dispose()
+
+
+async def _ensure_schema_twice(database_path) -> list:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+    try:
+        outcomes = [await ensure_schema(engine), await ensure_schema(engine)]
+        assert await read_stored_fingerprint(engine) == compute_schema_fingerprint()
+    finally:
+        await engine.dispose()
+    return outcomes
+
+
+# SQLite 는 식 인덱스(lower(...))를 리플렉션하지 못해 비교에서 제외된다는 경고
+@pytest.mark.filterwarnings("ignore::UserWarning", "ignore:Skipped unsupported reflection")
+async def test_ensure_schema_migrates_empty_database(database_path, sync_engine):
+    assert await _ensure_schema_twice(database_path) == ["migrated", "current"]
+
+    with sync_engine.connect() as conn:
+        assert schema_differences(conn) == []
+        assert conn.execute(select(schema_fingerprint_table.c.id)).scalars().all() == [1]
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning", "ignore:Skipped unsupported reflection")
+async def test_ensure_schema_upgrades_legacy_baseline(database_path, sync_engine):
+    # create_all 로 만든 기존 DB: 기준 리비전 스키마에 alembic_version 테이블이 없음
+    with sync_engine.begin() as conn:
+        upgrade(conn, "0001")
+        conn.exec_driver_sql("DROP TABLE alembic_version")
+        conn.exec_driver_sql(
+            "INSERT INTO users (id, email, hashed_password, name, role, is_active, dcyn, created_at, updated_at)"
+            " VALUES ('5f0c1a9e-3b2d-4c8e-9a71-2d4e6f8b0c13', 'legacy@aumc.ac.kr', 'x', 'Legacy', 'RESEARCHER', 1, 'N',"
+            " '2026-01-01', '2026-01-01')"
+        )
+
+    assert await _ensure_schema_twice(database_path) == ["migrated", "current"]
+
+    with sync_engine.connect() as conn:
+        assert schema_differences(conn) == []
+        # 기존 행은 그대로 남고 키는 0010 에서 바이너리 UUID 로 변환
+        assert conn.exec_driver_sql("SELECT hex(id) FROM users WHERE email = 'legacy@aumc.ac.kr'").scalar() == (
+            "5F0C1A9E3B2D4C8E9A712D4E6F8B0C13"
+        )
+
+
+def test_0009_backfills_service_types_mask(sync_engine):
+    with sync_engine.begin() as conn:
+        upgrade(conn, "0008")
+        for index, service_types in enumerate([
+            ["STRUCTURED_EXTRACTION"],
+            ["UNSTRUCTURED_EXTRACTION", "EXTERNAL_LINKAGE"],
+            ["PSEUDONYMIZATION", "UNKNOWN"],
+            [],
+        ]):
+            conn.exec_driver_sql(
+                "INSERT INTO applications (id, user_id, project_name, applicant_name, applicant_department,"
+                " applicant_phone, applicant_email, principal_investigator, pi_department, irb_number,"
+                " service_types, target_patients, request_details, status, dcyn, created_at, updated_at, version)"
+                " VALUES (?, 'u', 'p', 'a', 'd', '010', 'a@aumc.ac.kr', 'pi', 'd', 'irb', ?, 't', 'r',"
+                " 'SUBMITTED', 'N', '2026-01-01', '2026-01-01', 1)",
+                (f"app-{index}", json.dumps(service_types)),
+            )
+
+        upgrade(conn, "0009")
+
+        masks = dict(conn.exec_driver_sql("SELECT id, service_types_mask FROM applications").all())
+        indexes = {row[1] for row in conn.exec_driver_sql("PRAGMA index_list(applications)")}
+    # 알 수 없는 유형은 무시, 빈 목록은 기본값 0
+    assert masks == {"app-0": 0b1, "app-1": 0b1010, "app-2": 0b100, "app-3": 0}
+    assert "ix_applications_service_types_mask_created" in indexes
@@ -0,0 +1,48 @@
+"""
+Ordered process pool helper tests (app.services.process_pool)
+"""
+import time
+
+import pytest
+
+from app.services.process_pool import create_pool, map_in_order
+
+
+def _slow_square(value: int) -> int:
+    # 앞 블록이 늦게 끝나도 결과는 입력 순서대로
+    time.sleep(0.05 if value % 3 == 0 else 0)
+    return value * value
+
+
+def test_results_are_consumed_in_input_order_with_bounded_backlog():
+    submitted = []
+    results = []
+
+    def arguments():
+        for value in range(12):
+            # 소비한 결과 수보다 workers * 2 개 넘게 앞서 제출하지 않음
+            assert len(submitted) - len(results) <= 4
+            submitted.append(value)
+            yield (value,)
+
+    map_in_order(_slow_square, arguments(), results.append, workers=2)
+
+    assert results == [value * value for value in range(12)]
+
+
+def test_consumer_error_cancels_pending_blocks_and_keeps_given_pool():
+    pool = create_pool(2)
+    results = []
+
+    def consume(result):
+        results.append(result)
+        raise RuntimeError("write failed")
+
+    try:
+        with pytest.raises(RuntimeError, match="write failed"):
+            map_in_order(_slow_square, ((value,) for value in range(100)), consume, workers=2, pool=pool)
+        assert results == [0]
+        # 넘겨받은 풀은 닫지 않음
+        assert pool.submit(_slow_square, 4).result() == 16
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
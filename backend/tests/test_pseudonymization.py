@@ -0,0 +1,68 @@
+"""
+Pseudonymization rule tests (app.services.pseudonymization, extraction request rules)
+"""
+import io
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.extraction import ExtractionCreate
+from app.services.pseudonymization import Pseudonymizer, derive_key, pseudonymize_stream
+
+COHORT = {"dataset": "diagnosis", "conditions": [{"column": "diagCode", "op": "eq", "value": "I10"}]}
+
+
+def _pseudonymizer(rules, **options) -> Pseudonymizer:
+    return Pseudonymizer(key=derive_key("secret", "application-1"), rules=rules, **options)
+
+
+def _days(value: str) -> int:
+    return date.fromisoformat(value[:10]).toordinal()
+
+
+def test_request_requires_patient_id_rule():
+    assert ExtractionCreate(cohort=COHORT, pseudonymization={}).pseudonymization.rules[0].column == "id"
+    ExtractionCreate(cohort=COHORT, pseudonymization={"rules": [{"column": "id", "method": "drop"}]})
+
+    for rules in ([{"column": "birth", "method": "year"}], [{"column": "id", "method": "year"}]):
+        with pytest.raises(ValidationError, match="id 컬럼의 hmac 또는 drop"):
+            ExtractionCreate(cohort=COHORT, pseudonymization={"rules": rules})
+
+
+def test_rules_transform_each_column():
+    pseudonymizer = _pseudonymizer({"id": "hmac", "birth": "year", "date": "date_shift", "name": "drop"},
+                                   date_shift_days=10)
+    header = ["id", "name", "birth", "date", "sex"]
+    rows = [
+        ["p1", "홍길동", "1960-05-01", "2024-01-10 09:30", "M"],
+        ["p1", "홍길동", "1960-05-01", "2024-01-20", "M"],
+        ["p2", "김철수", "1975-07-15", "2024-03-05", "F"],
+    ]
+
+    assert pseudonymizer.output_header(header) == ["id", "birth", "date", "sex"]
+    output = pseudonymizer.transform(header, rows)
+
+    ids = [row[0] for row in output]
+    assert ids[0] == ids[1] != ids[2] and len(ids[0]) == 20 and "p1" not in ids
+    assert [row[1] for row in output] == ["1960", "1960", "1975"]
+    assert [row[3] for row in output] == ["M", "M", "F"]
+    # 같은 환자의 날짜는 같은 일수만큼 이동하므로 간격이 유지되고, 시각은 그대로
+    first, second = output[0][2], output[1][2]
+    assert first.endswith(" 09:30") and first[:10] != "2024-01-10"
+    shift = _days(first) - _days("2024-01-10")
+    assert 1 <= abs(shift) <= 10 and _days(second) - _days("2024-01-20") == shift
+
+
+def test_same_key_gives_same_pseudonyms_across_files():
+    rules = {"id": "hmac"}
+    first = _pseudonymizer(rules).transform(["id"], [["p1"]])
+    assert _pseudonymizer(rules).transform(["id"], [["p1"]]) == first
+    other_application = Pseudonymizer(key=derive_key("secret", "application-2"), rules=rules)
+    assert other_application.transform(["id"], [["p1"]]) != first
+
+
+def test_date_shift_without_patient_column_fails():
+    source = io.StringIO("date\n2024-01-10\n")
+    with pytest.raises(ValueError, match="id 컬럼이 필요합니다"):
+        pseudonymize_stream(source, io.StringIO(), _pseudonymizer({"date": "date_shift"}), chunk_rows=10)
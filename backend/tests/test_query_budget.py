@@ -0,0 +1,317 @@
+"""
+Per-route SQL query budget tests
+
+Each route in auth.py, applications.py and admin.py runs its success path once
+while every SQL statement is counted. The upper bound for each route lives in
+query_budgets.json; when a route goes over budget the test fails with the full
+list of statements it executed. Lower the budget when a route gets cheaper.
+"""
+import io
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import admin, applications, auth
+from app.core.crypto import encrypt_string
+from app.core.rate_limit import limiter
+from app.core.security import create_access_token, create_refresh_token
+from app.models import Application, ApplicationStatus, RefreshToken, PasswordResetToken
+
+BUDGETS = json.loads((Path(__file__).parent / "query_budgets.json").read_text(encoding="utf-8"))
+
+APPLICATION_FIELDS = {
+    "project_name": "Query budget project",
+    "applicant_phone": "010-0000-0000",
+    "principal_investigator": "PI",
+    "pi_department": "Test Department",
+    "irb_number": "IRB-0001",
+    "service_types": ["STRUCTURED_EXTRACTION"],
+    "target_patients": "Patients admitted in 2024",
+    "request_details": "Diagnosis and lab results for cohort study",
+}
+
+
+@dataclass
+class RouteContext:
+    db: AsyncSession
+    user: object
+    admin: object
+    tmp_path: Path
+
+    @property
+    def user_headers(self) -> dict:
+        return {"Authorization": f"Bearer {create_access_token({'sub': self.user.id})}"}
+
+    @property
+    def admin_headers(self) -> dict:
+        return {"Authorization": f"Bearer {create_access_token({'sub': self.admin.id})}"}
+
+    async def application(self, status: ApplicationStatus = ApplicationStatus.SUBMITTED, **fields) -> Application:
+        application = Application(
+            user_id=self.user.id,
+            applicant_name=self.user.name,
+            applicant_department=self.user.department or "",
+            applicant_email=self.user.email,
+            status=status,
+            **{**APPLICATION_FIELDS, **fields},
+        )
+        self.db.add(application)
+        await self.db.commit()
+        return application
+
+
+@dataclass
+class RouteRequest:
+    method: str
+    url: str
+    expected_status: int = 200
+    kwargs: dict = field(default_factory=dict)
+
+
+CASES = {}
+
+
+def case(route: str):
+    def register(func):
+        CASES[route] = func
+        return func
+    return register
+
+
+# --- auth.py ---------------------------------------------------------------
+
+@case("POST /api/auth/register")
+async def _(ctx: RouteContext):
+    return RouteRequest("POST", "/api/auth/register", kwargs={"json": {
+        "email": encrypt_string("new-user@aumc.ac.kr"),
+        "password": encrypt_string("newpassword123"),
+        "name": "New User",
+    }})
+
+
+@case("POST /api/auth/login")
+async def _(ctx: RouteContext):
+    return RouteRequest("POST", "/api/auth/login", kwargs={"json": {
+        "email": encrypt_string("test@aumc.ac.kr"),
+        "password": encrypt_string("testpassword123"),
+    }})
+
+
+@case("POST /api/auth/refresh")
+async def _(ctx: RouteContext):
+    # 같은 초에 재발급되는 토큰과 값이 겹치지 않도록 jti 추가
+    token = create_refresh_token({"sub": ctx.user.id, "jti": "query-budget"})
+    ctx.db.add(RefreshToken(user_id=ctx.user.id, token=token, expires_at=_future()))
+    await ctx.db.commit()
+    return RouteRequest("POST", "/api/auth/refresh", kwargs={"params": {"refresh_token": token}})
+
+
+@case("GET /api/auth/me")
+async def _(ctx: RouteContext):
+    return RouteRequest("GET", "/api/auth/me", kwargs={"headers": ctx.user_headers})
+
+
+@case("POST /api/auth/password-reset/request")
+async def _(ctx: RouteContext):
+    return RouteRequest("POST", "/api/auth/password-reset/request", kwargs={"params": {"email": ctx.user.email}})
+
+
+@case("POST /api/auth/password-reset/confirm")
+async def _(ctx: RouteContext):
+    reset_token = PasswordResetToken.generate_token(ctx.user.id)
+    ctx.db.add(reset_token)
+    await ctx.db.commit()
+    return RouteRequest("POST", "/api/auth/password-reset/confirm", kwargs={
+        "params": {"token": reset_token.token, "new_password": "changedpassword123"},
+    })
+
+
+# --- applications.py -------------------------------------------------------
+
+@case("GET /api/applications/")
+async def _(ctx: RouteContext):
+    for _ in range(3):
+        await ctx.application()
+    return RouteRequest("GET", "/api/applications/", kwargs={"headers": ctx.user_headers})
+
+
+@case("POST /api/applications/")
+async def _(ctx: RouteContext):
+    return RouteRequest("POST", "/api/applications/", kwargs={"headers": ctx.user_headers, "json": APPLICATION_FIELDS})
+
+
+@case("GET /api/applications/{application_id}")
+async def _(ctx: RouteContext):
+    application = await ctx.application(ApplicationStatus.APPROVED, reviewed_by=ctx.admin.id)
+    return RouteRequest("GET", f"/api/applications/{application.id}", kwargs={"headers": ctx.user_headers})
+
+
+@case("PUT /api/applications/{application_id}")
+async def _(ctx: RouteContext):
+    application = await ctx.application(ApplicationStatus.DRAFT)
+    return RouteRequest("PUT", f"/api/applications/{application.id}", kwargs={
+        "headers": ctx.user_headers, "json": {"project_name": "Renamed project"},
+    })
+
+
+@case("POST /api/applications/{application_id}/submit")
+async def _(ctx: RouteContext):
+    application = await ctx.application(ApplicationStatus.DRAFT)
+    return RouteRequest("POST", f"/api/applications/{application.id}/submit", kwargs={"headers": ctx.user_headers})
+
+
+@case("POST /api/applications/{application_id}/review")
+async def _(ctx: RouteContext):
+    application = await ctx.application()
+    return RouteRequest("POST", f"/api/applications/{application.id}/review", kwargs={
+        "headers": ctx.admin_headers, "json": {"status": "APPROVED"},
+    })
+
+
+@case("POST /api/applications/{application_id}/upload/irb")
+async def _(ctx: RouteContext):
+    application = await ctx.application(ApplicationStatus.DRAFT)
+    return RouteRequest("POST", f"/api/applications/{application.id}/upload/irb", kwargs={
+        "headers": ctx.user_headers, "files": {"file": ("irb.pdf", io.BytesIO(b"%PDF-1.4"), "application/pdf")},
+    })
+
+
+@case("POST /api/applications/{application_id}/upload/research-plan")
+async def _(ctx: RouteContext):
+    application = await ctx.application(ApplicationStatus.DRAFT)
+    return RouteRequest("POST", f"/api/applications/{application.id}/upload/research-plan", kwargs={
+        "headers": ctx.user_headers, "files": {"file": ("plan.pdf", io.BytesIO(b"%PDF-1.4"), "application/pdf")},
+    })
+
+
+@case("DELETE /api/applications/{application_id}/delete-file/{file_type}")
+async def _(ctx: RouteContext):
+    application = await ctx.application(ApplicationStatus.DRAFT, irb_document_path="uploads/irb.pdf")
+    return RouteRequest("DELETE", f"/api/applications/{application.id}/delete-file/irb", kwargs={"headers": ctx.user_headers})
+
+
+@case("GET /api/applications/{application_id}/download/{file_type}")
+async def _(ctx: RouteContext):
+    document = ctx.tmp_path / "irb.pdf"
+    document.write_bytes(b"%PDF-1.4")
+    application = await ctx.application(irb_document_path=str(document))
+    return RouteRequest("GET", f"/api/applications/{application.id}/download/irb", kwargs={"headers": ctx.user_headers})
+
+
+@case("PUT /api/applications/{application_id}/status")
+async def _(ctx: RouteContext):
+    application = await ctx.application(ApplicationStatus.APPROVED)
+    return RouteRequest("PUT", f"/api/applications/{application.id}/status", kwargs={
+        "headers": ctx.admin_headers, "json": {"status": "PROCESSING"},
+    })
+
+
+# --- admin.py --------------------------------------------------------------
+
+@case("GET /api/admin/users")
+async def _(ctx: RouteContext):
+    return RouteRequest("GET", "/api/admin/users", kwargs={"headers": ctx.admin_headers})
+
+
+@case("GET /api/admin/users/search")
+async def _(ctx: RouteContext):
+    return RouteRequest("GET", "/api/admin/users/search", kwargs={
+        "headers": ctx.admin_headers, "params": {"q": "Test", "role": "RESEARCHER"},
+    })
+
+
+@case("PUT /api/admin/users/{user_id}")
+async def _(ctx: RouteContext):
+    return RouteRequest("PUT", f"/api/admin/users/{ctx.user.id}", kwargs={
+        "headers": ctx.admin_headers, "json": {"department": "New Department"},
+    })
+
+
+@case("DELETE /api/admin/users/{user_id}")
+async def _(ctx: RouteContext):
+    return RouteRequest("DELETE", f"/api/admin/users/{ctx.user.id}", kwargs={"headers": ctx.admin_headers})
+
+
+@case("POST /api/admin/users/{user_id}/toggle-active")
+async def _(ctx: RouteContext):
+    return RouteRequest("POST", f"/api/admin/users/{ctx.user.id}/toggle-active", kwargs={"headers": ctx.admin_headers})
+
+
+@case("POST /api/admin/users/bulk")
+async def _(ctx: RouteContext):
+    return RouteRequest("POST", "/api/admin/users/bulk", kwargs={
+        "headers": ctx.admin_headers, "json": {"user_ids": [ctx.user.id], "action": "deactivate"},
+    })
+
+
+@case("GET /api/admin/statistics")
+async def _(ctx: RouteContext):
+    await ctx.application()
+    return RouteRequest("GET", "/api/admin/statistics", kwargs={"headers": ctx.admin_headers})
+
+
+@case("DELETE /api/admin/applications/{application_id}")
+async def _(ctx: RouteContext):
+    application = await ctx.application()
+    return RouteRequest("DELETE", f"/api/admin/applications/{application.id}", kwargs={
+        "headers": ctx.admin_headers, "json": {"reason": "duplicate"},
+    })
+
+
+@case("POST /api/admin/applications/bulk-status")
+async def _(ctx: RouteContext):
+    application_ids = [(await ctx.application(ApplicationStatus.APPROVED)).id for _ in range(5)]
+    return RouteRequest("POST", "/api/admin/applications/bulk-status", kwargs={
+        "headers": ctx.admin_headers, "json": {"application_ids": application_ids, "status": "PROCESSING"},
+    })
+
+
+@case("POST /api/admin/applications/bulk-delete")
+async def _(ctx: RouteContext):
+    application_ids = [(await ctx.application()).id for _ in range(5)]
+    return RouteRequest("POST", "/api/admin/applications/bulk-delete", kwargs={
+        "headers": ctx.admin_headers, "json": {"application_ids": application_ids, "reason": "duplicate"},
+    })
+
+
+def _future():
+    from datetime import datetime, timedelta
+    return datetime.utcnow() + timedelta(days=1)
+
+
+def _declared_routes() -> set:
+    routes = set()
+    for router in (auth.router, applications.router, admin.router):
+        for route in router.routes:
+            for method in route.methods:
+                routes.add(f"{method} {route.path}")
+    return routes
+
+
+@pytest.fixture
+async def route_context(db_session, test_user, test_admin, tmp_path, monkeypatch):
+    # 업로드 파일은 상대 경로(uploads/...)에 저장되므로 임시 디렉토리에서 실행
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(limiter, "enabled", False)
+    return RouteContext(db=db_session, user=test_user, admin=test_admin, tmp_path=tmp_path)
+
+
+def test_every_route_has_a_budget():
+    declared = _declared_routes()
+    assert declared - set(BUDGETS) == set(), "routes without a query budget"
+    assert set(BUDGETS) - declared == set(), "budgets for routes that no longer exist"
+    assert set(CASES) == set(BUDGETS), "budget entries without a test case"
+
+
+@pytest.mark.parametrize("route", sorted(CASES))
+async def test_route_query_budget(route, route_context, async_client, query_counter):
+    request = await CASES[route](route_context)
+
+    with query_counter() as counter:
+        response = await async_client.request(request.method, request.url, **request.kwargs)
+
+    assert response.status_code == request.expected_status, response.text
+    counter.assert_at_most(BUDGETS[route], route)
@@ -0,0 +1,80 @@
+"""
+Service type mask tests (Application.service_types_mask, has_service_type, service_type filters)
+"""
+from sqlalchemy import select
+
+from app.core.security import create_access_token
+from app.models import Application, ApplicationStatus
+from app.models.application import ServiceType, masks_with, service_types_from_mask, service_types_mask
+
+
+def _headers(user) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': user.id})}"}
+
+
+async def _mask(db, application_id) -> int:
+    db.expire_all()
+    return await db.scalar(select(Application.service_types_mask).where(Application.id == application_id))
+
+
+def test_mask_helpers_round_trip():
+    mask = service_types_mask(["STRUCTURED_EXTRACTION", ServiceType.PSEUDONYMIZATION])
+
+    assert mask == 0b101
+    assert service_types_from_mask(mask) == [ServiceType.STRUCTURED_EXTRACTION, ServiceType.PSEUDONYMIZATION]
+    # 해당 비트를 포함하는 모든 마스크 (4가지 유형 -> 8개)
+    linkage = masks_with(ServiceType.EXTERNAL_LINKAGE)
+    assert len(linkage) == 8 and all(value & 0b1000 for value in linkage)
+
+
+async def test_mask_follows_service_types_on_insert_and_update(db_session, test_user, make_application):
+    application = await make_application(test_user, service_types=["STRUCTURED_EXTRACTION", "PSEUDONYMIZATION"])
+    assert await _mask(db_session, application.id) == 0b101
+
+    # ORM 수정(before_update)
+    loaded = await db_session.get(Application, application.id)
+    loaded.service_types = ["EXTERNAL_LINKAGE"]
+    await db_session.commit()
+    assert await _mask(db_session, application.id) == 0b1000
+
+
+async def test_mask_follows_service_types_through_api(db_session, test_user, async_client, make_application):
+    application = await make_application(test_user, status=ApplicationStatus.DRAFT)
+
+    # 조건부 UPDATE(workflow.update_editable) 로 수정해도 마스크를 함께 갱신
+    response = await async_client.put(
+        f"/api/applications/{application.id}",
+        headers=_headers(test_user),
+        json={"service_types": ["UNSTRUCTURED_EXTRACTION", "EXTERNAL_LINKAGE"]},
+    )
+
+    assert response.status_code == 200, response.text
+    assert await _mask(db_session, application.id) == 0b1010
+
+
+async def test_list_and_statistics_filter_by_service_type(test_user, test_admin, async_client, make_application):
+    structured = await make_application(test_user, project_name="structured")
+    both = await make_application(test_user, project_name="both",
+                                  service_types=["STRUCTURED_EXTRACTION", "PSEUDONYMIZATION"])
+    await make_application(test_user, project_name="linkage", status=ApplicationStatus.APPROVED,
+                           service_types=["EXTERNAL_LINKAGE"])
+
+    response = await async_client.get("/api/applications/", headers=_headers(test_user),
+                                      params={"service_type": "STRUCTURED_EXTRACTION"})
+    assert response.status_code == 200
+    assert {item["id"] for item in response.json()} == {structured.id, both.id}
+    response = await async_client.get("/api/applications/", headers=_headers(test_user),
+                                      params={"service_type": "PSEUDONYMIZATION"})
+    assert [item["id"] for item in response.json()] == [both.id]
+
+    statistics = (await async_client.get("/api/admin/statistics", headers=_headers(test_admin))).json()
+    assert statistics["total_applications"] == 3
+    assert statistics["service_type_breakdown"] == {
+        "STRUCTURED_EXTRACTION": 2, "UNSTRUCTURED_EXTRACTION": 0, "PSEUDONYMIZATION": 1, "EXTERNAL_LINKAGE": 1,
+    }
+
+    filtered = (await async_client.get("/api/admin/statistics", headers=_headers(test_admin),
+                                       params={"service_type": "EXTERNAL_LINKAGE"})).json()
+    assert filtered["total_applications"] == 1
+    assert filtered["status_breakdown"] == {"APPROVED": 1}
+    assert filtered["service_type_breakdown"]["STRUCTURED_EXTRACTION"] == 0
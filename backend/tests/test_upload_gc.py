@@ -0,0 +1,130 @@
+"""
+Upload GC tests (app.services.upload_gc)
+"""
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import column, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.functions import code_point_order
+from app.services.upload_gc import (
+    QUARANTINE_DIR_NAME,
+    QUARANTINE_STAMP_FORMAT,
+    GCMode,
+    UploadGCReport,
+    collect_garbage,
+    collect_garbage_job,
+    iter_referenced_paths,
+)
+
+DAY = 86400
+
+
+def write_file(root: Path, path: str, age_seconds: float = 2 * DAY) -> Path:
+    """root 아래 파일 생성 (수정 시각은 age_seconds 전)"""
+    file = root / path
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_bytes(b"x" * 10)
+    modified = time.time() - age_seconds
+    os.utime(file, (modified, modified))
+    return file
+
+
+def test_code_point_order_ignores_database_collation():
+    statement = select(column("path")).order_by(code_point_order(column("path")))
+
+    assert 'ORDER BY path COLLATE "C"' in str(statement.compile(dialect=postgresql.dialect()))
+    assert "ORDER BY path COLLATE BINARY" in str(statement.compile(dialect=sqlite.dialect()))
+
+
+async def test_referenced_paths_follow_python_string_order(db_session, test_user, make_application):
+    root = Path("/srv/uploads")
+    names = ["가.pdf", "Z.pdf", "a.pdf", "_b.pdf", "é.pdf"]
+    for name in names:
+        await make_application(test_user, irb_document_path=f"{root}/applications/x/{name}")
+
+    report = UploadGCReport(mode="report", root=str(root))
+    paths = [path async for path in iter_referenced_paths(db_session, root, 2, None, report)]
+
+    assert paths == sorted(f"applications/x/{name}" for name in names)
+    assert report.referenced_paths == len(names)
+
+
+async def test_report_finds_orphans_outside_grace_period(db_session, test_user, make_application, tmp_path):
+    await make_application(test_user, irb_document_path=f"{tmp_path}/applications/a/irb.pdf",
+                           research_plan_path=f"{tmp_path}/applications/a/missing.pdf")
+    write_file(tmp_path, "applications/a/irb.pdf")
+    write_file(tmp_path, "applications/a/old.pdf")
+    write_file(tmp_path, "applications/b/recent.pdf", age_seconds=60)
+
+    report = await collect_garbage(db_session, root=tmp_path, mode=GCMode.REPORT, grace_seconds=DAY)
+
+    assert (report.scanned_files, report.referenced_found, report.missing) == (3, 1, 1)
+    assert (report.orphans, report.orphan_bytes, report.skipped_recent) == (1, 10, 1)
+    assert report.orphan_samples == ["applications/a/old.pdf"]
+    # 보고만 하고 파일은 그대로
+    assert report.removed == 0
+    assert (tmp_path / "applications/a/old.pdf").exists()
+
+
+async def test_deleted_application_files_are_kept_for_retention(db_session, test_user, make_application,
+                                                                 tmp_path):
+    now = datetime.utcnow()
+    await make_application(test_user, irb_document_path=f"{tmp_path}/applications/recent/irb.pdf",
+                           dcyn="Y", deleted_at=now - timedelta(days=10))
+    await make_application(test_user, irb_document_path=f"{tmp_path}/applications/expired/irb.pdf",
+                           dcyn="Y", deleted_at=now - timedelta(days=100))
+    write_file(tmp_path, "applications/recent/irb.pdf")
+    write_file(tmp_path, "applications/expired/irb.pdf")
+
+    report = await collect_garbage(db_session, root=tmp_path, grace_seconds=DAY, deleted_retention_days=90)
+
+    assert report.referenced_paths == 1
+    assert report.orphan_samples == ["applications/expired/irb.pdf"]
+
+
+async def test_quarantine_moves_orphans_and_purges_expired_runs(db_session, test_user, make_application,
+                                                                tmp_path):
+    await make_application(test_user, irb_document_path=f"{tmp_path}/applications/a/irb.pdf")
+    write_file(tmp_path, "applications/a/irb.pdf")
+    write_file(tmp_path, "applications/b/orphan.pdf")
+    quarantine = tmp_path / QUARANTINE_DIR_NAME
+    expired = (datetime.now() - timedelta(days=40)).strftime(QUARANTINE_STAMP_FORMAT)
+    kept = (datetime.now() - timedelta(days=5)).strftime(QUARANTINE_STAMP_FORMAT)
+    write_file(quarantine, f"{expired}/applications/c/old.pdf")
+    write_file(quarantine, f"{kept}/applications/d/old.pdf")
+
+    report = await collect_garbage(db_session, root=tmp_path, mode=GCMode.QUARANTINE, grace_seconds=DAY,
+                                   quarantine_retention_days=30)
+
+    # 격리 디렉터리는 검사 대상이 아님
+    assert (report.scanned_files, report.orphans, report.removed, report.removed_bytes) == (2, 1, 1, 10)
+    assert (tmp_path / "applications/a/irb.pdf").exists()
+    # 빈 상위 디렉터리는 정리하고, 이번 실행 시각 디렉터리로 같은 상대 경로에 이동
+    assert not (tmp_path / "applications/b").exists()
+    moved = [path.relative_to(quarantine).as_posix() for path in quarantine.rglob("orphan.pdf")]
+    assert len(moved) == 1 and moved[0].endswith("/applications/b/orphan.pdf")
+    assert report.quarantine_purged == 1
+    assert sorted(path.name for path in quarantine.iterdir()) == sorted([kept, moved[0].split("/")[0]])
+
+
+async def test_delete_mode_removes_orphans(db_session, tmp_path):
+    orphan = write_file(tmp_path, "applications/a/orphan.pdf")
+
+    report = await collect_garbage(db_session, root=tmp_path, mode=GCMode.DELETE, grace_seconds=DAY)
+
+    assert report.removed == 1
+    assert not orphan.exists() and not (tmp_path / QUARANTINE_DIR_NAME).exists()
+
+
+async def test_periodic_job_only_reports_by_default(db_session, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orphan = write_file(tmp_path, "uploads/applications/a/orphan.pdf")
+
+    result = await collect_garbage_job(db_session, {})
+
+    assert (result["mode"], result["orphans"], result["removed"]) == ("report", 1, 0)
+    assert orphan.exists()
@@ -0,0 +1,100 @@
+"""
+Application status workflow tests (app.services.workflow, bulk status update)
+"""
+from sqlalchemy import event, select
+
+from app.core.security import create_access_token
+from app.models import Application, ApplicationLog, ApplicationStatus
+from tests.conftest import test_engine
+
+
+def _headers(user) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': user.id})}"}
+
+
+async def _logged_old_statuses(db) -> dict:
+    result = await db.execute(select(ApplicationLog.application_id, ApplicationLog.details))
+    return {application_id: details["old_status"] for application_id, details in result if details}
+
+
+async def test_multi_source_transition_logs_old_status(db_session, test_user, test_admin, async_client, make_application):
+    application = await make_application(test_user, ApplicationStatus.PROCESSING)
+
+    response = await async_client.put(
+        f"/api/applications/{application.id}/status",
+        headers=_headers(test_admin),
+        json={"status": "COMPLETED"},
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == "COMPLETED"
+    assert await _logged_old_statuses(db_session) == {application.id: "PROCESSING"}
+
+
+async def test_bulk_status_logs_each_old_status(db_session, test_user, test_admin, async_client, make_application):
+    approved = await make_application(test_user, ApplicationStatus.APPROVED)
+    processing = await make_application(test_user, ApplicationStatus.PROCESSING)
+
+    response = await async_client.post(
+        "/api/admin/applications/bulk-status",
+        headers=_headers(test_admin),
+        json={"application_ids": [approved.id, processing.id], "status": "COMPLETED"},
+    )
+
+    assert response.json()["succeeded"] == 2
+    assert await _logged_old_statuses(db_session) == {approved.id: "APPROVED", processing.id: "PROCESSING"}
+
+
+async def test_bulk_status_reports_rows_changed_after_select(db_session, test_user, test_admin, async_client, make_application):
+    kept = await make_application(test_user, ApplicationStatus.APPROVED)
+    raced = await make_application(test_user, ApplicationStatus.APPROVED, project_name="raced")
+
+    raced_updates = []
+
+    def reject_raced_first(conn, cursor, statement, parameters, context, executemany):
+        # 일괄 변경의 SELECT 와 UPDATE 사이에 다른 관리자가 반려한 상황
+        if statement.startswith("UPDATE applications") and not raced_updates:
+            raced_updates.append(statement)
+            conn.exec_driver_sql("UPDATE applications SET status = 'REJECTED' WHERE project_name = 'raced'")
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", reject_raced_first)
+    try:
+        response = await async_client.post(
+            "/api/admin/applications/bulk-status",
+            headers=_headers(test_admin),
+            json={"application_ids": [kept.id, raced.id], "status": "PROCESSING"},
+        )
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", reject_raced_first)
+
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (1, 1)
+    assert [item["success"] for item in body["results"]] == [True, False]
+    assert await _logged_old_statuses(db_session) == {kept.id: "APPROVED"}
+    status = await db_session.scalar(select(Application.status).where(Application.id == raced.id))
+    assert status == ApplicationStatus.REJECTED
+
+
+async def test_transition_without_logged_old_status_is_one_update(db_session, test_user, test_admin, async_client,
+                                                                  make_application):
+    application = await make_application(test_user, ApplicationStatus.UNDER_REVIEW)
+    updates = []
+
+    def count_updates(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE applications"):
+            updates.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", count_updates)
+    try:
+        response = await async_client.post(
+            f"/api/applications/{application.id}/review",
+            headers=_headers(test_admin),
+            json={"status": "APPROVED"},
+        )
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", count_updates)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == "APPROVED"
+    # 허용 상태(SUBMITTED, UNDER_REVIEW)마다가 아니라 status IN (...) UPDATE 한 번
+    assert len(updates) == 1